@@ -19,7 +19,16 @@ def _compile_handler(
             include_path,
             macro_symbol,
             warnings_as_errors,
+            emit,
+            split_by_memzone,
+            depfile,
+            make_depfile,
+            memory_map,
+            max_errors,
+            diagnostics_format,
+            diagnostics_output,
         ):
+    import contextlib
     import os
 
     import click
@@ -27,6 +36,8 @@ def _compile_handler(
 
     if output_file is None:
         output_file = os.path.splitext(asm_file)[0] + '.bin'
+    if make_depfile and depfile is None:
+        depfile = os.path.splitext(output_file)[0] + '.d'
     if verbose:
         click.echo(f'The file to assemble is: {asm_file}')
         if binary:
@@ -36,20 +47,72 @@ def _compile_handler(
         if int(binary_max_address) >= 0:
             click.echo(f'  with the maximum address written: {binary_max_address}')
 
-    asm = Assembler(
-        asm_file, config_file,
-        binary, output_file,
-        int(binary_min_address), int(binary_max_address) if int(binary_max_address) >= 0 else None,
-        binary_fill,
-        pretty_print, pretty_print_format, pretty_print_output, verbose,
-        include_path,
-        macro_symbol,
-        warnings_as_errors,
-    )
-    asm.assemble_bytecode()
+    with contextlib.ExitStack() as stack:
+        diagnostics_stream = None
+        if diagnostics_output is not None:
+            diagnostics_stream = stack.enter_context(open(diagnostics_output, 'w', buffering=1))
+        asm = Assembler(
+            asm_file, config_file,
+            binary, output_file,
+            int(binary_min_address), int(binary_max_address) if int(binary_max_address) >= 0 else None,
+            binary_fill,
+            pretty_print, pretty_print_format, pretty_print_output, verbose,
+            include_path,
+            macro_symbol,
+            warnings_as_errors,
+            list(emit),
+            split_by_memzone,
+            depfile,
+            memory_map,
+            max_errors,
+            diagnostics_format.lower(),
+            diagnostics_stream,
+        )
+        asm.assemble_bytecode()
+
+
+def _check_handler(
+            asm_files,
+            config_file,
+            verbose,
+            include_path,
+            macro_symbol,
+            warnings_as_errors,
+            max_errors,
+            diagnostics_format,
+            diagnostics_output,
+        ):
+    import contextlib
+
+    import click
+    from bespokeasm.assembler.checker import SyntaxChecker
+
+    diagnostics_format = diagnostics_format.lower()
+    with contextlib.ExitStack() as stack:
+        diagnostics_stream = None
+        if diagnostics_output is not None:
+            diagnostics_stream = stack.enter_context(open(diagnostics_output, 'w', buffering=1))
+        checker = SyntaxChecker(
+            config_file,
+            verbose,
+            include_path,
+            macro_symbol,
+            warnings_as_errors,
+            max_errors,
+            diagnostics_format,
+            diagnostics_stream,
+        )
+        failed_files = checker.check_files(list(asm_files))
+    if len(failed_files) > 0:
+        if diagnostics_format == 'json':
+            # the errors were written as JSON, so no text summary is added to them
+            sys.exit(1)
+        sys.exit(f'ERROR: {len(failed_files)} of {len(asm_files)} files failed to assemble')
+    if verbose:
+        click.echo(f'{len(asm_files)} files assemble without errors')
 
 
-def _docs_handler(config_file, output_file, verbose):
+def _docs_handler(config_file, output_file, verbose, split_by_category, cache_file):
     import os
 
     import click
@@ -61,7 +124,9 @@ def _docs_handler(config_file, output_file, verbose):
         click.echo(f'ERROR: Configuration file not found: {config_file}', err=True)
         sys.exit(1)
 
-    generator = DocumentationGenerator(config_file, verbose)
+    if cache_file is not None:
+        cache_file = os.path.abspath(os.path.expanduser(cache_file))
+    generator = DocumentationGenerator(config_file, verbose, split_by_category, cache_file)
     try:
         output_path = generator.generate_markdown_documentation(output_file)
         click.echo(f'Documentation generated: {output_path}')
@@ -106,12 +171,58 @@ def _vim_handler(config_file, verbose, editor_config_dir, language_name, languag
     generator.generate()
 
 
+def _all_editors_handler(
+            config_file,
+            verbose,
+            vscode_config_dir,
+            sublime_config_dir,
+            vim_config_dir,
+            language_name,
+            language_version,
+            code_extension,
+        ):
+    import os
+
+    from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+    from bespokeasm.assembler.model import AssemblerModel
+    from bespokeasm.configgen.sublime import SublimeConfigGenerator
+    from bespokeasm.configgen.vim import VimConfigGenerator
+    from bespokeasm.configgen.vscode import VSCodeConfigGenerator
+
+    config_file = os.path.abspath(os.path.expanduser(config_file))
+    # the instruction set model is loaded once and shared by every editor's generator
+    model = AssemblerModel(config_file, verbose, DiagnosticReporter())
+    for generator_class, editor_config_dir in [
+        (VSCodeConfigGenerator, vscode_config_dir),
+        (SublimeConfigGenerator, sublime_config_dir),
+        (VimConfigGenerator, vim_config_dir),
+    ]:
+        generator = generator_class(
+            config_file, verbose, os.path.abspath(os.path.expanduser(editor_config_dir)),
+            language_name, language_version, code_extension, model,
+        )
+        generator.generate()
+
+
+def _lsp_handler(config_file, include_path):
+    import os
+
+    from bespokeasm.lsp import run_language_server
+
+    config_file = os.path.abspath(os.path.expanduser(config_file))
+    include_paths = [os.path.abspath(os.path.expanduser(path)) for path in include_path]
+    sys.exit(run_language_server(config_file, include_paths))
+
+
 _HANDLERS = CommandHandlers(
     compile=_compile_handler,
+    check=_check_handler,
     docs=_docs_handler,
     vscode=_vscode_handler,
     sublime=_sublime_handler,
     vim=_vim_handler,
+    all_editors=_all_editors_handler,
+    lsp=_lsp_handler,
 )
 
 
@@ -139,12 +250,14 @@ def entry_point():
     # If a known subcommand is present, run as-is; otherwise assume compile by default.
     known_subcommands = {
         'compile',
+        'check',
         'docs',
         'generate_extension',
         'generate-extension',
         'vscode',
         'sublime',
         'vim',
+        'lsp',
         'install_completion',
         'install-completion',
     }
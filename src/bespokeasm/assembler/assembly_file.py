@@ -19,6 +19,8 @@ from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.line_object.directive_line.address import AddressOrgLine
 from bespokeasm.assembler.line_object.directive_line.factory import SetMemoryZoneLine
+from bespokeasm.assembler.line_object.directive_line.include_binary import IncludeBinaryLine
+from bespokeasm.assembler.line_object.error_placeholder import ErrorPlaceholderLine
 from bespokeasm.assembler.line_object.factory import LineOjectFactory
 from bespokeasm.assembler.line_object.label_line import LabelLine
 from bespokeasm.assembler.line_object.preprocessor_line.condition_line import CONDITIONAL_LINE_PREFIX_LIST
@@ -70,8 +72,12 @@ class AssemblyFile:
                 memzone_manager: MemoryZoneManager,
                 preprocessor: Preprocessor,
                 log_verbosity: int,
-                assembly_files_used: set = set()
+                assembly_files_used: set[str] | None = None,
+                include_graph: dict[str, set[str]] | None = None,
             ) -> list[LineObject]:
+        # a fresh set per top level load, so separate assemblies in one process don't share state
+        if assembly_files_used is None:
+            assembly_files_used = set()
         line_objects = []
 
         try:
@@ -98,17 +104,19 @@ class AssemblyFile:
                                         line_id,
                                         '#include does not inherit #mute; included file will emit bytecode',
                                     )
-                                additional_line_objects = self._handle_include_file(
-                                    line_str,
-                                    line_id,
-                                    isa_model,
-                                    memzone_manager,
-                                    preprocessor,
-                                    include_paths,
-                                    log_verbosity,
-                                    assembly_files_used
-                                )
-                                line_objects.extend(additional_line_objects)
+                                with self._diagnostic_reporter.recovery_point(line_id):
+                                    additional_line_objects = self._handle_include_file(
+                                        line_str,
+                                        line_id,
+                                        isa_model,
+                                        memzone_manager,
+                                        preprocessor,
+                                        include_paths,
+                                        log_verbosity,
+                                        assembly_files_used,
+                                        include_graph,
+                                    )
+                                    line_objects.extend(additional_line_objects)
                             continue
 
                         lobj_list: list[LineObject] = []
@@ -123,80 +131,99 @@ class AssemblyFile:
                             line_objects.append(line_obj)
                             continue
                         # parse the line
-                        lobj_list.extend(LineOjectFactory.parse_line(
-                            line_id,
-                            line_str,
-                            isa_model,
-                            current_scope,
-                            active_named_scopes,
-                            current_memzone,
-                            memzone_manager,
-                            preprocessor,
-                            condition_stack,
-                            log_verbosity,
-                            self._filename,
-                        ))
+                        parsed_lobjs: list[LineObject] | None = None
+                        with self._diagnostic_reporter.recovery_point(line_id):
+                            parsed_lobjs = LineOjectFactory.parse_line(
+                                line_id,
+                                line_str,
+                                isa_model,
+                                current_scope,
+                                active_named_scopes,
+                                current_memzone,
+                                memzone_manager,
+                                preprocessor,
+                                condition_stack,
+                                log_verbosity,
+                                self._filename,
+                            )
+                        if parsed_lobjs is None:
+                            # the line has an error that was collected. Stand in for it so later lines are still checked.
+                            parsed_lobjs = [ErrorPlaceholderLine(line_id, line_str, isa_model, current_memzone)]
+                        lobj_list.extend(parsed_lobjs)
                         for lobj in lobj_list:
-                            if not isinstance(lobj, ConditionLine):
-                                lobj.compilable = condition_stack.currently_active(preprocessor)
-                                lobj.is_muted = condition_stack.is_muted
+                            with self._diagnostic_reporter.recovery_point(lobj.line_id):
+                                if not isinstance(lobj, ConditionLine):
+                                    lobj.compilable = condition_stack.currently_active(preprocessor)
+                                    lobj.is_muted = condition_stack.is_muted
 
-                            if lobj.compilable:
-                                if isinstance(lobj, CreateScopeLine):
-                                    self._defined_named_scopes.add(lobj.scope_name)
-                                elif isinstance(lobj, UseScopeLine):
-                                    if active_named_scopes and active_named_scopes[0] == lobj.scope_name:
-                                        self._diagnostic_reporter.warn(
-                                            lobj.line_id,
-                                            f'Named scope "{lobj.scope_name}" is already active; '
-                                            '#use-scope has no effect'
-                                        )
-                                    self._used_named_scopes.append((lobj.scope_name, lobj.line_id))
-                                elif isinstance(lobj, DeactivateScopeLine):
-                                    if lobj.scope_name not in active_named_scopes:
-                                        self._diagnostic_reporter.warn(
+                                if lobj.compilable:
+                                    if isinstance(lobj, CreateScopeLine):
+                                        self._defined_named_scopes.add(lobj.scope_name)
+                                    elif isinstance(lobj, UseScopeLine):
+                                        if active_named_scopes and active_named_scopes[0] == lobj.scope_name:
+                                            self._diagnostic_reporter.warn(
+                                                lobj.line_id,
+                                                f'Named scope "{lobj.scope_name}" is already active; '
+                                                '#use-scope has no effect'
+                                            )
+                                        self._used_named_scopes.append((lobj.scope_name, lobj.line_id))
+                                    elif isinstance(lobj, DeactivateScopeLine):
+                                        if lobj.scope_name not in active_named_scopes:
+                                            self._diagnostic_reporter.warn(
+                                                lobj.line_id,
+                                                f'Named scope "{lobj.scope_name}" is not active; '
+                                                '#deactivate-scope has no effect'
+                                            )
+                                    if isinstance(lobj, LabelLine):
+                                        if not lobj.is_constant \
+                                                and LabelScopeType.get_label_scope(lobj.get_label()) != LabelScopeType.LOCAL:
+                                            current_scope = LabelScope(
+                                                LabelScopeType.LOCAL, self.label_scope, lobj.get_label()
+                                            )
+                                    # both .org and .memzone directive should reset label scope to FILE and current memzone
+                                    elif isinstance(lobj, SetMemoryZoneLine):
+                                        if (
+                                            isinstance(lobj, AddressOrgLine)
+                                            and not lobj.has_explicit_memzone_name
+                                            and current_memzone.name != GLOBAL_ZONE_NAME
+                                        ):
+                                            self._diagnostic_reporter.warn(
+                                                lobj.line_id,
+                                                f'.org without a memzone name uses an absolute address; '
+                                                f'current memzone is "{current_memzone.name}"',
+                                            )
+                                        current_scope = self.label_scope
+                                        current_memzone = lobj.memory_zone
+                                    elif isinstance(lobj, UseScopeLine) or isinstance(lobj, CreateScopeLine):
+                                        active_named_scopes.activate_named_scope(lobj.scope_name)
+                                    elif isinstance(lobj, DeactivateScopeLine):
+                                        active_named_scopes.deactivate_named_scope(lobj.scope_name)
+                                    elif isinstance(lobj, IncludeBinaryLine):
+                                        lobj.set_filepath(self._locate_filename(
+                                            lobj.filename,
+                                            [os.path.dirname(self.filename), *include_paths],
                                             lobj.line_id,
-                                            f'Named scope "{lobj.scope_name}" is not active; '
-                                            '#deactivate-scope has no effect'
-                                        )
-                                if isinstance(lobj, LabelLine):
-                                    if not lobj.is_constant \
-                                            and LabelScopeType.get_label_scope(lobj.get_label()) != LabelScopeType.LOCAL:
-                                        current_scope = LabelScope(LabelScopeType.LOCAL, self.label_scope, lobj.get_label())
-                                # both .org and .memzone directive should reset label scope to FILE and current memzone
-                                elif isinstance(lobj, SetMemoryZoneLine):
-                                    if (
-                                        isinstance(lobj, AddressOrgLine)
-                                        and not lobj.has_explicit_memzone_name
-                                        and current_memzone.name != GLOBAL_ZONE_NAME
-                                    ):
-                                        self._diagnostic_reporter.warn(
+                                        ))
+                                        if include_graph is not None:
+                                            include_graph.setdefault(self.filename, set()).add(lobj.filepath)
+                                    lobj.label_scope = current_scope
+                                    lobj.active_named_scopes = active_named_scopes
+                                    lobj.diagnostic_reporter = self._diagnostic_reporter
+                                    # setting constants now so they can be used when evaluating lines later.
+                                    if isinstance(lobj, LabelLine) and lobj.is_constant:
+                                        # first check if label belongs to an active named scope
+                                        if not self._named_scope_manager.set_label_value(
+                                            lobj.get_label(),
+                                            lobj.get_value(),
                                             lobj.line_id,
-                                            f'.org without a memzone name uses an absolute address; '
-                                            f'current memzone is "{current_memzone.name}"',
-                                        )
-                                    current_scope = self.label_scope
-                                    current_memzone = lobj.memory_zone
-                                elif isinstance(lobj, UseScopeLine) or isinstance(lobj, CreateScopeLine):
-                                    active_named_scopes.activate_named_scope(lobj.scope_name)
-                                elif isinstance(lobj, DeactivateScopeLine):
-                                    active_named_scopes.deactivate_named_scope(lobj.scope_name)
-                                lobj.label_scope = current_scope
-                                lobj.active_named_scopes = active_named_scopes
-                                lobj.diagnostic_reporter = self._diagnostic_reporter
-                                # setting constants now so they can be used when evaluating lines later.
-                                if isinstance(lobj, LabelLine) and lobj.is_constant:
-                                    # first check if label belongs to an active named scope
-                                    if not self._named_scope_manager.set_label_value(
-                                        lobj.get_label(),
-                                        lobj.get_value(),
-                                        lobj.line_id,
-                                        lobj.active_named_scopes,
-                                        is_constant=True
-                                    ):
-                                        # if not in an active named scope, set to the current scope
-                                        lobj.label_scope.set_label_value(lobj.get_label(), lobj.get_value(), lobj.line_id)
-                            line_objects.append(lobj)
+                                            lobj.active_named_scopes,
+                                            is_constant=True
+                                        ):
+                                            # if not in an active named scope, set to the current scope
+                                            lobj.label_scope.set_label_value(
+                                                lobj.get_label(), lobj.get_value(), lobj.line_id, is_constant=True
+                                            )
+                                line_objects.append(lobj)
         except FileNotFoundError:
             self._diagnostic_reporter.error(
                 None,
@@ -232,7 +259,8 @@ class AssemblyFile:
                 preprocessor: Preprocessor,
                 include_paths: set[str],
                 log_verbosity: int,
-                assembly_files_used: set
+                assembly_files_used: set,
+                include_graph: dict[str, set[str]] | None = None,
             ) -> list[LineObject]:
         label_match = re.search(AssemblyFile.PATTERN_INCLUDE_FILE, line_str)
         if label_match is not None:
@@ -242,6 +270,9 @@ class AssemblyFile:
                     include_paths_with_current,
                     line_id
                 )
+            if include_graph is not None:
+                # records which file includes which, such as for finding the programs affected by a changed file
+                include_graph.setdefault(self.filename, set()).add(new_filepath)
             if new_filepath in assembly_files_used:
                 self._diagnostic_reporter.error(
                     line_id,
@@ -259,7 +290,8 @@ class AssemblyFile:
                 memzone_manager,
                 preprocessor,
                 log_verbosity,
-                assembly_files_used=assembly_files_used
+                assembly_files_used=assembly_files_used,
+                include_graph=include_graph,
             )
             self._defined_named_scopes.update(file_obj._defined_named_scopes)
             return include_line_objects
@@ -10,6 +10,17 @@ from bespokeasm.assembler.line_identifier import LineIdentifier
 
 
 class AssembledInstruction:
+    __slots__ = (
+        '_parts',
+        '_line_id',
+        '_word_size',
+        '_segment_size',
+        '_multi_word_endian',
+        '_intra_word_endian',
+        '_operand_label_bindings',
+        '_word_count',
+    )
+
     @dataclass(frozen=True)
     class OperandLabelBinding:
         label: str
@@ -134,8 +145,35 @@ class AssembledInstruction:
         )
         return words
 
+    def validate(
+            self,
+            label_scope: LabelScope,
+            active_named_scopes: ActiveNamedScopeList,
+            instruction_address: int,
+            instruction_size: int,
+    ) -> None:
+        '''
+        Checks the values of the assembled instruction, raising the same errors as `get_words()`
+        without generating the words.
+
+        :param label_scope: The label scope to use for resolving label values.
+        :param instruction_address: The address of the instruction.
+        :param instruction_size: The size of the instruction in words.
+        '''
+        ByteCodePart.validate_parts(
+            parts=self._parts,
+            word_size=self._word_size,
+            label_scope=label_scope,
+            active_named_scopes=active_named_scopes,
+            instruction_address=instruction_address,
+            instruction_size=instruction_size,
+            bytecode_start_address=instruction_address,
+        )
+
 
 class CompositeAssembledInstruction(AssembledInstruction):
+    __slots__ = ('_instructions',)
+
     def __init__(
         self,
         line_id: LineIdentifier,
@@ -17,6 +17,17 @@ from .packed_bits import PackedBits
 
 
 class ByteCodePart:
+    __slots__ = (
+        '_value_size',
+        '_word_align',
+        '_multi_word_endian',
+        '_intra_word_endian',
+        '_line_id',
+        '_word_size',
+        '_segment_size',
+        '_representation_type',
+    )
+
     def __init__(
         self,
         value_size: int,
@@ -158,6 +169,26 @@ class ByteCodePart:
                 f'ERROR: INTERNAL - get_words received unexpected value representation type: {type(value_representation)}'
             )
 
+    def validate(
+            self,
+            label_scope: LabelScope,
+            active_named_scopes: ActiveNamedScopeList,
+            instruction_address: int,
+            instruction_size: int,
+            bytecode_address: int | None = None,
+    ) -> None:
+        """
+        Checks that this part's value resolves and is allowed, raising the same errors as compacting
+        it into words would. Creating the value's representation checks that it fits in the part's bits.
+        """
+        self.get_value_representation(
+            label_scope,
+            active_named_scopes,
+            instruction_address,
+            instruction_size,
+            bytecode_address,
+        )
+
     def contains_register_labels(self, register_labels: set[str]) -> bool:
         return False
 
@@ -178,6 +209,34 @@ class ByteCodePart:
             yield part, part_bytecode_address
             bit_offset += part.value_size
 
+    @classmethod
+    def validate_parts(
+        cls,
+        parts: list[ByteCodePart],
+        word_size: int,
+        label_scope: LabelScope,
+        active_named_scopes: ActiveNamedScopeList,
+        instruction_address: int,
+        instruction_size: int,
+        bytecode_start_address: int | None = None,
+    ) -> None:
+        """
+        Checks the values of a list of ByteCodePart objects, raising the same errors as
+        `compact_parts_to_words()` but without packing the values into Word objects.
+        """
+        for part, part_bytecode_address in cls._iter_parts_with_bytecode_addresses(
+            parts,
+            word_size,
+            bytecode_start_address,
+        ):
+            part.validate(
+                label_scope,
+                active_named_scopes,
+                instruction_address,
+                instruction_size,
+                part_bytecode_address,
+            )
+
     @classmethod
     def compact_parts_to_words(
         cls,
@@ -302,6 +361,8 @@ class ByteCodePart:
 
 
 class NumericByteCodePart(ByteCodePart):
+    __slots__ = ('_value',)
+
     def __init__(
                 self,
                 value: int,
@@ -343,6 +404,8 @@ class NumericByteCodePart(ByteCodePart):
 
 
 class ExpressionByteCodePart(ByteCodePart):
+    __slots__ = ('_expression', '_parsed_expression')
+
     def __init__(
         self,
         value_expression: str,
@@ -400,6 +463,8 @@ class ExpressionByteCodePart(ByteCodePart):
 
 
 class ExpressionByteCodePartWithValidation(ExpressionByteCodePart):
+    __slots__ = ('_max', '_min')
+
     def __init__(
                 self,
                 max_value: int,
@@ -454,6 +519,8 @@ class ExpressionByteCodePartWithValidation(ExpressionByteCodePart):
 
 
 class ExpressionByteCodePartInMemoryZone(ExpressionByteCodePart):
+    __slots__ = ('_memzone',)
+
     def __init__(
         self,
         memzone: MemoryZone,
@@ -513,6 +580,8 @@ class ExpressionByteCodePartInMemoryZone(ExpressionByteCodePart):
 
 
 class ExpressionEnumerationByteCodePart(ExpressionByteCodePart):
+    __slots__ = ('_value_dict',)
+
     def __init__(
                 self,
                 value_dict: dict[int, int],
@@ -567,6 +636,8 @@ class ExpressionEnumerationByteCodePart(ExpressionByteCodePart):
 
 
 class CompositeByteCodePart(ByteCodePart):
+    __slots__ = ('_parts_list',)
+
     _parts_list: list[ByteCodePart]
 
     def __init__(
@@ -679,3 +750,26 @@ class CompositeByteCodePart(ByteCodePart):
             instruction_size,
             bytecode_address,
         )
+
+    def validate(
+        self,
+        label_scope: LabelScope,
+        active_named_scopes: ActiveNamedScopeList,
+        instruction_address: int,
+        instruction_size: int,
+        bytecode_address: int | None = None,
+    ) -> None:
+        if not self.word_align:
+            # the parts are packed together to be checked, as they are when compacted into words
+            super().validate(label_scope, active_named_scopes, instruction_address, instruction_size, bytecode_address)
+            return
+        # word aligned composite parts are compacted from each of their own parts
+        ByteCodePart.validate_parts(
+            self._parts_list,
+            self.word_size,
+            label_scope,
+            active_named_scopes,
+            instruction_address,
+            instruction_size,
+            bytecode_address,
+        )
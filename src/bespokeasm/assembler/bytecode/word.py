@@ -1,6 +1,7 @@
 import math
 from typing import Literal
 
+from .word_format import WordFormat
 from .word_slice import WordSlice
 
 
@@ -17,7 +18,11 @@ class Word:
     Words can be constructed from:
     - A list of WordSlice objects (packed in order from MSB to LSB)
     - An integer value (if it fits within the bit size)
+
+    The bit size, segment size, and endianness are held by a shared WordFormat so that each
+    Word only stores its value and a reference to the format.
     """
+    __slots__ = ('_value', '_format')
 
     def __init__(
         self,
@@ -35,32 +40,36 @@ class Word:
         :param intra_word_endianness: The endianness of segments when converting to bytes
         :raises ValueError: If parameters are invalid or value doesn't fit in bit_size
         """
-        if bit_size <= 0:
-            raise ValueError('bit_size must be greater than 0')
-
-        if segment_size <= 0:
-            raise ValueError('segment_size must be greater than 0')
-
-        if bit_size % segment_size != 0:
-            raise ValueError(f'bit_size {bit_size} must be divisible by segment_size {segment_size}')
-
-        if segment_size > bit_size:
-            raise ValueError(f'segment_size {segment_size} cannot be greater than bit_size {bit_size}')
-
-        # Calculate valid range for the given bit size
-        min_value = -(1 << (bit_size - 1))  # -2^(bit_size-1) for signed
-        max_value = (1 << bit_size) - 1  # 2^bit_size - 1 for unsigned
+        word_format = WordFormat.get(bit_size, segment_size, intra_word_endianness)
+        if value < word_format.min_value or value > word_format.value_mask:
+            raise ValueError(
+                f'value {value} is out of range for bit_size {bit_size} '
+                f'(range: {word_format.min_value} to {word_format.value_mask})'
+            )
+        self._value = value
+        self._format = word_format
 
-        if value < min_value or value > max_value:
-            raise ValueError(f'value {value} is out of range for bit_size {bit_size} (range: {min_value} to {max_value})')
+    @classmethod
+    def from_format(cls, value: int, word_format: WordFormat) -> 'Word':
+        """
+        Create a Word sharing an existing WordFormat.
 
-        if intra_word_endianness not in ['little', 'big']:
-            raise ValueError('intra_word_endianness must be "little" or "big"')
+        Only the value range is validated, as the format parameters were validated when the format was created.
 
-        self._value = value
-        self._bit_size = bit_size
-        self._segment_size = segment_size
-        self._intra_word_endianness = intra_word_endianness
+        :param value: The integer value of the word
+        :param word_format: The shared format of the word
+        :return: A new Word object
+        :raises ValueError: If the value doesn't fit in the format's bit size
+        """
+        if value < word_format.min_value or value > word_format.value_mask:
+            raise ValueError(
+                f'value {value} is out of range for bit_size {word_format.bit_size} '
+                f'(range: {word_format.min_value} to {word_format.value_mask})'
+            )
+        word = cls.__new__(cls)
+        word._value = value
+        word._format = word_format
+        return word
 
     @classmethod
     def from_word_slices(
@@ -178,22 +187,27 @@ class Word:
     @property
     def bit_size(self) -> int:
         """Returns the total number of bits in the word."""
-        return self._bit_size
+        return self._format.bit_size
 
     @property
     def segment_size(self) -> int:
         """Returns the size of segments within the word."""
-        return self._segment_size
+        return self._format.segment_size
 
     @property
     def intra_word_endianness(self) -> Literal['little', 'big']:
         """Returns the endianness of segments when converting to bytes."""
-        return self._intra_word_endianness
+        return self._format.intra_word_endianness
+
+    @property
+    def word_format(self) -> WordFormat:
+        """Returns the shared format descriptor of the word."""
+        return self._format
 
     @property
     def segment_count(self) -> int:
         """Returns the number of segments in the word."""
-        return self._bit_size // self._segment_size
+        return self._format.segment_count
 
     @property
     def ideal_hex_width(self) -> int:
@@ -220,12 +234,12 @@ class Word:
         :return: Bytes representation of the word
         """
         # Calculate number of bytes needed
-        byte_count = (self._bit_size + 7) // 8
+        byte_count = (self.bit_size + 7) // 8
 
         # Handle negative values by converting to two's complement
         if self._value < 0:
             # Convert to two's complement: invert bits and add 1
-            positive_value = (1 << self._bit_size) + self._value
+            positive_value = (1 << self.bit_size) + self._value
         else:
             positive_value = self._value
 
@@ -233,7 +247,7 @@ class Word:
         segments = self._extract_segments_from_value(positive_value)
 
         # Apply intra-word endianness
-        if self._intra_word_endianness == 'little':
+        if self.intra_word_endianness == 'little':
             segments = list(reversed(segments))
 
         # Combine segments back into a value
@@ -241,7 +255,7 @@ class Word:
 
         # Left-align the value within the byte array (MSB first)
         total_bits = byte_count * 8
-        shift = total_bits - self._bit_size
+        shift = total_bits - self.bit_size
         aligned_value = combined_value << shift
 
         # Convert to bytes using big-endian (since we've already handled endianness)
@@ -263,11 +277,11 @@ class Word:
         :return: List of segment values, ordered from most significant to least significant
         """
         segments = []
-        segment_mask = (1 << self._segment_size) - 1
+        segment_mask = (1 << self.segment_size) - 1
 
         for i in range(self.segment_count):
             # Extract segment starting from MSB
-            segment_value = (value >> (self._bit_size - (i + 1) * self._segment_size)) & segment_mask
+            segment_value = (value >> (self.bit_size - (i + 1) * self.segment_size)) & segment_mask
             segments.append(segment_value)
 
         return segments
@@ -284,16 +298,16 @@ class Word:
 
         value = 0
         for i, segment in enumerate(segments):
-            value |= segment << (self._bit_size - (i + 1) * self._segment_size)
+            value |= segment << (self.bit_size - (i + 1) * self.segment_size)
 
         return value
 
     def __repr__(self) -> str:
-        return f'Word<value=0x{self._value:x}, bit_size={self._bit_size}, ' \
-               f'segment_size={self._segment_size}, intra_word_endianness={self._intra_word_endianness}>'
+        return f'Word<value=0x{self._value:x}, bit_size={self.bit_size}, ' \
+               f'segment_size={self.segment_size}, intra_word_endianness={self.intra_word_endianness}>'
 
     def __str__(self) -> str:
-        return f'Word<{self._value} ({self._bit_size} bits, {self._segment_size}-bit segments, {self._intra_word_endianness})>'
+        return f'Word<{self._value} ({self.bit_size} bits, {self.segment_size}-bit segments, {self.intra_word_endianness})>'
 
     def __format__(self, format_spec):
         if not format_spec:
@@ -315,14 +329,14 @@ class Word:
         if isinstance(other, Word):
             return (
                     self._value == other._value and
-                    self._bit_size == other._bit_size and
-                    self._segment_size == other._segment_size and
-                    self._intra_word_endianness == other._intra_word_endianness
+                    self.bit_size == other.bit_size and
+                    self.segment_size == other.segment_size and
+                    self.intra_word_endianness == other.intra_word_endianness
                 )
         return False
 
     def __hash__(self) -> int:
-        return hash((self._value, self._bit_size, self._segment_size, self._intra_word_endianness))
+        return hash((self._value, self.bit_size, self.segment_size, self.intra_word_endianness))
 
     def __int__(self) -> int:
         return self._value
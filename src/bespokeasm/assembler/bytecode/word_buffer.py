@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+from .word import Word
+from .word_format import WordFormat
+
+
+_UNSIGNED_TYPECODES = ('B', 'H', 'I', 'L', 'Q')
+
+
+def _typecode_for_bit_size(bit_size: int) -> str | None:
+    """Returns the smallest unsigned array typecode able to hold a word of the passed bit size."""
+    for typecode in _UNSIGNED_TYPECODES:
+        if array(typecode).itemsize * 8 >= bit_size:
+            return typecode
+    return None
+
+
+def _shift_table(shift: int, mask: int) -> bytes:
+    """Returns a `bytes.translate()` table mapping each byte to `(byte >> shift) & mask`."""
+    return bytes((b >> shift) & mask for b in range(256))
+
+
+class WordBuffer:
+    """
+    An array-backed sequence of word values that all share one WordFormat.
+
+    Word values are stored as unsigned integers in an `array` sized to the ISA word (or a plain list
+    for words wider than 64 bits). Negative values are stored in their two's complement form. Word
+    objects are only created when a caller asks for them via iteration, indexing, or `words()`.
+    """
+    __slots__ = ('_format', '_values')
+
+    def __init__(self, word_format: WordFormat, values: Iterable[int] | None = None) -> None:
+        self._format = word_format
+        typecode = _typecode_for_bit_size(word_format.bit_size)
+        self._values = array(typecode) if typecode is not None else []
+        if values is not None:
+            self.extend(values)
+
+    @classmethod
+    def from_words(cls, words: Iterable[Word], word_format: WordFormat) -> WordBuffer:
+        """Creates a buffer holding the values of the passed Word objects."""
+        buffer = cls(word_format)
+        buffer.extend_words(words)
+        return buffer
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return f'WordBuffer<{len(self)} words, {self._format}>'
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Word]:
+        word_format = self._format
+        for value in self._values:
+            yield Word.from_format(value, word_format)
+
+    def __getitem__(self, index: int) -> Word:
+        return Word.from_format(self._values[index], self._format)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WordBuffer):
+            return self._format == other._format and list(self.values) == list(other.values)
+        if isinstance(other, list):
+            return self.words() == other
+        return False
+
+    @property
+    def word_format(self) -> WordFormat:
+        """Returns the shared format of the words in this buffer."""
+        return self._format
+
+    @property
+    def values(self) -> array | list[int]:
+        """Returns the unsigned word values. The returned sequence must not be modified."""
+        return self._values
+
+    def words(self) -> list[Word]:
+        """Returns a Word view for each value in this buffer."""
+        return list(self)
+
+    def _check_value(self, value: int) -> int:
+        word_format = self._format
+        if value < word_format.min_value or value > word_format.value_mask:
+            raise ValueError(
+                f'value {value} is out of range for bit_size {word_format.bit_size} '
+                f'(range: {word_format.min_value} to {word_format.value_mask})'
+            )
+        return value & word_format.value_mask
+
+    def append(self, value: int) -> None:
+        """Appends a word value, converting negative values to their two's complement form.
+
+        :raises ValueError: If the value doesn't fit in the word bit size, as with Word
+        """
+        self._values.append(self._check_value(value))
+
+    def extend(self, values: Iterable[int]) -> None:
+        """Appends several word values. See `append()`."""
+        if (
+            isinstance(values, array)
+            and isinstance(self._values, array)
+            and values.typecode in _UNSIGNED_TYPECODES
+            and values.itemsize * 8 <= self._format.bit_size
+        ):
+            # unsigned values no wider than the word are always in range
+            if values.typecode == self._values.typecode:
+                self._values.extend(values)
+            else:
+                self._values.extend(array(self._values.typecode, values))
+            return
+        self._values.extend(self._check_value(v) for v in values)
+
+    def extend_words(self, words: Iterable[Word]) -> None:
+        """Appends the values of the passed Word objects."""
+        mask = self._format.value_mask
+        self._values.extend(w.value & mask for w in words)
+
+    def extend_buffer(self, other, start: int = 0, stop: int | None = None) -> None:
+        """Appends the values of another WordBuffer or WordRun with the same word bit size without
+        creating Word objects. If `start` or `stop` are passed, only the values in that index range
+        of the other buffer are appended."""
+        if other.word_format.bit_size != self._format.bit_size:
+            raise ValueError(
+                f'Cannot concatenate a buffer of {other.word_format.bit_size}-bit words to '
+                f'a buffer of {self._format.bit_size}-bit words'
+            )
+        if stop is None:
+            stop = len(other)
+        if isinstance(other, WordBuffer):
+            if start == 0 and stop == len(other):
+                self._values.extend(other.values)
+            else:
+                self._values.extend(other.values[start:stop])
+        else:
+            self.extend_fill(other.value, stop - start)
+
+    def extend_fill(self, value: int, count: int) -> None:
+        """Appends `count` copies of the passed word value."""
+        if count <= 0:
+            return
+        masked = self._check_value(value)
+        if isinstance(self._values, array):
+            self._values.extend(array(self._values.typecode, [masked]) * count)
+        else:
+            self._values.extend([masked] * count)
+
+    def extend_bytes(self, data: bytes | memoryview, pack_bytes: bool = False, pad_value: int = 0) -> None:
+        """
+        Appends raw byte data to the buffer without creating a Python object per byte.
+
+        How bytes map to words depends on the word bit size:
+
+        - Words smaller than 8 bits: each byte is split into `8 / bit_size` words, ordered per the
+          multi-word endianness. The word bit size must evenly divide 8.
+        - Words holding several whole bytes when `pack_bytes` is True: `bit_size // 8` bytes are packed
+          into each word, ordered per the multi-word endianness. A partial final word is padded with
+          `pad_value` bytes.
+        - Otherwise each byte is zero-extended into its own word.
+
+        :raises ValueError: If words smaller than 8 bits do not evenly divide a byte
+        """
+        word_format = self._format
+        bit_size = word_format.bit_size
+        byte_count = len(data)
+        if byte_count == 0:
+            return
+        if bit_size < 8:
+            if 8 % bit_size != 0:
+                raise ValueError(f'Cannot split bytes into {bit_size}-bit words')
+            words_per_byte = 8 // bit_size
+            split = bytearray(byte_count * words_per_byte)
+            for i in range(words_per_byte):
+                shift = 8 - (i + 1)*bit_size if word_format.multi_word_endianness == 'big' else i*bit_size
+                split[i::words_per_byte] = bytes(data).translate(_shift_table(shift, word_format.value_mask))
+            self._values.extend(array('B', split) if isinstance(self._values, array) else split)
+            return
+
+        word_bytes = bit_size // 8
+        if not pack_bytes or word_bytes == 1:
+            if isinstance(self._values, array) and self._values.itemsize == 1:
+                self._values.frombytes(data)
+            elif isinstance(self._values, array):
+                # widen each byte into the least significant byte of a native machine word
+                itemsize = self._values.itemsize
+                widened = bytearray(byte_count * itemsize)
+                widened[(0 if sys.byteorder == 'little' else itemsize - 1)::itemsize] = data
+                self._values.frombytes(widened)
+            else:
+                self._values.extend(bytes(data))
+            return
+
+        padded = bytes(data)
+        if byte_count % word_bytes != 0:
+            padded += bytes([pad_value & 0xFF]) * (word_bytes - byte_count % word_bytes)
+        if isinstance(self._values, array) and self._values.itemsize == word_bytes:
+            packed = array(self._values.typecode)
+            packed.frombytes(padded)
+            if word_format.multi_word_endianness != sys.byteorder:
+                packed.byteswap()
+            self._values.extend(packed)
+        else:
+            self._values.extend(
+                int.from_bytes(padded[i:i + word_bytes], word_format.multi_word_endianness)
+                for i in range(0, len(padded), word_bytes)
+            )
+
+    def to_bytes(self, compact: bool = True) -> bytes:
+        """
+        Converts the buffer to bytes.
+
+        If compact is True, the bits of the words are packed tightly in order from most significant bit
+        to least significant bit, ignoring intra-word endianness, exactly as `Word.words_to_bytes()` does
+        with `compact_bytes=True`. Otherwise each word is converted with `Word.to_bytes()` semantics and
+        the results are concatenated.
+        """
+        return WordBuffer.pack_values(self._values, self._format, compact)
+
+    @staticmethod
+    def pack_values(values: array | list[int], word_format: WordFormat, compact: bool = True) -> bytes:
+        """Converts a sequence of unsigned word values of the given format to bytes. See `to_bytes()`."""
+        bit_size = word_format.bit_size
+        if len(values) == 0:
+            return b''
+        if bit_size % 8 == 0 and (compact or word_format.segment_count == 1 or word_format.intra_word_endianness == 'big'):
+            word_bytes = bit_size // 8
+            if isinstance(values, array) and values.itemsize == word_bytes:
+                if word_bytes == 1:
+                    return values.tobytes()
+                swapped = array(values.typecode, values)
+                if sys.byteorder == 'little':
+                    swapped.byteswap()
+                return swapped.tobytes()
+            return b''.join(v.to_bytes(word_bytes, 'big') for v in values)
+        if not compact:
+            return b''.join(Word.from_format(v, word_format).to_bytes() for v in values)
+        # Compact packing of word sizes that are not a multiple of 8 bits. Every group of 8 words
+        # is exactly `bit_size` bytes long, so the values are packed a group at a time.
+        output = bytearray()
+        for group_start in range(0, len(values), 8):
+            group = values[group_start:group_start + 8]
+            accumulator = 0
+            for v in group:
+                accumulator = (accumulator << bit_size) | v
+            group_bits = len(group) * bit_size
+            pad_bits = (-group_bits) % 8
+            output.extend((accumulator << pad_bits).to_bytes((group_bits + pad_bits) // 8, 'big'))
+        return bytes(output)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import math
+from typing import Literal
+
+
+class WordFormat:
+    """
+    Describes the shape of the words generated for an instruction set architecture.
+
+    A WordFormat holds the ISA-wide word parameters that would otherwise be repeated by every
+    Word and every line object:
+
+    - bit size of a word
+    - size of the segments within a word
+    - intra-word endianness (segment order when emitting bytes)
+    - multi-word endianness (word order for values spanning several words)
+
+    WordFormat instances are immutable and interned, so `WordFormat.get()` returns the same object
+    for the same parameters. Validation of the parameters is done once when the format is first created.
+    """
+    __slots__ = (
+        '_bit_size',
+        '_segment_size',
+        '_intra_word_endianness',
+        '_multi_word_endianness',
+        '_value_mask',
+        '_min_value',
+    )
+
+    _interned: dict[tuple, WordFormat] = {}
+
+    def __init__(
+        self,
+        bit_size: int,
+        segment_size: int = 8,
+        intra_word_endianness: Literal['little', 'big'] = 'big',
+        multi_word_endianness: Literal['little', 'big'] = 'big',
+    ) -> None:
+        if bit_size <= 0:
+            raise ValueError('bit_size must be greater than 0')
+        if segment_size <= 0:
+            raise ValueError('segment_size must be greater than 0')
+        if bit_size % segment_size != 0:
+            raise ValueError(f'bit_size {bit_size} must be divisible by segment_size {segment_size}')
+        if segment_size > bit_size:
+            raise ValueError(f'segment_size {segment_size} cannot be greater than bit_size {bit_size}')
+        if intra_word_endianness not in ['little', 'big']:
+            raise ValueError('intra_word_endianness must be "little" or "big"')
+        if multi_word_endianness not in ['little', 'big']:
+            raise ValueError('multi_word_endianness must be "little" or "big"')
+        self._bit_size = bit_size
+        self._segment_size = segment_size
+        self._intra_word_endianness = intra_word_endianness
+        self._multi_word_endianness = multi_word_endianness
+        self._value_mask = (1 << bit_size) - 1
+        self._min_value = -(1 << (bit_size - 1))
+
+    @classmethod
+    def get(
+        cls,
+        bit_size: int,
+        segment_size: int = 8,
+        intra_word_endianness: Literal['little', 'big'] = 'big',
+        multi_word_endianness: Literal['little', 'big'] = 'big',
+    ) -> WordFormat:
+        """Returns the shared WordFormat instance for the passed parameters, creating it if needed."""
+        key = (bit_size, segment_size, intra_word_endianness, multi_word_endianness)
+        word_format = cls._interned.get(key)
+        if word_format is None:
+            word_format = cls(bit_size, segment_size, intra_word_endianness, multi_word_endianness)
+            cls._interned[key] = word_format
+        return word_format
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return f'WordFormat<{self._bit_size} bits, {self._segment_size}-bit segments, ' \
+               f'intra={self._intra_word_endianness}, multi={self._multi_word_endianness}>'
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WordFormat):
+            return (
+                self._bit_size == other._bit_size and
+                self._segment_size == other._segment_size and
+                self._intra_word_endianness == other._intra_word_endianness and
+                self._multi_word_endianness == other._multi_word_endianness
+            )
+        return False
+
+    def __hash__(self) -> int:
+        return hash((self._bit_size, self._segment_size, self._intra_word_endianness, self._multi_word_endianness))
+
+    @property
+    def bit_size(self) -> int:
+        """Returns the total number of bits in a word."""
+        return self._bit_size
+
+    @property
+    def segment_size(self) -> int:
+        """Returns the size of segments within a word."""
+        return self._segment_size
+
+    @property
+    def intra_word_endianness(self) -> Literal['little', 'big']:
+        """Returns the endianness of segments within a word."""
+        return self._intra_word_endianness
+
+    @property
+    def multi_word_endianness(self) -> Literal['little', 'big']:
+        """Returns the order of words for values that span multiple words."""
+        return self._multi_word_endianness
+
+    @property
+    def segment_count(self) -> int:
+        """Returns the number of segments in a word."""
+        return self._bit_size // self._segment_size
+
+    @property
+    def value_mask(self) -> int:
+        """Returns a mask covering all bits of a word."""
+        return self._value_mask
+
+    @property
+    def min_value(self) -> int:
+        """Returns the smallest (signed) value a word can hold."""
+        return self._min_value
+
+    @property
+    def ideal_hex_width(self) -> int:
+        """Returns the ideal width in hex digits for this word size."""
+        return math.ceil(self._bit_size / 4)
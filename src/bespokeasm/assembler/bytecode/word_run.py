@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from .word import Word
+from .word_buffer import WordBuffer
+from .word_format import WordFormat
+
+
+class WordRun:
+    """
+    A run-length sequence of `count` identical words.
+
+    Fill directives such as `.fill`, `.zero`, and `.zerountil` generate a WordRun rather than a WordBuffer
+    so that large padding regions are represented by a single (value, count) pair all the way through
+    image generation and pretty printing. A WordRun provides the same read interface as a WordBuffer.
+    """
+    __slots__ = ('_format', '_value', '_count')
+
+    def __init__(self, word_format: WordFormat, value: int, count: int) -> None:
+        if value < word_format.min_value or value > word_format.value_mask:
+            raise ValueError(
+                f'value {value} is out of range for bit_size {word_format.bit_size} '
+                f'(range: {word_format.min_value} to {word_format.value_mask})'
+            )
+        self._format = word_format
+        self._value = value & word_format.value_mask
+        self._count = max(count, 0)
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return f'WordRun<0x{self._value:x} x {self._count}, {self._format}>'
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Word]:
+        if self._count > 0:
+            word = Word.from_format(self._value, self._format)
+            for _ in range(self._count):
+                yield word
+
+    def __getitem__(self, index: int) -> Word:
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError('WordRun index out of range')
+        return Word.from_format(self._value, self._format)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WordRun):
+            return (
+                self._format == other._format and
+                self._count == other._count and
+                (self._value == other._value or self._count == 0)
+            )
+        if isinstance(other, (WordBuffer, list)):
+            return self.words() == list(other)
+        return False
+
+    @property
+    def word_format(self) -> WordFormat:
+        """Returns the shared format of the words in this run."""
+        return self._format
+
+    @property
+    def value(self) -> int:
+        """Returns the unsigned value repeated by this run."""
+        return self._value
+
+    @property
+    def count(self) -> int:
+        """Returns the number of words in this run."""
+        return self._count
+
+    def words(self) -> list[Word]:
+        """Returns a Word view for each word in this run."""
+        return list(self)
+
+    def to_bytes(self, compact: bool = True) -> bytes:
+        """Converts the run to bytes. See `WordBuffer.to_bytes()`."""
+        if self._count == 0:
+            return b''
+        bit_size = self._format.bit_size
+        if bit_size % 8 == 0 or not compact:
+            return WordBuffer.pack_values([self._value], self._format, compact) * self._count
+        # Every group of 8 compactly packed words is byte aligned, so a packed group can be repeated.
+        group_count, remainder = divmod(self._count, 8)
+        group_bytes = WordBuffer.pack_values([self._value] * 8, self._format, compact)
+        return group_bytes * group_count + WordBuffer.pack_values([self._value] * remainder, self._format, compact)
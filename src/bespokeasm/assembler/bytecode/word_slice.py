@@ -18,6 +18,7 @@ class WordSlice:
       - WordSlice(offset_bits, 12)     # 12-bit offset
       - These would be concatenated to form a 16-bit address Word
     """
+    __slots__ = ('_value', '_bit_size')
 
     def __init__(self, value: int, bit_size: int):
         """
@@ -0,0 +1,88 @@
+"""
+Checks whether assembly files assemble without producing any output, such as from a pre-commit hook.
+The ISA configuration is loaded once and shared by the checks of every file.
+"""
+import sys
+from typing import TextIO
+
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.engine import Assembler
+from bespokeasm.assembler.model import AssemblerModel
+
+
+class SyntaxChecker:
+    def __init__(
+                self,
+                config_file: str,
+                is_verbose: int,
+                include_paths: list[str],
+                predefined: list[str],
+                warnings_as_errors: bool = False,
+                max_errors: int = 1,
+                diagnostics_format: str = 'text',
+                diagnostics_output: TextIO | None = None,
+            ):
+        self._config_file = config_file
+        self._verbose = is_verbose
+        self._include_paths = include_paths
+        self._predefined_symbols = predefined
+        self._warnings_as_errors = warnings_as_errors
+        self._diagnostic_reporter = DiagnosticReporter(
+            warnings_as_errors=warnings_as_errors,
+            verbosity=is_verbose,
+            max_errors=max_errors,
+            diagnostics_format=diagnostics_format,
+            diagnostics_output=diagnostics_output,
+        )
+        try:
+            self._model = AssemblerModel(self._config_file, self._verbose, self._diagnostic_reporter)
+        except SystemExit as e:
+            self._diagnostic_reporter.exit_with_collected_errors(e)
+
+    @property
+    def model(self) -> AssemblerModel:
+        return self._model
+
+    def check(self, source_file: str, include_graph: dict[str, set[str]] | None = None) -> bool:
+        """
+        Returns True if the source file assembles. Its errors are reported as `compile` would report
+        them, and a failing file does not stop the checks of other files. If passed, `include_graph` is
+        updated with the files included by each file read, even if the source file does not assemble.
+        """
+        # each file starts without the labels and errors of the previously checked file
+        self._model.reset_global_label_scope()
+        self._diagnostic_reporter.clear_errors()
+        assembler = None
+        try:
+            assembler = Assembler(
+                source_file,
+                self._config_file,
+                False,
+                None,
+                0,
+                None,
+                0,
+                False,
+                None,
+                None,
+                self._verbose,
+                self._include_paths,
+                self._predefined_symbols,
+                self._warnings_as_errors,
+                model=self._model,
+            )
+            assembler.check()
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                # the errors were not already written as they were reported
+                print(e.code, file=sys.stderr)
+            return e.code is None or e.code == 0
+        finally:
+            if include_graph is not None and assembler is not None:
+                for filename, included_files in assembler.include_graph.items():
+                    include_graph.setdefault(filename, set()).update(included_files)
+        return True
+
+    def check_files(self, source_files: list[str]) -> list[str]:
+        """Checks each of the source files, returning the files that do not assemble."""
+        return [source_file for source_file in source_files if not self.check(source_file)]
@@ -1,21 +1,140 @@
 from __future__ import annotations
 
+import contextlib
+import json
+import re
 import sys
 from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import NamedTuple
+from typing import TextIO
 
 from bespokeasm.assembler.line_identifier import LineIdentifier
 
 
+DIAGNOSTICS_FORMATS = ('text', 'json')
+
+
+class RelatedLocation(NamedTuple):
+    """Another source line involved in a diagnostic, such as the other line of an address overlap."""
+    line_id: LineIdentifier
+    message: str
+
+
+class Diagnostic:
+    __slots__ = ('_severity', '_line_id', '_message', '_category', '_columns', '_related')
+
+    def __init__(
+        self,
+        severity: str,
+        line_id: LineIdentifier | None,
+        message: str,
+        category: str = 'user',
+        columns: tuple[int, int] | None = None,
+        related: Iterable[RelatedLocation] | None = None,
+    ) -> None:
+        self._severity = severity
+        self._line_id = line_id
+        self._message = message
+        self._category = category
+        self._columns = columns
+        self._related = tuple(related) if related is not None else ()
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def severity(self) -> str:
+        return self._severity
+
+    @property
+    def line_id(self) -> LineIdentifier | None:
+        return self._line_id
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    @property
+    def columns(self) -> tuple[int, int] | None:
+        """The zero-based start and end columns of the diagnostic within its line, if known."""
+        return self._columns
+
+    @property
+    def related(self) -> tuple[RelatedLocation, ...]:
+        return self._related
+
+    @property
+    def text(self) -> str:
+        if self._line_id is None:
+            return f'{self._severity}: {self._message}'
+        return f'{self._severity}: {self._line_id} - {self._message}'
+
+    @property
+    def sort_key(self) -> tuple[str, int, str]:
+        if self._line_id is None:
+            return ('', 0, self._message)
+        return (self._line_id.filename or '', self._line_id.line_num, self._message)
+
+    def to_dict(self) -> dict:
+        return {
+            'severity': self._severity.lower(),
+            'category': self._category,
+            'file': self._line_id.filename if self._line_id is not None else None,
+            'line': self._line_id.line_num if self._line_id is not None else None,
+            'columns': list(self._columns) if self._columns is not None else None,
+            'message': self._message,
+            'related': [
+                {'file': location.line_id.filename, 'line': location.line_id.line_num, 'message': location.message}
+                for location in self._related
+            ],
+        }
+
+
+class DiagnosticError(SystemExit):
+    """Raised by `DiagnosticReporter.error()`. Like `sys.exit()`, it stops assembly unless it is collected."""
+    def __init__(self, diagnostic: Diagnostic) -> None:
+        super().__init__(diagnostic.text)
+        self.diagnostic = diagnostic
+
+
+class ErrorReportExit(SystemExit):
+    """Raised with the report of all collected errors once assembly can't continue."""
+
+
 class DiagnosticReporter:
+    # matches the prefixes of error messages passed directly to sys.exit(), such as 'ERROR: <line id> - '
+    PATTERN_ERROR_PREFIX = re.compile(
+        r'^ERROR(?:\s*:\s*(?:file (?P<filename>.*?), line (?P<line_num>\d+)|INTERNAL)?)?\s*-?\s*'
+    )
+
     def __init__(
         self,
         warnings_as_errors: bool = False,
         verbosity: int = 0,
         categories_elevated: Iterable[str] | None = None,
+        max_errors: int = 1,
+        diagnostics_format: str = 'text',
+        diagnostics_output: TextIO | None = None,
     ) -> None:
         self._warnings_as_errors = warnings_as_errors
         self._verbosity = verbosity
         self._categories_elevated = set(categories_elevated or {'user'})
+        # a max_errors of 1 stops at the first error. 0 collects errors without limit.
+        self._max_errors = max_errors
+        self._errors: dict[str, Diagnostic] = {}
+        if diagnostics_format not in DIAGNOSTICS_FORMATS:
+            raise ValueError(f'Unknown diagnostics format: {diagnostics_format}')
+        self._diagnostics_format = diagnostics_format
+        # None writes to the stderr in use when a diagnostic is emitted
+        self._diagnostics_output = diagnostics_output
 
     @property
     def warnings_as_errors(self) -> bool:
@@ -25,21 +144,69 @@ class DiagnosticReporter:
     def verbosity(self) -> int:
         return self._verbosity
 
+    @property
+    def max_errors(self) -> int:
+        return self._max_errors
+
+    @property
+    def diagnostics_format(self) -> str:
+        return self._diagnostics_format
+
+    @property
+    def is_streaming_errors(self) -> bool:
+        """True if errors are written as they are reported rather than in the message assembly exits with."""
+        return self._diagnostics_format == 'json' or self._diagnostics_output is not None
+
+    @property
+    def is_collecting_errors(self) -> bool:
+        return self._max_errors != 1
+
+    @property
+    def errors(self) -> list[Diagnostic]:
+        """Returns the collected errors, deduplicated and sorted by file and line."""
+        return sorted(self._errors.values(), key=lambda diagnostic: diagnostic.sort_key)
+
+    def clear_errors(self) -> None:
+        """Forgets the collected errors, so the reporter can be reused for the assembly of another file."""
+        self._errors.clear()
+
     def _format(self, prefix: str, line_id: LineIdentifier | None, message: str) -> str:
-        if line_id is None:
-            return f'{prefix}: {message}'
-        return f'{prefix}: {line_id} - {message}'
+        return Diagnostic(prefix, line_id, message).text
 
-    def error(self, line_id: LineIdentifier | None, message: str, category: str = 'user') -> None:
-        text = self._format('ERROR', line_id, message)
-        sys.exit(text)
+    def _emit(self, diagnostic: Diagnostic) -> None:
+        """
+        Writes a diagnostic as soon as it is reported. JSON diagnostics are written one object per line and
+        flushed, so tools can consume them while assembly is still running.
+        """
+        output = self._diagnostics_output if self._diagnostics_output is not None else sys.stderr
+        if self._diagnostics_format == 'json':
+            output.write(json.dumps(diagnostic.to_dict()) + '\n')
+            output.flush()
+        else:
+            print(diagnostic.text, file=output)
 
-    def warn(self, line_id: LineIdentifier | None, message: str, category: str = 'user') -> None:
+    def error(
+        self,
+        line_id: LineIdentifier | None,
+        message: str,
+        category: str = 'user',
+        columns: tuple[int, int] | None = None,
+        related: Iterable[RelatedLocation] | None = None,
+    ) -> None:
+        raise DiagnosticError(Diagnostic('ERROR', line_id, message, category, columns, related))
+
+    def warn(
+        self,
+        line_id: LineIdentifier | None,
+        message: str,
+        category: str = 'user',
+        columns: tuple[int, int] | None = None,
+        related: Iterable[RelatedLocation] | None = None,
+    ) -> None:
         if self._warnings_as_errors and category in self._categories_elevated:
-            self.error(line_id, message, category=category)
+            self.error(line_id, message, category=category, columns=columns, related=related)
             return
-        text = self._format('WARNING', line_id, message)
-        print(text, file=sys.stderr)
+        self._emit(Diagnostic('WARNING', line_id, message, category, columns, related))
 
     def info(
         self,
@@ -50,5 +217,66 @@ class DiagnosticReporter:
     ) -> None:
         if self._verbosity < min_verbosity:
             return
-        text = self._format('INFO', line_id, message)
-        print(text, file=sys.stderr)
+        self._emit(Diagnostic('INFO', line_id, message, category))
+
+    @contextlib.contextmanager
+    def recovery_point(self, line_id: LineIdentifier | None) -> Iterator[None]:
+        """
+        Context manager around the processing of one line. When collecting errors, an error raised
+        within it, whether from `error()` or a direct `sys.exit()`, is recorded against the line and
+        processing continues after the block. Otherwise the error stops assembly as usual.
+        """
+        try:
+            yield
+        except SystemExit as e:
+            if not self.is_collecting_errors or isinstance(e, ErrorReportExit) or not isinstance(e.code, str):
+                raise
+            self._collect(DiagnosticReporter.diagnostic_from_exit(e, line_id))
+
+    @staticmethod
+    def diagnostic_from_exit(exit_exception: SystemExit, line_id: LineIdentifier | None) -> Diagnostic:
+        """Converts an error that stopped processing into a Diagnostic, recovering its line from its text if present."""
+        if isinstance(exit_exception, DiagnosticError):
+            return exit_exception.diagnostic
+        text = str(exit_exception.code)
+        prefix_match = DiagnosticReporter.PATTERN_ERROR_PREFIX.match(text)
+        if prefix_match is not None and prefix_match.group('line_num') is not None:
+            # the message names its own line, which may differ from the line being processed
+            line_id = LineIdentifier(int(prefix_match.group('line_num')), prefix_match.group('filename'))
+        message = text[prefix_match.end():] if prefix_match is not None else text
+        return Diagnostic('ERROR', line_id, message)
+
+    def _record(self, diagnostic: Diagnostic) -> None:
+        if diagnostic.text not in self._errors:
+            self._errors[diagnostic.text] = diagnostic
+            if self.is_streaming_errors:
+                self._emit(diagnostic)
+
+    def _collect(self, diagnostic: Diagnostic) -> None:
+        self._record(diagnostic)
+        if self._max_errors > 0 and len(self._errors) >= self._max_errors:
+            raise self._error_report(f'stopping after {len(self._errors)} errors')
+
+    def _error_report(self, summary: str) -> ErrorReportExit:
+        if self.is_streaming_errors:
+            # each error was already written as it was collected
+            return ErrorReportExit(1)
+        return ErrorReportExit('\n'.join([*(diagnostic.text for diagnostic in self.errors), summary]))
+
+    def raise_collected_errors(self) -> None:
+        """Stops assembly with a report of the collected errors, if there are any."""
+        if len(self._errors) > 0:
+            error_count = len(self._errors)
+            raise self._error_report(f'{error_count} error{"s" if error_count != 1 else ""} found')
+
+    def exit_with_collected_errors(self, exit_exception: SystemExit) -> None:
+        """
+        Called with an error that stopped assembly outside of a recovery point. Re-raises it, or if
+        errors were already collected or are streamed, reports it along with the collected errors.
+        """
+        if isinstance(exit_exception, ErrorReportExit) or not isinstance(exit_exception.code, str):
+            raise exit_exception
+        if len(self._errors) == 0 and not self.is_streaming_errors:
+            raise exit_exception
+        self._record(DiagnosticReporter.diagnostic_from_exit(exit_exception, None))
+        self.raise_collected_errors()
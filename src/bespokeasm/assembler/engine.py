@@ -1,22 +1,40 @@
+import functools
+import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TextIO
 
 import click
 from bespokeasm.assembler.assembly_file import AssemblyFile
 from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_buffer import WordBuffer
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.diagnostic_reporter import RelatedLocation
 from bespokeasm.assembler.label_scope import LabelScopeType
 from bespokeasm.assembler.label_scope.named_scope_manager import NamedScopeManager
 from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.line_object.directive_line.fill_data import FillUntilDataLine
+from bespokeasm.assembler.line_object.directive_line.include_binary import IncludeBinaryLine
 from bespokeasm.assembler.line_object.instruction_line import InstructionLine
 from bespokeasm.assembler.line_object.label_line import LabelLine
 from bespokeasm.assembler.line_object.predefined_data import PredefinedDataLine
+from bespokeasm.assembler.memory_zone import MemoryZone
+from bespokeasm.assembler.memory_zone.manager import GLOBAL_ZONE_NAME
 from bespokeasm.assembler.memory_zone.manager import MemoryZoneManager
+from bespokeasm.assembler.memory_zone.occupancy import format_memory_map
+from bespokeasm.assembler.memory_zone.occupancy import memory_map_report
+from bespokeasm.assembler.memory_zone.occupancy import OccupancyIndex
 from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.output_target import OutputTarget
+from bespokeasm.assembler.output_target import unique_output_targets
+from bespokeasm.assembler.output_target import validate_output_targets
 from bespokeasm.assembler.preprocessor import Preprocessor
 from bespokeasm.assembler.pretty_printer.factory import PrettyPrinterFactory
+from bespokeasm.assembler.pretty_printer.line_stats import LineStats
 
 
 class Assembler:
@@ -36,6 +54,14 @@ class Assembler:
                 include_paths: list[str],
                 predefined: list[str],
                 warnings_as_errors: bool = False,
+                emit_targets: list[str] | None = None,
+                split_by_memzone: bool = False,
+                depfile: str | None = None,
+                print_memory_map: bool = False,
+                max_errors: int = 1,
+                diagnostics_format: str = 'text',
+                diagnostics_output: TextIO | None = None,
+                model: AssemblerModel | None = None,
             ):
         self._source_file = source_file
         self._output_file = output_file
@@ -51,13 +77,83 @@ class Assembler:
         self._include_paths = include_paths
         self._predefined_symbols = predefined
         self._warnings_as_errors = warnings_as_errors
-        self._diagnostic_reporter = DiagnosticReporter(
-            warnings_as_errors=self._warnings_as_errors,
-            verbosity=self._verbose,
-        )
-        self._model = AssemblerModel(self._config_file, self._verbose, self._diagnostic_reporter)
+        self._split_by_memzone = split_by_memzone
+        self._depfile = depfile
+        self._print_memory_map = print_memory_map
+        self._include_graph: dict[str, set[str]] = {}
+        if model is not None:
+            # a model shared by several assemblies reports through its own diagnostic reporter, as
+            # the instruction set parses lines with it
+            self._diagnostic_reporter = model.diagnostic_reporter
+        else:
+            self._diagnostic_reporter = DiagnosticReporter(
+                warnings_as_errors=self._warnings_as_errors,
+                verbosity=self._verbose,
+                max_errors=max_errors,
+                diagnostics_format=diagnostics_format,
+                diagnostics_output=diagnostics_output,
+            )
+        try:
+            self._model = model if model is not None else AssemblerModel(
+                self._config_file,
+                self._verbose,
+                self._diagnostic_reporter,
+            )
+            self._output_targets = self._create_output_targets(emit_targets)
+        except SystemExit as e:
+            # configuration errors are reported in the requested diagnostics format too
+            self._diagnostic_reporter.exit_with_collected_errors(e)
+
+    def _create_output_targets(self, emit_targets: list[str] | None) -> list[OutputTarget]:
+        # All outputs are produced from one assembly run. The binary and pretty print options are
+        # converted into output targets alongside any `--emit format[=path]` targets.
+        output_targets: list[OutputTarget] = []
+        if self._generate_binary:
+            output_targets.append(OutputTarget('binary', self._output_file))
+        if self._enable_pretty_print:
+            output_targets.append(OutputTarget(self._pretty_print_format, self._pretty_print_output))
+        # emitted outputs without a path are named after the binary output file
+        emit_base_file = self._output_file if self._output_file is not None else self._source_file
+        for emit_option in (emit_targets if emit_targets is not None else []):
+            output_targets.append(OutputTarget.from_emit_option(emit_option, emit_base_file))
+        output_targets = unique_output_targets(output_targets)
+        validate_output_targets(output_targets)
+        if self._depfile is not None and all(target.is_stdout for target in output_targets):
+            sys.exit(f'ERROR - cannot write dependency file {self._depfile} because no output files are written')
+        return output_targets
+
+    @property
+    def include_graph(self) -> dict[str, set[str]]:
+        """
+        The assembly and binary files included by each assembly file read by the last assembly, keyed
+        by the including file's path. Files that include nothing are not keys.
+        """
+        return self._include_graph
 
     def assemble_bytecode(self):
+        try:
+            self._assemble_bytecode()
+        except SystemExit as e:
+            # an error outside of a line's recovery point, reported along with any collected errors
+            self._diagnostic_reporter.exit_with_collected_errors(e)
+
+    def check(self):
+        """
+        Checks that the source assembles, reporting the same errors as `assemble_bytecode()`. Lines are
+        parsed, assigned addresses, and have their values checked against their allowed ranges, but where
+        possible without generating their words, and no byte code or output is produced. Any error stops
+        the check by exiting.
+        """
+        try:
+            self._assemble_bytecode(check_only=True)
+        except SystemExit as e:
+            self._diagnostic_reporter.exit_with_collected_errors(e)
+        except Exception as e:
+            # errors raised rather than exited with, such as expression syntax errors, are reported the same way
+            message = str(e) if str(e).startswith('ERROR') else f'ERROR: {type(e).__name__}: {e}'
+            self._diagnostic_reporter.exit_with_collected_errors(SystemExit(message))
+
+    def _assemble_bytecode(self, check_only: bool = False):
         # Create the named scope manager for this assembly session
         diagnostic_reporter = self._diagnostic_reporter
         named_scope_manager = NamedScopeManager(diagnostic_reporter)
@@ -134,12 +230,16 @@ class Assembler:
             )
 
         asm_file = AssemblyFile(self._source_file, global_label_scope, named_scope_manager, diagnostic_reporter)
+        assembly_files_used: set[str] = set()
+        self._include_graph = {}
         line_obs: list[LineObject] = asm_file.load_line_objects(
             self._model,
             include_dirs,
             memzone_manager,
             preprocessor,
-            self._verbose
+            self._verbose,
+            assembly_files_used=assembly_files_used,
+            include_graph=self._include_graph,
         )
 
         if self._verbose > 2:
@@ -150,49 +250,61 @@ class Assembler:
             )
 
         compilable_line_obs: list[LineObject] = [lobj for lobj in line_obs if lobj.compilable]
+        # column width statistics for the pretty printers are gathered as lines are visited
+        line_stats = LineStats()
+        # the address ranges occupied by byte code, used to detect overlaps as addresses are assigned
+        occupancy = OccupancyIndex()
         # First pass: assign addresses to labels
         for lobj in compilable_line_obs:
-            lobj.set_start_address(lobj.memory_zone.current_address)
-            if lobj.address is None:
-                diagnostic_reporter.error(
-                    lobj.line_id,
-                    f'INTERNAL line object address is None. Memory zone = {lobj.memory_zone}',
-                )
+            with diagnostic_reporter.recovery_point(lobj.line_id):
+                lobj.set_start_address(lobj.memory_zone.current_address)
+                if lobj.address is None:
+                    diagnostic_reporter.error(
+                        lobj.line_id,
+                        f'INTERNAL line object address is None. Memory zone = {lobj.memory_zone}',
+                    )
 
-            try:
-                word_count = lobj.word_count
-                if isinstance(lobj, InstructionLine) and lobj.has_operand_labels:
-                    lobj.register_operand_labels(named_scope_manager)
-                if isinstance(lobj, FillUntilDataLine) and word_count == 0:
-                    diagnostic_reporter.warn(
+                try:
+                    word_count = lobj.word_count
+                    line_stats.add(lobj, word_count)
+                    # advance first so a line after a collected error here is still placed after this one
+                    lobj.memory_zone.current_address = lobj.address + word_count
+                    if isinstance(lobj, LineWithWords):
+                        Assembler._add_occupied_range(occupancy, lobj, word_count, diagnostic_reporter)
+                    if isinstance(lobj, InstructionLine) and lobj.has_operand_labels:
+                        lobj.register_operand_labels(named_scope_manager)
+                    if isinstance(lobj, FillUntilDataLine) and word_count == 0:
+                        diagnostic_reporter.warn(
+                            lobj.line_id,
+                            '.zerountil target address is before the current address; no bytes emitted',
+                        )
+                except ValueError as e:
+                    diagnostic_reporter.error(
                         lobj.line_id,
-                        '.zerountil target address is before the current address; no bytes emitted',
+                        str(e),
                     )
-                lobj.memory_zone.current_address = lobj.address + word_count
-            except ValueError as e:
-                diagnostic_reporter.error(
-                    lobj.line_id,
-                    str(e),
-                )
 
-            if isinstance(lobj, LabelLine) and not lobj.is_constant:
-                # Address labels: try to add to named scope first (only if in same file as scope creation)
-                # is_constant=False by default for address labels
-                if not named_scope_manager.set_label_value(
-                    lobj.get_label(),
-                    lobj.get_value(),
-                    lobj.line_id,
-                    lobj.active_named_scopes
-                ):
-                    # if not in an active named scope, set to the current scope
-                    lobj.label_scope.set_label_value(
+                if isinstance(lobj, LabelLine) and not lobj.is_constant:
+                    # Address labels: try to add to named scope first (only if in same file as scope creation)
+                    # is_constant=False by default for address labels
+                    if not named_scope_manager.set_label_value(
                         lobj.get_label(),
                         lobj.get_value(),
                         lobj.line_id,
-                    )
+                        lobj.active_named_scopes
+                    ):
+                        # if not in an active named scope, set to the current scope
+                        lobj.label_scope.set_label_value(
+                            lobj.get_label(),
+                            lobj.get_value(),
+                            lobj.line_id,
+                        )
 
         # now merge prefined line objects and parsed line objects
         compilable_line_obs.extend(predefined_line_obs)
+        for lobj in predefined_line_obs:
+            line_stats.add(lobj, lobj.word_count)
+            Assembler._add_occupied_range(occupancy, lobj, lobj.word_count, diagnostic_reporter)
 
         # Sort lines according to their assigned address. This allows for .org directives
         compilable_line_obs.sort(key=lambda x: x.address)
@@ -203,41 +315,37 @@ class Assembler:
             if isinstance(lobj, LineWithWords) and not lobj.is_muted
         }
 
-        # second pass: build the machine code and check for overlaps
+        # second pass: build the machine code
         if self._verbose > 2:
             diagnostic_reporter.info(
                 None,
                 '\nProcessing lines:',
                 min_verbosity=3,
             )
-        bytecode = bytearray()
-        last_line = None
-
         for lobj in compilable_line_obs:
             if isinstance(lobj, LineWithWords):
-                try:
-                    lobj.generate_words()
-                except ValueError as e:
-                    diagnostic_reporter.error(
-                        lobj.line_id,
-                        str(e),
-                    )
+                with diagnostic_reporter.recovery_point(lobj.line_id):
+                    try:
+                        if check_only:
+                            lobj.validate()
+                        else:
+                            lobj.generate_words()
+                    except ValueError as e:
+                        diagnostic_reporter.error(
+                            lobj.line_id,
+                            str(e),
+                        )
             if self._verbose > 2:
                 diagnostic_reporter.info(
                     None,
                     f'Processing {lobj.line_id} = {lobj} at address ${lobj.address:x}',
                     min_verbosity=3,
                 )
-            if isinstance(lobj, LineWithWords):
-                if last_line is not None and (last_line.address + last_line.word_count) > lobj.address:
-                    diagnostic_reporter.error(
-                        lobj.line_id,
-                        'Address of byte code at this line overlaps with bytecode from '
-                        f'line <{last_line.line_id}> at address {hex(lobj.address)}\n'
-                        f'  memory zone of current line <{lobj.line_id}> = {lobj.memory_zone}\n'
-                        f'  memory zone of other line <{last_line.line_id}> = {last_line.memory_zone}',
-                    )
-                last_line = lobj
+
+        # any errors collected while assembling stop the assembly before outputs are written
+        diagnostic_reporter.raise_collected_errors()
+        if check_only:
+            return
 
         # Finally generate the binary image
         fill_word = Word(
@@ -247,7 +355,29 @@ class Assembler:
             self._model.intra_word_endianness,
         )
 
-        if self._generate_binary:
+        bytecode = None
+        zone_images = None
+        if not any(target.format == 'binary' for target in self._output_targets):
+            if self._verbose > 1:
+                diagnostic_reporter.info(
+                    None,
+                    'NOT writing byte code to binary image.',
+                    min_verbosity=2,
+                )
+        elif self._split_by_memzone:
+            zones = [zone for zone in memzone_manager.zones if zone.name != GLOBAL_ZONE_NAME]
+            if len(zones) == 0:
+                sys.exit(
+                    'ERROR - splitting the binary image by memory zone requires at least one '
+                    'memory zone other than GLOBAL'
+                )
+            zone_images = Assembler._generate_zone_images(
+                compilable_line_obs,
+                zones,
+                fill_word,
+                diagnostic_reporter,
+            )
+        else:
             bytecode = Assembler._generate_bytes(
                 line_dict,
                 max_generated_address,
@@ -256,29 +386,200 @@ class Assembler:
                 self._binary_end,
                 self._verbose,
             )
-            click.echo(f'Writing {len(bytecode)} bytes of byte code to {self._output_file}')
-            with open(self._output_file, 'wb') as f:
-                f.write(bytecode)
-        elif self._verbose > 1:
-            diagnostic_reporter.info(
-                None,
-                'NOT writing byte code to binary image.',
-                min_verbosity=2,
+
+        # Writers only read the assembled line objects, so outputs going to different files are
+        # written concurrently. Output to stdout is written serially to keep it in order.
+        memory_map = None
+        if self._print_memory_map or any(target.format == 'memory_map' for target in self._output_targets):
+            memory_map = memory_map_report(occupancy, memzone_manager.zones, self._model.word_size)
+
+        write_output = functools.partial(
+            self._write_output,
+            line_objs=compilable_line_obs,
+            line_stats=line_stats,
+            named_scope_manager=named_scope_manager,
+            bytecode=bytecode,
+            zone_images=zone_images,
+            memory_map=memory_map,
+        )
+        file_targets = [target for target in self._output_targets if not target.is_stdout]
+        if len(file_targets) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(file_targets), os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(write_output, target) for target in file_targets]
+                # re-raises any error or SystemExit from a writer thread
+                for future in futures:
+                    future.result()
+        else:
+            for target in file_targets:
+                write_output(target)
+        for target in self._output_targets:
+            if target.is_stdout:
+                write_output(target)
+
+        if self._print_memory_map:
+            click.echo(format_memory_map(memory_map, self._model.address_size), nl=False)
+
+        if self._depfile is not None:
+            # the dependencies are the ISA config, every assembly file read, and every .incbin file
+            dependencies = {self._config_file, *assembly_files_used}
+            dependencies.update(
+                lobj.filepath for lobj in compilable_line_obs
+                if isinstance(lobj, IncludeBinaryLine) and lobj.filepath is not None
             )
+            Assembler._write_depfile(self._depfile, self._output_file_paths(zone_images), sorted(dependencies))
 
-        if self._enable_pretty_print:
-            pprinter = PrettyPrinterFactory.getPrettyPrinter(
-                self._pretty_print_format,
-                compilable_line_obs,
-                self._model,
-                self._source_file,
+    def _write_output(
+                self,
+                target: OutputTarget,
+                line_objs: list[LineObject],
+                line_stats: LineStats,
+                named_scope_manager: NamedScopeManager,
+                bytecode: bytearray | None,
+                zone_images: dict[str, bytearray] | None,
+                memory_map: dict | None,
+            ) -> None:
+        if target.format == 'binary':
+            if zone_images is not None:
+                for zone_name, zone_bytecode in zone_images.items():
+                    Assembler._write_binary_file(Assembler._zone_image_path(target.path, zone_name), zone_bytecode)
+            else:
+                Assembler._write_binary_file(target.path, bytecode)
+            return
+        if target.format == 'memory_map':
+            if target.is_stdout:
+                json.dump(memory_map, sys.stdout, indent=2)
+                print()
+            else:
+                with open(target.path, 'w') as f:
+                    json.dump(memory_map, f, indent=2)
+                    f.write('\n')
+            return
+        pprinter = PrettyPrinterFactory.getPrettyPrinter(
+            target.format,
+            line_objs,
+            self._model,
+            self._source_file,
+            line_stats,
+            named_scope_manager,
+        )
+        if target.is_stdout:
+            pprinter.write(sys.stdout)
+            print()
+        else:
+            with open(target.path, 'w') as f:
+                pprinter.write(f)
+
+    @staticmethod
+    def _add_occupied_range(
+                occupancy: OccupancyIndex,
+                lobj: LineWithWords,
+                word_count: int,
+                diagnostic_reporter: DiagnosticReporter,
+            ) -> None:
+        other_line = occupancy.add(lobj.address, word_count, lobj)
+        if other_line is not None:
+            diagnostic_reporter.error(
+                lobj.line_id,
+                'Address of byte code at this line overlaps with bytecode from '
+                f'line <{other_line.line_id}> at address {hex(lobj.address)}\n'
+                f'  memory zone of current line <{lobj.line_id}> = {lobj.memory_zone}\n'
+                f'  memory zone of other line <{other_line.line_id}> = {other_line.memory_zone}',
+                related=[RelatedLocation(other_line.line_id, 'overlapping byte code')],
             )
-            pretty_str = pprinter.pretty_print()
-            if self._pretty_print_output == 'stdout':
-                print(pretty_str)
+
+    def _output_file_paths(self, zone_images: dict[str, bytearray] | None) -> list[str]:
+        """Returns the paths of all files written by the output targets."""
+        paths: list[str] = []
+        for target in self._output_targets:
+            if target.is_stdout:
+                continue
+            if target.format == 'binary' and zone_images is not None:
+                paths.extend(Assembler._zone_image_path(target.path, zone_name) for zone_name in zone_images)
             else:
-                with open(self._pretty_print_output, 'w') as f:
-                    f.write(pretty_str)
+                paths.append(target.path)
+        return paths
+
+    @staticmethod
+    def _zone_image_path(path: str, zone_name: str) -> str:
+        """Returns the path of a memory zone's binary image, made by inserting the zone name before the extension."""
+        path_root, path_ext = os.path.splitext(path)
+        return f'{path_root}.{zone_name}{path_ext}'
+
+    @staticmethod
+    def _write_depfile(depfile: str, targets: list[str], dependencies: list[str]) -> None:
+        """
+        Writes a make compatible dependency file stating that the output files depend on the passed
+        files. Build systems such as make and ninja use this to skip assembling when none of the
+        dependencies have changed.
+        """
+        def escape(path: str) -> str:
+            return path.replace('$', '$$').replace(' ', '\\ ').replace('#', '\\#')
+
+        with open(depfile, 'w') as f:
+            f.write(' '.join(escape(target) for target in targets) + ':')
+            for dependency in dependencies:
+                f.write(f' \\\n  {escape(dependency)}')
+            f.write('\n')
+
+    @staticmethod
+    def _write_binary_file(path: str, bytecode: bytearray) -> None:
+        click.echo(f'Writing {len(bytecode)} bytes of byte code to {path}')
+        with open(path, 'wb') as f:
+            f.write(bytecode)
+
+    @classmethod
+    def _generate_zone_images(
+        cls,
+        line_objs: list[LineObject],
+        zones: list[MemoryZone],
+        fill_word: Word,
+        diagnostic_reporter: DiagnosticReporter,
+    ) -> dict[str, bytearray]:
+        """
+        Generates one binary image per memory zone, each spanning the zone's full address range with
+        unused addresses set to the fill word. All images are built in a single walk over the address
+        sorted line objects. Zones may overlap, and a line crossing a zone boundary contributes only
+        its words inside the zone.
+        """
+        zones = sorted(zones, key=lambda zone: zone.start)
+        images = {zone.name: WordBuffer(fill_word.word_format) for zone in zones}
+        next_addresses = {zone.name: zone.start for zone in zones}
+        active_zones: list[MemoryZone] = []
+        next_zone_idx = 0
+        reported_unzoned = False
+        for lobj in line_objs:
+            if not isinstance(lobj, LineWithWords) or lobj.is_muted:
+                continue
+            lobj_buffer = lobj.get_word_buffer()
+            if len(lobj_buffer) == 0:
+                continue
+            first_address = lobj.address
+            last_address = lobj.address + len(lobj_buffer) - 1
+            # zones are activated as the walk reaches their start and retired once it passes their end
+            while next_zone_idx < len(zones) and zones[next_zone_idx].start <= last_address:
+                active_zones.append(zones[next_zone_idx])
+                next_zone_idx += 1
+            active_zones = [zone for zone in active_zones if zone.end >= first_address]
+            for zone in active_zones:
+                zone_first = max(first_address, zone.start)
+                zone_last = min(last_address, zone.end)
+                image = images[zone.name]
+                image.extend_fill(fill_word.value, zone_first - next_addresses[zone.name])
+                image.extend_buffer(lobj_buffer, zone_first - first_address, zone_last - first_address + 1)
+                next_addresses[zone.name] = zone_last + 1
+            if len(active_zones) == 0 and not reported_unzoned:
+                diagnostic_reporter.warn(
+                    lobj.line_id,
+                    f'byte code at address {hex(lobj.address)} is not in any memory zone and is '
+                    'omitted from the per memory zone binary images',
+                )
+                reported_unzoned = True
+        zone_images: dict[str, bytearray] = {}
+        for zone in zones:
+            image = images[zone.name]
+            image.extend_fill(fill_word.value, zone.end + 1 - next_addresses[zone.name])
+            zone_images[zone.name] = bytearray(image.to_bytes(compact=True))
+        return zone_images
 
     @classmethod
     def _generate_bytes(
@@ -290,23 +591,33 @@ class Assembler:
         end_address: int,
         log_level: int,
     ) -> bytearray:
-        words = []
+        image = WordBuffer(fill_word.word_format)
         addr = start_address
         if log_level > 2:
             print('\nGenerating byte code:')
-        while addr <= (max_generated_address if end_address is None else end_address):
+        last_address = max_generated_address if end_address is None else end_address
+        fill_start = None
+        while addr <= last_address:
             lobj = line_dict.get(addr, None)
-            word_advance = 1
             if lobj is not None and isinstance(lobj, LineWithWords):
-                lobj_words = lobj.get_words()
-                words.extend(lobj_words)
-                word_advance = lobj.word_count
+                if fill_start is not None:
+                    image.extend_fill(fill_word.value, addr - fill_start)
+                    fill_start = None
+                lobj_buffer = lobj.get_word_buffer()
+                image.extend_buffer(lobj_buffer)
                 if log_level > 2:
-                    word_str = ', '.join(f'0x{w.value:x}' for w in lobj_words)
+                    if isinstance(lobj_buffer, WordRun):
+                        word_str = f'0x{lobj_buffer.value:x} x {len(lobj_buffer)}'
+                    else:
+                        word_str = ', '.join(f'0x{v:x}' for v in lobj_buffer.values)
                     click.echo(f'Address ${addr:x} : {lobj} words = [{word_str}]')
+                addr += lobj.word_count
             else:
-                words.append(fill_word)
-            addr += word_advance
+                if fill_start is None:
+                    fill_start = addr
+                addr += 1
+        if fill_start is not None:
+            image.extend_fill(fill_word.value, addr - fill_start)
 
-        # Use compact_bytes=True to pack bits for arbitrary word sizes
-        return Word.words_to_bytes(words, compact_bytes=True)
+        # Use compact packing to pack bits for arbitrary word sizes
+        return bytearray(image.to_bytes(compact=True))
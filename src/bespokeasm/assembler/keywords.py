@@ -3,7 +3,7 @@ COMPILER_DIRECTIVES_SET = {
 }
 
 BYTECODE_DIRECTIVES_SET = {
-    'fill', 'zero', 'zerountil',
+    'fill', 'zero', 'zerountil', 'incbin',
     'byte', '2byte', '4byte', '8byte', '16byte', 'cstr', 'asciiz',
 }
 
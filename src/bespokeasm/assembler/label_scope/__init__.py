@@ -42,6 +42,7 @@ from __future__ import annotations
 
 import enum
 import sys
+from collections.abc import Iterator
 
 from bespokeasm.assembler.keywords import ASSEMBLER_KEYWORD_SET
 from bespokeasm.assembler.line_identifier import LineIdentifier
@@ -75,10 +76,13 @@ class LabelScopeType(enum.Enum):
 
 class LabelScope:
     class LabelInfo:
-        def __init__(self, label: str, value: int, line_id: LineIdentifier) -> None:
+        __slots__ = ('_label', '_value', '_line_id', '_is_constant')
+
+        def __init__(self, label: str, value: int, line_id: LineIdentifier, is_constant: bool = False) -> None:
             self._label = label
             self._value = value
             self._line_id = line_id
+            self._is_constant = is_constant
 
         def __repr__(self) -> str:
             return str(self)
@@ -98,11 +102,27 @@ class LabelScope:
         def line_id(self) -> int:
             return self._line_id
 
-    def __init__(self, scope_type: LabelScopeType, parent: LabelScope, scope_reference: str) -> None:
+        @property
+        def is_constant(self) -> bool:
+            return self._is_constant
+
+    def __init__(
+                self,
+                scope_type: LabelScopeType,
+                parent: LabelScope,
+                scope_reference: str,
+                register_with_parent: bool = True,
+            ) -> None:
         self._type = scope_type
         self._parent = parent
         self._reference = scope_reference
         self._labels = {}
+        # child scopes are tracked so that all labels can be enumerated from the global scope. A scope
+        # that outlives its parent's use, such as one per editor document, is left untracked so the
+        # parent does not keep it alive.
+        self._children: list[LabelScope] = []
+        if parent is not None and register_with_parent:
+            parent._children.append(self)
 
     def __repr__(self) -> str:
         return str(self)
@@ -122,6 +142,19 @@ class LabelScope:
     def reference(self) -> str:
         return self._reference
 
+    @property
+    def labels(self) -> list[LabelScope.LabelInfo]:
+        """Returns the labels and constants defined directly in this scope."""
+        return list(self._labels.values())
+
+    def iter_scopes(self) -> Iterator[LabelScope]:
+        """Yields this scope followed by all of its descendant scopes."""
+        pending = [self]
+        while len(pending) > 0:
+            scope = pending.pop()
+            yield scope
+            pending.extend(reversed(scope._children))
+
     def get_label_value(self, label: str, line_id: LineIdentifier) -> int:
         if label in self._labels:
             return self._labels[label].value
@@ -130,7 +163,14 @@ class LabelScope:
         else:
             return None
 
-    def set_label_value(self, label: str, value: int, line_id: LineIdentifier, scope: LabelScopeType = None) -> None:
+    def set_label_value(
+                self,
+                label: str,
+                value: int,
+                line_id: LineIdentifier,
+                scope: LabelScopeType = None,
+                is_constant: bool = False,
+            ) -> None:
         label_scope = LabelScopeType.get_label_scope(label) if scope is None else scope
         # first check to see if label name is a keyword
         # remove label prefix for checking
@@ -138,10 +178,10 @@ class LabelScope:
         if base_label in ASSEMBLER_KEYWORD_SET:
             sys.exit(f"ERROR: {line_id} - Label '{label}' is unallowed because it used an assembler keyword '{base_label}'")
         if label_scope.value < self.type.value:
-            self.parent.set_label_value(label, value, line_id)
+            self.parent.set_label_value(label, value, line_id, is_constant=is_constant)
         elif label_scope == self.type:
             if label not in self._labels:
-                self._labels[label] = LabelScope.LabelInfo(label, value, line_id)
+                self._labels[label] = LabelScope.LabelInfo(label, value, line_id, is_constant)
             else:
                 sys.exit(f"ERROR: {line_id} - Label '{label}' is defined multiple times at scope {self}")
         else:
@@ -157,6 +197,11 @@ class LabelScope:
             cls._global_scope = GlobalLabelScope(register_labels)
         return cls._global_scope
 
+    @classmethod
+    def reset_global_scope(cls) -> None:
+        """Discards the global scope, and with it every label, so the next assembly starts from an empty one."""
+        cls._global_scope = None
+
 
 class GlobalLabelScope(LabelScope):
     def __init__(self, register_labels: set[str]) -> None:
@@ -167,10 +167,15 @@ class NamedScopeManager:
                         # Label prefix matches but wrong file
                         # Let it fall back to normal scope hierarchy
                         return False
-                    scope.set_label_value(label, value, line_id, LabelScopeType.NAMED)
+                    scope.set_label_value(label, value, line_id, LabelScopeType.NAMED, is_constant=is_constant)
                     return True
         return False
 
+    @property
+    def scopes(self) -> list[NamedLabelScope]:
+        """Returns all named scope definitions in the order they were created."""
+        return list(self._scope_definitions.values())
+
     def get_scope_definition(self, name: str) -> NamedLabelScope | None:
         """Get a named scope definition by name.
 
@@ -191,6 +196,7 @@ class ActiveNamedScopeList(list[str]):
     def __init__(self, named_scope_manager: NamedScopeManager):
         super().__init__()
         self._named_scope_manager = named_scope_manager
+        self._snapshot: ActiveNamedScopeList | None = None
 
     def copy(self) -> ActiveNamedScopeList:
         """Copy the active named scopes list, keeping a reference to the same named scope manager."""
@@ -198,20 +204,34 @@ class ActiveNamedScopeList(list[str]):
         new_list.extend(self)
         return new_list
 
+    def snapshot(self) -> ActiveNamedScopeList:
+        """Returns a copy of the current state that is shared by every caller until this list changes.
+
+        Line objects hold the active named scopes in effect when they were parsed. Since the active
+        scopes rarely change from line to line, sharing one snapshot avoids a list copy per line object.
+        The returned list must not be modified.
+        """
+        if self._snapshot is None:
+            self._snapshot = self.copy()
+        return self._snapshot
+
     def activate_named_scope(self, name: str):
         """Activates a named scope for this line object. If already active, move to top of precedence."""
         if name in self:
             self.remove(name)
         self.insert(0, name)
+        self._snapshot = None
 
     def deactivate_named_scope(self, name: str):
         """Deactivates a named scope for this line object. If not active, do nothing."""
         if name in self:
             self.remove(name)
+            self._snapshot = None
 
     def clear_active_named_scopes(self):
         """Clears all active named scopes for this line object."""
         self.clear()
+        self._snapshot = None
 
     @property
     def named_scope_manager(self) -> NamedScopeManager:
@@ -1,4 +1,6 @@
 class LineIdentifier:
+    __slots__ = ('_filename', '_line_num')
+
     def __init__(self, line_num: int, filename: str = None) -> None:
         self._filename = filename
         self._line_num = line_num
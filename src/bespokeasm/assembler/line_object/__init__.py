@@ -1,6 +1,9 @@
 from typing import Literal
 
 from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_buffer import WordBuffer
+from bespokeasm.assembler.bytecode.word_format import WordFormat
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.label_scope import LabelScope
 from bespokeasm.assembler.label_scope.named_scope_manager import ActiveNamedScopeList
 from bespokeasm.assembler.line_identifier import LineIdentifier
@@ -15,6 +18,19 @@ INSTRUCTION_EXPRESSION_PATTERN = r'(?:{}|(?:[ \t]*)(?!(?:[ \t]*\;|[ \t]*\v)|{}))
 
 
 class LineObject:
+    __slots__ = (
+        '_line_id',
+        '_instruction',
+        '_comment',
+        '_address',
+        '_label_scope',
+        '_memzone',
+        '_compilable',
+        '_is_muted',
+        '_active_named_scopes',
+        '_diagnostic_reporter',
+    )
+
     def __init__(self, line_id: LineIdentifier, instruction: str, comment: str, memzone: MemoryZone):
         self._line_id = line_id
         self._instruction = instruction.strip()
@@ -84,7 +100,7 @@ class LineObject:
 
     @active_named_scopes.setter
     def active_named_scopes(self, value: ActiveNamedScopeList):
-        self._active_named_scopes = value.copy()
+        self._active_named_scopes = value.snapshot()
 
     @property
     def memory_zone(self) -> MemoryZone:
@@ -122,6 +138,8 @@ class LineObject:
 
 
 class LineWithWords(LineObject):
+    __slots__ = ('_words', '_word_format')
+
     def __init__(
         self,
         line_id: LineIdentifier,
@@ -134,24 +152,54 @@ class LineWithWords(LineObject):
         multi_word_endianness: Literal['little', 'big'],
     ) -> None:
         super().__init__(line_id, instruction, comment, memzone)
-        self._words: list[Word] = []
-        self._word_size = word_size
-        self._word_segment_size = word_segment_size
-        self._intra_word_endianness = intra_word_endianness
-        self._multi_word_endianness = multi_word_endianness
+        self._word_format = WordFormat.get(
+            word_size,
+            word_segment_size,
+            intra_word_endianness,
+            multi_word_endianness,
+        )
+        self._words: WordBuffer = WordBuffer(self._word_format)
+
+    @property
+    def word_format(self) -> WordFormat:
+        """Returns the shared word format descriptor used by this line"""
+        return self._word_format
 
     def generate_words(self) -> None:
         """Finalize the words for this line with the label assignemnts
 
-        Must be overriden by subclass to extend the self._bytes instance variable or
-        use the self._append_byte() method.
+        Must be overriden by subclass to extend the self._words word buffer or
+        use the self._append_word() method.
         """
         raise NotImplementedError
 
+    def validate(self) -> None:
+        """Checks the values of this line with the label assignments, reporting the same errors as generate_words()
+
+        Used when only checking that the code assembles. Subclasses override this when their values can be
+        checked without building the words. By default the words are generated.
+        """
+        self.generate_words()
+
     def get_words(self) -> list[Word]:
-        """Returns current state of constructed bytes"""
-        return self._words
+        """Returns current state of constructed words as Word objects"""
+        if isinstance(self._words, list):
+            # subclasses may manage their own list of Word objects
+            return self._words
+        return self._words.words()
+
+    def get_word_buffer(self) -> WordBuffer | WordRun:
+        """Returns current state of constructed words as a word buffer, or as a word run for fill lines.
+
+        Prefer this over get_words() when the word values are only being copied or emitted, as no
+        Word objects need to be created.
+        """
+        if not isinstance(self._words, list):
+            return self._words
+        words = self.get_words()
+        word_format = words[0].word_format if len(words) > 0 else self._word_format
+        return WordBuffer.from_words(words, word_format)
 
     def _append_word(self, word: Word):
-        """appends the passed byte value to this objects bytes"""
-        self._words.append(word)
+        """appends the passed word's value to this objects words"""
+        self._words.append(word.value)
@@ -1,17 +1,31 @@
 import math
 import re
 import sys
+from array import array
 from typing import Literal
 
-from bespokeasm.assembler.bytecode.word import Word
 from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.memory_zone import MemoryZone
 from bespokeasm.expression import ExpressionNode
 from bespokeasm.expression import parse_expression
+from bespokeasm.utilities import normalize_default_numeric_base
+
+# Plain numeric literals that can be converted without the expression parser. Unprefixed decimal literals are only
+# plain literals when the default numeric base is decimal.
+PATTERN_PREFIXED_LITERAL = r'(?:\$[0-9a-fA-F]+|0x[0-9a-fA-F]+|%[01]+)'
+PATTERN_DECIMAL_LITERAL = r'(?:\$[0-9a-fA-F]+|0x[0-9a-fA-F]+|%[01]+|\d+)'
 
 
 class DataLine(LineWithWords):
+    __slots__ = (
+        '_arg_value_list',
+        '_directive',
+        '_default_numeric_base',
+        '_string_byte_packing',
+        '_string_byte_packing_fill',
+        '_is_literal_list',
+    )
     PATTERN_DATA_DIRECTIVE = re.compile(
         r'^(\.byte|\.2byte|\.4byte|\.8byte|\.16byte|\.cstr|\.asciiz)\b\s*(.*)$',
         flags=re.IGNORECASE
@@ -37,6 +51,22 @@ class DataLine(LineWithWords):
         '.asciiz': 0xFF,
     }
 
+    PATTERN_LITERAL_LIST = {
+        'decimal': re.compile(
+            fr'{PATTERN_DECIMAL_LITERAL}(?:\s*,\s*{PATTERN_DECIMAL_LITERAL})*',
+            flags=re.IGNORECASE,
+        ),
+        'other': re.compile(
+            fr'{PATTERN_PREFIXED_LITERAL}(?:\s*,\s*{PATTERN_PREFIXED_LITERAL})*',
+            flags=re.IGNORECASE,
+        ),
+    }
+    PATTERN_LITERAL_VALUE = re.compile(PATTERN_DECIMAL_LITERAL, flags=re.IGNORECASE)
+
+    LITERAL_ARRAY_TYPECODES = {
+        array(typecode).itemsize: typecode for typecode in reversed(('B', 'H', 'I', 'L', 'Q'))
+    }
+
     def factory(
             line_id: LineIdentifier,
             line_str: str,
@@ -66,6 +96,26 @@ class DataLine(LineWithWords):
         if args_str == '':
             return None
 
+        literal_values = DataLine._parse_literal_list(directive_str, args_str, word_size, default_numeric_base)
+        if literal_values is not None:
+            return DataLine(
+                line_id,
+                directive_str,
+                literal_values,
+                line_str,
+                comment,
+                current_memzone,
+                word_size,
+                word_segment_size,
+                intra_word_endianness,
+                multi_word_endianness,
+                string_byte_packing,
+                string_byte_packing_fill,
+                default_numeric_base,
+                diagnostic_reporter=diagnostic_reporter,
+                is_literal_list=True,
+            )
+
         value_items = DataLine._split_data_items(args_str, line_id)
         if len(value_items) == 0:
             return None
@@ -104,6 +154,43 @@ class DataLine(LineWithWords):
             diagnostic_reporter=diagnostic_reporter,
         )
 
+    @staticmethod
+    def _parse_literal_list(
+            directive_str: str,
+            args_str: str,
+            word_size: int,
+            default_numeric_base: str,
+    ) -> array | None:
+        """Returns the values of an argument list made only of plain numeric literals as an array, converted in
+        bulk without building an expression per item. Returns None if the line must take the general path, such as
+        when it contains labels, expressions, strings, or values that would be truncated.
+        """
+        value_size = DataLine.DIRECTIVE_VALUE_BYTE_SIZE[directive_str]
+        word_bytes = word_size // 8
+        if (
+            directive_str in ('.cstr', '.asciiz')
+            or value_size not in DataLine.LITERAL_ARRAY_TYPECODES
+            or word_size < 8
+            or (value_size > word_bytes and value_size % word_bytes != 0)
+        ):
+            return None
+        base_key = 'decimal' if normalize_default_numeric_base(default_numeric_base) == 'decimal' else 'other'
+        if DataLine.PATTERN_LITERAL_LIST[base_key].fullmatch(args_str) is None:
+            return None
+        values = array(DataLine.LITERAL_ARRAY_TYPECODES[value_size])
+        try:
+            values.fromlist([
+                int(literal[1:], 16) if literal[0] == '$'
+                else int(literal[2:], 16) if literal[1:2] in ('x', 'X')
+                else int(literal[1:], 2) if literal[0] == '%'
+                else int(literal)
+                for literal in DataLine.PATTERN_LITERAL_VALUE.findall(args_str)
+            ])
+        except OverflowError:
+            # out of range values take the general path so the truncation warning is emitted
+            return None
+        return values
+
     @staticmethod
     def _split_data_items(args_str: str, line_id: LineIdentifier) -> list[str]:
         """Split comma-separated data items while respecting quoted strings."""
@@ -173,6 +260,7 @@ class DataLine(LineWithWords):
             default_numeric_base: str = 'decimal',
             *,
             diagnostic_reporter,
+            is_literal_list: bool = False,
     ) -> None:
         super().__init__(
             line_id,
@@ -192,6 +280,7 @@ class DataLine(LineWithWords):
         self._default_numeric_base = default_numeric_base
         self._string_byte_packing = string_byte_packing
         self._string_byte_packing_fill = string_byte_packing_fill
+        self._is_literal_list = is_literal_list
 
     def __str__(self):
         return f'DataLine<{self._directive}: {self._arg_value_list}>'
@@ -204,7 +293,7 @@ class DataLine(LineWithWords):
     @property
     def word_count(self) -> int:
         """Returns the number of words this data line will generate, matching generate_words logic."""
-        word_size_bytes = self._word_size // 8
+        word_size_bytes = self._word_format.bit_size // 8
         count = 0
         for arg_item in self._arg_value_list:
             value_size = DataLine.DIRECTIVE_VALUE_BYTE_SIZE[self._directive]
@@ -217,13 +306,16 @@ class DataLine(LineWithWords):
 
     def generate_words(self):
         """Finalize the data bytes for this line with the label assignments, matching documentation rules."""
+        if self._is_literal_list:
+            self._generate_literal_words()
+            return
         # If string_byte_packing is enabled and this is a string-based .byte/.cstr/.asciiz, pack bytes into words
         if (
             self._string_byte_packing
             and self._directive in ('.byte', '.cstr', '.asciiz')
             and all(isinstance(x, int) for x in self._arg_value_list)
         ):
-            word_bytes = self._word_size // 8
+            word_bytes = self._word_format.bit_size // 8
             values = self._arg_value_list[:]
             # Pad to full word if needed, using string_byte_packing_fill
             if len(values) % word_bytes != 0:
@@ -231,7 +323,7 @@ class DataLine(LineWithWords):
                 values += [self._string_byte_packing_fill] * pad_len
             for i in range(0, len(values), word_bytes):
                 chunk = values[i:i+word_bytes]
-                if self._multi_word_endianness == 'big':
+                if self._word_format.multi_word_endianness == 'big':
                     word_val = 0
                     for b in chunk:
                         word_val = (word_val << 8) | (b & 0xFF)
@@ -239,9 +331,7 @@ class DataLine(LineWithWords):
                     word_val = 0
                     for j, b in enumerate(chunk):
                         word_val |= (b & 0xFF) << (8 * j)
-                self._words.append(
-                    Word(word_val, self._word_size, self._word_segment_size, self._intra_word_endianness)
-                )
+                self._words.append(word_val)
             return
         # Default behavior
         for arg_item in self._arg_value_list:
@@ -268,24 +358,34 @@ class DataLine(LineWithWords):
                     f'Data value {arg_val} truncated to {masked_val} for {self._directive}',
                 )
             # If value size <= word size, put in its own word, zero-extended
-            if value_size <= self._word_size // 8:
+            if value_size <= self._word_format.bit_size // 8:
                 # Place in least significant bits, zero-extended
-                self._words.append(
-                    Word(masked_val, self._word_size, self._word_segment_size, self._intra_word_endianness)
-                )
+                self._words.append(masked_val)
             else:
                 # Value is larger than word size, split across multiple words
                 total_bytes = value_size
-                word_bytes = self._word_size // 8
-                value_bytes = masked_val.to_bytes(total_bytes, byteorder=self._multi_word_endianness, signed=False)
+                word_bytes = self._word_format.bit_size // 8
+                multi_word_endianness = self._word_format.multi_word_endianness
+                value_bytes = masked_val.to_bytes(total_bytes, byteorder=multi_word_endianness, signed=False)
                 # Split into word-sized chunks
                 for i in range(0, total_bytes, word_bytes):
                     chunk = value_bytes[i:i+word_bytes]
                     # Pad chunk if not full word
                     if len(chunk) < word_bytes:
-                        chunk = (b'\x00' * (word_bytes - len(chunk))) + chunk if self._multi_word_endianness == 'big' \
+                        chunk = (b'\x00' * (word_bytes - len(chunk))) + chunk if multi_word_endianness == 'big' \
                             else chunk + (b'\x00' * (word_bytes - len(chunk)))
-                    wval = int.from_bytes(chunk, byteorder=self._multi_word_endianness)
-                    self._words.append(
-                        Word(wval, self._word_size, self._word_segment_size, self._intra_word_endianness)
-                    )
+                    wval = int.from_bytes(chunk, byteorder=multi_word_endianness)
+                    self._words.append(wval)
+
+    def _generate_literal_words(self) -> None:
+        """Converts an all-literal value array into words in bulk, applying the same word splitting as
+        generate_words() for values larger than a word."""
+        values: array = self._arg_value_list
+        if values.itemsize <= self._word_format.bit_size // 8:
+            self._words.extend(values)
+        else:
+            # Lay out each value's bytes in multi-word endianness order, then pack them into words.
+            ordered_values = array(values.typecode, values)
+            if self._word_format.multi_word_endianness != sys.byteorder:
+                ordered_values.byteswap()
+            self._words.extend_bytes(ordered_values.tobytes(), pack_bytes=True)
@@ -9,6 +9,8 @@ from .memzone import SetMemoryZoneLine
 
 
 class AddressOrgLine(SetMemoryZoneLine):
+    __slots__ = ('_parsed_memzone_name', '_address_expr')
+
     def __init__(
             self,
             line_id:
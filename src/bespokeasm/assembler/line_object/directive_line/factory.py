@@ -13,6 +13,7 @@ from bespokeasm.assembler.model import AssemblerModel
 from .address import AddressOrgLine
 from .fill_data import FillDataLine
 from .fill_data import FillUntilDataLine
+from .include_binary import IncludeBinaryLine
 from .memzone import SetMemoryZoneLine
 from .page_align import PageAlignLine
 
@@ -26,6 +27,7 @@ from .page_align import PageAlignLine
 #   .zerountil X    - fill with 0 value until and including address X
 #   .memzone X      - sets the current memory zone to X
 #   .align [X]      - aligns the current address to the next page boundary
+#   .incbin "F"[, O[, L]] - emits the bytes of binary file F, optionally starting at offset O and limited to L bytes
 
 
 class DirectiveLine:
@@ -150,6 +152,26 @@ class DirectiveLine:
                 isa_model.default_numeric_base,
             )
 
+        # .incbin
+        line_match = re.search(IncludeBinaryLine.PATTERN_INCLUDE_BINARY, cleaned_line_str)
+        if line_match is not None:
+            return IncludeBinaryLine(
+                line_id,
+                line_match.group(0),
+                comment,
+                line_match.group(1),
+                line_match.group(2),
+                line_match.group(3),
+                current_memzone,
+                isa_model.word_size,
+                isa_model.word_segment_size,
+                isa_model.intra_word_endianness,
+                isa_model.multi_word_endianness,
+                isa_model.string_byte_packing,
+                isa_model.string_byte_packing_fill,
+                isa_model.default_numeric_base,
+            )
+
         # .page
         line_match = PageAlignLine.PATTERN_PAGE_ALIGN.match(cleaned_line_str)
         if line_match is not None:
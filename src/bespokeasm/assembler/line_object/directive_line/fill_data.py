@@ -1,6 +1,6 @@
 from typing import Literal
 
-from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.memory_zone import MemoryZone
@@ -9,6 +9,8 @@ from bespokeasm.expression import parse_expression
 
 
 class FillDataLine(LineWithWords):
+    __slots__ = ('_count_expr', '_value_expr', '_count', '_value')
+
     _count_expr: ExpressionNode
     _value_expr: ExpressionNode
 
@@ -52,14 +54,12 @@ class FillDataLine(LineWithWords):
             self._count = self._count_expr.get_value(self.label_scope, self.active_named_scopes, self.line_id)
         if self._value is None:
             self._value = self._value_expr.get_value(self.label_scope, self.active_named_scopes, self.line_id)
-        value_mask = (1 << self._word_size) - 1
-        self._words.extend([
-            Word(self._value & value_mask, self._word_size, self._word_segment_size, self._intra_word_endianness)
-            for _ in range(self._count)
-        ])
+        self._words = WordRun(self._word_format, self._value & self._word_format.value_mask, self._count)
 
 
 class FillUntilDataLine(LineWithWords):
+    __slots__ = ('_fill_until_addr_expr', '_fill_value_expr', '_fill_until_addr', '_fill_value')
+
     _fill_until_addr_expr: ExpressionNode
     _fill_value_expr: ExpressionNode
     _fill_until_addr: int
@@ -119,8 +119,4 @@ class FillUntilDataLine(LineWithWords):
         if self._fill_value is None:
             self._fill_value = self._fill_value_expr.get_value(self.label_scope, self.active_named_scopes, self.line_id)
         if self.word_count > 0 and len(self._words) == 0:
-            value_mask = (1 << self._word_size) - 1
-            self._words.extend([
-                Word(self._fill_value & value_mask, self._word_size, self._word_segment_size, self._intra_word_endianness)
-                for _ in range(self.word_count)
-            ])
+            self._words = WordRun(self._word_format, self._fill_value & self._word_format.value_mask, self.word_count)
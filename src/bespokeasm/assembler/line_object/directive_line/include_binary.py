@@ -0,0 +1,171 @@
+# The include binary directive emits the contents of a binary file, such as a font table or bitmap asset, directly
+# into the generated byte code. It is used as follows:
+#
+#   .incbin "filename" [, offset [, length]]
+#
+# The file is located using the same search as the `#include` preprocessor directive: the directory of the current
+# assembly file first, then the configured include paths. The optional offset is the number of bytes to skip at the
+# start of the file, and the optional length is the maximum number of bytes to include. Both may be expressions, but
+# any labels used must be constants since the word count is needed when addresses are assigned.
+#
+# How file bytes map to words follows the rules for string data in `.byte`:
+# - If the word size is less than 8 bits, each byte is split into several words per the multi-word endianness.
+# - If `string_byte_packing` is enabled and a word holds several bytes, bytes are packed into words per the
+#   multi-word endianness, and a partial final word is padded with `string_byte_packing_fill`.
+# - Otherwise each byte is placed into its own word.
+#
+# The file is memory mapped and its bytes are converted to words in bulk without creating a Python object per byte.
+import math
+import mmap
+import os
+import re
+import sys
+from typing import Literal
+
+from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.line_object import INSTRUCTION_EXPRESSION_PATTERN
+from bespokeasm.assembler.line_object import LineWithWords
+from bespokeasm.assembler.memory_zone import MemoryZone
+from bespokeasm.expression import parse_expression
+
+
+class IncludeBinaryLine(LineWithWords):
+    __slots__ = (
+        '_filename',
+        '_filepath',
+        '_file_size',
+        '_offset_expr',
+        '_length_expr',
+        '_byte_range',
+        '_string_byte_packing',
+        '_string_byte_packing_fill',
+    )
+
+    PATTERN_INCLUDE_BINARY = re.compile(
+        r'^(?:\.incbin)\s+(?:\'|\")([\w\.\-_/]+)(?:\'|\")'
+        fr'(?:\s*\,\s*({INSTRUCTION_EXPRESSION_PATTERN}))?'
+        fr'(?:\s*\,\s*({INSTRUCTION_EXPRESSION_PATTERN}))?',
+        flags=re.IGNORECASE | re.MULTILINE
+    )
+
+    def __init__(
+            self,
+            line_id: LineIdentifier,
+            instruction: str,
+            comment: str,
+            filename: str,
+            offset_expression: str | None,
+            length_expression: str | None,
+            current_memzone: MemoryZone,
+            word_size: int,
+            word_segment_size: int,
+            intra_word_endianness: Literal['little', 'big'],
+            multi_word_endianness: Literal['little', 'big'],
+            string_byte_packing: bool = False,
+            string_byte_packing_fill: int = 0,
+            default_numeric_base: str = 'decimal',
+    ) -> None:
+        super().__init__(
+            line_id,
+            instruction,
+            comment,
+            current_memzone,
+            word_size,
+            word_segment_size,
+            intra_word_endianness,
+            multi_word_endianness,
+        )
+        if word_size < 8 and 8 % word_size != 0:
+            sys.exit(f'ERROR: {line_id} - .incbin requires a word size that evenly divides 8 bits or is at least 8 bits')
+        self._filename = filename
+        self._filepath = None
+        self._file_size = None
+        self._offset_expr = None
+        if offset_expression is not None and len(offset_expression.strip()) > 0:
+            self._offset_expr = parse_expression(line_id, offset_expression, default_numeric_base)
+        self._length_expr = None
+        if length_expression is not None and len(length_expression.strip()) > 0:
+            self._length_expr = parse_expression(line_id, length_expression, default_numeric_base)
+        self._byte_range = None
+        self._string_byte_packing = string_byte_packing
+        self._string_byte_packing_fill = string_byte_packing_fill
+
+    def __str__(self):
+        return f'IncludeBinaryLine<{self._filename}>'
+
+    @property
+    def filename(self) -> str:
+        """Returns the file name as written in the directive"""
+        return self._filename
+
+    @property
+    def filepath(self) -> str | None:
+        """Returns the located path of the included file, or None if it has not been located yet"""
+        return self._filepath
+
+    def set_filepath(self, filepath: str) -> None:
+        """Sets the located path of the included file. Called by the assembly file once the include paths are known."""
+        self._filepath = filepath
+        try:
+            self._file_size = os.path.getsize(filepath)
+        except OSError as e:
+            sys.exit(f'ERROR: {self.line_id} - could not read binary file "{self._filename}": {e}')
+
+    def _get_byte_range(self) -> tuple[int, int]:
+        """Returns the (offset, byte count) of the file region to include."""
+        if self._byte_range is None:
+            if self._file_size is None:
+                sys.exit(f'ERROR: INTERNAL - {self.line_id} - .incbin file "{self._filename}" has not been located')
+            offset = 0
+            if self._offset_expr is not None:
+                offset = self._offset_expr.get_value(self.label_scope, self.active_named_scopes, self.line_id)
+            if offset < 0 or offset > self._file_size:
+                sys.exit(
+                    f'ERROR: {self.line_id} - .incbin offset {offset} is outside of the '
+                    f'{self._file_size} byte file "{self._filename}"'
+                )
+            byte_count = self._file_size - offset
+            if self._length_expr is not None:
+                length = self._length_expr.get_value(self.label_scope, self.active_named_scopes, self.line_id)
+                if length < 0:
+                    sys.exit(f'ERROR: {self.line_id} - .incbin length {length} must not be negative')
+                byte_count = min(length, byte_count)
+            self._byte_range = (offset, byte_count)
+        return self._byte_range
+
+    @property
+    def byte_count(self) -> int:
+        """Returns the number of file bytes this line includes"""
+        return self._get_byte_range()[1]
+
+    @property
+    def word_count(self) -> int:
+        bit_size = self._word_format.bit_size
+        byte_count = self.byte_count
+        if bit_size < 8:
+            return byte_count * (8 // bit_size)
+        if self._string_byte_packing:
+            return math.ceil(byte_count / (bit_size // 8))
+        return byte_count
+
+    def generate_words(self):
+        if len(self._words) > 0:
+            return
+        offset, byte_count = self._get_byte_range()
+        if byte_count == 0:
+            return
+        try:
+            with open(self._filepath, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    with memoryview(mapped_file)[offset:offset + byte_count] as file_region:
+                        self._words.extend_bytes(
+                            file_region,
+                            pack_bytes=self._string_byte_packing,
+                            pad_value=self._string_byte_packing_fill,
+                        )
+        except OSError as e:
+            sys.exit(f'ERROR: {self.line_id} - could not read binary file "{self._filename}": {e}')
+
+    def validate(self):
+        # the file was sized when it was located, so only the included byte range needs checking
+        self._get_byte_range()
@@ -7,6 +7,8 @@ from bespokeasm.assembler.memory_zone.manager import MemoryZoneManager
 
 
 class SetMemoryZoneLine(LineObject):
+    __slots__ = ('_memzone_manager', '_name')
+
     def __init__(
             self,
             line_id: LineIdentifier,
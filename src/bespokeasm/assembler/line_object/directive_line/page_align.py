@@ -25,6 +25,8 @@ from bespokeasm.expression import parse_expression
 
 
 class PageAlignLine(LineObject):
+    __slots__ = ('_page_size',)
+
     PATTERN_PAGE_ALIGN = re.compile(
             f'^\\.align(?:\\s+({INSTRUCTION_EXPRESSION_PATTERN}))?',
         )
@@ -8,7 +8,6 @@ import math
 import re
 from typing import Literal
 
-from bespokeasm.assembler.bytecode.word import Word
 from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.memory_zone import MemoryZone
@@ -18,6 +17,8 @@ EMBEDDED_STRING_PATTERN = r'(?P<quote>[\"])((?:\\(?P=quote)|.|\n)*?)(?P=quote)'
 
 
 class EmbeddedString(LineWithWords):
+    __slots__ = ('_string_bytes',)
+
     QUOTED_STRING_PATTERN = re.compile(
         rf'^{EMBEDDED_STRING_PATTERN}',
         flags=re.IGNORECASE | re.MULTILINE | re.DOTALL
@@ -92,9 +93,9 @@ class EmbeddedString(LineWithWords):
     @property
     def word_count(self) -> int:
         # TODO: reconcile this to final rules for data compilation
-        return math.ceil(self.byte_size*8 / self._word_size)
+        return math.ceil(self.byte_size*8 / self._word_format.bit_size)
 
     def generate_words(self) -> None:
         # set the bytes
         for c in self._string_bytes:
-            self._words.append(Word(c, self._word_size, self._word_segment_size, self._intra_word_endianness))
+            self._words.append(c)
@@ -0,0 +1,66 @@
+"""
+This module defines the ErrorPlaceholderLine class, which stands in for a source line that failed to parse
+when errors are being collected rather than stopping assembly at the first one.
+"""
+from bespokeasm.assembler.bytecode.word_run import WordRun
+from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.line_object import LineWithWords
+from bespokeasm.assembler.memory_zone import MemoryZone
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.model.instruction import Instruction
+from bespokeasm.assembler.parsing import split_line_comment
+
+
+class ErrorPlaceholderLine(LineWithWords):
+    """
+    Occupies the best guess of the words a line that failed to parse would have emitted, so the addresses
+    of the lines after it, and any errors reported against them, stay close to what they would be once
+    the line is fixed. If the line starts with a known instruction mnemonic, the guess is the size of the
+    instruction's smallest variant. Otherwise the line is assumed to emit nothing.
+    """
+    __slots__ = ('_word_count',)
+
+    def __init__(
+            self,
+            line_id: LineIdentifier,
+            line_str: str,
+            isa_model: AssemblerModel,
+            current_memzone: MemoryZone,
+    ) -> None:
+        instruction_portion, comment_portion = split_line_comment(line_str)
+        super().__init__(
+            line_id,
+            instruction_portion.strip(),
+            comment_portion.strip(),
+            current_memzone,
+            isa_model.word_size,
+            isa_model.word_segment_size,
+            isa_model.intra_word_endianness,
+            isa_model.multi_word_endianness,
+        )
+        self._word_count = ErrorPlaceholderLine._guess_word_count(self.instruction, isa_model)
+
+    def __str__(self):
+        return f'ErrorPlaceholderLine<{self.instruction}>'
+
+    @staticmethod
+    def _guess_word_count(instruction_str: str, isa_model: AssemblerModel) -> int:
+        tokens = instruction_str.split(maxsplit=1)
+        if len(tokens) == 0:
+            return 0
+        instruction = isa_model.instructions.get(tokens[0].lower())
+        if not isinstance(instruction, Instruction) or len(instruction.variants) == 0:
+            return 0
+        bit_size = min(variant.base_bytecode_size for variant in instruction.variants)
+        return -(-bit_size // isa_model.word_size)
+
+    @property
+    def word_count(self) -> int:
+        return self._word_count
+
+    def generate_words(self) -> None:
+        self._words = WordRun(self._word_format, 0, self._word_count)
+
+    def validate(self) -> None:
+        # the line's error was already reported when it failed to parse
+        pass
@@ -16,6 +16,8 @@ from bespokeasm.assembler.parsing import split_line_comment
 
 
 class InstructionLine(LineWithWords):
+    __slots__ = ('_command', '_argument_str', '_isa_model', '_assembled_instruction')
+
     _INSTRUCTUION_EXTRACTION_PATTERN = None
     _INSTRUCTION_PATTERN_KEY = None
 
@@ -165,7 +167,7 @@ class InstructionLine(LineWithWords):
 
     def generate_words(self) -> bytearray:
         """Finalize the bytes for this line with the label assignemnts"""
-        self._words.extend(
+        self._words.extend_words(
             self._assembled_instruction.get_words(
                 self.label_scope,
                 self.active_named_scopes,
@@ -173,3 +175,11 @@ class InstructionLine(LineWithWords):
                 self.word_count,
             )
         )
+
+    def validate(self) -> None:
+        self._assembled_instruction.validate(
+            self.label_scope,
+            self.active_named_scopes,
+            self.address,
+            self.word_count,
+        )
@@ -12,6 +12,8 @@ from bespokeasm.utilities import is_valid_label
 
 
 class LabelLine(LineObject):
+    __slots__ = ('_label', '_value')
+
     PATTERN_LABEL = re.compile(
         r'^\s*((\.?\w+):)(?:\s*([^;]*))?\;?',
         flags=re.IGNORECASE | re.MULTILINE
@@ -5,7 +5,7 @@ of repeated data in the assembled output.
 """
 from typing import Literal
 
-from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.memory_zone import MemoryZone
@@ -18,6 +18,8 @@ class PredefinedDataLine(LineWithWords):
     This is used to efficiently represent a block of memory initialized to a repeated value, such as for zero-filling or
     pattern-filling memory regions. The number of words, the value to repeat, and word formatting are all configurable.
     """
+    __slots__ = ('_word_count', '_value')
+
     def __init__(
             self,
             line_id: LineIdentifier,
@@ -72,12 +74,7 @@ class PredefinedDataLine(LineWithWords):
 
     def generate_words(self):
         """
-        Generate the repeated words for this line and append them to the internal word list.
+        Generate the repeated words for this line as a single run of identical words.
         Each word will have the specified value, masked to the word size.
         """
-        word_mask = (1 << self._word_size) - 1
-        words = [
-            Word(self._value & word_mask, self._word_size, self._word_segment_size, self._intra_word_endianness)
-            for _ in range(self._word_count)
-        ]
-        self._words.extend(words)
+        self._words = WordRun(self._word_format, self._value & self._word_format.value_mask, self._word_count)
@@ -4,6 +4,8 @@ from bespokeasm.assembler.memory_zone import MemoryZone
 
 
 class PreprocessorLine(LineObject):
+    __slots__ = ()
+
     def __init__(self, line_id: LineIdentifier, instruction: str, comment: str, memzone: MemoryZone):
         super().__init__(line_id, instruction, comment, memzone)
 
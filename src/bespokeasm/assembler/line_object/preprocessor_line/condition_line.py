@@ -12,6 +12,8 @@ CONDITIONAL_LINE_PREFIX_LIST = ['#if ', '#ifdef ', '#ifndef ', '#elif ', '#else'
 
 
 class ConditionLine(PreprocessorLine):
+    __slots__ = ('_condition',)
+
     def __init__(
                 self,
                 line_id: LineIdentifier,
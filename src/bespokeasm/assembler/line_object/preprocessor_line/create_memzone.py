@@ -12,6 +12,8 @@ from bespokeasm.utilities import PATTERN_NUMERIC
 
 
 class CreateMemzoneLine(PreprocessorLine):
+    __slots__ = ('_name', '_start_addr', '_end_addr')
+
     PATTERN_CREATE_MEMORY_ZONE = re.compile(
         r'#create_memzone\s+({})\s+({})\s+({})'.format(
             MEMORY_ZONE_NAME_PATTERN,
@@ -60,3 +62,7 @@ class CreateMemzoneLine(PreprocessorLine):
 
     def __repr__(self) -> str:
         return f'CreateMemzoneLine<{self._name}: {self._start_addr} -> {self._end_addr}>'
+
+    @property
+    def name(self) -> str:
+        return self._name
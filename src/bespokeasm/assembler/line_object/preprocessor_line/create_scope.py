@@ -10,6 +10,7 @@ from bespokeasm.assembler.model import AssemblerModel
 
 class CreateScopeLine(PreprocessorLine):
     """Preprocessor line for #create-scope directive."""
+    __slots__ = ('_scope_name', '_prefix')
 
     PATTERN_CREATE_SCOPE = re.compile(
         r'^#create-scope\s+"([^"]+)"\s*(?:prefix\s*=\s*"([^"]*)")?\s*$',
@@ -10,6 +10,7 @@ from bespokeasm.assembler.model import AssemblerModel
 
 class DeactivateScopeLine(PreprocessorLine):
     """Preprocessor line for #deactivate-scope directive."""
+    __slots__ = ('_scope_name', '_filename')
 
     PATTERN_DEACTIVATE_SCOPE = re.compile(
         r'^#deactivate-scope\s+"([^"]+)"\s*$',
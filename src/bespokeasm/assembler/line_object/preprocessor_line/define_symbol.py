@@ -12,6 +12,8 @@ from bespokeasm.assembler.preprocessor.symbol import SYMBOL_PATTERN
 
 
 class DefineSymbolLine(PreprocessorLine):
+    __slots__ = ('_symbol',)
+
     PATTERN_DEFINE_SYMBOL = re.compile(
             fr'^#define\s+({SYMBOL_PATTERN})(?:\s+(\S.*?))?\s*$',
         )
@@ -8,6 +8,8 @@ from bespokeasm.assembler.preprocessor.condition_stack import ConditionStack
 
 
 class ErrorLine(PreprocessorLine):
+    __slots__ = ('_message',)
+
     PATTERN_ERROR = re.compile(
         r'^#error(?:\s+"([\s\S]*?)")?\s*$',
         re.IGNORECASE,
@@ -10,6 +10,8 @@ from bespokeasm.assembler.preprocessor.condition_stack import ConditionStack
 
 
 class PrintLine(PreprocessorLine):
+    __slots__ = ('_min_level', '_color', '_message')
+
     PATTERN_PRINT = re.compile(
         r'^#print(?:\s+(\d+))?(?:\s+(black|red|green|yellow|blue|magenta|cyan|white))?\s+"([\s\S]*?)"\s*$',
         re.IGNORECASE,
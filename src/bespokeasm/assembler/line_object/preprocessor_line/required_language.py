@@ -10,6 +10,8 @@ from packaging import version
 
 
 class RequiredLanguageLine(PreprocessorLine):
+    __slots__ = ('_language', '_operator_str', '_version_obj')
+
     # Legacy string format pattern
     PATTERN_REQUIRE_LANGUAGE = re.compile(
         fr'\#require\s+\"([\w\-\_\.]*)(?:\s*(==|>=|<=|>|<)\s*({version.VERSION_PATTERN}))?\"',
@@ -10,6 +10,7 @@ from bespokeasm.assembler.model import AssemblerModel
 
 class UseScopeLine(PreprocessorLine):
     """Preprocessor line for #use-scope directive."""
+    __slots__ = ('_scope_name', '_filename')
 
     PATTERN_USE_SCOPE = re.compile(
         r'^#use-scope\s+"([^"]+)"\s*$',
@@ -21,6 +21,11 @@ class MemoryZoneManager:
     def global_zone(self) -> MemoryZone:
         return self._zones[GLOBAL_ZONE_NAME]
 
+    @property
+    def zones(self) -> list[MemoryZone]:
+        """Returns all memory zones, including the GLOBAL zone, in the order they were defined."""
+        return list(self._zones.values())
+
     def zone(self, name: str) -> MemoryZone:
         return self._zones.get(name, None)
 
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any
+
+from bespokeasm.assembler.memory_zone import MemoryZone
+
+
+@dataclass(frozen=True)
+class ZoneUsage:
+    """How much of a memory zone's address range is occupied by byte code. Sizes are in words."""
+    name: str
+    start: int
+    end: int
+    size: int
+    used: int
+    free: int
+    largest_free: int
+    free_regions: int
+
+    @property
+    def fragmentation(self) -> float:
+        """Returns the fraction of the free words that are outside of the largest free region."""
+        if self.free == 0:
+            return 0.0
+        return 1.0 - self.largest_free/self.free
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'start': self.start,
+            'end': self.end,
+            'size': self.size,
+            'used': self.used,
+            'free': self.free,
+            'largest_free': self.largest_free,
+            'free_regions': self.free_regions,
+            'fragmentation': round(self.fragmentation, 4),
+        }
+
+
+class OccupancyIndex:
+    """
+    Index of the address ranges occupied by byte code, used to find overlapping byte code and to report
+    memory zone usage.
+
+    Occupied ranges never overlap each other, so they are kept in parallel lists sorted by start address
+    and any range overlapping a queried range is found with a binary search. Byte code is mostly added
+    in increasing address order, which appends to the lists; other ranges are inserted in sorted position.
+    """
+    __slots__ = ('_starts', '_ends', '_items')
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        # exclusive end addresses
+        self._ends: list[int] = []
+        self._items: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def find_overlap(self, address: int, word_count: int) -> Any | None:
+        """Returns the item of an occupied range overlapping the passed range, or None if there is none."""
+        if word_count <= 0:
+            return None
+        idx = bisect_right(self._starts, address)
+        # the range starting at or before the address overlaps if it extends past the address
+        if idx > 0 and self._ends[idx - 1] > address:
+            return self._items[idx - 1]
+        # otherwise only the next range can overlap
+        if idx < len(self._starts) and self._starts[idx] < address + word_count:
+            return self._items[idx]
+        return None
+
+    def add(self, address: int, word_count: int, item: Any) -> Any | None:
+        """
+        Marks a range of addresses as occupied by the passed item, such as a line object. If the range
+        overlaps an occupied range, it is not added and the item occupying the overlapped range is
+        returned. Otherwise None is returned. Empty ranges are ignored.
+        """
+        if word_count <= 0:
+            return None
+        overlap = self.find_overlap(address, word_count)
+        if overlap is not None:
+            return overlap
+        if len(self._starts) == 0 or address >= self._starts[-1]:
+            self._starts.append(address)
+            self._ends.append(address + word_count)
+            self._items.append(item)
+        else:
+            idx = bisect_right(self._starts, address)
+            self._starts.insert(idx, address)
+            self._ends.insert(idx, address + word_count)
+            self._items.insert(idx, item)
+        return None
+
+    def zone_usage(self, zone: MemoryZone) -> ZoneUsage:
+        """Returns the usage of the passed memory zone's address range."""
+        zone_end = zone.end + 1
+        idx = bisect_right(self._starts, zone.start)
+        if idx > 0 and self._ends[idx - 1] > zone.start:
+            idx -= 1
+        used = 0
+        largest_free = 0
+        free_regions = 0
+        cursor = zone.start
+        while idx < len(self._starts) and self._starts[idx] < zone_end:
+            range_start = max(self._starts[idx], zone.start)
+            range_end = min(self._ends[idx], zone_end)
+            if range_start > cursor:
+                largest_free = max(largest_free, range_start - cursor)
+                free_regions += 1
+            used += range_end - range_start
+            cursor = range_end
+            idx += 1
+        if zone_end > cursor:
+            largest_free = max(largest_free, zone_end - cursor)
+            free_regions += 1
+        size = zone_end - zone.start
+        return ZoneUsage(zone.name, zone.start, zone.end, size, used, size - used, largest_free, free_regions)
+
+
+def memory_map_report(index: OccupancyIndex, zones: list[MemoryZone], word_size: int) -> dict:
+    """Returns the usage of each memory zone as a JSON serializable dictionary."""
+    return {
+        'format': 'bespokeasm-memory-map',
+        'version': 1,
+        'word_size': word_size,
+        'zones': [
+            index.zone_usage(zone).to_dict()
+            for zone in sorted(zones, key=lambda zone: (zone.start, zone.name))
+        ],
+    }
+
+
+def format_memory_map(report: dict, address_size: int) -> str:
+    """Formats a memory map report from `memory_map_report()` as a text table."""
+    address_width = max(4, (address_size + 3) // 4)
+    name_width = max([len('zone')] + [len(zone['name']) for zone in report['zones']])
+    size_width = max([len('largest free')] + [len(str(zone['size'])) for zone in report['zones']])
+    lines = [
+        f'Memory map (sizes in {report["word_size"]}-bit words):',
+        f'{"zone":<{name_width}}  {"start":<{address_width + 2}}  {"end":<{address_width + 2}}  '
+        f'{"size":>{size_width}}  {"used":>{size_width}}  {"free":>{size_width}}  {"used %":>7}  '
+        f'{"largest free":>{size_width}}  {"fragmentation":>13}',
+    ]
+    for zone in report['zones']:
+        used_percent = 100.0 * zone['used'] / zone['size']
+        lines.append(
+            f'{zone["name"]:<{name_width}}  0x{zone["start"]:0{address_width}x}  0x{zone["end"]:0{address_width}x}  '
+            f'{zone["size"]:>{size_width}}  {zone["used"]:>{size_width}}  {zone["free"]:>{size_width}}  '
+            f'{used_percent:>6.2f}%  {zone["largest_free"]:>{size_width}}  {zone["fragmentation"]:>13.2%}'
+        )
+    return '\n'.join(lines) + '\n'
@@ -19,7 +19,6 @@ from bespokeasm.assembler.model.operand_set import OperandSetCollection
 from bespokeasm.utilities import is_unprefixed_numeric_string
 from bespokeasm.utilities import normalize_default_numeric_base
 from packaging import version
-from ruamel.yaml import YAML
 
 
 class AssemblerModel:
@@ -41,6 +40,9 @@ class AssemblerModel:
             with open(config_file_path) as json_file:
                 config_dict = json.load(json_file)
         elif config_file_path.endswith('.yaml'):
+            # ruamel.yaml is only imported when a YAML configuration is loaded
+            from ruamel.yaml import YAML
+
             yaml_loader = YAML()
             try:
                 with open(config_file_path) as yaml_file:
@@ -141,6 +143,10 @@ class AssemblerModel:
         fill = general.get('string_byte_packing_fill', 0)
         if not isinstance(fill, int) or not (0 <= fill <= 255):
             sys.exit('ERROR - "string_byte_packing_fill" must be an integer between 0 and 255.')
+        # Validate hex_address_scale
+        address_scale = general.get('hex_address_scale', 1)
+        if not isinstance(address_scale, int) or isinstance(address_scale, bool) or address_scale < 1:
+            sys.exit('ERROR - "hex_address_scale" must be a positive integer.')
         try:
             general['default_numeric_base'] = normalize_default_numeric_base(
                 general.get('default_numeric_base')
@@ -342,6 +348,15 @@ class AssemblerModel:
         '''The number of bits in a word. defaults to 8 bits.'''
         return self._config['general'].get('word_size', 8)
 
+    @property
+    def hex_address_scale(self) -> int:
+        '''
+        The number of record addresses per word address in Intel HEX and S-record output. Defaults to the
+        number of bytes in a word, so that records use byte addresses. Word-addressed ISAs whose tools
+        expect word addresses in records can set `general.hex_address_scale` to 1.
+        '''
+        return self._config['general'].get('hex_address_scale', max(1, self.word_size // 8))
+
     @property
     def word_segment_size(self) -> int:
         '''The number of bits in a word segment. Defaults to the word size.'''
@@ -436,9 +451,18 @@ class AssemblerModel:
                     value,
                     predefines_lineid,
                     scope=LabelScopeType.GLOBAL,
+                    is_constant=True,
                 )
         return self._global_label_scope
 
+    def reset_global_label_scope(self) -> None:
+        """
+        Discards the labels set by a previous assembly, so the model can be shared by assemblies of
+        several files. The predefined constants are set again in the next global scope.
+        """
+        LabelScope.reset_global_scope()
+        self._global_label_scope = None
+
     @property
     def predefined_symbols(self) -> list[dict]:
         if 'predefined' in self._config \
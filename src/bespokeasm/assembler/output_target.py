@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import NamedTuple
+
+
+STDOUT_PATH = 'stdout'
+
+# The file extension used for each output format when an `--emit` option does not give a path.
+EMIT_FORMAT_EXTENSIONS: dict[str, str] = {
+    'binary': '.bin',
+    'minhex': '.minhex',
+    'hex': '.hex',
+    'intel_hex': '.hex',
+    'srec': '.srec',
+    'listing': '.lst',
+    'symbols': '.sym.json',
+    'srcmap': '.srcmap.jsonl',
+    'memory_map': '.memmap.json',
+}
+
+
+class OutputTarget(NamedTuple):
+    """An output format and the file path it is written to. A path of `stdout` writes to standard output."""
+    format: str
+    path: str
+
+    @property
+    def is_stdout(self) -> bool:
+        return self.path == STDOUT_PATH
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """The format and real path of the target, which are equal for targets writing the same output."""
+        return self.format, (STDOUT_PATH if self.is_stdout else os.path.realpath(self.path))
+
+    @classmethod
+    def from_emit_option(cls, emit_option: str, base_file: str) -> OutputTarget:
+        """
+        Parses an `--emit format[=path]` option value. If no path is given, the path is the base file
+        path, such as the binary output file, with its extension replaced by the default extension for
+        the format. A path of `-` or `stdout` writes to standard output.
+        """
+        output_format, separator, path = emit_option.partition('=')
+        output_format = output_format.strip().lower()
+        path = path.strip()
+        if output_format not in EMIT_FORMAT_EXTENSIONS:
+            sys.exit(
+                f'ERROR - unknown emit format "{output_format}". '
+                f'Supported formats: {", ".join(EMIT_FORMAT_EXTENSIONS)}'
+            )
+        if separator and len(path) == 0:
+            sys.exit(f'ERROR - emit option "{emit_option}" is missing the output path after "="')
+        if not separator:
+            path = os.path.splitext(base_file)[0] + EMIT_FORMAT_EXTENSIONS[output_format]
+        elif path == '-':
+            path = STDOUT_PATH
+        if path == STDOUT_PATH and output_format == 'binary':
+            sys.exit('ERROR - binary output cannot be written to stdout')
+        return cls(output_format, path)
+
+
+def unique_output_targets(targets: list[OutputTarget]) -> list[OutputTarget]:
+    """Returns the targets without the repeats of a format written to the same file, such as by `--emit binary`."""
+    unique_targets: dict[tuple[str, str], OutputTarget] = {}
+    for target in targets:
+        unique_targets.setdefault(target.key, target)
+    return list(unique_targets.values())
+
+
+def validate_output_targets(targets: list[OutputTarget]) -> None:
+    """Exits with an error if more than one output target would write to the same file."""
+    seen_paths: dict[str, OutputTarget] = {}
+    for target in targets:
+        if target.is_stdout:
+            continue
+        real_path = os.path.realpath(target.path)
+        if real_path in seen_paths:
+            sys.exit(
+                f'ERROR - both the {seen_paths[real_path].format} and {target.format} outputs '
+                f'would be written to {target.path}'
+            )
+        seen_paths[real_path] = target
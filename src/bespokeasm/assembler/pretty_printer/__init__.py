@@ -1,6 +1,8 @@
+from typing import TextIO
+
 from bespokeasm.assembler.line_object import LineObject
-from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.pretty_printer.line_stats import LineStats
 
 
 class PrettyPrinterBase:
@@ -9,26 +11,19 @@ class PrettyPrinterBase:
                 line_objs: list[LineObject],
                 model: AssemblerModel,
                 instruction_indent: int = 0,
+                line_stats: LineStats | None = None,
             ) -> None:
         self._line_objs = line_objs
         self._model = model
-        # scan though the line objects to get max widths
-        line_num_max = 0
-        instruction_max_width = 0
-        self._max_byte_count = 0
-        self._max_comment_width = 0
-        for lo in line_objs:
-            if lo.line_id.line_num > line_num_max:
-                line_num_max = lo.line_id.line_num
-            if len(lo.instruction) + instruction_indent > instruction_max_width:
-                instruction_max_width = len(lo.instruction) + instruction_indent
-            if len(lo.comment) > self._max_comment_width:
-                self._max_comment_width = len(lo.comment)
-            if isinstance(lo, LineWithWords):
-                if len(lo.get_words()) > self._max_byte_count:
-                    self._max_byte_count = len(lo.get_words())
-        self._max_line_num_width = len(str(line_num_max))
-        self._max_instruction_width = instruction_max_width
+        self._instruction_indent = instruction_indent
+        # column widths come from the passed stats, or are gathered from the line objects on first use
+        self._line_stats = line_stats
+
+    @property
+    def line_stats(self) -> LineStats:
+        if self._line_stats is None:
+            self._line_stats = LineStats.from_line_objects(self._line_objs)
+        return self._line_stats
 
     @property
     def line_objects(self) -> list[LineObject]:
@@ -40,19 +35,27 @@ class PrettyPrinterBase:
 
     @property
     def max_line_num_width(self) -> int:
-        return max(self._max_line_num_width, 4)
+        return max(len(str(self.line_stats.max_line_num)), 4)
 
     @property
     def max_instruction_width(self) -> int:
-        return self._max_instruction_width
+        return self.line_stats.max_instruction_length + self._instruction_indent
 
     @property
     def max_byte_count(self) -> int:
-        return self._max_byte_count
+        return self.line_stats.max_word_count
 
     @property
     def max_comment_width(self) -> int:
-        return self._max_comment_width
+        return self.line_stats.max_comment_length
 
     def pretty_print(self) -> str:
         raise NotImplementedError
+
+    def write(self, output: TextIO) -> None:
+        """Writes the pretty printed output to the passed text stream.
+
+        Subclasses that can produce their output incrementally should override this to stream to the
+        output rather than building the full string first.
+        """
+        output.write(self.pretty_print())
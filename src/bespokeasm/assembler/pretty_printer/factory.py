@@ -1,9 +1,13 @@
+from bespokeasm.assembler.label_scope.named_scope_manager import NamedScopeManager
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.model import AssemblerModel
 from bespokeasm.assembler.pretty_printer import PrettyPrinterBase
-from bespokeasm.assembler.pretty_printer.intelhex import IntelHexPrettyPrinter
+from bespokeasm.assembler.pretty_printer.hexrecords import HexRecordPrettyPrinter
+from bespokeasm.assembler.pretty_printer.line_stats import LineStats
 from bespokeasm.assembler.pretty_printer.listing import ListingPrettyPrinter
 from bespokeasm.assembler.pretty_printer.minhex import MinHexPrettyPrinter
+from bespokeasm.assembler.pretty_printer.source_map import SourceMapPrettyPrinter
+from bespokeasm.assembler.pretty_printer.symbols import SymbolTablePrettyPrinter
 
 
 class PrettyPrinterFactory:
@@ -15,13 +19,24 @@ class PrettyPrinterFactory:
             line_objs:  list[LineObject],
             model: AssemblerModel,
             main_filename: str,
+            line_stats: LineStats | None = None,
+            named_scope_manager: NamedScopeManager | None = None,
     ) -> PrettyPrinterBase:
         if pretty_printer_type == 'minhex':
             return MinHexPrettyPrinter(line_objs, model)
         elif pretty_printer_type == 'hex':
+            # the intelhex package is only imported for the output format that uses it
+            from bespokeasm.assembler.pretty_printer.intelhex import IntelHexPrettyPrinter
+
             return IntelHexPrettyPrinter(line_objs, model, False)
         elif pretty_printer_type == 'intel_hex':
-            return IntelHexPrettyPrinter(line_objs, model, True)
+            return HexRecordPrettyPrinter(line_objs, model, 'intel_hex')
+        elif pretty_printer_type == 'srec':
+            return HexRecordPrettyPrinter(line_objs, model, 'srec')
         elif pretty_printer_type == 'listing':
-            return ListingPrettyPrinter(line_objs, model, main_filename)
+            return ListingPrettyPrinter(line_objs, model, main_filename, line_stats)
+        elif pretty_printer_type == 'symbols':
+            return SymbolTablePrettyPrinter(line_objs, model, named_scope_manager)
+        elif pretty_printer_type == 'srcmap':
+            return SourceMapPrettyPrinter(line_objs, model)
         raise NotImplementedError
@@ -0,0 +1,149 @@
+import io
+import sys
+from collections.abc import Iterator
+from typing import Literal
+from typing import TextIO
+
+from bespokeasm.assembler.line_object import LineObject
+from bespokeasm.assembler.line_object import LineWithWords
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.pretty_printer import PrettyPrinterBase
+
+
+class HexRecordPrettyPrinter(PrettyPrinterBase):
+    '''
+    Streams the generated byte code as Intel HEX or Motorola S-record text.
+
+    Records are produced directly from the address-ordered line objects, merging the words of adjacent
+    lines into records of up to 16 data bytes, so no map of every emitted byte is built. Each word is
+    emitted as `word_size / 8` bytes ordered per the intra-word endianness. A word's record address is
+    its word address multiplied by the ISA's `hex_address_scale`, which defaults to the bytes per word.
+
+    Intel HEX output uses extended linear address records (type 04) for addresses beyond 64 KiB. S-record
+    output picks S1/S2/S3 data records (S19, S28, or S37 files) based on the largest address emitted.
+    '''
+    RECORD_DATA_BYTES = 16
+
+    def __init__(
+        self,
+        line_objs: list[LineObject],
+        model: AssemblerModel,
+        record_format: Literal['intel_hex', 'srec'],
+    ) -> None:
+        super().__init__(line_objs, model)
+        if record_format not in ('intel_hex', 'srec'):
+            raise ValueError(f'Unknown hex record format: {record_format}')
+        if model.word_size % 8 != 0:
+            sys.exit(
+                f'ERROR - {"Intel HEX" if record_format == "intel_hex" else "S-record"} Pretty Printer only '
+                f'supports word sizes that are a multiple of 8 bits'
+            )
+        self._record_format = record_format
+        self._bytes_per_word = model.word_size // 8
+        self._address_scale = model.hex_address_scale
+        self._words_per_record = max(1, HexRecordPrettyPrinter.RECORD_DATA_BYTES // self._bytes_per_word)
+
+    def pretty_print(self) -> str:
+        output = io.StringIO()
+        self.write(output)
+        return output.getvalue()
+
+    def write(self, output: TextIO) -> None:
+        emitting_lines = sorted(
+            (
+                lobj for lobj in self.line_objects
+                if isinstance(lobj, LineWithWords) and not lobj.is_muted and len(lobj.get_word_buffer()) > 0
+            ),
+            key=lambda lobj: lobj.address,
+        )
+        if self._record_format == 'intel_hex':
+            self._write_intel_hex(output, emitting_lines)
+        else:
+            self._write_srec(output, emitting_lines)
+
+    def _iter_data_chunks(self, emitting_lines: list[LineWithWords]) -> Iterator[tuple[int, bytes]]:
+        '''Yields (word address, data bytes) chunks of at most one record's worth of whole words.'''
+        bytes_per_word = self._bytes_per_word
+        record_bytes = self._words_per_record * bytes_per_word
+        run_address = None
+        run = bytearray()
+        for lobj in emitting_lines:
+            if run_address is not None and lobj.address != run_address + len(run) // bytes_per_word:
+                yield from self._split_run(run_address, run, record_bytes)
+                run_address = None
+                run = bytearray()
+            if run_address is None:
+                run_address = lobj.address
+            run += lobj.get_word_buffer().to_bytes(compact=False)
+            full_bytes = len(run) - len(run) % record_bytes
+            if full_bytes > 0:
+                yield from self._split_run(run_address, run[:full_bytes], record_bytes)
+                run_address += full_bytes // bytes_per_word
+                run = run[full_bytes:]
+        if run_address is not None and len(run) > 0:
+            yield from self._split_run(run_address, run, record_bytes)
+
+    def _split_run(self, word_address: int, run: bytes, record_bytes: int) -> Iterator[tuple[int, bytes]]:
+        words_per_record = self._words_per_record
+        for i, offset in enumerate(range(0, len(run), record_bytes)):
+            yield word_address + i*words_per_record, bytes(run[offset:offset + record_bytes])
+
+    @staticmethod
+    def _checksum(record: bytes) -> int:
+        return (-sum(record)) & 0xFF
+
+    def _write_intel_hex_record(self, output: TextIO, record_type: int, offset: int, data: bytes) -> None:
+        record = bytes([len(data), (offset >> 8) & 0xFF, offset & 0xFF, record_type]) + data
+        output.write(f':{record.hex().upper()}{HexRecordPrettyPrinter._checksum(record):02X}\n')
+
+    def _write_intel_hex(self, output: TextIO, emitting_lines: list[LineWithWords]) -> None:
+        bytes_per_word = self._bytes_per_word
+        address_scale = self._address_scale
+        upper_address = 0
+        for word_address, data in self._iter_data_chunks(emitting_lines):
+            word_count = len(data) // bytes_per_word
+            word_offset = 0
+            while word_offset < word_count:
+                address = (word_address + word_offset) * address_scale
+                if address > 0xFFFFFFFF:
+                    sys.exit(f'ERROR - address {address:#x} is beyond the 4 GiB range of Intel HEX linear addressing')
+                if (address >> 16) != upper_address:
+                    upper_address = address >> 16
+                    self._write_intel_hex_record(output, 0x04, 0, upper_address.to_bytes(2, 'big'))
+                # a record cannot cross a 64 KiB boundary, so it ends with the last whole word that fits
+                # before the boundary
+                chunk_words = min(word_count - word_offset, max(1, (0x10000 - (address & 0xFFFF)) // address_scale))
+                chunk_data = data[word_offset*bytes_per_word:(word_offset + chunk_words)*bytes_per_word]
+                self._write_intel_hex_record(output, 0x00, address & 0xFFFF, chunk_data)
+                word_offset += chunk_words
+        self._write_intel_hex_record(output, 0x01, 0, b'')
+
+    def _write_srec_record(self, output: TextIO, record_type: int, address: int, address_bytes: int, data: bytes) -> None:
+        record = bytes([address_bytes + len(data) + 1]) + address.to_bytes(address_bytes, 'big') + data
+        output.write(f'S{record_type}{record.hex().upper()}{(~sum(record)) & 0xFF:02X}\n')
+
+    def _write_srec(self, output: TextIO, emitting_lines: list[LineWithWords]) -> None:
+        max_address = 0
+        if len(emitting_lines) > 0:
+            last_line = emitting_lines[-1]
+            last_word_address = last_line.address + len(last_line.get_word_buffer()) - 1
+            max_address = last_word_address * self._address_scale + self._bytes_per_word - 1
+        if max_address <= 0xFFFF:
+            data_type, termination_type, address_bytes = 1, 9, 2
+        elif max_address <= 0xFFFFFF:
+            data_type, termination_type, address_bytes = 2, 8, 3
+        elif max_address <= 0xFFFFFFFF:
+            data_type, termination_type, address_bytes = 3, 7, 4
+        else:
+            sys.exit(f'ERROR - address {max_address:#x} is beyond the 32-bit range of S-records')
+
+        self._write_srec_record(output, 0, 0, 2, b'')
+        record_count = 0
+        for word_address, data in self._iter_data_chunks(emitting_lines):
+            self._write_srec_record(output, data_type, word_address * self._address_scale, address_bytes, data)
+            record_count += 1
+        if record_count <= 0xFFFF:
+            self._write_srec_record(output, 5, record_count, 2, b'')
+        elif record_count <= 0xFFFFFF:
+            self._write_srec_record(output, 6, record_count, 3, b'')
+        self._write_srec_record(output, termination_type, 0, address_bytes, b'')
@@ -1,7 +1,6 @@
 import io
 import sys
 
-from bespokeasm.assembler.bytecode.word import Word
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.line_object.directive_line.address import AddressOrgLine
@@ -23,7 +22,7 @@ class IntelHexPrettyPrinter(PrettyPrinterBase):
         output = io.StringIO()
         for lobj in self.line_objects:
             if isinstance(lobj, LineWithWords) and not lobj.is_muted:
-                line_bytes = Word.words_to_bytes(lobj.get_words()).decode(encoding='latin-')
+                line_bytes = lobj.get_word_buffer().to_bytes(compact=False).decode(encoding='latin-')
                 self._intel_hex.puts(lobj.address, line_bytes)
 
             elif isinstance(lobj, AddressOrgLine):
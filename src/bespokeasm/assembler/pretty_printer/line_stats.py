@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from bespokeasm.assembler.line_object import LineObject
+from bespokeasm.assembler.line_object import LineWithWords
+
+
+class LineStats:
+    """
+    Running maximums of the line object fields that determine pretty printer column widths.
+
+    The assembler updates these as it assigns addresses to lines, so pretty printers can lay out their
+    columns without another scan over every line object.
+    """
+    __slots__ = ('max_line_num', 'max_instruction_length', 'max_comment_length', 'max_word_count')
+
+    def __init__(self) -> None:
+        self.max_line_num = 0
+        self.max_instruction_length = 0
+        self.max_comment_length = 0
+        self.max_word_count = 0
+
+    def __str__(self) -> str:
+        return (
+            f'LineStats<line_num={self.max_line_num}, instruction={self.max_instruction_length}, '
+            f'comment={self.max_comment_length}, words={self.max_word_count}>'
+        )
+
+    @classmethod
+    def from_line_objects(cls, line_objs: Iterable[LineObject]) -> LineStats:
+        """Gathers the statistics of already assembled line objects."""
+        stats = cls()
+        for lobj in line_objs:
+            stats.add(lobj)
+        return stats
+
+    def add(self, lobj: LineObject, word_count: int | None = None) -> None:
+        """Updates the statistics with a line object. If the word count of a line with words isn't
+        passed, it is taken from the line's generated words."""
+        if lobj.line_id.line_num > self.max_line_num:
+            self.max_line_num = lobj.line_id.line_num
+        if len(lobj.instruction) > self.max_instruction_length:
+            self.max_instruction_length = len(lobj.instruction)
+        if len(lobj.comment) > self.max_comment_length:
+            self.max_comment_length = len(lobj.comment)
+        if isinstance(lobj, LineWithWords):
+            if word_count is None:
+                word_count = len(lobj.get_word_buffer())
+            if word_count > self.max_word_count:
+                self.max_word_count = word_count
@@ -1,9 +1,10 @@
 import io
 import math
 import sys
+from typing import TextIO
 
 from bespokeasm.assembler.bytecode.word import Word
-from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.line_object.directive_line.memzone import SetMemoryZoneLine
@@ -11,14 +12,26 @@ from bespokeasm.assembler.line_object.label_line import LabelLine
 from bespokeasm.assembler.line_object.preprocessor_line import PreprocessorLine
 from bespokeasm.assembler.model import AssemblerModel
 from bespokeasm.assembler.pretty_printer import PrettyPrinterBase
+from bespokeasm.assembler.pretty_printer.line_stats import LineStats
 
 
 class ListingPrettyPrinter(PrettyPrinterBase):
     MAX_NUM_BYTES_PER_LINE = 6
     INSTRUCTION_INDENT = 4
 
-    def __init__(self, line_objs:  list[LineObject], model: AssemblerModel, main_filename: str) -> None:
-        super().__init__(line_objs, model, instruction_indent=ListingPrettyPrinter.INSTRUCTION_INDENT)
+    def __init__(
+                self,
+                line_objs: list[LineObject],
+                model: AssemblerModel,
+                main_filename: str,
+                line_stats: LineStats | None = None,
+            ) -> None:
+        super().__init__(
+            line_objs,
+            model,
+            instruction_indent=ListingPrettyPrinter.INSTRUCTION_INDENT,
+            line_stats=line_stats,
+        )
         self._address_size = math.ceil(self.model.address_size/4)
         self._address_format_str = f'{{0:0{self._address_size}x}}'
         self._main_filename = main_filename
@@ -30,18 +43,24 @@ class ListingPrettyPrinter(PrettyPrinterBase):
         self._word_segment_size = model.word_segment_size
 
     def pretty_print(self) -> str:
-        if len(self.line_objects) < 1:
-            return ''
-
         output = io.StringIO()
+        self.write(output)
+        return output.getvalue()
 
-        # create a new list of line objects sorted by file then line number.
-        lobjs: list[LineIdentifier] = self.line_objects.copy()
-        lobjs.sort(
-            key=lambda x:
-                f'{x.line_id.line_num:04d}'
-                if x.line_id.filename == self._main_filename
-                else f'z_{x.line_id.filename}_{x.line_id.line_num:04d}'
+    def write(self, output: TextIO) -> None:
+        if len(self.line_objects) < 1:
+            return
+
+        # Order the lines by file then line number, with the main file first and the other files in
+        # file name order. Each line is keyed by a single integer combining its file's index and line
+        # number, and lines with the same key keep their original order.
+        filenames = {lo.line_id.filename for lo in self.line_objects}
+        filenames.discard(self._main_filename)
+        file_indices = {filename: i + 1 for i, filename in enumerate(sorted(filenames))}
+        file_indices[self._main_filename] = 0
+        lobjs = sorted(
+            self.line_objects,
+            key=lambda x: (file_indices[x.line_id.filename] << 32) | x.line_id.line_num,
         )
 
         cur_filename = None
@@ -55,9 +74,8 @@ class ListingPrettyPrinter(PrettyPrinterBase):
 
             # print the line object
             self._print_line_object(output, lo, hex_width)
-        return output.getvalue()
 
-    def _print_file_header(self, output: io.StringIO, filename: str, hex_width: int) -> None:
+    def _print_file_header(self, output: TextIO, filename: str, hex_width: int) -> None:
         COMMENT_HEADER = 'comment'
         comment_header_width = len(COMMENT_HEADER) if len(COMMENT_HEADER) > self.max_comment_width else self.max_comment_width
 
@@ -113,7 +131,7 @@ class ListingPrettyPrinter(PrettyPrinterBase):
             '-'*(comment_header_width + 2) + '\n'
         )
 
-    def _print_line_object(self, output: io.StringIO, lobj: LineObject, hex_width: int) -> None:
+    def _print_line_object(self, output: TextIO, lobj: LineObject, hex_width: int) -> None:
         # wite the lobj details to output using the following format:
         #    line number in decimal | address in hex | machine code in hex (6 bytes wide) | instruction text | comment text
         #     1 | 0000 | 00 00 00 00 00 00 | nop | this is a comment
@@ -127,14 +145,24 @@ class ListingPrettyPrinter(PrettyPrinterBase):
         # The comment text is left justified.
         #
 
-        # first, get the line bytes, if any
-        line_bytes = None if not isinstance(lobj, LineWithWords) \
-                        else ListingPrettyPrinter._generate_bytecode_line_string(
-                            lobj.get_words(),
-                            self._bytes_per_line,
-                            self._word_size,
-                            self._word_segment_size,
-                        )
+        # first, get the line bytes, if any. Runs of identical words that would span several rows
+        # (e.g., from .fill or .zerountil) are collapsed into a single summarized row.
+        line_bytes = None
+        if isinstance(lobj, LineWithWords):
+            line_buffer = lobj.get_word_buffer()
+            if isinstance(line_buffer, WordRun) and len(line_buffer) > self._bytes_per_line:
+                line_bytes = [ListingPrettyPrinter._generate_word_run_line_string(
+                    line_buffer,
+                    self._bytes_per_line,
+                    hex_width,
+                )]
+            else:
+                line_bytes = ListingPrettyPrinter._generate_bytecode_line_string(
+                    lobj.get_words(),
+                    self._bytes_per_line,
+                    self._word_size,
+                    self._word_segment_size,
+                )
 
         # write the line number
         output.write(f' {lobj.line_id.line_num:{self.max_line_num_width}d} | ')
@@ -215,3 +243,13 @@ class ListingPrettyPrinter(PrettyPrinterBase):
         if cur_str is not None:
             results.append(f'{cur_str:<{words_per_str*(hex_width+1)}}')
         return results
+
+    @classmethod
+    def _generate_word_run_line_string(cls, word_run: WordRun, words_per_str: int, hex_width: int) -> str:
+        # summarize a run of identical words as "<value> x <decimal count>", for example "00 x 4096". If
+        # the summary does not fit in the machine code column, the first row of words is shown instead.
+        column_width = words_per_str*(hex_width+1)
+        summary = f'{word_run.value:0{hex_width}x} x {len(word_run)} '
+        if len(summary) > column_width:
+            summary = f'{word_run.value:0{hex_width}x} '*words_per_str
+        return f'{summary:<{column_width}}'
@@ -1,7 +1,6 @@
 import io
 import sys
 
-from bespokeasm.assembler.bytecode.word import Word
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.line_object.directive_line.address import AddressOrgLine
@@ -21,7 +20,7 @@ class MinHexPrettyPrinter(PrettyPrinterBase):
         address_width = int(self.model.address_size/4)
         for lobj in self.line_objects:
             if isinstance(lobj, LineWithWords) and not lobj.is_muted:
-                line_bytes = Word.words_to_bytes(lobj.get_words(), False, 'big')
+                line_bytes = lobj.get_word_buffer().to_bytes(compact=False)
                 for b in line_bytes:
                     if line_byte_count == 0:
                         output.write(':')
@@ -0,0 +1,60 @@
+import io
+import json
+from typing import TextIO
+
+from bespokeasm.assembler.line_object import LineObject
+from bespokeasm.assembler.line_object import LineWithWords
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.pretty_printer import PrettyPrinterBase
+
+
+class SourceMapPrettyPrinter(PrettyPrinterBase):
+    '''
+    Writes an address to source line map as JSON lines. The first line is a header naming the record
+    fields and the source files, and every following line is one compact record per line of generated
+    byte code:
+
+        {"format": "bespokeasm-srcmap", "version": 1, "fields": ["address", "word_count", "file", "line"],
+         "files": ["main.asm", "lib.asm"], "record_count": 2}
+        [256, 3, 0, 12]
+        [259, 1, 1, 4]
+
+    The `file` field is an index into the header's `files` list. Records are sorted by address and never
+    overlap, so tools can binary search them to find the source line of any address.
+    '''
+    FORMAT_NAME = 'bespokeasm-srcmap'
+    FORMAT_VERSION = 1
+    RECORD_FIELDS = ('address', 'word_count', 'file', 'line')
+
+    def __init__(self, line_objs: list[LineObject], model: AssemblerModel) -> None:
+        super().__init__(line_objs, model)
+
+    def pretty_print(self) -> str:
+        output = io.StringIO()
+        self.write(output)
+        return output.getvalue()
+
+    def write(self, output: TextIO) -> None:
+        emitting_lines = sorted(
+            (
+                lobj for lobj in self.line_objects
+                if isinstance(lobj, LineWithWords) and not lobj.is_muted and lobj.word_count > 0
+            ),
+            key=lambda lobj: lobj.address,
+        )
+        file_indices: dict[str, int] = {}
+        for lobj in emitting_lines:
+            file_indices.setdefault(lobj.line_id.filename, len(file_indices))
+        header = {
+            'format': SourceMapPrettyPrinter.FORMAT_NAME,
+            'version': SourceMapPrettyPrinter.FORMAT_VERSION,
+            'fields': list(SourceMapPrettyPrinter.RECORD_FIELDS),
+            'files': list(file_indices),
+            'record_count': len(emitting_lines),
+        }
+        output.write(json.dumps(header))
+        output.write('\n')
+        for lobj in emitting_lines:
+            output.write(
+                f'[{lobj.address}, {lobj.word_count}, {file_indices[lobj.line_id.filename]}, {lobj.line_id.line_num}]\n'
+            )
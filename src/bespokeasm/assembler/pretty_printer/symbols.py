@@ -0,0 +1,86 @@
+import io
+import json
+from typing import TextIO
+
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.label_scope import LabelScopeType
+from bespokeasm.assembler.label_scope.named_scope_manager import NamedScopeManager
+from bespokeasm.assembler.line_object import LineObject
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.pretty_printer import PrettyPrinterBase
+
+
+class SymbolTablePrettyPrinter(PrettyPrinterBase):
+    '''
+    Writes every label and constant resolved during assembly as a JSON document for debuggers and
+    emulators. Symbols are gathered from the global scope and all of its file and local scopes, plus
+    the named scopes, and are listed in value order:
+
+        {
+            "format": "bespokeasm-symbols",
+            "version": 1,
+            "symbols": [
+                {"name": "start", "value": 256, "kind": "label", "scope": "global",
+                 "scope_reference": null, "file": "main.asm", "line": 3},
+                ...
+            ]
+        }
+
+    `kind` is either `label` or `constant`. `scope` is one of `global`, `file`, `local`, or `named`,
+    and `scope_reference` identifies the specific scope: the file name for file scope, the parent label
+    for local scope, and the scope name for named scopes.
+    '''
+    FORMAT_NAME = 'bespokeasm-symbols'
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        line_objs: list[LineObject],
+        model: AssemblerModel,
+        named_scope_manager: NamedScopeManager | None = None,
+    ) -> None:
+        super().__init__(line_objs, model)
+        self._named_scope_manager = named_scope_manager
+
+    def pretty_print(self) -> str:
+        output = io.StringIO()
+        self.write(output)
+        return output.getvalue()
+
+    def write(self, output: TextIO) -> None:
+        json.dump(
+            {
+                'format': SymbolTablePrettyPrinter.FORMAT_NAME,
+                'version': SymbolTablePrettyPrinter.FORMAT_VERSION,
+                'symbols': self.symbols(),
+            },
+            output,
+            indent=2,
+        )
+        output.write('\n')
+
+    def symbols(self) -> list[dict]:
+        '''Returns a record for each symbol, sorted by value and then name.'''
+        scopes: list[LabelScope] = list(self.model.global_label_scope.iter_scopes())
+        if self._named_scope_manager is not None:
+            scopes.extend(self._named_scope_manager.scopes)
+        records = [
+            SymbolTablePrettyPrinter._symbol_record(scope, label_info)
+            for scope in scopes
+            for label_info in scope.labels
+        ]
+        records.sort(key=lambda record: (record['value'], record['name']))
+        return records
+
+    @staticmethod
+    def _symbol_record(scope: LabelScope, label_info: LabelScope.LabelInfo) -> dict:
+        line_id = label_info.line_id
+        return {
+            'name': label_info.label,
+            'value': label_info.value,
+            'kind': 'constant' if label_info.is_constant else 'label',
+            'scope': scope.type.name.lower(),
+            'scope_reference': None if scope.type == LabelScopeType.GLOBAL else scope.reference,
+            'file': line_id.filename if line_id is not None else None,
+            'line': line_id.line_num if line_id is not None else None,
+        }
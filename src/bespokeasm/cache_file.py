@@ -0,0 +1,43 @@
+"""
+JSON cache files that speed up later runs, such as of the rendered documentation or of the files each
+program includes. A cache is only used by the bespokeasm version and cache format that wrote it. A cache
+that is missing, unreadable, or stale reads as empty, and one that can't be written is only warned about,
+as the next run just redoes the work.
+"""
+import json
+from pathlib import Path
+
+import click
+from bespokeasm import BESPOKEASM_VERSION_STR
+
+
+def load_cache_file(cache_file_path: str, format_version: int) -> dict | None:
+    """Returns the cached data, or None if the cache is missing, unreadable, or was written by another version."""
+    try:
+        with open(cache_file_path, encoding='utf-8') as f:
+            cache_data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cache_data, dict)
+        or cache_data.get('format') != format_version
+        or cache_data.get('bespokeasm_version') != BESPOKEASM_VERSION_STR
+    ):
+        return None
+    return cache_data
+
+
+def save_cache_file(cache_file_path: str, format_version: int, data: dict, description: str) -> None:
+    """Writes the data to the cache, warning if the `description` cache file can't be written."""
+    cache_data = {
+        'format': format_version,
+        'bespokeasm_version': BESPOKEASM_VERSION_STR,
+        **data,
+    }
+    try:
+        cache_file = Path(cache_file_path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f, ensure_ascii=False)
+    except OSError as e:
+        click.echo(f'Warning: Failed to write {description} cache file: {e}', err=True)
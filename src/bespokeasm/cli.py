@@ -11,10 +11,13 @@ VERBOSE_HELP = 'Verbosity of logging (counting flag: -v, -vv, -vvv or --verbose
 
 class CommandHandlers(NamedTuple):
     compile: Callable[..., Any]
+    check: Callable[..., Any]
     docs: Callable[..., Any]
     vscode: Callable[..., Any]
     sublime: Callable[..., Any]
     vim: Callable[..., Any]
+    all_editors: Callable[..., Any]
+    lsp: Callable[..., Any]
 
 
 def _detect_shell():
@@ -172,7 +175,7 @@ def build_cli(handlers: CommandHandlers):
         )
     @click.option(
             '--pretty-print-format', '-t',
-            type=click.Choice(['minhex', 'hex', 'intel_hex', 'listing'], case_sensitive=False),
+            type=click.Choice(['minhex', 'hex', 'intel_hex', 'srec', 'listing'], case_sensitive=False),
             default='listing',
             help='The format that should be used when pretty printing.',
     )
@@ -198,6 +201,60 @@ def build_cli(handlers: CommandHandlers):
             default=False,
             help='Treat warnings as errors and stop compilation.'
         )
+    @click.option(
+            '--emit', multiple=True, default=[],
+            metavar='FORMAT[=PATH]',
+            help='Additionally write the output FORMAT (binary, minhex, hex, intel_hex, srec, listing, symbols, '
+                 'srcmap, or memory_map) to PATH. '
+                 'PATH defaults to the output file name with a format specific extension, and "-" writes to stdout. '
+                 'Multiple can be seperately specified.'
+        )
+    @click.option(
+            '--split-by-memzone',
+            is_flag=True,
+            default=False,
+            help='Write one binary image per memory zone instead of a single image. Each image spans its zone\'s '
+                 'address range and is named by adding the zone name before the binary file extension.'
+        )
+    @click.option(
+            '--depfile',
+            type=click.Path(dir_okay=False),
+            help='Write a make compatible dependency file to this path listing the ISA configuration file and '
+                 'every assembly and binary file the output files depend on.'
+        )
+    @click.option(
+            '--make-depfile', '-MD',
+            is_flag=True,
+            default=False,
+            help='Write a make compatible dependency file named after the binary image with a *.d extension. '
+                 'Ignored if --depfile is given.'
+        )
+    @click.option(
+            '--memory-map',
+            is_flag=True,
+            default=False,
+            help='Print how much of each memory zone is used, its largest free region, and its fragmentation. '
+                 'Use "--emit memory_map" to write the same report as JSON.'
+        )
+    @click.option(
+            '--max-errors',
+            type=click.IntRange(min=0),
+            default=1,
+            help='Keep assembling after an error and stop once this many errors are found, reporting them all. '
+                 '0 reports every error found.'
+        )
+    @click.option(
+            '--diagnostics-format',
+            type=click.Choice(['text', 'json'], case_sensitive=False),
+            default='text',
+            help='The format of errors, warnings, and messages. "json" writes one JSON object per line with the '
+                 'severity, category, file, line, columns, message, and related locations of each diagnostic.'
+        )
+    @click.option(
+            '--diagnostics-output',
+            type=click.Path(dir_okay=False),
+            help='The file diagnostics are written to as they are reported. Defaults to stderr.'
+        )
     def compile(
                 asm_file,
                 config_file,
@@ -213,6 +270,14 @@ def build_cli(handlers: CommandHandlers):
                 include_path,
                 macro_symbol,
                 warnings_as_errors,
+                emit,
+                split_by_memzone,
+                depfile,
+                make_depfile,
+                memory_map,
+                max_errors,
+                diagnostics_format,
+                diagnostics_output,
             ):
         return handlers.compile(
             asm_file,
@@ -229,6 +294,80 @@ def build_cli(handlers: CommandHandlers):
             include_path,
             macro_symbol,
             warnings_as_errors,
+            emit,
+            split_by_memzone,
+            depfile,
+            make_depfile,
+            memory_map,
+            max_errors,
+            diagnostics_format,
+            diagnostics_output,
+        )
+
+    @main.command(short_help='check that assembly files assemble without writing any output')
+    @click.argument('asm_files', nargs=-1, required=True, type=click.Path(dir_okay=False, exists=True))
+    @click.option(
+            '--config-file', '-c', required=True,
+            type=click.Path(dir_okay=False, exists=True),
+            help='The filepath to the instruction set configuration file,'
+        )
+    @click.option('--verbose', '-v', count=True, help=VERBOSE_HELP)
+    @click.option(
+            '--include-path', '-I', multiple=True, default=[],
+            type=click.Path(file_okay=False),
+            help='Path to use when searching for included asm files. Multiple paths can be seperately specified.'
+        )
+    @click.option(
+            '--macro-symbol', '-D', multiple=True, default=[],
+            help='Predefine name as macro. Assigning name with value may be done with "name=value" syntax. '
+                 'Multiple can be seperately specified.'
+        )
+    @click.option(
+            '--warnings-as-errors', '-W',
+            is_flag=True,
+            default=False,
+            help='Treat warnings as errors and fail the check.'
+        )
+    @click.option(
+            '--max-errors',
+            type=click.IntRange(min=0),
+            default=1,
+            help='Keep checking a file after an error and stop once this many errors are found in it, reporting '
+                 'them all. 0 reports every error found.'
+        )
+    @click.option(
+            '--diagnostics-format',
+            type=click.Choice(['text', 'json'], case_sensitive=False),
+            default='text',
+            help='The format of errors, warnings, and messages. "json" writes one JSON object per line with the '
+                 'severity, category, file, line, columns, message, and related locations of each diagnostic.'
+        )
+    @click.option(
+            '--diagnostics-output',
+            type=click.Path(dir_okay=False),
+            help='The file diagnostics are written to as they are reported. Defaults to stderr.'
+        )
+    def check(
+                asm_files,
+                config_file,
+                verbose,
+                include_path,
+                macro_symbol,
+                warnings_as_errors,
+                max_errors,
+                diagnostics_format,
+                diagnostics_output,
+            ):
+        return handlers.check(
+            asm_files,
+            config_file,
+            verbose,
+            include_path,
+            macro_symbol,
+            warnings_as_errors,
+            max_errors,
+            diagnostics_format,
+            diagnostics_output,
         )
 
     @main.command(cls=OptionForwardingCommand, short_help='generate markdown documentation for an ISA')
@@ -239,12 +378,38 @@ def build_cli(handlers: CommandHandlers):
     )
     @click.option(
         '--output-file', '-o',
-        type=click.Path(dir_okay=False),
-        help='The filepath to write the markdown documentation. Defaults to same directory as config file with .md extension.'
+        type=click.Path(),
+        help='The filepath to write the markdown documentation. Defaults to same directory as config file with .md extension. '
+             'With --split-by-category, the directory to write the markdown files into.'
     )
     @click.option('--verbose', '-v', count=True, help=VERBOSE_HELP)
-    def docs(config_file, output_file, verbose):
-        return handlers.docs(config_file, output_file, verbose)
+    @click.option(
+        '--split-by-category', is_flag=True, default=False,
+        help='Write an index file and one markdown file per instruction and macro category into the output directory. '
+             'Files whose content is unchanged are not rewritten.'
+    )
+    @click.option(
+        '--cache-file',
+        type=click.Path(dir_okay=False),
+        help='A file caching the rendered documentation of each instruction and macro. Instructions and macros whose '
+             'documentation is unchanged since the previous run reuse their cached rendering.'
+    )
+    def docs(config_file, output_file, verbose, split_by_category, cache_file):
+        return handlers.docs(config_file, output_file, verbose, split_by_category, cache_file)
+
+    @main.command(cls=OptionForwardingCommand, short_help='run a language server for an ISA over stdio')
+    @click.option(
+        '--config-file', '-c', required=True,
+        type=click.Path(dir_okay=False, exists=True),
+        help='The filepath to the instruction set configuration file (YAML or JSON).'
+    )
+    @click.option(
+        '--include-path', '-I', multiple=True, default=[],
+        type=click.Path(file_okay=False),
+        help='Path to use when searching for included asm files. Multiple paths can be seperately specified.'
+    )
+    def lsp(config_file, include_path):
+        return handlers.lsp(config_file, include_path)
 
     @main.group(cls=AutoOptionGroup, short_help='generate a language syntax highlighting extension')
     def generate_extension():
@@ -338,6 +503,53 @@ def build_cli(handlers: CommandHandlers):
     def vim(config_file, verbose, editor_config_dir, language_name, language_version, code_extension):
         return handlers.vim(config_file, verbose, editor_config_dir, language_name, language_version, code_extension)
 
+    @generate_extension.command(
+        'all', cls=OptionForwardingCommand, short_help='generate for VisualStudio Code, Sublime, and Vim at once'
+    )
+    @click.option(
+            '--config-file', '-c', required=True,
+            type=click.Path(dir_okay=False, exists=True),
+            help='The filepath to the instruction set configuration file,'
+        )
+    @click.option('--verbose', '-v', count=True, help=VERBOSE_HELP)
+    @click.option(
+            '--vscode-config-dir', default='~/.vscode/',
+            type=click.Path(file_okay=False),
+            help='The file path the Visual Studo Code configuration directory containing the extensions directory.'
+        )
+    @click.option(
+            '--sublime-config-dir', default='~/',
+            type=click.Path(file_okay=False),
+            help='The directory into which the generated Sublime package should be saved.'
+        )
+    @click.option(
+            '--vim-config-dir', default='~/.vim/',
+            type=click.Path(file_okay=False),
+            help='The Vim configuration root directory containing syntax/ and ftdetect/.'
+        )
+    @click.option(
+            '--language-name', '-l',
+            help='The name of the language in the editor configuration files. Defaults to value '
+                 'provide in instruction set configuration file.'
+        )
+    @click.option(
+            '--language-version', '-k',
+            help='The version of the language in the editor configuration files. Defaults to '
+                 'value provide in instruction set configuration file.'
+        )
+    @click.option(
+            '--code-extension', '-x',
+            help='The file extension for asssembly code files for this language configuraton.'
+        )
+    def all_editors(
+        config_file, verbose, vscode_config_dir, sublime_config_dir, vim_config_dir,
+        language_name, language_version, code_extension,
+    ):
+        return handlers.all_editors(
+            config_file, verbose, vscode_config_dir, sublime_config_dir, vim_config_dir,
+            language_name, language_version, code_extension,
+        )
+
     @main.command(cls=OptionForwardingCommand, short_help='install shell tab completions for bespokeasm')
     @click.option(
         '--shell', 'target_shell',
@@ -8,10 +8,13 @@ def _noop(*_args, **_kwargs):
 
 _NOOP_HANDLERS = CommandHandlers(
     compile=_noop,
+    check=_noop,
     docs=_noop,
     vscode=_noop,
     sublime=_noop,
     vim=_noop,
+    all_editors=_noop,
+    lsp=_noop,
 )
 
 
@@ -1,9 +1,18 @@
+import importlib.resources as pkg_resources
+import os
 import re
+import secrets
+from types import ModuleType
 
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
 from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.configgen.word_regex import build_word_trie_regex
+from bespokeasm.configgen.word_regex import PCRE_NEVER_MATCH
 from bespokeasm.utilities import PATTERN_ALLOWED_LABELS
 
+# placeholders in the packaged editor resources look like `##LABEL_PATTERN##`
+TEMPLATE_TOKEN_PATTERN = re.compile(r'##[A-Z_]+##')
+
 
 class LanguageConfigGenerator:
     def __init__(
@@ -14,8 +23,11 @@ class LanguageConfigGenerator:
                 language_name: str,
                 language_version: str,
                 code_extension: str,
+                model: AssemblerModel = None,
             ) -> None:
-        self._model = AssemblerModel(config_file_path, is_verbose, DiagnosticReporter())
+        if model is None:
+            model = AssemblerModel(config_file_path, is_verbose, DiagnosticReporter())
+        self._model = model
         self._verbose = is_verbose
         self._export_dir = export_dir
         self._language_name = self.model.isa_name if language_name is None else language_name
@@ -56,29 +68,52 @@ class LanguageConfigGenerator:
         token: str,
         item_list: list[str]
     ) -> str:
-        # first, convert the item list into individual regex strings, which is
-        # mostly escaping any periods or other special characters
-        regex_list = [re.escape(item) for item in item_list]
-        regex_str = '\\b' + '\\b|\\b'.join(regex_list) + '\\b'
+        # the items are factored into a prefix trie with a single word boundary wrapper, as a flat
+        # alternation of many words makes the editor's regex engine backtrack heavily on every line
+        trie_regex = build_word_trie_regex(item_list)
+        regex_str = '\\b' + trie_regex + '\\b' if trie_regex else PCRE_NEVER_MATCH
         return template_str.replace(token, regex_str)
 
-    def _replace_token_in_file(self, file_path: str, token_to_replace: str, replacement_string: str):
+    def _render_template(self, template_str: str, tokens: dict[str, str]) -> str:
         """
-        Replaces all instances of a specified token within a text file
-        with a given replacement string, writing the changes back to the same file.
-
-        Args:
-            file_path: The path to the text file.
-            token_to_replace: The string to be replaced.
-            replacement_string: The string to replace the token with.
+        Replaces every `##TOKEN##` placeholder found in `tokens` in a single pass over the template.
+        Placeholders not in `tokens` are left as is.
         """
-        with open(file_path) as file:
-            content = file.read()
+        if not tokens:
+            return template_str
+        return TEMPLATE_TOKEN_PATTERN.sub(lambda m: tokens.get(m.group(0), m.group(0)), template_str)
 
-        modified_content = content.replace(token_to_replace, replacement_string)
+    def _render_resource(self, resource_package: ModuleType, resource_name: str, tokens: dict[str, str] = None) -> str:
+        """
+        Reads a packaged resource file and returns its text with the given tokens replaced.
+        """
+        template_str = pkg_resources.files(resource_package).joinpath(resource_name).read_text(encoding='utf-8')
+        return self._render_template(template_str, tokens or {})
 
-        with open(file_path, 'w') as file:
-            file.write(modified_content)
+    def _write_output_file(self, file_path: str, content: str | bytes) -> None:
+        """
+        Writes a generated file in one go. The content is written to a temporary file in the same
+        directory which then replaces the destination, so an interrupted run never leaves a partially
+        written file behind.
+        """
+        directory = os.path.dirname(os.path.abspath(file_path))
+        tmp_path = os.path.join(directory, f'.{os.path.basename(file_path)}.{secrets.token_hex(8)}.tmp')
+        # created with the usual default permissions, which the kernel restricts by the process umask
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            if isinstance(content, bytes):
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+            else:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.verbose > 1:
+            print(f'  generated {os.path.basename(file_path)}')
 
     def _label_pattern(self) -> str:
         pattern = PATTERN_ALLOWED_LABELS.pattern
@@ -1,8 +1,28 @@
+"""
+Builds the hover documentation shown by the editor extensions.
+
+The Sublime Text and VS Code extensions read the documentation from a hover-doc bundle file so that
+a hover lookup never parses the whole document set. A bundle is laid out as:
+
+    BESPOKEASM-HOVER-DOCS <version> <index length>\n
+    <index>
+    <entries>
+
+The index is UTF-8 encoded JSON with the same nesting as the dictionary built by `build_hover_docs()`,
+except that each markdown string is replaced by an `[offset, length]` pair locating its UTF-8 bytes in
+the entries section. Identical markdown strings share one entry.
+"""
+import json
+
 from bespokeasm.assembler.model import AssemblerModel
 from bespokeasm.docsgen import build_documentation_model
 from bespokeasm.docsgen import directive_docs
 from bespokeasm.docsgen.markdown_generator import MarkdownGenerator
 
+HOVER_DOC_BUNDLE_FILENAME = 'hover-docs.bundle'
+HOVER_DOC_BUNDLE_MAGIC = 'BESPOKEASM-HOVER-DOCS'
+HOVER_DOC_BUNDLE_VERSION = 1
+
 
 def build_hover_docs(assembler_model: AssemblerModel, verbose: int = 0) -> dict:
     doc_model = build_documentation_model(assembler_model, verbose)
@@ -36,3 +56,46 @@ def build_hover_docs(assembler_model: AssemblerModel, verbose: int = 0) -> dict:
         'registers': markdown_generator.generate_register_hover_docs(),
         'expression_functions': directive_docs.EXPRESSION_FUNCTION_DOCS,
     }
+
+
+def encode_hover_doc_bundle(hover_docs: dict) -> bytes:
+    """Encodes a hover documentation dictionary, such as built by `build_hover_docs()`, as a bundle."""
+    entries = bytearray()
+    entry_locations: dict[str, list[int]] = {}
+
+    def index_node(node: dict) -> dict:
+        index = {}
+        for key, value in node.items():
+            if isinstance(value, dict):
+                index[key] = index_node(value)
+            elif isinstance(value, str):
+                if value not in entry_locations:
+                    data = value.encode('utf-8')
+                    entry_locations[value] = [len(entries), len(data)]
+                    entries.extend(data)
+                index[key] = entry_locations[value]
+        return index
+
+    index_data = json.dumps(index_node(hover_docs), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header = f'{HOVER_DOC_BUNDLE_MAGIC} {HOVER_DOC_BUNDLE_VERSION} {len(index_data)}\n'.encode('ascii')
+    return header + index_data + bytes(entries)
+
+
+def decode_hover_doc_bundle(data: bytes) -> dict:
+    """Decodes every entry of a hover-doc bundle back into a hover documentation dictionary."""
+    header_end = data.find(b'\n')
+    fields = data[:header_end].decode('ascii', errors='replace').split(' ') if header_end >= 0 else []
+    if len(fields) != 3 or fields[0] != HOVER_DOC_BUNDLE_MAGIC or fields[1] != str(HOVER_DOC_BUNDLE_VERSION):
+        raise ValueError('not a version 1 hover-doc bundle')
+    index_start = header_end + 1
+    entries_start = index_start + int(fields[2])
+    index = json.loads(data[index_start:entries_start].decode('utf-8'))
+
+    def decode_node(node: dict) -> dict:
+        return {
+            key: decode_node(value) if isinstance(value, dict) else
+            data[entries_start + value[0]:entries_start + value[0] + value[1]].decode('utf-8')
+            for key, value in node.items()
+        }
+
+    return decode_node(index)
@@ -1,4 +1,5 @@
 import importlib.resources as pkg_resources
+import io
 import json
 import os
 import re
@@ -12,11 +13,15 @@ from bespokeasm.assembler.keywords import BYTECODE_DIRECTIVES_SET
 from bespokeasm.assembler.keywords import COMPILER_DIRECTIVES_SET
 from bespokeasm.assembler.keywords import EXPRESSION_FUNCTIONS_SET
 from bespokeasm.assembler.keywords import PREPROCESSOR_DIRECTIVES_SET
+from bespokeasm.assembler.model import AssemblerModel
 from bespokeasm.configgen import LanguageConfigGenerator
 from bespokeasm.configgen.color_scheme import build_hover_color_map
 from bespokeasm.configgen.color_scheme import DEFAULT_COLOR_SCHEME
 from bespokeasm.configgen.color_scheme import SyntaxElement
 from bespokeasm.configgen.hover_docs import build_hover_docs
+from bespokeasm.configgen.hover_docs import encode_hover_doc_bundle
+from bespokeasm.configgen.hover_docs import HOVER_DOC_BUNDLE_FILENAME
+from bespokeasm.configgen.word_regex import build_word_trie_regex
 from ruamel.yaml import YAML
 
 
@@ -29,8 +34,11 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
                 language_name: str,
                 language_version: str,
                 code_extension: str,
+                model: AssemblerModel = None,
             ) -> None:
-        super().__init__(config_file_path, is_verbose, save_config_dir, language_name, language_version, code_extension)
+        super().__init__(
+            config_file_path, is_verbose, save_config_dir, language_name, language_version, code_extension, model
+        )
 
     def _generate_sublime_color_rules(self) -> list:
         """
@@ -150,10 +158,11 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
         self._generate_files_in_dir(tmp_dir)
 
         archive_fp = os.path.join(self.export_dir, self.language_name + '.sublime-package')
-        archive_file = ZipFile(archive_fp, 'w')
-        for f in os.listdir(tmp_dir):
-            archive_file.write(os.path.join(tmp_dir, f), f)
-        archive_file.close()
+        archive_data = io.BytesIO()
+        with ZipFile(archive_data, 'w') as archive_file:
+            for f in sorted(os.listdir(tmp_dir)):
+                archive_file.write(os.path.join(tmp_dir, f), f)
+        self._write_output_file(archive_fp, archive_data.getvalue())
 
         shutil.rmtree(tmp_dir)
 
@@ -254,19 +263,19 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
             del syntax_dict['contexts']['compiler_labels']
 
         # compiler directives
-        directives_regex = '|'.join(['\\.'+d for d in COMPILER_DIRECTIVES_SET])
+        directives_regex = build_word_trie_regex(['.' + d for d in COMPILER_DIRECTIVES_SET])
         directives_str = syntax_dict['contexts']['compiler_directives'][0]['match']
         syntax_dict['contexts']['compiler_directives'][0]['match'] = \
             directives_str.replace('##DIRECTIVES##', directives_regex)
 
         # data types
-        datatypes_regex = '|'.join(['\\.'+d for d in BYTECODE_DIRECTIVES_SET])
+        datatypes_regex = build_word_trie_regex(['.' + d for d in BYTECODE_DIRECTIVES_SET])
         datatypes_str = syntax_dict['contexts']['data_types_directives'][0]['match']
         syntax_dict['contexts']['data_types_directives'][0]['match'] = datatypes_str.replace('##DATATYPES##', datatypes_regex)
 
         # preprocessor directives
-        # Sort by length (desc) to avoid prefix matches like 'if' matching 'ifdef'
-        preprocessor_regex = '|'.join(sorted(PREPROCESSOR_DIRECTIVES_SET, key=len, reverse=True))
+        # the trie tries the longer directive first, so 'if' does not shadow 'ifdef'
+        preprocessor_regex = build_word_trie_regex(PREPROCESSOR_DIRECTIVES_SET)
         updated = False
         for rule in syntax_dict['contexts']['preprocessor_directives'][0]['push']:
             if 'match' in rule and '##PREPROCESSOR##' in rule['match']:
@@ -278,7 +287,7 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
             sys.exit('ERROR - INTERNAL - did not find correct preprocessor rule for Sublime systax file.')
 
         # expression functions
-        func_regex = '|'.join([d for d in EXPRESSION_FUNCTIONS_SET])
+        func_regex = build_word_trie_regex(EXPRESSION_FUNCTIONS_SET)
         updated = False
         for rule in syntax_dict['contexts']['numerical_expressions']:
             if 'scope' in rule and rule['scope'] == 'keyword.operator.word':
@@ -292,17 +301,10 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
         # save syntax file
         syntax_fp = os.path.join(destination_dir, self.language_name + '.sublime-syntax')
         yaml_dumper = YAML()
-        with open(syntax_fp, 'w', encoding='utf-8') as f:
-            yaml_dumper.dump(syntax_dict, f)
-        # now reinsert the YAML prefix. This is required due to an odditity in Sublime's package loading.
-        # I don't know a better way to do this.
-        with open(syntax_fp) as f:
-            file_txt = f.read()
-        updated_file_txt = '%YAML 1.2\n---\n' + file_txt
-        with open(syntax_fp, 'w') as f:
-            f.write(updated_file_txt)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(syntax_fp)}')
+        syntax_stream = io.StringIO()
+        yaml_dumper.dump(syntax_dict, syntax_stream)
+        # the YAML prefix is required due to an odditity in Sublime's package loading.
+        self._write_output_file(syntax_fp, '%YAML 1.2\n---\n' + syntax_stream.getvalue())
 
         # generate color scheme file from central configuration
         color_scheme_fp = os.path.join(destination_dir, self.language_name + '.sublime-color-scheme')
@@ -318,49 +320,29 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
             'rules': self._generate_sublime_color_rules()
         }
 
-        with open(color_scheme_fp, 'w', encoding='utf-8') as f:
-            json.dump(color_scheme_data, f, indent=2)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(color_scheme_fp)}')
+        self._write_output_file(color_scheme_fp, json.dumps(color_scheme_data, indent=2))
 
         hover_docs = build_hover_docs(self.model, self.verbose)
-        docs_fp = os.path.join(destination_dir, 'instruction-docs.json')
-        with open(docs_fp, 'w', encoding='utf-8') as docs_file:
-            json.dump(hover_docs, docs_file, ensure_ascii=False, indent=2)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(docs_fp)}')
+        docs_fp = os.path.join(destination_dir, HOVER_DOC_BUNDLE_FILENAME)
+        self._write_output_file(docs_fp, encode_hover_doc_bundle(hover_docs))
 
         hover_colors = build_hover_color_map(DEFAULT_COLOR_SCHEME)
         hover_colors_fp = os.path.join(destination_dir, 'hover-colors.json')
-        with open(hover_colors_fp, 'w', encoding='utf-8') as colors_file:
-            json.dump(hover_colors, colors_file, ensure_ascii=False, indent=2)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(hover_colors_fp)}')
-
-        # copy keymap files over
-        keymap_fp = os.path.join(destination_dir, 'Default.sublime-keymap')
-        fp = pkg_resources.files(resources).joinpath('sublime-keymap.json')
-        shutil.copy(str(fp), keymap_fp)
-        # replace the file extension name in the keymap file
-        self._replace_token_in_file(keymap_fp, '##FILEEXTENSION##', self.code_extension)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(keymap_fp)}')
-
-        fp = pkg_resources.files(resources).joinpath('bespokeasm_hover.py')
-        hover_plugin = self._hover_plugin_filename()
-        hover_plugin_fp = os.path.join(destination_dir, hover_plugin)
-        shutil.copy(str(fp), hover_plugin_fp)
-        self._replace_token_in_file(hover_plugin_fp, '##PACKAGE_NAME##', self.language_name)
-        self._replace_token_in_file(hover_plugin_fp, '##LABEL_PATTERN##', self._label_pattern())
-        self._replace_token_in_file(hover_plugin_fp, '##MNEMONIC_PATTERN##', self._mnemonic_pattern())
+        self._write_output_file(hover_colors_fp, json.dumps(hover_colors, ensure_ascii=False, indent=2))
+
         if self.model.registers:
             register_regex = self._replace_token_with_regex_list(
                 '##REGISTERS##', '##REGISTERS##', self.model.registers
             )
-            self._replace_token_in_file(hover_plugin_fp, '##REGISTERS##', register_regex)
         else:
-            self._replace_token_in_file(hover_plugin_fp, '##REGISTERS##', '(?!)')
-        hover_color_tokens = {
+            register_regex = '(?!)'
+        tokens = {
+            '##FILEEXTENSION##': self.code_extension,
+            '##LANGUAGE_NAME##': self.language_name,
+            '##PACKAGE_NAME##': self.language_name,
+            '##LABEL_PATTERN##': self._label_pattern(),
+            '##MNEMONIC_PATTERN##': self._mnemonic_pattern(),
+            '##REGISTERS##': register_regex,
             '##HOVER_COLOR_INSTRUCTION##': hover_colors['instruction'],
             '##HOVER_COLOR_COMPILER_LABEL##': hover_colors['compiler_label'],
             '##HOVER_COLOR_LABEL_USAGE##': hover_colors['label_usage'],
@@ -378,45 +360,22 @@ class SublimeConfigGenerator(LanguageConfigGenerator):
             '##HOVER_COLOR_PUNCTUATION_PREPROCESSOR##': hover_colors['punctuation_preprocessor'],
             '##HOVER_COLOR_OPERATOR##': hover_colors['operator'],
         }
-        for token, color in hover_color_tokens.items():
-            self._replace_token_in_file(hover_plugin_fp, token, color)
-        if self.verbose > 1:
-            print(f'  generated {hover_plugin}')
-
-        fp = pkg_resources.files(resources).joinpath('sublime-settings.json')
-        settings_fp = os.path.join(destination_dir, f'{self.language_name}.sublime-settings')
-        shutil.copy(str(fp), settings_fp)
-        self._replace_token_in_file(settings_fp, '##LANGUAGE_NAME##', self.language_name)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(settings_fp)}')
-
-        # copy all snippet, macro, and preference files
+
+        # map each packaged resource to the file it is rendered into
+        output_filenames = {
+            'sublime-keymap.json': 'Default.sublime-keymap',
+            'bespokeasm_hover.py': self._hover_plugin_filename(),
+            'sublime-settings.json': f'{self.language_name}.sublime-settings',
+        }
         for filename in [path.name for path in pkg_resources.files(resources).iterdir()]:
             if filename.endswith('.sublime-snippet.xml'):
-                file_obj = pkg_resources.files(resources).joinpath(filename)
-                with pkg_resources.as_file(file_obj) as fp:
-                    snippet_name = filename.partition('.')[0]
-                    snippet_fp = os.path.join(destination_dir, self.language_name + '__' + snippet_name + '.sublime-snippet')
-                    shutil.copy(fp, snippet_fp)
-                    # replace the file extension name in the snippet file
-                    self._replace_token_in_file(snippet_fp, '##FILEEXTENSION##', self.code_extension)
-                    if self.verbose > 1:
-                        print(f'  generated {os.path.basename(snippet_fp)}')
+                output_filenames[filename] = self.language_name + '__' + filename.partition('.')[0] + '.sublime-snippet'
             elif filename.endswith('.sublime-macro.json'):
-                file_obj = pkg_resources.files(resources).joinpath(filename)
-                with pkg_resources.as_file(file_obj) as fp:
-                    macro_filename = filename.partition('.')[0] + '.sublime-macro'
-                    macro_fp = os.path.join(destination_dir, macro_filename)
-                    shutil.copy(fp, macro_fp)
-                    if self.verbose > 1:
-                        print(f'  generated {os.path.basename(macro_fp)}')
+                output_filenames[filename] = filename.partition('.')[0] + '.sublime-macro'
             elif filename.endswith('.tmPreferences.xml'):
-                file_obj = pkg_resources.files(resources).joinpath(filename)
-                with pkg_resources.as_file(file_obj) as fp:
-                    pref_filename = filename.partition('.')[0] + '.tmPreferences'
-                    pref_fp = os.path.join(destination_dir, pref_filename)
-                    shutil.copy(fp, pref_fp)
-                    # replace the file extension name in the preference file
-                    self._replace_token_in_file(pref_fp, '##FILEEXTENSION##', self.code_extension)
-                    if self.verbose > 1:
-                        print(f'  generated {os.path.basename(pref_fp)}')
+                output_filenames[filename] = filename.partition('.')[0] + '.tmPreferences'
+        for filename, output_filename in output_filenames.items():
+            self._write_output_file(
+                os.path.join(destination_dir, output_filename),
+                self._render_resource(resources, filename, tokens),
+            )
@@ -2,6 +2,7 @@ import html
 import json
 import os
 import re
+import threading
 from urllib.parse import parse_qs
 from urllib.parse import quote
 from urllib.parse import unquote
@@ -21,6 +22,9 @@ PREPROCESSOR_DIRECTIVE_PATTERN = re.compile(r'#(\S+)\b', re.IGNORECASE)
 REGISTER_PATTERN = re.compile(r'(?i)(?:##REGISTERS##)')
 INCLUDE_PATTERN = re.compile(r'^\s*#include\s+(?:"([^"]+)"|<([^>]+)>|(\S+))', re.IGNORECASE)
 PACKAGE_NAME = '##PACKAGE_NAME##'
+HOVER_DOC_BUNDLE_FILENAME = 'hover-docs.bundle'
+HOVER_DOC_BUNDLE_MAGIC = 'BESPOKEASM-HOVER-DOCS'
+HOVER_DOC_BUNDLE_VERSION = '1'
 
 LABEL_USAGE_SCOPE = 'variable.other.label.usage'
 CONSTANT_USAGE_SCOPE = 'variable.other.constant.usage'
@@ -67,8 +71,18 @@ DEFAULT_SEMANTIC_HIGHLIGHTING = True
 _DOCS_CACHE = {}
 _COLOR_CACHE = {}
 _VIEW_CACHE = {}
+# Per-window indexes of the files read from disk, keyed by window id and then by file path.
+_WINDOW_FILE_INDEXES = {}
+_INDEX_LOCK = threading.RLock()
 _PENDING_SEMANTIC = {}
+# The usages last pushed to each view, used to find what changed since the previous update.
+_SEMANTIC_SNAPSHOTS = {}
+# The blocks of lines edited in each view since its last update, recorded as the edits are made.
+_DIRTY_SEMANTIC_BLOCKS = {}
 SEMANTIC_DEBOUNCE_MS = 350
+# Usage regions are added to the view in blocks of lines, each under its own region key, so an
+# edit only replaces the regions of the blocks it changed.
+SEMANTIC_BLOCK_LINES = 256
 
 
 def _is_bespokeasm_view(view):
@@ -153,6 +167,48 @@ def _get_semantic_setting(view):
     return DEFAULT_SEMANTIC_HIGHLIGHTING
 
 
+class _HoverDocBundle:
+    """
+    Read-only mapping over one level of a hover-doc bundle index. Nested levels are returned as
+    bundles too, and markdown entries are decoded from the bundle data only when looked up.
+    """
+
+    def __init__(self, data, entries_start, index):
+        self._data = data
+        self._entries_start = entries_start
+        self._index = index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __getitem__(self, key):
+        value = self._index[key]
+        if isinstance(value, dict):
+            return _HoverDocBundle(self._data, self._entries_start, value)
+        start = self._entries_start + value[0]
+        return self._data[start:start + value[1]].decode('utf-8')
+
+    def get(self, key, default=None):
+        if key not in self._index:
+            return default
+        return self[key]
+
+
+def _parse_hover_doc_bundle(data):
+    """Parse the header and index of a hover-doc bundle, leaving the entries undecoded."""
+    header_end = data.find(b'\n')
+    fields = data[:header_end].decode('ascii', 'replace').split(' ') if header_end >= 0 else []
+    if len(fields) != 3 or fields[0] != HOVER_DOC_BUNDLE_MAGIC or fields[1] != HOVER_DOC_BUNDLE_VERSION:
+        return None
+    index_start = header_end + 1
+    entries_start = index_start + int(fields[2])
+    index = json.loads(data[index_start:entries_start].decode('utf-8'))
+    return _HoverDocBundle(data, entries_start, index)
+
+
 def _load_instruction_docs(view):
     package_name = _get_package_name(view)
     if not package_name:
@@ -160,10 +216,9 @@ def _load_instruction_docs(view):
     cached = _DOCS_CACHE.get(package_name)
     if cached is not None:
         return cached
-    resource_path = 'Packages/{}/instruction-docs.json'.format(package_name)
+    resource_path = 'Packages/{}/{}'.format(package_name, HOVER_DOC_BUNDLE_FILENAME)
     try:
-        raw = sublime.load_resource(resource_path)
-        docs = json.loads(raw)
+        docs = _parse_hover_doc_bundle(sublime.load_binary_resource(resource_path))
     except Exception:
         docs = None
     _DOCS_CACHE[package_name] = docs
@@ -198,31 +253,87 @@ def _collect_lines(view):
     return view.substr(sublime.Region(0, view.size())).splitlines()
 
 
-def _collect_included_files(lines, base_dir, visited=None):
+def _get_window_file_index(view):
+    window = view.window() if view else None
+    window_id = window.id() if window else 0
+    return _WINDOW_FILE_INDEXES.setdefault(window_id, {})
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime, stat.st_size)
+
+
+def _load_file_entry(path, file_index):
+    """Return the index entry for a file on disk, reading it again only if its mtime or size changed."""
+    signature = _file_signature(path)
+    if signature is None:
+        file_index.pop(path, None)
+        return None
+    entry = file_index.get(path)
+    if entry is not None and entry.get('signature') == signature:
+        return entry
+    try:
+        with open(path, encoding='utf-8') as handle:
+            lines = handle.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        file_index.pop(path, None)
+        return None
+    entry = _make_entry(path, lines)
+    entry['signature'] = signature
+    file_index[path] = entry
+    return entry
+
+
+def _make_entry(path, lines, line_info=None):
+    if line_info is None:
+        line_info = [_analyze_line(text) for text in lines]
+    return {
+        'path': path,
+        'lines': lines,
+        'line_info': line_info,
+        'includes': [include for include in (_parse_include_path(text) for text in lines) if include],
+    }
+
+
+def _collect_included_files(lines, base_dir, visited=None, file_index=None):
     if visited is None:
         visited = set()
+    if file_index is None:
+        file_index = {}
     entries = []
     for line in lines:
         include_path = _parse_include_path(line)
         if not include_path:
             continue
-        resolved = include_path
-        if base_dir and not os.path.isabs(resolved):
-            resolved = os.path.normpath(os.path.join(base_dir, include_path))
-        if resolved in visited:
-            continue
-        try:
-            with open(resolved, encoding='utf-8') as handle:
-                include_lines = handle.read().splitlines()
-        except OSError:
-            continue
-        visited.add(resolved)
-        entries.append({'path': resolved, 'lines': include_lines})
-        include_base_dir = os.path.dirname(resolved)
-        entries.extend(_collect_included_files(include_lines, include_base_dir, visited))
+        entries.extend(_collect_included_entries(include_path, base_dir, visited, file_index))
     return entries
 
 
+def _collect_included_entries(include_path, base_dir, visited, file_index):
+    resolved = include_path
+    if base_dir and not os.path.isabs(resolved):
+        resolved = os.path.normpath(os.path.join(base_dir, include_path))
+    if resolved in visited:
+        return []
+    entry = _load_file_entry(resolved, file_index)
+    if entry is None:
+        return []
+    visited.add(resolved)
+    entries = [entry]
+    include_base_dir = os.path.dirname(resolved)
+    for nested_include in entry['includes']:
+        entries.extend(_collect_included_entries(nested_include, include_base_dir, visited, file_index))
+    return entries
+
+
+def _entries_are_current(entries):
+    return all(_file_signature(entry['path']) == entry.get('signature') for entry in entries)
+
+
 def _get_code_regions(text):
     ranges = []
     segment_start = 0
@@ -295,51 +406,119 @@ def _iter_constant_definitions(text):
     return [(name, col)]
 
 
-def _build_definition_map(entries, definition_kind):
+def _iter_code_words(text):
+    words = []
+    for start, end in _get_code_regions(text):
+        segment = text[start:end]
+        for match in WORD_PATTERN.finditer(segment):
+            words.append((match.group(0), start + match.start()))
+    return words
+
+
+def _analyze_line(text):
+    """Return the label definitions, constant definitions, and code words of a line."""
+    return (_iter_label_definitions(text), _iter_constant_definitions(text), _iter_code_words(text))
+
+
+def _get_line_info(entry):
+    line_info = entry.get('line_info')
+    if line_info is None:
+        line_info = [_analyze_line(text) for text in entry.get('lines', [])]
+        entry['line_info'] = line_info
+    return line_info
+
+
+def _changed_line_range(old_lines, new_lines):
+    """Return (start, old_end, new_end): the lines between the unchanged head and tail of an edit."""
+    limit = min(len(old_lines), len(new_lines))
+    start = 0
+    while start < limit and old_lines[start] == new_lines[start]:
+        start += 1
+    old_end = len(old_lines)
+    new_end = len(new_lines)
+    while old_end > start and new_end > start and old_lines[old_end - 1] == new_lines[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+def _update_line_info(old_lines, old_line_info, new_lines):
+    """Reuse the analysis of the unchanged lines at the start and end of an edited view."""
+    start, old_end, new_end = _changed_line_range(old_lines, new_lines)
+    return old_line_info[:start] + [_analyze_line(text) for text in new_lines[start:new_end]] + old_line_info[old_end:]
+
+
+def _get_entry_definitions(entry, definition_kind):
+    """Return the first definition of each name in one file, cached on the entry."""
+    cache_key = '{}_definitions'.format(definition_kind)
+    definitions = entry.get(cache_key)
+    if definitions is not None:
+        return definitions
     definitions = {}
-    for entry in entries:
-        path = entry.get('path')
-        for line_index, text in enumerate(entry.get('lines', [])):
-            if definition_kind == 'label':
-                line_definitions = _iter_label_definitions(text)
-            else:
-                line_definitions = _iter_constant_definitions(text)
-            for name, col in line_definitions:
-                if name in definitions:
-                    continue
+    info_index = 0 if definition_kind == 'label' else 1
+    path = entry.get('path')
+    for line_index, info in enumerate(_get_line_info(entry)):
+        for name, col in info[info_index]:
+            if name not in definitions:
                 definitions[name] = {
                     'line': line_index,
                     'col': col,
                     'path': path
                 }
+    entry[cache_key] = definitions
+    return definitions
+
+
+def _build_definition_map(entries, definition_kind):
+    definitions = {}
+    for entry in entries:
+        for name, location in _get_entry_definitions(entry, definition_kind).items():
+            definitions.setdefault(name, location)
     return definitions
 
 
 def _get_view_state(view):
     view_id = view.id()
     change_count = view.change_count()
-    cached = _VIEW_CACHE.get(view_id)
-    if cached and cached.get('change_count') == change_count:
-        return cached
-
-    lines = _collect_lines(view)
-    entries = [{'path': view.file_name(), 'lines': lines}]
-    base_dir = os.path.dirname(view.file_name()) if view.file_name() else None
-    if base_dir:
-        entries.extend(_collect_included_files(lines, base_dir))
+    with _INDEX_LOCK:
+        cached = _VIEW_CACHE.get(view_id)
+        if (
+            cached
+            and cached.get('change_count') == change_count
+            and _entries_are_current(cached['included_entries'])
+        ):
+            return cached
 
-    label_map = _build_definition_map(entries, 'label')
-    constant_map = _build_definition_map(entries, 'constant')
-    state = {
-        'change_count': change_count,
-        'lines': lines,
-        'label_map': label_map,
-        'constant_map': constant_map,
-        'current_path': view.file_name(),
-        'included_entries': entries[1:] if len(entries) > 1 else [],
-    }
-    _VIEW_CACHE[view_id] = state
-    return state
+        lines = _collect_lines(view)
+        if cached is not None:
+            line_info = _update_line_info(cached['lines'], cached['line_info'], lines)
+        else:
+            line_info = None
+        view_entry = _make_entry(view.file_name(), lines, line_info)
+        entries = [view_entry]
+        base_dir = os.path.dirname(view.file_name()) if view.file_name() else None
+        if base_dir:
+            entries.extend(_collect_included_files(lines, base_dir, file_index=_get_window_file_index(view)))
+
+        label_map = _build_definition_map(entries, 'label')
+        constant_map = _build_definition_map(entries, 'constant')
+        state = {
+            'change_count': change_count,
+            'lines': lines,
+            'line_info': view_entry['line_info'],
+            'label_map': label_map,
+            'constant_map': constant_map,
+            'current_path': view.file_name(),
+            'included_entries': entries[1:] if len(entries) > 1 else [],
+        }
+        _VIEW_CACHE[view_id] = state
+        return state
+
+
+def _warm_view_state(view):
+    """Build the index for a view ahead of the first hover. Runs on Sublime's async thread."""
+    if _is_bespokeasm_view(view):
+        _get_view_state(view)
 
 
 def _get_token_at_point(view, point):
@@ -392,6 +571,21 @@ def _build_definition_hover(name, location, current_path, token_color=None):
     return '<p>{}: {}</p>'.format(code_html, location_text)
 
 
+def _get_reference_index(entry):
+    """Return the usage locations of every word in one file, excluding definitions. Cached on the entry."""
+    references = entry.get('reference_index')
+    if references is not None:
+        return references
+    references = {}
+    for line_index, (label_defs, const_defs, words) in enumerate(_get_line_info(entry)):
+        for word, col in words:
+            if (word, col) in label_defs or (word, col) in const_defs:
+                continue
+            references.setdefault(word, []).append((line_index, col))
+    entry['reference_index'] = references
+    return references
+
+
 def _find_references(token, state):
     """Find all usage locations of a token (excluding its definition).
 
@@ -399,29 +593,10 @@ def _find_references(token, state):
     """
     refs = []
     current_path = state.get('current_path')
-
-    def _scan_lines(lines, path):
-        for line_index, text in enumerate(lines):
-            label_defs = None
-            const_defs = None
-            for start, end in _get_code_regions(text):
-                segment = text[start:end]
-                for match in WORD_PATTERN.finditer(segment):
-                    if match.group(0) != token:
-                        continue
-                    col = start + match.start()
-                    if label_defs is None:
-                        label_defs = _iter_label_definitions(text)
-                    if const_defs is None:
-                        const_defs = _iter_constant_definitions(text)
-                    is_def = any(n == token and c == col for n, c in label_defs)
-                    is_def = is_def or any(n == token and c == col for n, c in const_defs)
-                    if not is_def:
-                        refs.append({'line': line_index, 'col': col, 'path': path})
-
-    _scan_lines(state.get('lines', []), current_path)
-    for entry in state.get('included_entries', []):
-        _scan_lines(entry.get('lines', []), entry.get('path'))
+    for entry in [state] + list(state.get('included_entries', [])):
+        path = current_path if entry is state else entry.get('path')
+        for line_index, col in _get_reference_index(entry).get(token, []):
+            refs.append({'line': line_index, 'col': col, 'path': path})
     return refs
 
 
@@ -763,7 +938,7 @@ def _render_code_block(lines, hover_colors):
     }
     compiler_directive_names = {'org', 'memzone', 'align'}
     data_type_names = {
-        'fill', 'zero', 'zerountil',
+        'fill', 'zero', 'zerountil', 'incbin',
         'byte', '2byte', '4byte', '8byte', '16byte', 'cstr', 'asciiz',
     }
 
@@ -1040,69 +1215,145 @@ def _schedule_semantic_update(view):
     sublime.set_timeout_async(_run, SEMANTIC_DEBOUNCE_MS)
 
 
-def _update_semantic_regions(view):
-    if not _is_bespokeasm_view(view):
-        return
-    if not _get_semantic_setting(view):
-        view.erase_regions('bespokeasm_label_usages')
-        view.erase_regions('bespokeasm_constant_usages')
-        return
-    state = _get_view_state(view)
-    labels = set(state['label_map'].keys())
-    constants = set(state['constant_map'].keys())
-    label_regions = []
-    constant_regions = []
-
-    # Compute line start offsets once instead of
-    # calling view.text_point() per match.
-    line_offsets = []
-    offset = 0
-    for text in state['lines']:
-        line_offsets.append(offset)
-        offset += len(text) + 1  # +1 for newline
-
-    for line_index, text in enumerate(state['lines']):
-        # Use pure-text code region detection instead of
-        # view.match_selector() per match (avoids API round-trips).
-        code_regions = _get_code_regions(text)
-        if not code_regions:
+def _line_usages(info, labels, constants):
+    """Return the (col, length, is_constant) of each label and constant usage on one line."""
+    label_defs, const_defs, words = info
+    usages = []
+    for word, col in words:
+        if word in constants:
+            if (word, col) not in const_defs:
+                usages.append((col, len(word), True))
             continue
+        if word in labels and (word, col) not in label_defs:
+            usages.append((col, len(word), False))
+    return tuple(usages)
 
-        label_definition_starts = set(_iter_label_definitions(text))
-        constant_definition_starts = set(_iter_constant_definitions(text))
-        base_offset = line_offsets[line_index]
-
-        for region_start, region_end in code_regions:
-            segment = text[region_start:region_end]
-            for match in WORD_PATTERN.finditer(segment):
-                word = match.group(0)
-                col = region_start + match.start()
-                if word in constants:
-                    if (word, col) in constant_definition_starts:
-                        continue
-                    start = base_offset + col
-                    constant_regions.append(sublime.Region(start, start + len(word)))
-                    continue
-                if word in labels:
-                    if (word, col) in label_definition_starts:
-                        continue
-                    start = base_offset + col
-                    label_regions.append(sublime.Region(start, start + len(word)))
 
+def _semantic_region_keys(block_index):
+    return (
+        'bespokeasm_label_usages_{}'.format(block_index),
+        'bespokeasm_constant_usages_{}'.format(block_index),
+    )
+
+
+def _mark_semantic_lines_dirty(view):
+    """Record the blocks of lines being edited so their regions are refreshed on the next update."""
+    dirty_blocks = _DIRTY_SEMANTIC_BLOCKS.setdefault(view.id(), set())
+    for region in view.sel():
+        first_row = view.rowcol(region.begin())[0]
+        last_row = view.rowcol(region.end())[0]
+        dirty_blocks.update(range(first_row // SEMANTIC_BLOCK_LINES, last_row // SEMANTIC_BLOCK_LINES + 1))
+
+
+def _erase_semantic_regions(view):
+    _DIRTY_SEMANTIC_BLOCKS.pop(view.id(), None)
+    snapshot = _SEMANTIC_SNAPSHOTS.pop(view.id(), None)
+    if snapshot is None:
+        return
+    for block_index in range(len(snapshot['blocks'])):
+        for key in _semantic_region_keys(block_index):
+            view.erase_regions(key)
+
+
+def _compute_line_usages(state, snapshot, labels, constants):
+    """
+    Return the usages of every line and the range of edited lines. Only the lines edited since the
+    snapshot and the lines using a name whose definition was added or removed are re-scanned.
+    """
+    line_info = _get_line_info(state)
+    if snapshot is None:
+        return [_line_usages(info, labels, constants) for info in line_info], (0, len(line_info))
+    start, old_end, new_end = _changed_line_range(snapshot['lines'], state['lines'])
+    usages = (
+        snapshot['usages'][:start]
+        + [_line_usages(info, labels, constants) for info in line_info[start:new_end]]
+        + snapshot['usages'][old_end:]
+    )
+    changed_names = (labels ^ snapshot['labels']) | (constants ^ snapshot['constants'])
+    if changed_names:
+        references = _get_reference_index(state)
+        affected_lines = set()
+        for name in changed_names:
+            affected_lines.update(line_index for line_index, _ in references.get(name, ()))
+        for line_index in affected_lines:
+            usages[line_index] = _line_usages(line_info[line_index], labels, constants)
+    return usages, (start, new_end)
+
+
+def _add_block_regions(view, block_index, block_start, lines, block_usages):
+    label_regions = []
+    constant_regions = []
+    # Compute line start offsets from the block start instead of calling view.text_point() per line.
+    offset = view.text_point(block_start, 0)
+    for line_index, usages in enumerate(block_usages):
+        for col, length, is_constant in usages:
+            start = offset + col
+            if is_constant:
+                constant_regions.append(sublime.Region(start, start + length))
+            else:
+                label_regions.append(sublime.Region(start, start + length))
+        offset += len(lines[block_start + line_index]) + 1  # +1 for newline
+    label_key, constant_key = _semantic_region_keys(block_index)
     view.add_regions(
-        'bespokeasm_label_usages',
+        label_key,
         label_regions,
         scope=LABEL_USAGE_SCOPE,
         flags=sublime.DRAW_SOLID_UNDERLINE
     )
     view.add_regions(
-        'bespokeasm_constant_usages',
+        constant_key,
         constant_regions,
         scope=CONSTANT_USAGE_SCOPE,
         flags=sublime.DRAW_SOLID_UNDERLINE
     )
 
 
+def _update_semantic_regions(view):
+    if not _is_bespokeasm_view(view):
+        return
+    if not _get_semantic_setting(view):
+        _erase_semantic_regions(view)
+        return
+    state = _get_view_state(view)
+    labels = set(state['label_map'].keys())
+    constants = set(state['constant_map'].keys())
+    snapshot = _SEMANTIC_SNAPSHOTS.get(view.id())
+    usages, (edit_start, edit_end) = _compute_line_usages(state, snapshot, labels, constants)
+
+    # Regions already in the view move with the text as it is edited, so a block only needs to be
+    # added again when the usages on its lines changed or its text was edited. An edit that was
+    # reverted before this update leaves no difference in the text, so the blocks recorded as edited
+    # by on_modified are refreshed too. When lines are inserted or removed, the regions of every later
+    # block move onto the lines of another block, so they are all added again.
+    refresh_blocks = _DIRTY_SEMANTIC_BLOCKS.pop(view.id(), set())
+    lines = state['lines']
+    if snapshot is not None and len(lines) != len(snapshot['lines']):
+        edit_end = max(edit_end, len(lines))
+    if edit_end > edit_start:
+        refresh_blocks.update(range(edit_start // SEMANTIC_BLOCK_LINES, (edit_end - 1) // SEMANTIC_BLOCK_LINES + 1))
+    blocks = [
+        tuple(usages[block_start:block_start + SEMANTIC_BLOCK_LINES])
+        for block_start in range(0, len(lines), SEMANTIC_BLOCK_LINES)
+    ]
+    previous_blocks = snapshot['blocks'] if snapshot is not None else []
+    for block_index, block_usages in enumerate(blocks):
+        is_unchanged = block_index < len(previous_blocks) and previous_blocks[block_index] == block_usages
+        if is_unchanged and block_index not in refresh_blocks:
+            continue
+        _add_block_regions(view, block_index, block_index * SEMANTIC_BLOCK_LINES, lines, block_usages)
+    for block_index in range(len(blocks), len(previous_blocks)):
+        for key in _semantic_region_keys(block_index):
+            view.erase_regions(key)
+
+    _SEMANTIC_SNAPSHOTS[view.id()] = {
+        'lines': lines,
+        'usages': usages,
+        'labels': labels,
+        'constants': constants,
+        'blocks': blocks,
+    }
+
+
 class BespokeAsmHoverListener(sublime_plugin.EventListener):
     def on_hover(self, view, point, hover_zone):
         if hover_zone != sublime.HOVER_TEXT or not _is_bespokeasm_view(view):
@@ -1237,13 +1488,30 @@ class BespokeAsmHoverListener(sublime_plugin.EventListener):
 
 class BespokeAsmSemanticListener(sublime_plugin.EventListener):
     def on_load_async(self, view):
+        _warm_view_state(view)
         _schedule_semantic_update(view)
 
+    def on_modified(self, view):
+        if _is_bespokeasm_view(view):
+            _mark_semantic_lines_dirty(view)
+
     def on_modified_async(self, view):
         _schedule_semantic_update(view)
 
     def on_activated_async(self, view):
+        _warm_view_state(view)
         _schedule_semantic_update(view)
 
     def on_post_save_async(self, view):
         _schedule_semantic_update(view)
+
+    def on_close(self, view):
+        with _INDEX_LOCK:
+            _VIEW_CACHE.pop(view.id(), None)
+        _PENDING_SEMANTIC.pop(view.id(), None)
+        _SEMANTIC_SNAPSHOTS.pop(view.id(), None)
+        _DIRTY_SEMANTIC_BLOCKS.pop(view.id(), None)
+
+    def on_pre_close_window(self, window):
+        with _INDEX_LOCK:
+            _WINDOW_FILE_INDEXES.pop(window.id(), None)
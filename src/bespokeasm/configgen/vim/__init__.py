@@ -1,14 +1,28 @@
 import os
+import re
 from pathlib import Path
 
 from bespokeasm.assembler.keywords import BYTECODE_DIRECTIVES_SET
 from bespokeasm.assembler.keywords import COMPILER_DIRECTIVES_SET
 from bespokeasm.assembler.keywords import EXPRESSION_FUNCTIONS_SET
 from bespokeasm.assembler.keywords import PREPROCESSOR_DIRECTIVES_SET
+from bespokeasm.assembler.model import AssemblerModel
 from bespokeasm.configgen import LanguageConfigGenerator
 from bespokeasm.configgen.color_scheme import DEFAULT_COLOR_SCHEME
 from bespokeasm.configgen.color_scheme import SyntaxElement
 from bespokeasm.configgen.hover_docs import build_hover_docs
+from bespokeasm.configgen.word_regex import build_word_trie_regex
+from bespokeasm.configgen.word_regex import VIM_DIALECT
+from bespokeasm.configgen.word_regex import vim_escape
+
+
+# words Vim reads as arguments of `:syn keyword` rather than as keywords (see :help :syn-keyword)
+_VIM_SYN_KEYWORD_ARGUMENTS = frozenset([
+    'cchar', 'conceal', 'concealends', 'contained', 'containedin', 'contains', 'display', 'extend',
+    'fold', 'nextgroup', 'oneline', 'skipempty', 'skipnl', 'skipwhite', 'transparent',
+])
+# the characters in Vim's default 'iskeyword', limited to ASCII
+_VIM_KEYWORD_PATTERN = re.compile(r'[A-Za-z0-9_]+')
 
 
 class VimConfigGenerator(LanguageConfigGenerator):
@@ -20,8 +34,11 @@ class VimConfigGenerator(LanguageConfigGenerator):
                 language_name: str,
                 language_version: str,
                 code_extension: str,
+                model: AssemblerModel = None,
             ) -> None:
-        super().__init__(config_file_path, is_verbose, vim_config_dir, language_name, language_version, code_extension)
+        super().__init__(
+            config_file_path, is_verbose, vim_config_dir, language_name, language_version, code_extension, model
+        )
 
     def _get_vim_cterm_approximation(self, hex_color: str) -> int:
         """
@@ -187,47 +204,71 @@ ctermbg=NONE gui=bold cterm=bold')
         ftdetect_fp = os.path.join(ftdetect_dir_path, f'{vim_filetype}.vim')
 
         syntax_text = self._build_syntax_vim(vim_filetype)
-        with open(syntax_fp, 'w', encoding='utf-8') as f:
-            f.write(syntax_text)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(syntax_fp)}')
+        self._write_output_file(syntax_fp, syntax_text)
 
         ftdetect_text = self._build_ftdetect_vim(vim_filetype)
-        with open(ftdetect_fp, 'w', encoding='utf-8') as f:
-            f.write(ftdetect_text)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(ftdetect_fp)}')
+        self._write_output_file(ftdetect_fp, ftdetect_text)
 
         ftplugin_fp = os.path.join(ftplugin_dir_path, f'{vim_filetype}.vim')
         ftplugin_text = self._build_ftplugin_vim(vim_filetype)
-        with open(ftplugin_fp, 'w', encoding='utf-8') as f:
-            f.write(ftplugin_text)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(ftplugin_fp)}')
+        self._write_output_file(ftplugin_fp, ftplugin_text)
 
         docs_fp = os.path.join(autoload_dir_path, f'{vim_filetype}_docs.vim')
         docs_text = self._build_docs_autoload_vim(vim_filetype)
-        with open(docs_fp, 'w', encoding='utf-8') as f:
-            f.write(docs_text)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(docs_fp)}')
+        self._write_output_file(docs_fp, docs_text)
 
     def _vim_escape(self, token: str) -> str:
-        # Escape Vim regex special chars
-        # Escape backslash first
-        escaped = token.replace('\\', '\\\\')
-        for ch in ['.', '+', '*', '?', '^', '$', '(', ')', '[', ']', '{', '}', '|', '-']:
-            escaped = escaped.replace(ch, '\\' + ch)
-        return escaped
+        return vim_escape(token)
 
     def _alternation(self, items: list[str]) -> str:
         if len(items) == 0:
             return ''
-        return '\\%(' + '\\|'.join([self._vim_escape(it) for it in items]) + '\\)'
+        # factored into a prefix trie so Vim does not try every word in turn at each position
+        return '\\%(' + build_word_trie_regex(items, VIM_DIALECT) + '\\)'
+
+    def _mnemonic_alternation(self, items: list[str]) -> str:
+        # Decorated mnemonics such as `m+` or `++inc` can start or end with a non-keyword character,
+        # where \< and \> cannot match. Those boundaries then only require no adjacent keyword
+        # character. The look-behind is much slower, so \< and \> are kept whenever they can match.
+        alternation = self._alternation(items)
+        if len(alternation) == 0:
+            return ''
+        all_start_with_keyword = all(_VIM_KEYWORD_PATTERN.match(item[0]) for item in items)
+        all_end_with_keyword = all(_VIM_KEYWORD_PATTERN.match(item[-1]) for item in items)
+        start = '\\<' if all_start_with_keyword else '\\k\\@1<!'
+        end = '\\>' if all_end_with_keyword else '\\k\\@!'
+        return start + alternation + end
 
     def _join_keywords(self, items: list[str]) -> str:
         # space-separated; do not escape to allow Vim to treat each as a keyword
-        return ' '.join(items)
+        return ' '.join(sorted(items))
+
+    def _split_keywords(self, items: list[str], decorated_items: list[str]) -> tuple[list[str], list[str]]:
+        """
+        Splits tokens into those that can be highlighted with `syn keyword`, which Vim looks up in a hash
+        table instead of trying a regex at every position, and those that need a regex. A token needs a
+        regex if it is not made of keyword characters, or if it starts one of the `decorated_items`
+        followed by a non-keyword character, e.g. `mov` when there is a `mov.b`, because a keyword takes
+        priority over a regex match starting at the same position.
+        """
+        keywords: list[str] = []
+        patterns: list[str] = []
+        for item in items:
+            is_keyword = (
+                _VIM_KEYWORD_PATTERN.fullmatch(item) is not None
+                and item.lower() not in _VIM_SYN_KEYWORD_ARGUMENTS
+                and not any(
+                    len(decorated) > len(item)
+                    and decorated.lower().startswith(item.lower())
+                    and _VIM_KEYWORD_PATTERN.match(decorated[len(item)]) is None
+                    for decorated in decorated_items
+                )
+            )
+            if is_keyword:
+                keywords.append(item)
+            else:
+                patterns.append(item)
+        return keywords, patterns
 
     def _build_syntax_vim(self, vim_filetype: str) -> str:
         # Collect token groups
@@ -246,21 +287,27 @@ ctermbg=NONE gui=bold cterm=bold')
 
         expr_functions = list(EXPRESSION_FUNCTIONS_SET)
 
+        # Plain identifiers are emitted as `syn keyword` items, which Vim matches far faster than
+        # regexes. Regexes are kept for decorated tokens and for contextual constructs.
+        operations = list(self.model.operation_mnemonics)
+        decorated_operations = [op for op in operations if _VIM_KEYWORD_PATTERN.fullmatch(op) is None]
+        instruction_keywords, instruction_patterns = self._split_keywords(instructions, decorated_operations)
+        macro_keywords, macro_patterns = self._split_keywords(macros, decorated_operations)
+        register_keywords, register_patterns = self._split_keywords(registers, [])
+        label_keywords, label_patterns = self._split_keywords(predefined_labels, [])
+        expr_func_keywords, expr_func_patterns = self._split_keywords(expr_functions, [])
+        preproc_keywords, preproc_patterns = self._split_keywords(preproc_directives, preproc_directives)
+
         # Build vim regex alternations
         directives_words = [d.lstrip('.') for d in compiler_directives]
         datatypes_words = [d.lstrip('.') for d in data_types]
         # Emit separate regions for each directive to keep patterns simple.
-        preproc_alt = self._alternation(preproc_directives)
-        registers_kw = self._join_keywords(registers)
-        instructions_alt = self._alternation(instructions)
-        macros_alt = self._alternation(macros)
-        operations_alt = self._alternation(list(self.model.operation_mnemonics))
-        # Add word boundary to each label alternative as well
-        if predefined_labels:
-            labels_alt = '\\%(' + '\\|'.join([self._vim_escape(w) + r'\>' for w in predefined_labels]) + '\\)'
-        else:
-            labels_alt = ''
-        expr_funcs_alt = self._alternation(expr_functions)
+        registers_alt = self._alternation(register_patterns)
+        instructions_alt = self._mnemonic_alternation(instruction_patterns)
+        macros_alt = self._mnemonic_alternation(macro_patterns)
+        operations_alt = self._mnemonic_alternation(operations)
+        labels_alt = self._alternation(label_patterns)
+        expr_funcs_alt = self._alternation(expr_func_patterns)
 
         lang_group = vim_filetype
         bracket_contains = ','.join([
@@ -310,7 +357,7 @@ ctermbg=NONE gui=bold cterm=bold')
             f'{lang_group}ParenExpr',
             f'{lang_group}Param',
         ])
-        operation_line_end = fr'\s*\ze\<{operations_alt}\>\|\s*\ze;\|$' if operations_alt else r'\s*\ze;\|$'
+        operation_line_end = fr'\s*\ze{operations_alt}\|\s*\ze;\|$' if operations_alt else r'\s*\ze;\|$'
 
         lines: list[str] = []
         lines.append('if exists("b:current_syntax")')
@@ -381,26 +428,54 @@ skip=+\\.+ end=+'+ oneline contains={lang_group}Escape")
                 fr'contains={directive_contains}'
             )
         # Preprocessor
-        if preproc_alt:
+        if preproc_directives:
             # Highlight the leading '#' separately as punctuation and chain to macro name
             lines.append(fr'syn match {lang_group}PreProcPunc /^#/ nextgroup={lang_group}PreProc skipwhite')
-            # Highlight the macro name as a contained match following '#'
-            for w in preproc_directives:
+            # Highlight the macro name as a contained keyword or match following '#'
+            if preproc_keywords:
+                lines.append(f'syn keyword {lang_group}PreProc {self._join_keywords(preproc_keywords)} contained')
+            for w in preproc_patterns:
                 lines.append(fr'syn match {lang_group}PreProc /\<' + self._vim_escape(w) + r'\>/ contained')
         # Expression functions
+        if expr_func_keywords:
+            lines.append(f'syn keyword {lang_group}Operator ' + self._join_keywords(expr_func_keywords))
         if expr_funcs_alt:
             lines.append(fr'syn match {lang_group}Operator /\<' + expr_funcs_alt + r'\>/')
         # Operators
         lines.append(rf'syn match {lang_group}Operator /==\|!=\|>=\|<=\|>>\|<<\|[+\-*/&|^]/')
         # Registers
-        if registers_kw:
-            lines.append(f'syn keyword {lang_group}Register ' + registers_kw)
-        # Instructions and macros
+        if register_keywords:
+            lines.append(f'syn keyword {lang_group}Register ' + self._join_keywords(register_keywords))
+        if registers_alt:
+            lines.append(fr'syn match {lang_group}Register /\<' + registers_alt + r'\>/')
+        # Instructions and macros. Keyword mnemonics chain to a contained operands region, while
+        # decorated mnemonics start a region of their own.
+        if instruction_keywords or macro_keywords:
+            # the operands start where the mnemonic's skipped white space ends. Vim ignores an empty
+            # end match at the start of a region, so a mnemonic directly following another is matched
+            # as a contained item.
+            lines.append(
+                fr'syn region {lang_group}Operands '
+                fr'start=/[^;[:space:]]\@=/ '
+                fr'end=/{operation_line_end}/ oneline contained '
+                fr'contains={operand_contains},{lang_group}Instruction,{lang_group}Macro,'
+                fr'{lang_group}InstrLine,{lang_group}MacroLine'
+            )
+        if instruction_keywords:
+            lines.append(
+                f'syn keyword {lang_group}Instruction {self._join_keywords(instruction_keywords)} '
+                f'nextgroup={lang_group}Operands skipwhite'
+            )
+        if macro_keywords:
+            lines.append(
+                f'syn keyword {lang_group}Macro {self._join_keywords(macro_keywords)} '
+                f'nextgroup={lang_group}Operands skipwhite'
+            )
         if instructions_alt:
             lines.append(
                 fr'syn region {lang_group}InstrLine '
                 fr'matchgroup={lang_group}Instruction '
-                fr'start=/\<{instructions_alt}\>/ '
+                fr'start=/{instructions_alt}/ '
                 fr'end=/{operation_line_end}/ oneline '
                 fr'contains={operand_contains}'
             )
@@ -408,13 +483,15 @@ skip=+\\.+ end=+'+ oneline contains={lang_group}Escape")
             lines.append(
                 fr'syn region {lang_group}MacroLine '
                 fr'matchgroup={lang_group}Macro '
-                fr'start=/\<{macros_alt}\>/ '
+                fr'start=/{macros_alt}/ '
                 fr'end=/{operation_line_end}/ oneline '
                 fr'contains={operand_contains}'
             )
         # Compiler predefined labels
+        if label_keywords:
+            lines.append(f'syn keyword {lang_group}CompilerLabel ' + self._join_keywords(label_keywords))
         if labels_alt:
-            lines.append(fr'syn match {lang_group}CompilerLabel /\<' + labels_alt + r'/')
+            lines.append(fr'syn match {lang_group}CompilerLabel /\<' + labels_alt + r'\>/')
 
         # Punctuation
         lines.append(
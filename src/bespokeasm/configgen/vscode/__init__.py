@@ -1,7 +1,5 @@
-import importlib.resources as pkg_resources
 import json
 import os
-import shutil
 from pathlib import Path
 
 import bespokeasm.configgen.vscode.resources as resources
@@ -9,10 +7,14 @@ from bespokeasm.assembler.keywords import BYTECODE_DIRECTIVES_SET
 from bespokeasm.assembler.keywords import COMPILER_DIRECTIVES_SET
 from bespokeasm.assembler.keywords import EXPRESSION_FUNCTIONS_SET
 from bespokeasm.assembler.keywords import PREPROCESSOR_DIRECTIVES_SET
+from bespokeasm.assembler.model import AssemblerModel
 from bespokeasm.configgen import LanguageConfigGenerator
 from bespokeasm.configgen.color_scheme import DEFAULT_COLOR_SCHEME
 from bespokeasm.configgen.color_scheme import SyntaxElement
 from bespokeasm.configgen.hover_docs import build_hover_docs
+from bespokeasm.configgen.hover_docs import encode_hover_doc_bundle
+from bespokeasm.configgen.hover_docs import HOVER_DOC_BUNDLE_FILENAME
+from bespokeasm.configgen.word_regex import build_word_trie_regex
 
 
 class VSCodeConfigGenerator(LanguageConfigGenerator):
@@ -24,8 +26,11 @@ class VSCodeConfigGenerator(LanguageConfigGenerator):
                 language_name: str,
                 language_version: str,
                 code_extension: str,
+                model: AssemblerModel = None,
             ) -> None:
-        super().__init__(config_file_path, is_verbose, vscode_config_dir, language_name,  language_version, code_extension)
+        super().__init__(
+            config_file_path, is_verbose, vscode_config_dir, language_name, language_version, code_extension, model
+        )
 
     def _generate_vscode_color_rules(self) -> list:
         """
@@ -159,9 +164,7 @@ class VSCodeConfigGenerator(LanguageConfigGenerator):
         Path(extension_dir_path).mkdir(parents=True, exist_ok=True)
         Path(os.path.join(extension_dir_path, 'syntaxes')).mkdir(parents=True, exist_ok=True)
         # generate package.json
-        fp = pkg_resources.files(resources).joinpath('package.json')
-        with open(fp) as json_file:
-            package_json = json.load(json_file)
+        package_json = json.loads(self._render_resource(resources, 'package.json'))
 
         scope_name = 'source.' + self.language_id
         theme_filename = self.language_id + '-theme.json'
@@ -192,15 +195,10 @@ class VSCodeConfigGenerator(LanguageConfigGenerator):
             config_block['properties'] = updated_properties
 
         package_fp = os.path.join(extension_dir_path, 'package.json')
-        with open(package_fp, 'w', encoding='utf-8') as f:
-            json.dump(package_json, f, ensure_ascii=False, indent=4)
-            if self.verbose > 1:
-                print('  generated package.json')
+        self._write_output_file(package_fp, json.dumps(package_json, ensure_ascii=False, indent=4))
 
         # generate tmGrammar.json
-        fp = pkg_resources.files(resources).joinpath('tmGrammar.json')
-        with open(fp) as json_file:
-            grammar_json = json.load(json_file)
+        grammar_json = json.loads(self._render_resource(resources, 'tmGrammar.json'))
 
         grammar_json['scopeName'] = scope_name
         # handle instructions
@@ -266,25 +264,25 @@ class VSCodeConfigGenerator(LanguageConfigGenerator):
         # handle bespokeasm directives
         for item in grammar_json['repository']['directives']['patterns']:
             if 'meta.directive' == item['name']:
-                directives_regex = '|'.join(['\\.'+d for d in COMPILER_DIRECTIVES_SET])
+                directives_regex = build_word_trie_regex(['.' + d for d in COMPILER_DIRECTIVES_SET])
                 directives_str = item['begin']
                 item['begin'] = directives_str.replace('##DIRECTIVES##', directives_regex)
             elif 'storage.type' == item['name']:
-                datatypes_regex = '|'.join(['\\.'+d for d in BYTECODE_DIRECTIVES_SET])
+                datatypes_regex = build_word_trie_regex(['.' + d for d in BYTECODE_DIRECTIVES_SET])
                 datatypes_str = item['match']
                 item['match'] = datatypes_str.replace('##DATATYPES##', datatypes_regex)
             elif 'meta.preprocessor' == item['name']:
                 for pattern in item['patterns']:
                     if 'name' in pattern and 'keyword.control.preprocessor' == pattern['name']:
-                        # Sort by length (desc) to avoid prefix matches like 'if' matching 'ifdef'
-                        preprocessor_regex = '|'.join(sorted(PREPROCESSOR_DIRECTIVES_SET, key=len, reverse=True))
+                        # the trie tries the longer directive first, so 'if' does not shadow 'ifdef'
+                        preprocessor_regex = build_word_trie_regex(PREPROCESSOR_DIRECTIVES_SET)
                         preprocesspr_str = pattern['match']
                         pattern['match'] = preprocesspr_str.replace('##PREPROCESSOR##', preprocessor_regex)
 
         # handle expresion functions
         for item in grammar_json['repository']['operators']['patterns']:
             if 'keyword.operator.word' == item['name']:
-                func_regex = '|'.join([d for d in EXPRESSION_FUNCTIONS_SET])
+                func_regex = build_word_trie_regex(EXPRESSION_FUNCTIONS_SET)
                 func_str = item['match']
                 item['match'] = func_str.replace('##EXPRESSION_FUNCTIONS##', func_regex)
 
@@ -295,69 +293,41 @@ class VSCodeConfigGenerator(LanguageConfigGenerator):
                     pattern['match'] = pattern['match'].replace('##LABEL_PATTERN##', self._label_pattern())
 
         tmGrammar_fp = os.path.join(extension_dir_path, 'syntaxes', 'tmGrammar.json')
-        with open(tmGrammar_fp, 'w', encoding='utf-8') as f:
-            json.dump(grammar_json, f, ensure_ascii=False, indent=4)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(tmGrammar_fp)}')
-
-        # copy snippets.json and lanaguage-configuration.json, nothing to modify
-        fp = pkg_resources.files(resources).joinpath('snippets.json')
-        shutil.copy(str(fp), extension_dir_path)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(str(fp))}')
-
-        fp = pkg_resources.files(resources).joinpath('language-configuration.json')
-        shutil.copy(str(fp), extension_dir_path)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(str(fp))}')
-
-        fp = pkg_resources.files(resources).joinpath('extension.js')
-        extension_fp = os.path.join(extension_dir_path, 'extension.js')
-        shutil.copy(str(fp), extension_fp)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(str(fp))}')
-
-        fp = pkg_resources.files(resources).joinpath('include_files.js')
-        shutil.copy(str(fp), extension_dir_path)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(str(fp))}')
-
-        fp = pkg_resources.files(resources).joinpath('label_hover.js')
-        label_hover_fp = os.path.join(extension_dir_path, 'label_hover.js')
-        shutil.copy(str(fp), label_hover_fp)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(str(fp))}')
-
-        fp = pkg_resources.files(resources).joinpath('constants_hover.js')
-        constants_hover_fp = os.path.join(extension_dir_path, 'constants_hover.js')
-        shutil.copy(str(fp), constants_hover_fp)
-        if self.verbose > 1:
-            print(f'  generated {os.path.basename(str(fp))}')
+        self._write_output_file(tmGrammar_fp, json.dumps(grammar_json, ensure_ascii=False, indent=4))
 
         label_pattern = self._label_pattern()
-        mnemonic_pattern = self._mnemonic_pattern()
         if self.model.registers:
             register_pattern = self._replace_token_with_regex_list(
                 '##REGISTERS##', '##REGISTERS##', self.model.registers
             )
         else:
             register_pattern = '(?!)'
-        self._replace_token_in_file(extension_fp, '##LABEL_PATTERN##', label_pattern)
-        self._replace_token_in_file(extension_fp, '##MNEMONIC_PATTERN##', mnemonic_pattern)
-        self._replace_token_in_file(extension_fp, '##REGISTERS##', register_pattern)
-        self._replace_token_in_file(label_hover_fp, '##LABEL_PATTERN##', label_pattern)
-        self._replace_token_in_file(constants_hover_fp, '##LABEL_PATTERN##', label_pattern)
+        script_tokens = {
+            '##LABEL_PATTERN##': label_pattern,
+            '##MNEMONIC_PATTERN##': self._mnemonic_pattern(),
+            '##REGISTERS##': register_pattern,
+        }
+        # snippets.json, language-configuration.json, include_files.js, and hover_docs.js have no tokens to replace
+        for filename in [
+            'snippets.json',
+            'language-configuration.json',
+            'extension.js',
+            'include_files.js',
+            'hover_docs.js',
+            'label_hover.js',
+            'constants_hover.js',
+        ]:
+            self._write_output_file(
+                os.path.join(extension_dir_path, filename),
+                self._render_resource(resources, filename, script_tokens),
+            )
 
         # Generate theme file from central color configuration
         theme_json = self._generate_theme_json(self.language_id)
-        with open(os.path.join(extension_dir_path, theme_filename), 'w', encoding='utf-8') as theme_file:
-            json.dump(theme_json, theme_file, ensure_ascii=False, indent=2)
-            if self.verbose > 1:
-                print(f'  generated {theme_filename}')
+        self._write_output_file(
+            os.path.join(extension_dir_path, theme_filename), json.dumps(theme_json, ensure_ascii=False, indent=2)
+        )
 
         hover_docs = build_hover_docs(self.model, self.verbose)
-        docs_fp = os.path.join(extension_dir_path, 'instruction-docs.json')
-        with open(docs_fp, 'w', encoding='utf-8') as docs_file:
-            json.dump(hover_docs, docs_file, ensure_ascii=False, indent=2)
-            if self.verbose > 1:
-                print(f'  generated {os.path.basename(docs_fp)}')
+        docs_fp = os.path.join(extension_dir_path, HOVER_DOC_BUNDLE_FILENAME)
+        self._write_output_file(docs_fp, encode_hover_doc_bundle(hover_docs))
@@ -2,6 +2,7 @@ const fs = require('fs');
 const path = require('path');
 const vscode = require('vscode');
 
+const { HoverDocBundle } = require('./hover_docs');
 const labelHover = require('./label_hover');
 const constantsHover = require('./constants_hover');
 const includeFiles = require('./include_files');
@@ -20,10 +21,9 @@ const DEFAULT_HOVER_SETTINGS = {
 };
 
 function loadInstructionDocs(context) {
-  const docsPath = context.asAbsolutePath('instruction-docs.json');
+  const docsPath = context.asAbsolutePath('hover-docs.bundle');
   try {
-    const raw = fs.readFileSync(docsPath, 'utf8');
-    return JSON.parse(raw);
+    return HoverDocBundle.open(docsPath);
   } catch (error) {
     console.error('Failed to load instruction docs:', error);
     return null;
@@ -448,20 +448,18 @@ function activate(context) {
     return;
   }
 
-  const instructionDocs = hoverDocs.instructions || {};
-  const macroDocs = hoverDocs.macros || {};
-  const predefinedDocs = hoverDocs.predefined || {};
-  const predefinedConstantDocs = predefinedDocs.constants || {};
-  const predefinedDataDocs = predefinedDocs.data || {};
-  const predefinedMemoryZoneDocs = predefinedDocs.memory_zones || {};
-  const directiveDocsAll = hoverDocs.directives || {};
+  const instructionDocs = hoverDocs.section('instructions');
+  const macroDocs = hoverDocs.section('macros');
+  const predefinedConstantDocs = hoverDocs.section('predefined', 'constants');
+  const predefinedDataDocs = hoverDocs.section('predefined', 'data');
+  const predefinedMemoryZoneDocs = hoverDocs.section('predefined', 'memory_zones');
   const directiveCategories = [
-    directiveDocsAll.preprocessor || {},
-    directiveDocsAll.data_type || {},
-    directiveDocsAll.compiler || {}
+    hoverDocs.section('directives', 'preprocessor'),
+    hoverDocs.section('directives', 'data_type'),
+    hoverDocs.section('directives', 'compiler')
   ];
-  const registerDocs = hoverDocs.registers || {};
-  const exprFuncDocs = hoverDocs.expression_functions || {};
+  const registerDocs = hoverDocs.section('registers');
+  const exprFuncDocs = hoverDocs.section('expression_functions');
   const wordPattern = /(?:##MNEMONIC_PATTERN##|##LABEL_PATTERN##)/i;
   const provider = {
     provideHover(document, position) {
@@ -473,8 +471,8 @@ function activate(context) {
         const directiveName = getDirectiveAtPosition(lineText, position.character);
         if (directiveName) {
           for (const category of directiveCategories) {
-            if (directiveName in category) {
-              return new vscode.Hover(buildMarkdownHover(category[directiveName]));
+            if (category.has(directiveName)) {
+              return new vscode.Hover(buildMarkdownHover(category.get(directiveName)));
             }
           }
         }
@@ -484,8 +482,9 @@ function activate(context) {
       if (hoverSettings.mnemonics) {
         if (isOffsetInCodeRegion(lineText, position.character)) {
           const registerName = getRegisterAtPosition(lineText, position.character);
-          if (registerName && registerDocs[registerName]) {
-            return new vscode.Hover(buildMarkdownHover(registerDocs[registerName]));
+          const registerDoc = registerName ? registerDocs.get(registerName) : null;
+          if (registerDoc) {
+            return new vscode.Hover(buildMarkdownHover(registerDoc));
           }
         }
       }
@@ -506,11 +505,11 @@ function activate(context) {
 
       if (hoverSettings.mnemonics) {
         const key = token.toUpperCase();
-        const doc = instructionDocs[key] || macroDocs[key];
+        const doc = instructionDocs.get(key) || macroDocs.get(key);
         if (doc) {
           return new vscode.Hover(buildMarkdownHover(doc), range);
         }
-        const exprDoc = exprFuncDocs[key];
+        const exprDoc = exprFuncDocs.get(key);
         if (exprDoc) {
           return new vscode.Hover(buildMarkdownHover(exprDoc), range);
         }
@@ -534,7 +533,7 @@ function activate(context) {
             return new vscode.Hover(markdown, range);
           }
         } else {
-          const predefinedConstantDoc = predefinedConstantDocs[token];
+          const predefinedConstantDoc = predefinedConstantDocs.get(token);
           if (predefinedConstantDoc) {
             return new vscode.Hover(buildMarkdownHover(predefinedConstantDoc), range);
           }
@@ -560,7 +559,7 @@ function activate(context) {
           return new vscode.Hover(markdown, range);
         }
 
-        const predefinedLabelDoc = predefinedDataDocs[token] || predefinedMemoryZoneDocs[token];
+        const predefinedLabelDoc = predefinedDataDocs.get(token) || predefinedMemoryZoneDocs.get(token);
         if (predefinedLabelDoc) {
           return new vscode.Hover(buildMarkdownHover(predefinedLabelDoc), range);
         }
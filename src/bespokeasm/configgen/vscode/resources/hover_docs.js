@@ -0,0 +1,100 @@
+const fs = require('fs');
+
+// A hover-doc bundle starts with a "BESPOKEASM-HOVER-DOCS <version> <index length>\n" header, followed by
+// a JSON index whose leaves are [offset, length] locations of the markdown entries that come after it.
+const HOVER_DOC_BUNDLE_MAGIC = 'BESPOKEASM-HOVER-DOCS';
+const HOVER_DOC_BUNDLE_VERSION = '1';
+const MAX_HEADER_BYTES = 64;
+
+function readExactly(fd, length, position) {
+  const buffer = Buffer.alloc(length);
+  let offset = 0;
+  while (offset < length) {
+    const bytesRead = fs.readSync(fd, buffer, offset, length - offset, position + offset);
+    if (bytesRead === 0) {
+      throw new Error('hover-doc bundle is truncated');
+    }
+    offset += bytesRead;
+  }
+  return buffer;
+}
+
+function isObject(value) {
+  return value !== null && typeof value === 'object' && !Array.isArray(value);
+}
+
+function hasOwn(node, key) {
+  return Object.prototype.hasOwnProperty.call(node, key);
+}
+
+class HoverDocBundle {
+  constructor(filePath, entriesStart, index) {
+    this.filePath = filePath;
+    this.entriesStart = entriesStart;
+    this.index = index;
+    this.entryCache = new Map();
+  }
+
+  static open(filePath) {
+    const fd = fs.openSync(filePath, 'r');
+    try {
+      const size = fs.fstatSync(fd).size;
+      const header = readExactly(fd, Math.min(MAX_HEADER_BYTES, size), 0);
+      const headerEnd = header.indexOf(0x0a);
+      if (headerEnd < 0) {
+        throw new Error('missing hover-doc bundle header');
+      }
+      const fields = header.toString('ascii', 0, headerEnd).split(' ');
+      if (fields.length !== 3 || fields[0] !== HOVER_DOC_BUNDLE_MAGIC || fields[1] !== HOVER_DOC_BUNDLE_VERSION) {
+        throw new Error('unsupported hover-doc bundle header');
+      }
+      const indexLength = parseInt(fields[2], 10);
+      const index = JSON.parse(readExactly(fd, indexLength, headerEnd + 1).toString('utf8'));
+      return new HoverDocBundle(filePath, headerEnd + 1 + indexLength, index);
+    } finally {
+      fs.closeSync(fd);
+    }
+  }
+
+  // Returns a lookup over the index level at the given path of keys, e.g. section('predefined', 'data').
+  section(...path) {
+    let node = this.index;
+    for (const key of path) {
+      node = isObject(node) && hasOwn(node, key) ? node[key] : null;
+    }
+    return new HoverDocSection(this, isObject(node) ? node : {});
+  }
+
+  readEntry(location) {
+    const [offset, length] = location;
+    if (!this.entryCache.has(offset)) {
+      const fd = fs.openSync(this.filePath, 'r');
+      try {
+        this.entryCache.set(offset, readExactly(fd, length, this.entriesStart + offset).toString('utf8'));
+      } finally {
+        fs.closeSync(fd);
+      }
+    }
+    return this.entryCache.get(offset);
+  }
+}
+
+class HoverDocSection {
+  constructor(bundle, node) {
+    this.bundle = bundle;
+    this.node = node;
+  }
+
+  has(key) {
+    return hasOwn(this.node, key) && Array.isArray(this.node[key]);
+  }
+
+  // Returns the markdown for key, reading it from the bundle file on first use, or null.
+  get(key) {
+    return this.has(key) ? this.bundle.readEntry(this.node[key]) : null;
+  }
+}
+
+module.exports = {
+  HoverDocBundle
+};
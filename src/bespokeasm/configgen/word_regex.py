@@ -0,0 +1,125 @@
+"""
+Builds compact regular expressions that match exactly one word from a list.
+
+Editor grammars match mnemonics, registers, and directives against every line. A flat alternation of
+hundreds of words makes the regex engine try each alternative in turn at every position, so the
+words are instead factored into a prefix trie, e.g. `ld`, `lda`, `ldi`, and `lxi` become
+`l(?:d(?:a|i)?|xi)`. Alternatives in each group start with different characters, so at most one of
+them can proceed past its first character.
+"""
+import re
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import NamedTuple
+
+
+class RegexDialect(NamedTuple):
+    escape: Callable[[str], str]
+    group_open: str
+    group_close: str
+    alternation: str
+    optional: str
+
+
+def vim_escape(text: str) -> str:
+    """
+    Escapes the regex special characters in a word for use in a `/`-delimited Vim syntax pattern.
+    Patterns are in Vim's default 'magic' mode, where characters such as `+`, `?`, `(`, and `|` are
+    literal and only become special when preceded by a backslash.
+    """
+    escaped = text.replace('\\', '\\\\')
+    for ch in ['.', '*', '~', '^', '$', '[', ']', '/']:
+        escaped = escaped.replace(ch, '\\' + ch)
+    return escaped
+
+
+# the dialect used by TextMate (VS Code), Sublime Text, JavaScript, and Python regexes
+PCRE_DIALECT = RegexDialect(re.escape, '(?:', ')', '|', '?')
+VIM_DIALECT = RegexDialect(vim_escape, '\\%(', '\\)', '\\|', '\\=')
+
+# a pattern that never matches, used when there are no words
+PCRE_NEVER_MATCH = '(?!)'
+
+_END_OF_WORD = ''
+
+
+def build_word_trie_regex(words: Iterable[str], dialect: RegexDialect = PCRE_DIALECT) -> str:
+    """
+    Returns a regex matching exactly the given words, factored into a prefix trie. Word boundaries are
+    left to the caller. The result has no top-level alternation, so it can be concatenated with other
+    patterns without adding a group. Returns an empty string if there are no words.
+    """
+    trie: dict = {}
+    for word in set(words):
+        if len(word) == 0:
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_END_OF_WORD] = {}
+    return _node_regex(trie, dialect)
+
+
+def _node_regex(node: dict, dialect: RegexDialect) -> str:
+    branches = [
+        (dialect.escape(ch), _node_regex(child, dialect))
+        for ch, child in sorted(node.items())
+        if ch != _END_OF_WORD
+    ]
+    if len(branches) == 0:
+        return ''
+    if len(branches) == 1:
+        first_char, remainder = branches[0]
+        body = first_char + remainder
+        if _END_OF_WORD not in node:
+            return body
+        if len(remainder) == 0:
+            # a single character can be made optional without a group
+            return body + dialect.optional
+        return dialect.group_open + body + dialect.group_close + dialect.optional
+    body = dialect.group_open + dialect.alternation.join(ch + remainder for ch, remainder in branches) + dialect.group_close
+    if _END_OF_WORD in node:
+        return body + dialect.optional
+    return body
+
+
+def trie_regex_words(pattern: str, dialect: RegexDialect = PCRE_DIALECT) -> set[str]:
+    """
+    Returns the words matched by a regex made of literal characters, groups, alternations, and optional
+    items, such as those built by `build_word_trie_regex()` or a flat alternation of words.
+    """
+    words, position = _parse_alternation(pattern, 0, dialect)
+    if position != len(pattern):
+        raise ValueError(f'unexpected "{pattern[position:]}" in word regex "{pattern}"')
+    return words
+
+
+def _parse_alternation(pattern: str, position: int, dialect: RegexDialect) -> tuple[set[str], int]:
+    words, position = _parse_sequence(pattern, position, dialect)
+    while pattern.startswith(dialect.alternation, position):
+        more_words, position = _parse_sequence(pattern, position + len(dialect.alternation), dialect)
+        words |= more_words
+    return words, position
+
+
+def _parse_sequence(pattern: str, position: int, dialect: RegexDialect) -> tuple[set[str], int]:
+    words = {''}
+    while position < len(pattern):
+        if pattern.startswith(dialect.group_open, position):
+            item_words, position = _parse_alternation(pattern, position + len(dialect.group_open), dialect)
+            if not pattern.startswith(dialect.group_close, position):
+                raise ValueError(f'unclosed group in word regex "{pattern}"')
+            position += len(dialect.group_close)
+        elif pattern.startswith(dialect.group_close, position) or pattern.startswith(dialect.alternation, position):
+            break
+        elif pattern[position] == '\\':
+            item_words = {pattern[position + 1]}
+            position += 2
+        else:
+            item_words = {pattern[position]}
+            position += 1
+        if pattern.startswith(dialect.optional, position):
+            item_words = item_words | {''}
+            position += len(dialect.optional)
+        words = {prefix + suffix for prefix in words for suffix in item_words}
+    return words, position
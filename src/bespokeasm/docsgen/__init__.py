@@ -4,8 +4,11 @@ from pathlib import Path
 import click
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
 from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.cache_file import load_cache_file
+from bespokeasm.cache_file import save_cache_file
 
 from .documentation_model import DocumentationModel
+from .markdown_generator import FRAGMENT_FORMAT_VERSION
 from .markdown_generator import MarkdownGenerator
 
 
@@ -14,16 +17,28 @@ class DocumentationGenerator:
     Generates documentation for instruction set architectures from configuration files.
     """
 
-    def __init__(self, config_file_path: str, is_verbose: int = 0):
+    def __init__(
+        self,
+        config_file_path: str,
+        is_verbose: int = 0,
+        split_by_category: bool = False,
+        cache_file_path: str | None = None,
+    ):
         """
         Initialize the documentation generator.
 
         Args:
             config_file_path: Path to the ISA configuration file
             is_verbose: Verbosity level (0=quiet, 1=normal, 2+=debug)
+            split_by_category: Write a directory with an index file and one file per
+                            instruction and macro category instead of a single file
+            cache_file_path: Path of a file caching the rendered markdown of each
+                            instruction and macro between runs, or None for no cache
         """
         self._config_file_path = config_file_path
         self._verbose = is_verbose
+        self._split_by_category = split_by_category
+        self._cache_file_path = cache_file_path
         self._model = None
         self._doc_model = None
 
@@ -32,11 +47,13 @@ class DocumentationGenerator:
         Generate markdown documentation from the ISA configuration.
 
         Args:
-            output_file_path: Path where to write the markdown file. If None,
-                            will use the config file path with .md extension.
+            output_file_path: Path where to write the markdown file, or the directory to
+                            write the markdown files into when splitting by category. If
+                            None, will use the config file path with .md extension, or
+                            with a -docs suffix when splitting by category.
 
         Returns:
-            The path to the generated documentation file.
+            The path to the generated documentation file or directory.
 
         Raises:
             SystemExit: If there are errors in configuration loading or file writing
@@ -56,11 +73,27 @@ class DocumentationGenerator:
         self._doc_model = DocumentationModel(self._model, self._verbose)
 
         # Generate markdown content
-        markdown_generator = MarkdownGenerator(self._doc_model, self._verbose)
-        markdown_content = markdown_generator.generate()
-
-        # Write to file
-        self._write_output_file(output_file_path, markdown_content)
+        if self._cache_file_path is None:
+            markdown_generator = MarkdownGenerator(self._doc_model, self._verbose)
+        else:
+            markdown_generator = MarkdownGenerator(self._doc_model, self._verbose, self._load_fragment_cache())
+
+        if self._split_by_category:
+            for filename, content in markdown_generator.generate_split_by_category().items():
+                self._write_changed_output_file(str(Path(output_file_path) / filename), content)
+        else:
+            markdown_content = markdown_generator.generate()
+
+            # Write to file
+            self._write_output_file(output_file_path, markdown_content)
+
+        if self._cache_file_path is not None:
+            if self._verbose:
+                click.echo(
+                    f'Reused {markdown_generator.fragments_reused} cached instruction and macro sections, '
+                    f'rendered {markdown_generator.fragments_rendered}'
+                )
+            self._save_fragment_cache(markdown_generator.used_fragments)
 
         if self._verbose:
             click.echo(f'Documentation generated successfully: {output_file_path}')
@@ -79,8 +112,36 @@ class DocumentationGenerator:
     def _generate_default_output_path(self) -> str:
         """Generate the default output file path by replacing extension with .md"""
         config_path = Path(self._config_file_path)
+        if self._split_by_category:
+            return str(config_path.with_name(config_path.stem + '-docs'))
         return str(config_path.with_suffix('.md'))
 
+    def _load_fragment_cache(self) -> dict[str, str]:
+        """Load the rendered fragment cache, returning an empty cache if it is missing or stale."""
+        cache_data = load_cache_file(self._cache_file_path, FRAGMENT_FORMAT_VERSION)
+        if cache_data is None or not isinstance(cache_data.get('fragments'), dict):
+            return {}
+        return cache_data['fragments']
+
+    def _save_fragment_cache(self, fragments: dict[str, str]) -> None:
+        """Save the fragments used by this run, dropping those for documentation that no longer exists."""
+        save_cache_file(self._cache_file_path, FRAGMENT_FORMAT_VERSION, {'fragments': fragments}, 'documentation')
+
+    def _write_changed_output_file(self, output_path: str, content: str) -> None:
+        """
+        Write an output file unless it already has the given content, so that unchanged
+        files keep their modification time.
+        """
+        try:
+            with open(output_path, encoding='utf-8') as f:
+                if f.read() == content:
+                    if self._verbose > 1:
+                        click.echo(f'Unchanged: {output_path}')
+                    return
+        except (OSError, ValueError):
+            pass
+        self._write_output_file(output_path, content)
+
     def _write_output_file(self, output_path: str, content: str) -> None:
         """
         Write the markdown content to the output file.
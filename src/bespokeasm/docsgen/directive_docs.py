@@ -137,6 +137,20 @@ BYTECODE_DIRECTIVE_DOCS: dict[str, str] = {
         '`<address>`. Emits nothing if the target address has already '
         'been passed.'
     ),
+    'incbin': (
+        '### `.incbin` : Include Binary File\n\n'
+        '---\n\n'
+        'Emits the contents of a binary file into the bytecode.\n\n'
+        '**Usage:**\n\n'
+        '```\n'
+        '.incbin "filename"\n'
+        '.incbin "filename", <offset>, <length>\n'
+        '```\n\n'
+        'The file is located like an `#include` file. The optional '
+        '`<offset>` skips bytes at the start of the file and the optional '
+        '`<length>` limits how many bytes are included. Bytes map to words '
+        'like string data, honoring `string_byte_packing`.'
+    ),
     'cstr': (
         '### `.cstr` : C-Style String\n\n'
         '---\n\n'
@@ -1,25 +1,43 @@
+import hashlib
+import json
+import re
 from typing import Any
 
 import click
 
 from .documentation_model import DocumentationModel
 
+# Bump when the markdown rendered for an instruction or macro changes, so cached fragments are discarded.
+FRAGMENT_FORMAT_VERSION = 1
+
 
 class MarkdownGenerator:
     """
     Generates markdown documentation from parsed documentation data.
     """
 
-    def __init__(self, doc_model: DocumentationModel, verbose: int = 0):
+    def __init__(
+        self,
+        doc_model: DocumentationModel,
+        verbose: int = 0,
+        fragment_cache: dict[str, str] | None = None,
+    ):
         """
         Initialize the markdown generator.
 
         Args:
             doc_model: The parsed documentation model
             verbose: Verbosity level for logging
+            fragment_cache: Previously rendered instruction and macro markdown keyed by
+                            content hash. Fragments whose documentation is unchanged are
+                            reused rather than rendered again.
         """
         self.doc_model = doc_model
         self.verbose = verbose
+        self.fragment_cache = fragment_cache if fragment_cache is not None else {}
+        self.used_fragments: dict[str, str] = {}
+        self.fragments_reused = 0
+        self.fragments_rendered = 0
 
     def generate(self) -> str:
         """
@@ -28,6 +46,27 @@ class MarkdownGenerator:
         Returns:
             The complete markdown content as a string
         """
+        return self._generate_document(None)
+
+    def generate_split_by_category(self) -> dict[str, str]:
+        """
+        Generate the documentation as an index file plus one file per instruction
+        category and per macro category. The index has the same content as the
+        single file documentation, except that the instructions and macros sections
+        link to the category files.
+
+        Returns:
+            Dictionary mapping file names to their markdown content
+        """
+        category_files: dict[str, str] = {}
+        index_content = self._generate_document(category_files)
+        return {'index.md': index_content, **category_files}
+
+    def _generate_document(self, category_files: dict[str, str] | None) -> str:
+        """
+        Generate the document sections. When `category_files` is provided, each category of
+        instructions and macros is added to it as a separate file and linked from the document.
+        """
         sections = []
 
         # Document header
@@ -60,14 +99,14 @@ class MarkdownGenerator:
 
         # Instructions section
         if self.doc_model.instruction_docs:
-            sections.append(self._generate_instructions_section())
+            sections.append(self._generate_instructions_section(category_files))
         elif self.verbose:
             click.echo('Warning: No instruction documentation found')
 
         # Macros section
         macro_docs = getattr(self.doc_model, 'macro_docs', {})
         if macro_docs:
-            sections.append(self._generate_macros_section())
+            sections.append(self._generate_macros_section(category_files))
 
         # Examples section
         general_examples = getattr(self.doc_model, 'general_docs', {}).get('examples') or []
@@ -1070,7 +1109,7 @@ class MarkdownGenerator:
 
         return '\n\n'.join(sections)
 
-    def _generate_instructions_section(self) -> str:
+    def _generate_instructions_section(self, category_files: dict[str, str] | None = None) -> str:
         """Generate the instructions section organized by category."""
         sections = ['# Instructions']
 
@@ -1079,25 +1118,48 @@ class MarkdownGenerator:
 
         # Sort categories alphabetically
         for category in sorted(categories.keys()):
-            sections.append(self._generate_category_section(category, categories[category]))
+            category_section = self._generate_category_section(category, categories[category])
+            if category_files is None:
+                sections.append(category_section)
+            else:
+                sections.append(self._add_category_file(category_files, 'instructions', category, category_section))
 
         return '\n\n'.join(sections)
 
-    def _generate_macros_section(self) -> str:
+    def _generate_macros_section(self, category_files: dict[str, str] | None = None) -> str:
         """Generate the macros section organized by category."""
         sections = ['# Macros']
 
         categories = self.doc_model.get_macros_by_category()
         for category in sorted(categories.keys()):
-            sections.append(self._generate_category_section(
+            category_section = self._generate_category_section(
                 category,
                 categories[category],
                 doc_map=self.doc_model.macro_docs,
                 include_missing_doc_notice=False
-            ))
+            )
+            if category_files is None:
+                sections.append(category_section)
+            else:
+                sections.append(self._add_category_file(category_files, 'macros', category, category_section))
 
         return '\n\n'.join(sections)
 
+    @staticmethod
+    def _add_category_file(category_files: dict[str, str], kind: str, category: str, category_section: str) -> str:
+        """
+        Add a category section to `category_files` as its own document and return the
+        index entry linking to it.
+        """
+        slug = re.sub(r'[^0-9a-z]+', '-', category.lower()).strip('-') or 'uncategorized'
+        filename = f'{kind}-{slug}.md'
+        suffix = 2
+        while filename in category_files:
+            filename = f'{kind}-{slug}-{suffix}.md'
+            suffix += 1
+        category_files[filename] = f'# {kind.title()}\n\n{category_section}'
+        return f'* [{category.title()}]({filename})'
+
     def _generate_category_section(
         self,
         category: str,
@@ -1123,10 +1185,10 @@ class MarkdownGenerator:
         for index, operation in enumerate(operations):
             instruction_doc = doc_map[operation]
             sections.append(
-                self._generate_instruction_documentation(
+                self._generate_cached_instruction_documentation(
                     operation,
                     instruction_doc,
-                    include_missing_doc_notice=include_missing_doc_notice
+                    include_missing_doc_notice
                 )
             )
             if index < num_instructions - 1:
@@ -1134,6 +1196,40 @@ class MarkdownGenerator:
 
         return '\n\n'.join(sections)
 
+    def _generate_cached_instruction_documentation(
+        self,
+        instruction_name: str,
+        instruction_doc: dict[str, Any],
+        include_missing_doc_notice: bool
+    ) -> str:
+        """
+        Generate documentation for a single instruction or macro, reusing the fragment cache
+        when the same documentation was rendered before.
+        """
+        fragment_key = self.fragment_key(instruction_name, instruction_doc, include_missing_doc_notice)
+        fragment = self.fragment_cache.get(fragment_key)
+        if fragment is None:
+            fragment = self._generate_instruction_documentation(
+                instruction_name,
+                instruction_doc,
+                include_missing_doc_notice=include_missing_doc_notice
+            )
+            self.fragments_rendered += 1
+        else:
+            self.fragments_reused += 1
+        self.used_fragments[fragment_key] = fragment
+        return fragment
+
+    @staticmethod
+    def fragment_key(instruction_name: str, instruction_doc: dict[str, Any], include_missing_doc_notice: bool) -> str:
+        """Return the content hash identifying the rendered markdown of an instruction or macro."""
+        content = json.dumps(
+            [FRAGMENT_FORMAT_VERSION, instruction_name, instruction_doc, include_missing_doc_notice],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
     def _generate_instruction_documentation(
         self,
         instruction_name: str,
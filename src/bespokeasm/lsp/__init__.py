@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import os
+import re
+import sys
+from typing import BinaryIO
+from urllib.parse import unquote
+from urllib.parse import urlparse
+from urllib.request import pathname2url
+
+from bespokeasm import BESPOKEASM_VERSION_STR
+from bespokeasm.assembler.label_scope import LabelScopeType
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.lsp.analysis import CollectingDiagnosticReporter
+from bespokeasm.lsp.analysis import DocumentAnalysis
+from bespokeasm.lsp.analysis import SymbolDefinition
+from bespokeasm.lsp.document import TextDocument
+from bespokeasm.lsp.jsonrpc import JsonRpcStream
+
+
+# JSON-RPC and Language Server Protocol constants
+ERROR_METHOD_NOT_FOUND = -32601
+ERROR_INTERNAL = -32603
+ERROR_SERVER_NOT_INITIALIZED = -32002
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+DIAGNOSTIC_SEVERITY = {'ERROR': 1, 'WARNING': 2}
+
+PATTERN_WORD = re.compile(r'[.#]?\w+')
+
+
+def uri_to_path(uri: str) -> str:
+    parsed = urlparse(uri)
+    if parsed.scheme != 'file':
+        return uri
+    return os.path.normpath(unquote(parsed.path))
+
+
+def path_to_uri(path: str) -> str:
+    return 'file://' + pathname2url(os.path.abspath(path))
+
+
+def word_at(line: str, character: int) -> tuple[str, int, int] | None:
+    """Returns the label, mnemonic, or directive name at a position in a line with its start and end columns."""
+    for word_match in PATTERN_WORD.finditer(line):
+        if word_match.start() <= character <= word_match.end():
+            return word_match.group(0), word_match.start(), word_match.end()
+    return None
+
+
+class LanguageServer:
+    """
+    A Language Server Protocol server for assembly files of one ISA configuration, speaking JSON-RPC
+    over a pair of byte streams.
+
+    Open documents are analyzed with the assembler front end as they change, and their errors and
+    warnings are published as diagnostics. Go to definition and hover look up labels, constants,
+    preprocessor symbols, and memory zones in the open file, the files it includes, and the other open
+    files. Hover also shows the ISA documentation for instructions, macros, directives, registers, and
+    predefined entities.
+    """
+    def __init__(
+        self,
+        config_file: str,
+        include_paths: list[str],
+        input_stream: BinaryIO,
+        output_stream: BinaryIO,
+    ) -> None:
+        self._model = AssemblerModel(config_file, 0, CollectingDiagnosticReporter())
+        self._include_paths = list(include_paths)
+        self._stream = JsonRpcStream(input_stream, output_stream)
+        self._documents: dict[str, tuple[TextDocument, DocumentAnalysis]] = {}
+        # analyses of included files that are not open, with the modification time they were analyzed at
+        self._file_analyses: dict[str, tuple[float, DocumentAnalysis]] = {}
+        self._hover_docs: dict | None = None
+        self._is_initialized = False
+        self._is_shutdown = False
+        self._requests = {
+            'initialize': self._initialize,
+            'shutdown': self._shutdown,
+            'textDocument/definition': self._definition,
+            'textDocument/hover': self._hover,
+        }
+        self._notifications = {
+            'initialized': lambda params: None,
+            'exit': lambda params: None,
+            'textDocument/didOpen': self._did_open,
+            'textDocument/didChange': self._did_change,
+            'textDocument/didClose': self._did_close,
+        }
+
+    def serve(self) -> int:
+        """Handles messages until an exit notification or the end of input. Returns the process exit code."""
+        while True:
+            message = self._stream.read_message()
+            if message is None:
+                return 1
+            if message.get('method') == 'exit':
+                return 0 if self._is_shutdown else 1
+            self.handle_message(message)
+
+    def handle_message(self, message: dict) -> None:
+        method = message.get('method')
+        params = message.get('params') or {}
+        if 'id' not in message:
+            handler = self._notifications.get(method)
+            if handler is not None and (self._is_initialized or method == 'exit'):
+                handler(params)
+            return
+        handler = self._requests.get(method)
+        if handler is None:
+            self._send_error(message['id'], ERROR_METHOD_NOT_FOUND, f'Unsupported method: {method}')
+        elif not self._is_initialized and method != 'initialize':
+            self._send_error(message['id'], ERROR_SERVER_NOT_INITIALIZED, 'Server has not been initialized')
+        else:
+            try:
+                result = handler(params)
+            except Exception as e:
+                self._send_error(message['id'], ERROR_INTERNAL, f'{type(e).__name__}: {e}')
+                return
+            self._stream.write_message({'jsonrpc': '2.0', 'id': message['id'], 'result': result})
+
+    def _send_error(self, request_id, code: int, message: str) -> None:
+        self._stream.write_message({'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}})
+
+    def _send_notification(self, method: str, params: dict) -> None:
+        self._stream.write_message({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def _initialize(self, params: dict) -> dict:
+        self._is_initialized = True
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': TEXT_DOCUMENT_SYNC_INCREMENTAL},
+                'definitionProvider': True,
+                'hoverProvider': True,
+            },
+            'serverInfo': {'name': 'bespokeasm', 'version': BESPOKEASM_VERSION_STR},
+        }
+
+    def _shutdown(self, params: dict) -> None:
+        self._is_shutdown = True
+        return None
+
+    def _did_open(self, params: dict) -> None:
+        text_document = params['textDocument']
+        document = TextDocument(text_document['uri'], text_document['text'], text_document.get('version'))
+        analysis = DocumentAnalysis(self._model, uri_to_path(document.uri), document.lines)
+        self._documents[document.uri] = (document, analysis)
+        self._publish_diagnostics(document, analysis)
+
+    def _did_change(self, params: dict) -> None:
+        uri = params['textDocument']['uri']
+        if uri not in self._documents:
+            return
+        document, analysis = self._documents[uri]
+        for change in params['contentChanges']:
+            edit = document.apply_change(change, params['textDocument'].get('version'))
+            analysis.update(document.lines, edit)
+        self._publish_diagnostics(document, analysis)
+
+    def _did_close(self, params: dict) -> None:
+        uri = params['textDocument']['uri']
+        if self._documents.pop(uri, None) is not None:
+            self._send_notification('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    def _publish_diagnostics(self, document: TextDocument, analysis: DocumentAnalysis) -> None:
+        diagnostics = [
+            {
+                'range': LanguageServer._range(line_num, diagnostic.start, diagnostic.end),
+                'severity': DIAGNOSTIC_SEVERITY[diagnostic.severity],
+                'source': 'bespokeasm',
+                'message': diagnostic.message,
+            }
+            for line_num, diagnostic in analysis.diagnostics()
+        ]
+        params = {'uri': document.uri, 'diagnostics': diagnostics}
+        if document.version is not None:
+            params['version'] = document.version
+        self._send_notification('textDocument/publishDiagnostics', params)
+
+    @staticmethod
+    def _range(line_num: int, start: int, end: int) -> dict:
+        return {'start': {'line': line_num, 'character': start}, 'end': {'line': line_num, 'character': end}}
+
+    def _word_at_position(self, params: dict) -> tuple[str, DocumentAnalysis, int, tuple[str, int, int]] | None:
+        uri = params['textDocument']['uri']
+        if uri not in self._documents:
+            return None
+        document, analysis = self._documents[uri]
+        line_num = params['position']['line']
+        if line_num >= len(document.lines):
+            return None
+        word = word_at(document.lines[line_num], params['position']['character'])
+        if word is None:
+            return None
+        return uri, analysis, line_num, word
+
+    def _definition(self, params: dict) -> dict | None:
+        position = self._word_at_position(params)
+        if position is None:
+            return None
+        uri, analysis, line_num, (name, _, _) = position
+        found = self._find_definition(name, uri, analysis, line_num)
+        if found is None:
+            return None
+        definition_analysis, definition_line, definition = found
+        return {
+            'uri': path_to_uri(definition_analysis.filename),
+            'range': LanguageServer._range(definition_line, definition.start, definition.end),
+        }
+
+    def _hover(self, params: dict) -> dict | None:
+        position = self._word_at_position(params)
+        if position is None:
+            return None
+        uri, analysis, line_num, (name, start, end) = position
+        markdown = None
+        found = self._find_definition(name, uri, analysis, line_num)
+        if found is not None:
+            markdown = LanguageServer._definition_markdown(*found)
+        else:
+            markdown = self._documentation_markdown(name)
+        if markdown is None:
+            return None
+        return {
+            'contents': {'kind': 'markdown', 'value': markdown},
+            'range': LanguageServer._range(line_num, start, end),
+        }
+
+    @staticmethod
+    def _definition_markdown(analysis: DocumentAnalysis, line_num: int, definition: SymbolDefinition) -> str:
+        kind_titles = {
+            'label': 'Label',
+            'constant': 'Constant',
+            'symbol': 'Preprocessor Symbol',
+            'memzone': 'Memory Zone',
+            'named_scope': 'Named Scope',
+        }
+        markdown = f'**{kind_titles[definition.kind]}** `{definition.name}`'
+        if isinstance(definition.value, int):
+            markdown += f' = `{definition.value}` (`{definition.value:#x}`)'
+        elif definition.value is not None:
+            markdown += f' = `{definition.value}`'
+        source_line = analysis.line(line_num).text.strip()
+        return f'{markdown}\n\n```\n{source_line}\n```\n\nDefined at {os.path.basename(analysis.filename)}:{line_num + 1}'
+
+    def _documentation_markdown(self, name: str) -> str | None:
+        if self._hover_docs is None:
+            # docsgen is only imported once documentation is first needed
+            from bespokeasm.configgen.hover_docs import build_hover_docs
+            self._hover_docs = build_hover_docs(self._model)
+        hover_docs = self._hover_docs
+        if name.startswith('.'):
+            directives = hover_docs['directives']
+            return directives['compiler'].get(name[1:]) or directives['data_type'].get(name[1:])
+        if name.startswith('#'):
+            return hover_docs['directives']['preprocessor'].get(name[1:])
+        for docs in (hover_docs['instructions'], hover_docs['macros']):
+            if name.upper() in docs:
+                return docs[name.upper()]
+        if name in hover_docs['registers']:
+            return hover_docs['registers'][name]
+        for docs in hover_docs['predefined'].values():
+            if name in docs:
+                return docs[name]
+        return None
+
+    def _find_definition(
+        self,
+        name: str,
+        uri: str,
+        analysis: DocumentAnalysis,
+        line_num: int,
+    ) -> tuple[DocumentAnalysis, int, SymbolDefinition] | None:
+        found = analysis.find_definition(name, line_num)
+        if found is not None:
+            return analysis, *found
+        if LabelScopeType.get_label_scope(name) == LabelScopeType.LOCAL:
+            return None
+        # file scoped names can be defined in included files, as included files share the file's scope
+        for included_analysis in self._included_analyses(analysis):
+            definitions = included_analysis.definitions(name)
+            if len(definitions) > 0:
+                return included_analysis, *definitions[0]
+        if LabelScopeType.get_label_scope(name) == LabelScopeType.GLOBAL:
+            for other_uri, (_, other_analysis) in self._documents.items():
+                if other_uri == uri:
+                    continue
+                definitions = other_analysis.definitions(name)
+                if len(definitions) > 0:
+                    return other_analysis, *definitions[0]
+        return None
+
+    def _included_analyses(self, analysis: DocumentAnalysis) -> list[DocumentAnalysis]:
+        """Returns the analyses of the files included by a file, directly or indirectly."""
+        results = []
+        visited = {os.path.realpath(analysis.filename)}
+        pending = [analysis]
+        while len(pending) > 0:
+            current = pending.pop()
+            for include_name in current.includes:
+                include_path = self._locate_include(include_name, current.filename)
+                if include_path is None or os.path.realpath(include_path) in visited:
+                    continue
+                visited.add(os.path.realpath(include_path))
+                included_analysis = self._analysis_for_path(include_path)
+                results.append(included_analysis)
+                pending.append(included_analysis)
+        return results
+
+    def _locate_include(self, include_name: str, including_file: str) -> str | None:
+        for include_dir in [os.path.dirname(including_file), *self._include_paths]:
+            include_path = os.path.normpath(os.path.join(include_dir, include_name))
+            if os.path.isfile(include_path):
+                return include_path
+        return None
+
+    def _analysis_for_path(self, path: str) -> DocumentAnalysis:
+        uri = path_to_uri(path)
+        if uri in self._documents:
+            return self._documents[uri][1]
+        modified_time = os.path.getmtime(path)
+        cached = self._file_analyses.get(path)
+        if cached is None or cached[0] != modified_time:
+            with open(path) as handle:
+                lines = TextDocument(uri, handle.read()).lines
+            cached = (modified_time, DocumentAnalysis(self._model, path, lines))
+            self._file_analyses[path] = cached
+        return cached[1]
+
+
+def run_language_server(config_file: str, include_paths: list[str]) -> int:
+    """Serves the Language Server Protocol over stdin and stdout until the client exits."""
+    input_stream = sys.stdin.buffer
+    output_stream = sys.stdout.buffer
+    # stdout carries the protocol, so any other output, such as from #print directives, goes to stderr
+    sys.stdout = sys.stderr
+    server = LanguageServer(config_file, include_paths, input_stream, output_stream)
+    return server.serve()
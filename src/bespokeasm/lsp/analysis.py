@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from bespokeasm.assembler.assembly_file import AssemblyFile
+from bespokeasm.assembler.diagnostic_reporter import Diagnostic
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.label_scope import LabelScopeType
+from bespokeasm.assembler.label_scope.named_scope_manager import ActiveNamedScopeList
+from bespokeasm.assembler.label_scope.named_scope_manager import NamedScopeManager
+from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.line_object import LineObject
+from bespokeasm.assembler.line_object.factory import LineOjectFactory
+from bespokeasm.assembler.line_object.label_line import LabelLine
+from bespokeasm.assembler.line_object.preprocessor_line.condition_line import CONDITIONAL_LINE_PREFIX_LIST
+from bespokeasm.assembler.line_object.preprocessor_line.create_memzone import CreateMemzoneLine
+from bespokeasm.assembler.line_object.preprocessor_line.create_scope import CreateScopeLine
+from bespokeasm.assembler.line_object.preprocessor_line.define_symbol import DefineSymbolLine
+from bespokeasm.assembler.memory_zone.manager import MemoryZoneManager
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.parsing import split_line_comment
+from bespokeasm.assembler.preprocessor import Preprocessor
+from bespokeasm.assembler.preprocessor.condition_stack import ConditionStack
+from bespokeasm.lsp.document import LineEdit
+
+
+# definition kinds that change how other lines parse, so the shared parse context is rebuilt when they change
+_CONTEXT_DEFINITION_KINDS = frozenset({'symbol', 'memzone'})
+# definition kinds whose changes can change the diagnostics of the lines using them. Constants are resolved
+# when lines are parsed, but label references are not, so the lines using a label are not parsed again.
+_PARSE_DEFINITION_KINDS = _CONTEXT_DEFINITION_KINDS | {'constant'}
+_CONDITIONAL_PREFIXES = tuple(prefix.strip() for prefix in CONDITIONAL_LINE_PREFIX_LIST)
+_PATTERN_NAME = re.compile(r'[.#]?\w+')
+
+
+class SymbolDefinition(NamedTuple):
+    """A name defined by a source line. `kind` is one of label, constant, symbol, memzone, or named_scope."""
+    name: str
+    kind: str
+    start: int
+    end: int
+    value: int | str | None = None
+
+
+class LineDiagnostic(NamedTuple):
+    severity: str
+    message: str
+    start: int
+    end: int
+
+
+class LineAnalysis:
+    """
+    The result of running one source line through the assembler front end. `names` holds every name
+    that appears on the line, so lines using a definition can be found when the definition changes.
+    """
+    __slots__ = ('text', 'definitions', 'diagnostics', 'include', 'names', 'has_errors', 'line_num')
+
+    def __init__(
+        self,
+        text: str,
+        definitions: tuple[SymbolDefinition, ...] = (),
+        diagnostics: tuple[LineDiagnostic, ...] = (),
+        include: str | None = None,
+        line_num: int = 0,
+    ) -> None:
+        self.text = text
+        self.definitions = definitions
+        self.diagnostics = diagnostics
+        self.include = include
+        self.names = frozenset(_PATTERN_NAME.findall(split_line_comment(text)[0])) if len(text) > 0 else frozenset()
+        self.has_errors = any(diagnostic.severity == 'ERROR' for diagnostic in diagnostics)
+        # the current line number, kept up to date as lines are inserted and removed above this line
+        self.line_num = line_num
+
+    @property
+    def starts_local_scope(self) -> bool:
+        """True if this line defines a label that local labels on the following lines belong to."""
+        return any(
+            definition.kind == 'label' and LabelScopeType.get_label_scope(definition.name) != LabelScopeType.LOCAL
+            for definition in self.definitions
+        )
+
+
+class CollectingDiagnosticReporter(DiagnosticReporter):
+    """A diagnostic reporter that keeps the warnings reported while a line is analyzed instead of printing them."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.warnings: list[Diagnostic] = []
+
+    def _emit(self, diagnostic: Diagnostic) -> None:
+        if diagnostic.severity == 'WARNING':
+            self.warnings.append(diagnostic)
+
+
+class _DocumentLabelScope(LabelScope):
+    """A file label scope that resolves constants from a document's current definitions."""
+    def __init__(self, analysis: DocumentAnalysis, parent: LabelScope, filename: str) -> None:
+        # the shared global scope outlives every analysis, so it must not hold on to this scope
+        super().__init__(LabelScopeType.FILE, parent, filename, register_with_parent=False)
+        self._analysis = analysis
+
+    def get_label_value(self, label: str, line_id: LineIdentifier) -> int:
+        value = self._analysis.constant_value(label)
+        if value is not None:
+            return value
+        return self.parent.get_label_value(label, line_id)
+
+
+class DocumentAnalysis:
+    """
+    Incrementally maintained front end analysis of one assembly source file.
+
+    Each line is parsed on its own with `LineOjectFactory` against a parse context shared by the file,
+    holding its preprocessor symbols, memory zones, and constants. When lines are edited only those
+    lines are parsed again. The shared context is rebuilt only when a `#define` or `#create_memzone`
+    line changes. When a symbol, memory zone, or constant definition changes, the lines using it are
+    checked again, as the change may have broken or resolved them, and so on for the definitions those
+    lines change in turn.
+
+    Because lines are not assembled in order, conditional blocks are not evaluated and every line is
+    checked, and lines are not assigned addresses.
+    """
+    def __init__(self, model: AssemblerModel, filename: str, lines: list[str]) -> None:
+        if not isinstance(model.diagnostic_reporter, CollectingDiagnosticReporter):
+            raise ValueError('DocumentAnalysis requires a model created with a CollectingDiagnosticReporter')
+        self._model = model
+        self._reporter: CollectingDiagnosticReporter = model.diagnostic_reporter
+        self._filename = filename
+        self._label_scope = _DocumentLabelScope(self, model.global_label_scope, filename)
+        self._symbols: dict[str, list[LineAnalysis]] = {}
+        self._references: dict[str, set[LineAnalysis]] = {}
+        self._lines: list[LineAnalysis] = []
+        self._reset_parse_context()
+        for line_num, text in enumerate(lines):
+            line_analysis = self._analyze_line(text, line_num)
+            self._lines.append(line_analysis)
+            self._index_line(line_analysis)
+            if any(definition.kind in _CONTEXT_DEFINITION_KINDS for definition in line_analysis.definitions):
+                self._register_context_definitions(line_analysis, line_num)
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    def line(self, line_num: int) -> LineAnalysis:
+        return self._lines[line_num]
+
+    @property
+    def includes(self) -> list[str]:
+        """The file names included by this file, in order."""
+        return [line_analysis.include for line_analysis in self._lines if line_analysis.include is not None]
+
+    def diagnostics(self) -> Iterator[tuple[int, LineDiagnostic]]:
+        for line_num, line_analysis in enumerate(self._lines):
+            for diagnostic in line_analysis.diagnostics:
+                yield line_num, diagnostic
+
+    def constant_value(self, name: str) -> int | None:
+        for line_analysis in reversed(self._symbols.get(name, ())):
+            for definition in line_analysis.definitions:
+                if definition.name == name and definition.kind == 'constant':
+                    return definition.value
+        return None
+
+    def definitions(self, name: str) -> list[tuple[int, SymbolDefinition]]:
+        """Returns the line number and definition of each definition of a non-local name in this file."""
+        results = []
+        for line_analysis in self._symbols.get(name, ()):
+            results.extend((line_analysis.line_num, d) for d in line_analysis.definitions if d.name == name)
+        return results
+
+    def find_definition(self, name: str, line_num: int) -> tuple[int, SymbolDefinition] | None:
+        """
+        Finds the definition of a name used on a line. Local labels are looked up between the
+        non-local labels surrounding the line. Other names are looked up across the file.
+        """
+        if LabelScopeType.get_label_scope(name) != LabelScopeType.LOCAL:
+            definitions = self.definitions(name)
+            return definitions[0] if len(definitions) > 0 else None
+        line_num = min(line_num, len(self._lines) - 1)
+        start = line_num
+        while start > 0 and not self._lines[start].starts_local_scope:
+            start -= 1
+        end = line_num + 1
+        while end < len(self._lines) and not self._lines[end].starts_local_scope:
+            end += 1
+        for candidate in range(start, end):
+            for definition in self._lines[candidate].definitions:
+                if definition.name == name:
+                    return candidate, definition
+        return None
+
+    def update(self, lines: list[str], edit: LineEdit) -> None:
+        """Brings the analysis up to date with the document lines after `edit` was applied to them."""
+        removed = self._lines[edit.first_line:edit.first_line + edit.removed_count]
+        for line_analysis in removed:
+            self._unindex_line(line_analysis)
+        added = []
+        for line_num in range(edit.first_line, edit.first_line + edit.inserted_count):
+            line_analysis = self._analyze_line(lines[line_num], line_num)
+            added.append(line_analysis)
+            self._index_line(line_analysis)
+        self._lines[edit.first_line:edit.first_line + edit.removed_count] = added
+        if edit.inserted_count != edit.removed_count:
+            for line_num in range(edit.first_line + edit.inserted_count, len(self._lines)):
+                self._lines[line_num].line_num = line_num
+
+        removed_keys = DocumentAnalysis._definition_keys(removed)
+        added_keys = DocumentAnalysis._definition_keys(added)
+        if removed_keys == added_keys:
+            return
+        if any(key[1] in _CONTEXT_DEFINITION_KINDS for key in removed_keys ^ added_keys):
+            self._reset_parse_context()
+            for line_analysis in self._lines:
+                if any(definition.kind in _CONTEXT_DEFINITION_KINDS for definition in line_analysis.definitions):
+                    self._register_context_definitions(line_analysis, line_analysis.line_num)
+        # the lines using a changed definition may now be in error or resolved, and checking them again
+        # may change the definitions they make in turn
+        checked = set(added)
+        changed_names = [key[0] for key in removed_keys ^ added_keys if key[1] in _PARSE_DEFINITION_KINDS]
+        while len(changed_names) > 0:
+            for line_analysis in list(self._references.get(changed_names.pop(), ())):
+                if line_analysis in checked:
+                    continue
+                line_num = line_analysis.line_num
+                self._unindex_line(line_analysis)
+                self._lines[line_num] = self._analyze_line(line_analysis.text, line_num)
+                self._index_line(self._lines[line_num])
+                checked.add(self._lines[line_num])
+                old_keys = DocumentAnalysis._definition_keys([line_analysis])
+                new_keys = DocumentAnalysis._definition_keys([self._lines[line_num]])
+                changed_names.extend(key[0] for key in old_keys ^ new_keys if key[1] in _PARSE_DEFINITION_KINDS)
+
+    @staticmethod
+    def _definition_keys(line_analyses: list[LineAnalysis]) -> set[tuple]:
+        return {(d.name, d.kind, d.value) for line_analysis in line_analyses for d in line_analysis.definitions}
+
+    def _index_line(self, line_analysis: LineAnalysis) -> None:
+        for definition in line_analysis.definitions:
+            if LabelScopeType.get_label_scope(definition.name) != LabelScopeType.LOCAL:
+                self._symbols.setdefault(definition.name, []).append(line_analysis)
+        for name in line_analysis.names:
+            self._references.setdefault(name, set()).add(line_analysis)
+
+    def _unindex_line(self, line_analysis: LineAnalysis) -> None:
+        for definition in line_analysis.definitions:
+            defining_lines = self._symbols.get(definition.name)
+            if defining_lines is None:
+                continue
+            for i, defining_line in enumerate(defining_lines):
+                if defining_line is line_analysis:
+                    del defining_lines[i]
+                    break
+            if len(defining_lines) == 0:
+                del self._symbols[definition.name]
+        for name in line_analysis.names:
+            referencing_lines = self._references[name]
+            referencing_lines.discard(line_analysis)
+            if len(referencing_lines) == 0:
+                del self._references[name]
+
+    def _reset_parse_context(self) -> None:
+        self._preprocessor = Preprocessor(
+            self._model.predefined_symbols,
+            self._model,
+            diagnostic_reporter=self._reporter,
+        )
+        self._memzone_manager = MemoryZoneManager(
+            self._model.address_size,
+            self._model.default_origin,
+            self._model.predefined_memory_zones,
+        )
+        named_scope_manager = NamedScopeManager(self._reporter)
+        self._active_named_scopes = ActiveNamedScopeList(named_scope_manager)
+
+    def _register_context_definitions(self, line_analysis: LineAnalysis, line_num: int) -> None:
+        """Adds the preprocessor symbols and memory zones a line defines to the shared parse context."""
+        try:
+            self._parse(line_analysis.text, line_num, self._preprocessor, self._memzone_manager)
+        except SystemExit:
+            # the error was reported when the line was analyzed, such as a symbol defined twice
+            pass
+
+    def _parse(
+        self,
+        text: str,
+        line_num: int,
+        preprocessor: Preprocessor,
+        memzone_manager: MemoryZoneManager,
+    ) -> list[LineObject]:
+        return LineOjectFactory.parse_line(
+            LineIdentifier(line_num + 1, filename=self._filename),
+            text,
+            self._model,
+            self._label_scope,
+            self._active_named_scopes,
+            memzone_manager.global_zone,
+            memzone_manager,
+            preprocessor,
+            ConditionStack(self._reporter),
+            0,
+            self._filename,
+        )
+
+    def _analyze_line(self, text: str, line_num: int) -> LineAnalysis:
+        line_str = text.strip()
+        if len(line_str) == 0 or line_str.startswith(';') or line_str.startswith(_CONDITIONAL_PREFIXES):
+            return LineAnalysis(text, line_num=line_num)
+        code_start = len(text) - len(text.lstrip())
+        code_end = len(split_line_comment(text)[0].rstrip())
+        if line_str.startswith('#include'):
+            include_match = re.search(AssemblyFile.PATTERN_INCLUDE_FILE, line_str)
+            if include_match is None:
+                return LineAnalysis(
+                    text,
+                    diagnostics=(LineDiagnostic('ERROR', 'Improperly formatted include directive', code_start, code_end),),
+                    line_num=line_num,
+                )
+            return LineAnalysis(text, include=include_match.group(1).strip(), line_num=line_num)
+
+        self._reporter.warnings.clear()
+        definitions: list[SymbolDefinition] = []
+        diagnostics: list[LineDiagnostic] = []
+        try:
+            if line_str.startswith('#'):
+                # Preprocessor directives change the parse context when parsed, so they are parsed against a
+                # scratch context. Their definitions are added to the shared context separately.
+                line_objects = self._parse(
+                    line_str,
+                    line_num,
+                    Preprocessor(self._model.predefined_symbols, self._model, diagnostic_reporter=self._reporter),
+                    MemoryZoneManager(
+                        self._model.address_size,
+                        self._model.default_origin,
+                        self._model.predefined_memory_zones,
+                    ),
+                )
+            else:
+                line_objects = self._parse(line_str, line_num, self._preprocessor, self._memzone_manager)
+        except SystemExit as e:
+            message = DiagnosticReporter.diagnostic_from_exit(e, None).message
+            diagnostics.append(LineDiagnostic('ERROR', message, code_start, code_end))
+            line_objects = []
+        except Exception as e:
+            # an unexpected failure analyzing one line should not stop the analysis of the rest
+            diagnostics.append(LineDiagnostic('ERROR', f'{type(e).__name__}: {e}', code_start, code_end))
+            line_objects = []
+        for warning in self._reporter.warnings:
+            diagnostics.append(LineDiagnostic('WARNING', warning.message, code_start, code_end))
+
+        for lobj in line_objects:
+            if isinstance(lobj, LabelLine):
+                if lobj.is_constant:
+                    definitions.append(self._definition(text, lobj.get_label(), 'constant', lobj.get_value()))
+                else:
+                    definitions.append(self._definition(text, lobj.get_label(), 'label'))
+            elif isinstance(lobj, DefineSymbolLine):
+                definitions.append(self._definition(text, lobj.symbol.name, 'symbol', lobj.symbol.value))
+            elif isinstance(lobj, CreateMemzoneLine):
+                definitions.append(self._definition(text, lobj.name, 'memzone'))
+            elif isinstance(lobj, CreateScopeLine):
+                definitions.append(self._definition(text, lobj.scope_name, 'named_scope'))
+        return LineAnalysis(text, tuple(definitions), tuple(diagnostics), line_num=line_num)
+
+    @staticmethod
+    def _definition(text: str, name: str, kind: str, value: int | str | None = None) -> SymbolDefinition:
+        for name_match in _PATTERN_NAME.finditer(text):
+            if name_match.group(0) == name:
+                return SymbolDefinition(name, kind, name_match.start(), name_match.end(), value)
+        start = max(text.find(name), 0)
+        return SymbolDefinition(name, kind, start, start + len(name), value)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class LineEdit(NamedTuple):
+    """The lines replaced by a text change: `removed_count` lines starting at `first_line` were
+    replaced by `inserted_count` lines."""
+    first_line: int
+    removed_count: int
+    inserted_count: int
+
+
+class TextDocument:
+    """
+    The text of an open source file held as a list of lines, updated in place by Language Server
+    Protocol content changes.
+
+    Positions are zero-based lines and characters. Characters are counted as Python code points, which
+    match the protocol's UTF-16 offsets for all text in the Basic Multilingual Plane.
+    """
+    __slots__ = ('_uri', '_version', '_lines')
+
+    def __init__(self, uri: str, text: str, version: int | None = None) -> None:
+        self._uri = uri
+        self._version = version
+        self._lines: list[str] = TextDocument._split_lines(text)
+
+    @staticmethod
+    def _split_lines(text: str) -> list[str]:
+        return text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @property
+    def version(self) -> int | None:
+        return self._version
+
+    @property
+    def lines(self) -> list[str]:
+        """The lines of the document without line terminators. The returned list must not be modified."""
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self._lines)
+
+    def apply_change(self, change: dict, version: int | None = None) -> LineEdit:
+        """
+        Applies one `TextDocumentContentChangeEvent`. A change without a range replaces the whole
+        document. Returns the lines that were replaced.
+        """
+        if version is not None:
+            self._version = version
+        new_lines = TextDocument._split_lines(change['text'])
+        if change.get('range') is None:
+            removed_count = len(self._lines)
+            self._lines = new_lines
+            return LineEdit(0, removed_count, len(new_lines))
+
+        start = change['range']['start']
+        end = change['range']['end']
+        start_line = min(start['line'], len(self._lines) - 1)
+        end_line = min(end['line'], len(self._lines) - 1)
+        prefix = self._lines[start_line][:start['character']]
+        suffix = self._lines[end_line][end['character']:]
+        new_lines[0] = prefix + new_lines[0]
+        new_lines[-1] = new_lines[-1] + suffix
+        self._lines[start_line:end_line + 1] = new_lines
+        return LineEdit(start_line, end_line - start_line + 1, len(new_lines))
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+from typing import BinaryIO
+
+
+class JsonRpcStream:
+    """
+    Reads and writes JSON-RPC messages framed with `Content-Length` headers, as the Language Server
+    Protocol uses over stdio.
+    """
+    def __init__(self, input_stream: BinaryIO, output_stream: BinaryIO) -> None:
+        self._input = input_stream
+        self._output = output_stream
+
+    def read_message(self) -> dict | None:
+        """Returns the next message, or None once the input stream is closed."""
+        content_length = None
+        while True:
+            header = self._input.readline()
+            if len(header) == 0:
+                return None
+            header = header.strip()
+            if len(header) == 0:
+                if content_length is None:
+                    # tolerate stray blank lines between messages
+                    continue
+                break
+            name, _, value = header.decode('ascii').partition(':')
+            if name.strip().lower() == 'content-length':
+                content_length = int(value.strip())
+        body = self._input.read(content_length)
+        if len(body) < content_length:
+            return None
+        return json.loads(body.decode('utf-8'))
+
+    def write_message(self, message: dict) -> None:
+        body = json.dumps(message, separators=(',', ':')).encode('utf-8')
+        self._output.write(f'Content-Length: {len(body)}\r\n\r\n'.encode('ascii') + body)
+        self._output.flush()
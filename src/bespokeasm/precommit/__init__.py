@@ -0,0 +1,226 @@
+"""
+The pre-commit hook, which checks that the root programs affected by the staged files still assemble.
+Which root programs include which files is cached between runs in an include graph, recorded each time a
+root program is checked. Only the affected root programs are assembled, in parallel and without writing
+any output.
+"""
+from __future__ import annotations
+
+import contextlib
+import glob
+import io
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+from bespokeasm.assembler.checker import SyntaxChecker
+from bespokeasm.cli import VERBOSE_HELP
+from bespokeasm.precommit.include_graph import file_stamp
+from bespokeasm.precommit.include_graph import IncludeGraph
+
+
+DEFAULT_CACHE_FILENAME = 'bespokeasm-include-graph.json'
+
+# the checker used by this process, which loads the ISA configuration once for all of the roots it checks
+_process_checker: SyntaxChecker | None = None
+
+
+def _init_worker(
+            config_file: str,
+            include_paths: list[str],
+            predefined: list[str],
+            warnings_as_errors: bool,
+            max_errors: int,
+        ) -> None:
+    global _process_checker
+    # worker processes started by fork already have the checker of the hook's process
+    if _process_checker is None:
+        _process_checker = SyntaxChecker(config_file, 0, include_paths, predefined, warnings_as_errors, max_errors)
+
+
+def _check_root(root: str) -> tuple[str, bool, str, dict[str, set[str]]]:
+    """Checks a root program, returning whether it assembles, its diagnostics, and the files it includes."""
+    include_graph: dict[str, set[str]] = {}
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            passed = _process_checker.check(root, include_graph)
+        except Exception as e:
+            # an unexpected error fails only this root, so the results of the others are still recorded
+            print(f'ERROR: {os.path.relpath(root)} - {type(e).__name__}: {e}', file=sys.stderr)
+            passed = False
+    return root, passed, output.getvalue(), include_graph
+
+
+def _default_cache_file() -> str:
+    """Returns the include graph cache file path inside the git directory, so it is never committed."""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--git-path', DEFAULT_CACHE_FILENAME],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return '.' + DEFAULT_CACHE_FILENAME
+
+
+def run_pre_commit_hook(
+            staged_files: list[str],
+            config_file: str,
+            root_patterns: list[str],
+            include_paths: list[str],
+            predefined: list[str],
+            warnings_as_errors: bool = False,
+            max_errors: int = 1,
+            jobs: int = 0,
+            cache_file: str | None = None,
+            verbose: int = 0,
+        ) -> list[str]:
+    """
+    Checks the root programs matching the glob patterns that are affected by the staged files, and
+    returns the checked root programs. Exits with an error if any of them does not assemble.
+    """
+    global _process_checker
+
+    roots = sorted({
+        os.path.realpath(path)
+        for pattern in root_patterns
+        for path in glob.glob(pattern, recursive=True)
+        if os.path.isfile(path)
+    })
+    if len(roots) == 0:
+        sys.exit(f'ERROR: no root programs match {", ".join(root_patterns)}')
+    include_paths = [os.path.realpath(path) for path in include_paths]
+    if cache_file is None:
+        cache_file = _default_cache_file()
+
+    # the cached graph is only used with the settings it was recorded with
+    settings = {
+        'config_file': os.path.realpath(config_file),
+        'config_stamp': file_stamp(config_file),
+        'include_paths': include_paths,
+        'macro_symbols': list(predefined),
+        'warnings_as_errors': warnings_as_errors,
+    }
+    graph = IncludeGraph.load(cache_file, settings)
+    affected_roots = graph.affected_roots(roots, [os.path.realpath(path) for path in staged_files])
+    if verbose:
+        click.echo(f'Checking {len(affected_roots)} of {len(roots)} root programs affected by the staged files')
+    if len(affected_roots) == 0:
+        return affected_roots
+
+    # the ISA configuration is loaded here, before any workers are started, so its errors are reported once
+    _process_checker = SyntaxChecker(config_file, 0, include_paths, list(predefined), warnings_as_errors, max_errors)
+    worker_count = min(jobs if jobs > 0 else (os.cpu_count() or 1), len(affected_roots))
+    if worker_count > 1:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_worker,
+            initargs=(config_file, include_paths, list(predefined), warnings_as_errors, max_errors),
+        ) as executor:
+            results = list(executor.map(_check_root, affected_roots))
+    else:
+        results = [_check_root(root) for root in affected_roots]
+
+    failed_roots: list[str] = []
+    for root, passed, output, include_graph in results:
+        graph.record(
+            root,
+            passed,
+            {
+                os.path.realpath(path): {os.path.realpath(included_path) for included_path in included_paths}
+                for path, included_paths in include_graph.items()
+            },
+        )
+        click.echo(output, err=True, nl=False)
+        if not passed:
+            failed_roots.append(root)
+    graph.save(cache_file)
+
+    if len(failed_roots) > 0:
+        sys.exit(
+            f'ERROR: {len(failed_roots)} of {len(affected_roots)} affected root programs failed to assemble: '
+            + ', '.join(os.path.relpath(root) for root in failed_roots)
+        )
+    return affected_roots
+
+
+@click.command(short_help='check the root programs affected by staged files')
+@click.argument('staged_files', nargs=-1, type=click.Path())
+@click.option(
+        '--config-file', '-c', required=True,
+        type=click.Path(dir_okay=False, exists=True),
+        help='The filepath to the instruction set configuration file,'
+    )
+@click.option(
+        '--root', '-r', 'root_patterns', multiple=True, required=True,
+        help='A glob pattern matching root programs, the assembly files that are assembled on their own rather '
+             'than included. Multiple can be seperately specified.'
+    )
+@click.option('--verbose', '-v', count=True, help=VERBOSE_HELP)
+@click.option(
+        '--include-path', '-I', multiple=True, default=[],
+        type=click.Path(file_okay=False),
+        help='Path to use when searching for included asm files. Multiple paths can be seperately specified.'
+    )
+@click.option(
+        '--macro-symbol', '-D', multiple=True, default=[],
+        help='Predefine name as macro. Assigning name with value may be done with "name=value" syntax. '
+             'Multiple can be seperately specified.'
+    )
+@click.option(
+        '--warnings-as-errors', '-W',
+        is_flag=True,
+        default=False,
+        help='Treat warnings as errors and fail the check.'
+    )
+@click.option(
+        '--max-errors',
+        type=click.IntRange(min=0),
+        default=1,
+        help='Keep checking a root program after an error and stop once this many errors are found in it, '
+             'reporting them all. 0 reports every error found.'
+    )
+@click.option(
+        '--jobs', '-j',
+        type=click.IntRange(min=0),
+        default=0,
+        help='The number of root programs checked in parallel. Defaults to the number of CPUs.'
+    )
+@click.option(
+        '--cache-file',
+        type=click.Path(dir_okay=False),
+        help='The file caching which files each root program includes. Defaults to a file in the git directory.'
+    )
+def main(
+            staged_files,
+            config_file,
+            root_patterns,
+            verbose,
+            include_path,
+            macro_symbol,
+            warnings_as_errors,
+            max_errors,
+            jobs,
+            cache_file,
+        ):
+    run_pre_commit_hook(
+        list(staged_files),
+        config_file,
+        list(root_patterns),
+        list(include_path),
+        list(macro_symbol),
+        warnings_as_errors,
+        max_errors,
+        jobs,
+        cache_file,
+        verbose,
+    )
+
+
+def entry_point():
+    return main()
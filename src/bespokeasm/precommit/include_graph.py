@@ -0,0 +1,103 @@
+"""
+A cache of the files each assembly file includes, recorded as root programs are assembled. Inverting it
+gives the root programs that depend on a file, so that only the programs affected by changed files need
+to be assembled again.
+
+Each file's entry holds the modification time and size it had when it was last read. A file whose stamp
+no longer matches is treated as changed, so changes made outside of a commit, such as by a checkout,
+are not missed. Entries are only trusted for the settings they were recorded with.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+
+from bespokeasm.cache_file import load_cache_file
+from bespokeasm.cache_file import save_cache_file
+
+
+INCLUDE_GRAPH_FORMAT_VERSION = 1
+
+
+def file_stamp(path: str) -> list[int] | None:
+    """Returns the modification time and size of a file, or None if it can't be read."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+class IncludeGraph:
+    def __init__(self, settings: dict) -> None:
+        self._settings = settings
+        # the stamp and included files of every file read when assembling the root programs
+        self._stamps: dict[str, list[int] | None] = {}
+        self._includes: dict[str, set[str]] = {}
+        # whether each root program assembled when it was last checked
+        self._roots: dict[str, bool] = {}
+
+    @classmethod
+    def load(cls, cache_file_path: str, settings: dict) -> IncludeGraph:
+        """Loads the cached graph, returning an empty graph if it is missing or was recorded with other settings."""
+        graph = cls(settings)
+        cache_data = load_cache_file(cache_file_path, INCLUDE_GRAPH_FORMAT_VERSION)
+        if (
+            cache_data is None
+            or cache_data.get('settings') != settings
+            or not isinstance(cache_data.get('files'), dict)
+            or not isinstance(cache_data.get('roots'), dict)
+        ):
+            return graph
+        for path, entry in cache_data['files'].items():
+            graph._stamps[path] = entry['stamp']
+            graph._includes[path] = set(entry['includes'])
+        graph._roots = dict(cache_data['roots'])
+        return graph
+
+    def save(self, cache_file_path: str) -> None:
+        data = {
+            'settings': self._settings,
+            'roots': self._roots,
+            'files': {
+                path: {'stamp': self._stamps[path], 'includes': sorted(self._includes[path])}
+                for path in sorted(self._stamps)
+            },
+        }
+        save_cache_file(cache_file_path, INCLUDE_GRAPH_FORMAT_VERSION, data, 'include graph')
+
+    def record(self, root: str, passed: bool, include_graph: dict[str, set[str]]) -> None:
+        """
+        Records the files included by each file read when assembling a root program. A file read
+        unchanged since it was last recorded keeps its other included files too, as a file can include
+        different files for different root programs, such as within a `#ifdef` block.
+        """
+        self._roots[root] = passed
+        files_read = {root, *include_graph.keys(), *(path for paths in include_graph.values() for path in paths)}
+        for path in files_read:
+            stamp = file_stamp(path)
+            if path not in self._stamps or self._stamps[path] != stamp:
+                self._stamps[path] = stamp
+                self._includes[path] = set()
+            self._includes[path].update(include_graph.get(path, ()))
+
+    def affected_roots(self, roots: Iterable[str], changed_files: Iterable[str]) -> list[str]:
+        """
+        Returns the root programs that include any of the changed files, directly or through other files.
+        Files changed since they were recorded, roots that have not been recorded, and roots that did not
+        assemble when they were last checked are always included.
+        """
+        changed = set(changed_files)
+        changed.update(path for path, stamp in self._stamps.items() if file_stamp(path) != stamp)
+        includers: dict[str, set[str]] = {}
+        for path, included_paths in self._includes.items():
+            for included_path in included_paths:
+                includers.setdefault(included_path, set()).add(path)
+        reached = set(changed)
+        pending = list(changed)
+        while len(pending) > 0:
+            for includer in includers.get(pending.pop(), ()):
+                if includer not in reached:
+                    reached.add(includer)
+                    pending.append(includer)
+        return [root for root in roots if root in reached or not self._roots.get(root, False)]
@@ -1,9 +1,5 @@
 import re
 
-from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap
-from ruamel.yaml.comments import CommentedSeq
-
 
 DEFAULT_NUMERIC_BASE_ALIASES = {
     'decimal': 'decimal',
@@ -186,6 +182,11 @@ def convert_disallowed_pairs_to_flow_style(obj):
 
 def load_yaml_with_format_preservation(yaml_str):
     """Load YAML while preserving number formats and comments."""
+    # ruamel.yaml is imported here so that importing this module for its numeric helpers stays cheap
+    from ruamel.yaml import YAML
+    from ruamel.yaml.comments import CommentedMap
+    from ruamel.yaml.comments import CommentedSeq
+
     yaml_loader = YAML()
     yaml_loader.preserve_quotes = True
     yaml_loader.indent(mapping=2, sequence=4, offset=2)
@@ -234,6 +235,10 @@ def load_yaml_with_format_preservation(yaml_str):
 
 def dump_yaml_with_formatting(updated_dict, output_stream):
     """Dump YAML with proper formatting for disallowed_pairs, preserved number formats, and comments."""
+    from ruamel.yaml import YAML
+    from ruamel.yaml.comments import CommentedMap
+    from ruamel.yaml.comments import CommentedSeq
+
     yaml_dumper = YAML()
     yaml_dumper.preserve_quotes = True
     yaml_dumper.indent(mapping=2, sequence=4, offset=2)
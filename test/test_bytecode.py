@@ -1,8 +1,10 @@
 import unittest
 
 from bespokeasm.assembler.bytecode.assembled import AssembledInstruction
+from bespokeasm.assembler.bytecode.parts import ByteCodePart
 from bespokeasm.assembler.bytecode.parts import CompositeByteCodePart
 from bespokeasm.assembler.bytecode.parts import ExpressionByteCodePart
+from bespokeasm.assembler.bytecode.parts import ExpressionByteCodePartWithValidation
 from bespokeasm.assembler.bytecode.parts import NumericByteCodePart
 from bespokeasm.assembler.bytecode.word import Word
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
@@ -197,6 +199,54 @@ class TestBytecodeObjects(unittest.TestCase):
             'words should match',
         )
 
+    def test_validate_parts_matches_compact_parts_to_words(self):
+        test_line_id = LineIdentifier(4, 'test_validate_parts_matches_compact_parts_to_words')
+        label_values = GlobalLabelScope({'a', 'i'})
+        label_values.set_label_value('small', 5, 1)
+        label_values.set_label_value('large', 300, 2)
+        active_named_scopes = ActiveNamedScopeList(NamedScopeManager(self.diagnostic_reporter))
+
+        def parts_for(expression: str) -> list:
+            return [
+                NumericByteCodePart(1, 4, False, 'big', 'big', test_line_id, 8, 8),
+                ExpressionByteCodePartWithValidation(20, None, expression, 4, False, 'big', 'big', test_line_id, 8, 8),
+                CompositeByteCodePart(
+                    [
+                        NumericByteCodePart(3, 4, False, 'big', 'big', test_line_id, 8, 8),
+                        ExpressionByteCodePart(expression, 8, False, 'big', 'big', test_line_id, 8, 8),
+                    ],
+                    True, 'big', 'big', test_line_id, 8, 8,
+                ),
+            ]
+
+        for expression, expected_error in [
+            ('small', None),
+            ('small + 11', 'out of range for bit_size 4'),
+            ('small + 20', 'exceeds maximun allowed of 20'),
+            ('large', 'exceeds maximun allowed of 20'),
+            ('missing', 'missing'),
+        ]:
+            with self.subTest(expression=expression):
+                errors = []
+                for check in (
+                    lambda: ByteCodePart.compact_parts_to_words(
+                        parts_for(expression), 8, 8, 'big', label_values, active_named_scopes, 0x8000, 3,
+                    ),
+                    lambda: ByteCodePart.validate_parts(
+                        parts_for(expression), 8, label_values, active_named_scopes, 0x8000, 3,
+                    ),
+                ):
+                    try:
+                        check()
+                        errors.append(None)
+                    except (SystemExit, ValueError) as e:
+                        errors.append(str(e))
+                self.assertEqual(errors[0], errors[1])
+                if expected_error is None:
+                    self.assertIsNone(errors[1])
+                else:
+                    self.assertIn(expected_error, errors[1])
+
     def test_bytecode_assembly_16bit_word(self):
         register_labels = {'a', 'i'}
         label_values = GlobalLabelScope(register_labels)
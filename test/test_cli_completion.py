@@ -66,7 +66,7 @@ def test_generate_extension_vim_options_surface_without_dash():
 
 
 def test_generate_extension_vscode_and_sublime_have_required_config_option():
-    for sub in ('vscode', 'sublime'):
+    for sub in ('vscode', 'sublime', 'all'):
         items = _zsh_completions(['generate-extension', sub], '')
         values = {item.value: item.help or '' for item in items}
         assert '--config-file' in values
@@ -80,7 +80,7 @@ def test_completion_cli_matches_main_compile_completions():
     def _noop(*a, **k):
         return None
 
-    completion_main = build_cli(CommandHandlers(_noop, _noop, _noop, _noop, _noop))
+    completion_main = build_cli(CommandHandlers(_noop, _noop, _noop, _noop, _noop, _noop, _noop, _noop))
     main_items = _zsh_completions_for(main, ['compile'], '-')
     completion_items = _zsh_completions_for(completion_main, ['compile'], '-')
     assert {(item.value, item.help) for item in main_items} == {(item.value, item.help) for item in completion_items}
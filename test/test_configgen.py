@@ -4,18 +4,26 @@ import os
 import pathlib as pl
 import re
 import shutil
+import subprocess
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from bespokeasm.configgen.color_scheme import build_hover_color_map
 from bespokeasm.configgen.color_scheme import DEFAULT_COLOR_SCHEME
 from bespokeasm.configgen.color_scheme import SyntaxElement
+from bespokeasm.configgen.hover_docs import decode_hover_doc_bundle
+from bespokeasm.configgen.hover_docs import encode_hover_doc_bundle
+from bespokeasm.configgen.hover_docs import HOVER_DOC_BUNDLE_FILENAME
 from bespokeasm.configgen.sublime import SublimeConfigGenerator
 from bespokeasm.configgen.vim import VimConfigGenerator
 from bespokeasm.configgen.vscode import VSCodeConfigGenerator
+from bespokeasm.configgen.word_regex import trie_regex_words
+from bespokeasm.configgen.word_regex import VIM_DIALECT
 from ruamel.yaml import YAML
 
 from test import config_files
+from test import test_code
 
 
 class TestConfigurationGeneration(unittest.TestCase):
@@ -43,11 +51,42 @@ class TestConfigurationGeneration(unittest.TestCase):
         for line in invalid_cases:
             self.assertIsNone(compiled.match(line), f'{source_name} should reject {line!r}')
 
+    @staticmethod
+    def _first_word_group(item_str: str) -> str | None:
+        # the first group that is not a flag or lookaround, with its word boundaries removed
+        start = re.search(r'\((?!\?[i<=!])(?:\?:)?', item_str)
+        if start is None:
+            return None
+        depth = 1
+        position = start.end()
+        while position < len(item_str) and depth > 0:
+            if item_str[position] == '\\':
+                position += 1
+            elif item_str[position] == '(':
+                depth += 1
+            elif item_str[position] == ')':
+                depth -= 1
+            position += 1
+        group = item_str[start.end():position - 1]
+        return group.removeprefix('\\b').removesuffix('\\b')
+
     def _assert_grouped_item_list(self, item_str: str, target_list: list[str], test_name: str) -> None:
-        match = re.search(r'^.*(?<=[\w\)])?\((?:\?\:)?(.*)\)', item_str, re.IGNORECASE)
-        self.assertIsNotNone(match, f'{test_name} match should be found')
-        match_list = set(match.group(1).split('|'))
-        self.assertSetEqual(match_list, set(target_list), f'all items from "{test_name}" should be found')
+        group = self._first_word_group(item_str)
+        self.assertIsNotNone(group, f'{test_name} match should be found')
+        match_list = trie_regex_words(group)
+        target_words = {re.sub(r'\\(.)', r'\1', target.replace('\\b', '')) for target in target_list}
+        self.assertSetEqual(match_list, target_words, f'all items from "{test_name}" should be found')
+
+    @staticmethod
+    def _vim_keywords(syn: str, group: str) -> set[str]:
+        keywords = set()
+        for line in syn.splitlines():
+            if line.startswith(f'syn keyword {group} '):
+                keywords.update(
+                    word for word in line.split()[3:]
+                    if '=' not in word and word not in ('contained', 'skipwhite')
+                )
+        return keywords
 
     def _assert_vim_contextual_syntax(self, syn: str, vim_ft: str) -> None:
         self.assertNotRegex(syn, rf'(?m)^syn\s+match\s+{re.escape(vim_ft)}Instruction\b')
@@ -67,20 +106,20 @@ class TestConfigurationGeneration(unittest.TestCase):
         self.assertIn(f'syn region {vim_ft}BracketExpr matchgroup={vim_ft}Bracket', syn)
         self.assertIn(f'syn region {vim_ft}DoubleBracketExpr matchgroup={vim_ft}DoubleBracket', syn)
         self.assertIn(f'syn region {vim_ft}ParenExpr matchgroup={vim_ft}Paren', syn)
-        instr_line = next(
+        operands_line = next(
             line for line in syn.splitlines()
-            if line.startswith(f'syn region {vim_ft}InstrLine ')
+            if line.startswith(f'syn region {vim_ft}Operands ') or line.startswith(f'syn region {vim_ft}InstrLine ')
         )
         bracket_line = next(
             line for line in syn.splitlines()
             if line.startswith(f'syn region {vim_ft}BracketExpr ')
         )
-        self.assertIn(f'{vim_ft}LabelUsage', instr_line)
+        self.assertIn(f'{vim_ft}LabelUsage', operands_line)
         self.assertIn(f'{vim_ft}LabelUsage', bracket_line)
         self.assertNotRegex(syn, rf'(?m)^syn\s+match\s+{re.escape(vim_ft)}LabelUsage\b')
         self.assertIn(r'start=/\[\(\[\)\@!/', syn)
         self.assertIn(r'end=/\s*\ze;\|$/ oneline', syn)
-        for region_name in ('InstrLine', 'MacroLine'):
+        for region_name in ('Operands', 'InstrLine', 'MacroLine'):
             region_line = next(
                 (line for line in syn.splitlines() if line.startswith(f'syn region {vim_ft}{region_name} ')),
                 None,
@@ -96,7 +135,8 @@ class TestConfigurationGeneration(unittest.TestCase):
         self.assertIn(f'hi {vim_ft}AssignOp ', syn)
 
         param_index = syn.find(f'syn match {vim_ft}Param')
-        compiler_label_index = syn.find(f'syn match {vim_ft}CompilerLabel')
+        compiler_label_match = re.search(rf'(?m)^syn (?:keyword|match) {re.escape(vim_ft)}CompilerLabel ', syn)
+        compiler_label_index = compiler_label_match.start() if compiler_label_match else -1
         self.assertGreaterEqual(param_index, 0, 'Param match should exist')
         self.assertGreaterEqual(compiler_label_index, 0, 'CompilerLabel match should exist')
         self.assertLess(param_index, compiler_label_index, 'Param must be defined before CompilerLabel')
@@ -352,10 +392,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         self.assertIn("if (ch === ';')", js_content)
         self.assertIn('if (!isOffsetInCodeRegion(lineText, range.start.character))', js_content)
 
-        docs_fp = os.path.join(extension_dirpath, 'bespokeasm-test', 'instruction-docs.json')
+        docs_fp = os.path.join(extension_dirpath, 'bespokeasm-test', HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(docs_fp)
-        with open(docs_fp) as json_file:
-            docs_json = json.load(json_file)
+        with open(docs_fp, 'rb') as bundle_file:
+            docs_json = decode_hover_doc_bundle(bundle_file.read())
         self.assertIn('instructions', docs_json)
         self.assertIn('macros', docs_json)
         self.assertIn('predefined', docs_json)
@@ -459,10 +499,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         self.assertIsFile(os.path.join(extension_dirpath, 'tester-assembly', 'language-configuration.json'))
         self.assertIsFile(os.path.join(extension_dirpath, 'tester-assembly', 'extension.js'))
 
-        docs_fp = os.path.join(extension_dirpath, 'tester-assembly', 'instruction-docs.json')
+        docs_fp = os.path.join(extension_dirpath, 'tester-assembly', HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(docs_fp)
-        with open(docs_fp) as json_file:
-            docs_json = json.load(json_file)
+        with open(docs_fp, 'rb') as bundle_file:
+            docs_json = decode_hover_doc_bundle(bundle_file.read())
         self.assertIn('instructions', docs_json)
         self.assertIn('macros', docs_json)
         self.assertIn('predefined', docs_json)
@@ -491,10 +531,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         configgen.generate()
 
         extension_dirpath = os.path.join(str(test_dir), 'extensions')
-        docs_fp = os.path.join(extension_dirpath, 'bespokeasm-test', 'instruction-docs.json')
+        docs_fp = os.path.join(extension_dirpath, 'bespokeasm-test', HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(docs_fp)
-        with open(docs_fp) as json_file:
-            docs_json = json.load(json_file)
+        with open(docs_fp, 'rb') as bundle_file:
+            docs_json = decode_hover_doc_bundle(bundle_file.read())
 
         self.assertIn('instructions', docs_json)
         self.assertIn('macros', docs_json)
@@ -526,10 +566,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         vscode_configgen.generate()
 
         extension_dirpath = os.path.join(str(test_dir), 'extensions')
-        docs_fp = os.path.join(extension_dirpath, 'predefined-hover-test', 'instruction-docs.json')
+        docs_fp = os.path.join(extension_dirpath, 'predefined-hover-test', HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(docs_fp)
-        with open(docs_fp) as json_file:
-            docs_json = json.load(json_file)
+        with open(docs_fp, 'rb') as bundle_file:
+            docs_json = decode_hover_doc_bundle(bundle_file.read())
 
         self.assertIn('predefined', docs_json)
         self.assertIn('VAR_BUF', docs_json['predefined']['constants'])
@@ -551,10 +591,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         )
         sublime_configgen._generate_files_in_dir(sublime_tmp_dir)
 
-        sublime_docs_fp = os.path.join(sublime_tmp_dir, 'instruction-docs.json')
+        sublime_docs_fp = os.path.join(sublime_tmp_dir, HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(sublime_docs_fp)
-        with open(sublime_docs_fp) as json_file:
-            sublime_docs_json = json.load(json_file)
+        with open(sublime_docs_fp, 'rb') as bundle_file:
+            sublime_docs_json = decode_hover_doc_bundle(bundle_file.read())
 
         self.assertIn('VAR_BUF', sublime_docs_json['predefined']['constants'])
         self.assertIn('| **Size** | 2 words |', sublime_docs_json['predefined']['constants']['VAR_BUF'])
@@ -615,7 +655,7 @@ class TestConfigurationGeneration(unittest.TestCase):
         self._assert_grouped_item_list(
             syntax_dict['contexts']['data_types_directives'][0]['match'],
             [
-                '\\.fill', '\\.zero', '\\.zerountil', '\\.byte', '\\.2byte',
+                '\\.fill', '\\.zero', '\\.zerountil', '\\.incbin', '\\.byte', '\\.2byte',
                 '\\.4byte', '\\.8byte', '\\.16byte', '\\.cstr', '\\.asciiz',
             ],
             'data type directives'
@@ -658,10 +698,10 @@ class TestConfigurationGeneration(unittest.TestCase):
             hover_plugin_content = hover_plugin_file.read()
         self.assertNotIn('##HOVER_COLOR_', hover_plugin_content)
         self.assertIn(expected_hover_colors['instruction'], hover_plugin_content)
-        docs_fp = os.path.join(test_tmp_dir, 'instruction-docs.json')
+        docs_fp = os.path.join(test_tmp_dir, HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(docs_fp)
-        with open(docs_fp) as json_file:
-            docs_json = json.load(json_file)
+        with open(docs_fp, 'rb') as bundle_file:
+            docs_json = decode_hover_doc_bundle(bundle_file.read())
         self.assertIn('instructions', docs_json)
         self.assertIn('macros', docs_json)
         self.assertIn('predefined', docs_json)
@@ -737,7 +777,7 @@ class TestConfigurationGeneration(unittest.TestCase):
         self._assert_grouped_item_list(
             syntax_dict['contexts']['data_types_directives'][0]['match'],
             [
-                '\\.fill', '\\.zero', '\\.zerountil',
+                '\\.fill', '\\.zero', '\\.zerountil', '\\.incbin',
                 '\\.byte', '\\.2byte', '\\.4byte', '\\.8byte', '\\.16byte',
                 '\\.cstr', '\\.asciiz',
             ],
@@ -781,10 +821,10 @@ class TestConfigurationGeneration(unittest.TestCase):
             hover_plugin_content = hover_plugin_file.read()
         self.assertNotIn('##HOVER_COLOR_', hover_plugin_content)
         self.assertIn(expected_hover_colors['instruction'], hover_plugin_content)
-        docs_fp = os.path.join(test_tmp_dir, 'instruction-docs.json')
+        docs_fp = os.path.join(test_tmp_dir, HOVER_DOC_BUNDLE_FILENAME)
         self.assertIsFile(docs_fp)
-        with open(docs_fp) as json_file:
-            docs_json = json.load(json_file)
+        with open(docs_fp, 'rb') as bundle_file:
+            docs_json = decode_hover_doc_bundle(bundle_file.read())
         self.assertIn('instructions', docs_json)
         self.assertIn('macros', docs_json)
         self.assertIn('predefined', docs_json)
@@ -873,10 +913,88 @@ class TestConfigurationGeneration(unittest.TestCase):
             r'syn\s+region\s+\w+InstrLine\s+matchgroup=\w+Instruction\s+start=/.+ma\\\.hl.+/',
             'Vim: instruction with period should be escaped and matched',
         )
+        self.assertSetEqual(self._vim_keywords(syn, f'{vim_ft}Instruction'), {'nop'})
         # String punctuation should be a separate matchgroup from the string body
         self.assertIn('matchgroup=' + vim_ft + 'StringPunc', syn)
         shutil.rmtree(test_dir)
 
+    def test_vim_keywords_exclude_decorated_prefixes(self):
+        test_dir = tempfile.mkdtemp()
+        config_file = pkg_resources.files(config_files).joinpath('test_mnemonic_decorators.yaml')
+        configgen = VimConfigGenerator(str(config_file), 0, str(test_dir), None, None, 'asmtest')
+        configgen.generate()
+        vim_ft = (configgen.language_id.replace('-', '').lower())
+        with open(os.path.join(str(test_dir), 'syntax', f'{vim_ft}.vim')) as f:
+            syn = f.read()
+        # a keyword `m` would take priority over the `m+` and `m-` regex, so it stays in the regex
+        self.assertSetEqual(self._vim_keywords(syn, f'{vim_ft}Instruction'), {'nop'})
+        m = re.search(rf'(?m)^syn region {re.escape(vim_ft)}InstrLine .*start=/(.+?)/ end=', syn)
+        self.assertIsNotNone(m, 'decorated mnemonics should have an instruction region')
+        # `++inc` starts with a non-keyword character, where \< cannot match
+        self.assertTrue(m.group(1).startswith(r'\k\@1<!\%('), m.group(1))
+        self.assertTrue(m.group(1).endswith(r'\)\k\@!'), m.group(1))
+        mnemonic_group = m.group(1)[len(r'\k\@1<!\%('):-len(r'\)\k\@!')]
+        self.assertSetEqual(trie_regex_words(mnemonic_group, VIM_DIALECT), {'++inc', 'm', 'm+', 'm-'})
+        shutil.rmtree(test_dir)
+
+        keywords, patterns = configgen._split_keywords(['mov', 'mov2', 'ld', 'display', 'a-b', 'Ld'], ['ld.b', 'a-b'])
+        self.assertListEqual(keywords, ['mov', 'mov2'])
+        self.assertListEqual(patterns, ['ld', 'display', 'a-b', 'Ld'])
+
+    def test_vim_keyword_highlighting_in_vim(self):
+        vim_path = shutil.which('vim')
+        if vim_path is None:
+            self.skipTest('vim is not available to check the generated syntax')
+        test_dir = tempfile.mkdtemp()
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_macros.yaml')
+        configgen = VimConfigGenerator(str(config_file), 0, str(test_dir), None, None, 'asmtest')
+        configgen.generate()
+        vim_ft = (configgen.language_id.replace('-', '').lower())
+        asm_file = pkg_resources.files(test_code).joinpath('vim_keyword_highlighting.asm')
+        report_fp = os.path.join(test_dir, 'groups.txt')
+        # writes the syntax group name at every column of every line
+        dump_script_fp = os.path.join(test_dir, 'dump_groups.vim')
+        with open(dump_script_fp, 'w') as f:
+            f.write(
+                'let s:lines = []\n'
+                "for s:lnum in range(1, line('$'))\n"
+                "  let s:cols = range(1, max([1, col([s:lnum, '$']) - 1]))\n"
+                "  call add(s:lines, join(map(s:cols, {_, c -> synIDattr(synID(s:lnum, c, 1), 'name')}), ' '))\n"
+                'endfor\n'
+                f"call writefile(s:lines, '{report_fp}')\n"
+            )
+        subprocess.run(
+            [
+                vim_path, '-N', '-u', 'NONE', '-i', 'NONE', '-n', '-es',
+                '--cmd', f'set rtp^={test_dir}', '-c', 'syntax on', '-c', f'set ft={vim_ft}',
+                '-c', f'source {dump_script_fp}', '-c', 'qa!', str(asm_file),
+            ],
+            check=True,
+            timeout=60,
+        )
+        with open(asm_file) as f:
+            source_lines = f.read().splitlines()
+        with open(report_fp) as f:
+            line_groups = [line.split(' ') for line in f.read().splitlines()]
+
+        def group_at(line: str, token: str) -> str:
+            line_num = source_lines.index(line)
+            return line_groups[line_num][line.index(token)].removeprefix(vim_ft)
+
+        self.assertEqual(group_at('    push2 a, i', 'push2'), 'Macro')
+        self.assertEqual(group_at('    push2 a, i', 'i'), 'Register')
+        self.assertEqual(group_at('    addc predefined_value1', 'addc'), 'Instruction')
+        self.assertEqual(group_at('    addc predefined_value1', 'predefined'), 'CompilerLabel')
+        self.assertEqual(group_at('    mov a, __LANGUAGE_VERSION_MAJOR__', '__'), 'CompilerLabel')
+        self.assertEqual(group_at('    add16 BYTE0(label_value) + 1', 'BYTE0'), 'Operator')
+        self.assertEqual(group_at('    add16 BYTE0(label_value) + 1', 'label_value'), 'Param')
+        self.assertEqual(group_at('    ldar $2000 ; load the address register', 'address'), 'Comment')
+        self.assertEqual(group_at('    push a pop j', 'pop'), 'Instruction')
+        self.assertEqual(group_at('    push a pop j', 'j'), 'Register')
+        self.assertEqual(group_at('#define SYMBOL 1', 'define'), 'PreProc')
+        self.assertEqual(group_at('.loop:', 'loop'), 'LabelName')
+        shutil.rmtree(test_dir)
+
     def test_vscode_and_sublime_include_aliases(self):
         # Use the instruction alias config
         test_dir = tempfile.mkdtemp()
@@ -902,14 +1020,8 @@ class TestConfigurationGeneration(unittest.TestCase):
             grammar_json = json.load(json_file)
         # All mnemonics and aliases should be present
         regex_str = grammar_json['repository']['instructions']['begin']
-        # Remove leading (?i)( and trailing ) if present
-        if regex_str.startswith('(?i)(') and regex_str.endswith(')'):
-            regex_str = regex_str[5:-1]
-        actual = set(regex_str.split('|'))
-        expected = {
-            '\\bjsr\\b', '\\bcall\\b', '\\bjsr2\\b', '\\bcall2\\b',
-            '\\bjump_to_subroutine\\b', '\\bnop\\b'
-        }
+        actual = trie_regex_words(self._first_word_group(regex_str))
+        expected = {'jsr', 'call', 'jsr2', 'call2', 'jump_to_subroutine', 'nop'}
         self.assertSetEqual(actual, expected, 'VSCode: all mnemonics and aliases should be present')
         # Sublime
         configgen_sublime = SublimeConfigGenerator(
@@ -935,12 +1047,17 @@ class TestConfigurationGeneration(unittest.TestCase):
             with zf.open(syntax_files[0]) as f:
                 syntax = f.read().decode('utf-8')
         # All mnemonics and aliases should be present in the regex
-        for mnemonic in ['jsr', 'call', 'jsr2', 'call2', 'jump_to_subroutine', 'nop']:
-            self.assertRegex(
-                syntax,
-                rf'\\b{re.escape(mnemonic)}\\b',
-                f'Sublime: {mnemonic} should be present',
-            )
+        syntax_dict = YAML().load(syntax)
+        instruction_matches = [
+            instr_dict['match'] for instr_dict in syntax_dict['contexts']['instructions']
+            if instr_dict['scope'] == 'variable.function.instruction'
+        ]
+        self.assertEqual(len(instruction_matches), 1, 'Sublime: one instruction match expected')
+        self.assertSetEqual(
+            trie_regex_words(self._first_word_group(instruction_matches[0])),
+            {'jsr', 'call', 'jsr2', 'call2', 'jump_to_subroutine', 'nop'},
+            'Sublime: all mnemonics and aliases should be present',
+        )
 
     def test_vim_configgen_no_registers(self):
         test_dir = tempfile.mkdtemp()
@@ -964,24 +1081,13 @@ class TestConfigurationGeneration(unittest.TestCase):
         with open(syntax_fp) as f:
             syn = f.read()
         self._assert_vim_contextual_syntax(syn, vim_ft)
-        # Instructions present (syn region alternation with word boundaries)
-        m = re.search(
-            rf'^syn\s+region\s+{re.escape(vim_ft)}InstrLine\s+'
-            rf'matchgroup={re.escape(vim_ft)}Instruction\s+start=/(.+?)/\s+end=',
-            syn,
-            re.MULTILINE,
-        )
-        self.assertIsNotNone(m, 'Instruction region line should exist')
-        pat = m.group(1)
-        # Extract the alternation group between \%( ... ) without using nested-regex
-        start = pat.find(r'\%(')
-        end = pat.rfind(r'\)')
-        self.assertTrue(start >= 0 and end > start, 'Instruction pattern should contain alternation group')
-        group = pat[start+3:end]
-        for mnemonic in ['lda', 'add', 'set', 'big', 'hlt']:
-            self.assertRegex(group, rf'(?:^|\\\|){re.escape(mnemonic)}(?:\\\||$)')
+        # Instructions present as keywords that chain to the operands region
+        self.assertSetEqual(self._vim_keywords(syn, f'{vim_ft}Instruction'), {'lda', 'add', 'set', 'big', 'hlt'})
+        self.assertIn(f'nextgroup={vim_ft}Operands skipwhite', syn)
+        self.assertNotRegex(syn, rf'(?m)^syn\s+region\s+{re.escape(vim_ft)}InstrLine\b', 'No decorated mnemonics')
         # No macros
         self.assertNotRegex(syn, rf'(?m)^syn\s+region\s+{re.escape(vim_ft)}MacroLine\b', 'No macros expected')
+        self.assertNotRegex(syn, rf'(?m)^syn\s+keyword\s+{re.escape(vim_ft)}Macro\b', 'No macros expected')
         # No registers
         self.assertIsNone(
             re.search(rf'^syn\s+keyword\s+{re.escape(vim_ft)}Register\b', syn, re.MULTILINE),
@@ -1001,7 +1107,7 @@ class TestConfigurationGeneration(unittest.TestCase):
             syn,
         )
         # Data types
-        for dt in ['fill', 'zero', 'zerountil', 'byte', '2byte', '4byte', '8byte', '16byte', 'cstr', 'asciiz']:
+        for dt in ['fill', 'zero', 'zerountil', 'incbin', 'byte', '2byte', '4byte', '8byte', '16byte', 'cstr', 'asciiz']:
             self.assertIn(
                 f'syn region {vim_ft}DataTypeLine matchgroup={vim_ft}DataType start=/\\s*\\.{dt}\\>/',
                 syn,
@@ -1013,15 +1119,21 @@ class TestConfigurationGeneration(unittest.TestCase):
         self.assertIsNotNone(m, 'PreProcPunc match line should exist')
         self.assertIn('^#/', m.group(1))
         self.assertIn(f'nextgroup={vim_ft}PreProc', m.group(1))
-        for pp in [
-            'include', 'require',
-            'create_memzone', 'print',
-            'define', 'if', 'elif', 'else', 'endif',
-            'ifdef', 'ifndef', 'mute', 'unmute', 'emit',
-        ]:
+        self.assertSetEqual(
+            self._vim_keywords(syn, f'{vim_ft}PreProc'),
+            {
+                'include', 'require', 'error',
+                'create_memzone', 'print',
+                'define', 'if', 'elif', 'else', 'endif',
+                'ifdef', 'ifndef', 'mute', 'unmute', 'emit',
+            },
+        )
+        self.assertRegex(syn, rf'(?m)^syn\s+keyword\s+{re.escape(vim_ft)}PreProc\s+.*\scontained$')
+        # directives that are not plain identifiers remain contained matches
+        for pp in ['create-scope', 'use-scope', 'deactivate-scope']:
             self.assertRegex(
                 syn,
-                rf'syn\s+match\s+{re.escape(vim_ft)}PreProc\s+/\\<{re.escape(pp)}\\>/',
+                rf'syn\s+match\s+{re.escape(vim_ft)}PreProc\s+/\\<{re.escape(pp)}\\>/ contained',
                 f'preprocessor {pp} present',
             )
         # ftdetect
@@ -1055,20 +1167,7 @@ class TestConfigurationGeneration(unittest.TestCase):
         regs = set(m.group(1).split())
         self.assertTrue({'a', 'j', 'i', 'h', 'l', 'hl', 'sp', 'mar'}.issubset(regs))
         # Instructions present
-        m = re.search(
-            rf'^syn\s+region\s+{re.escape(vim_ft)}InstrLine\s+'
-            rf'matchgroup={re.escape(vim_ft)}Instruction\s+start=/(.+?)/\s+end=',
-            syn,
-            re.MULTILINE,
-        )
-        self.assertIsNotNone(m, 'Instruction region line should exist')
-        pat = m.group(1)
-        start = pat.find(r'\%(')
-        end = pat.rfind(r'\)')
-        self.assertTrue(start >= 0 and end > start, 'Instruction pattern should contain alternation group')
-        group = pat[start+3:end]
-        for mnemonic in ['nop', 'mov', 'cmp', 'jmp']:
-            self.assertRegex(group, rf'(?:^|\\\|){re.escape(mnemonic)}(?:\\\||$)')
+        self.assertSetEqual(self._vim_keywords(syn, f'{vim_ft}Instruction'), {'nop', 'mov', 'cmp', 'jmp'})
         shutil.rmtree(test_dir)
 
     def test_vim_include_aliases(self):
@@ -1089,20 +1188,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         with open(syntax_fp) as f:
             syn = f.read()
         self._assert_vim_contextual_syntax(syn, vim_ft)
-        m = re.search(
-            rf'^syn\s+region\s+{re.escape(vim_ft)}InstrLine\s+'
-            rf'matchgroup={re.escape(vim_ft)}Instruction\s+start=/(.+?)/\s+end=',
-            syn,
-            re.MULTILINE,
-        )
-        self.assertIsNotNone(m, 'Instruction region line should exist')
-        pat = m.group(1)
-        start = pat.find(r'\%(')
-        end = pat.rfind(r'\)')
-        self.assertTrue(start >= 0 and end > start, 'Instruction pattern should contain alternation group')
-        group = pat[start+3:end]
-        for mnemonic in ['jsr', 'call', 'jsr2', 'call2', 'jump_to_subroutine', 'nop']:
-            self.assertRegex(group, rf'(?:^|\\\|){re.escape(mnemonic)}(?:\\\||$)')
+        self.assertSetEqual(
+            self._vim_keywords(syn, f'{vim_ft}Instruction'),
+            {'jsr', 'call', 'jsr2', 'call2', 'jump_to_subroutine', 'nop'},
+        )
         shutil.rmtree(test_dir)
 
     def test_vim_instruction_region_ends_before_next_same_line_instruction(self):
@@ -1125,7 +1214,7 @@ class TestConfigurationGeneration(unittest.TestCase):
 
         region_line = next(
             line for line in syn.splitlines()
-            if line.startswith(f'syn region {vim_ft}InstrLine ')
+            if line.startswith(f'syn region {vim_ft}Operands ')
         )
         self.assertIn(r'end=/\s*\ze\<', region_line)
         self.assertIn(r'\|\s*\ze;\|$/ oneline', region_line)
@@ -1334,14 +1423,11 @@ class TestConfigurationGeneration(unittest.TestCase):
         with open(syntax_fp) as f:
             syn = f.read()
         self._assert_vim_contextual_syntax(syn, vim_ft)
-        m = re.search(
-            rf'^syn\s+region\s+{re.escape(vim_ft)}MacroLine\s+'
-            rf'matchgroup={re.escape(vim_ft)}Macro\s+start=/(.+?)/\s+end=',
+        self.assertIn('push2', self._vim_keywords(syn, f'{vim_ft}Macro'))
+        self.assertRegex(
             syn,
-            re.MULTILINE,
+            rf'(?m)^syn keyword {re.escape(vim_ft)}Macro .* nextgroup={re.escape(vim_ft)}Operands skipwhite$',
         )
-        self.assertIsNotNone(m, 'Macro region line should exist')
-        self.assertIn('push2', m.group(1))
         shutil.rmtree(test_dir)
 
     def test_vim_instruction_and_macro_regions_end_on_either_mnemonic(self):
@@ -1364,19 +1450,16 @@ class TestConfigurationGeneration(unittest.TestCase):
         with open(syntax_fp) as f:
             syn = f.read()
 
-        instr_line = next(
+        # instructions and macros share the operands region
+        operands_line = next(
             line for line in syn.splitlines()
-            if line.startswith(f'syn region {vim_ft}InstrLine ')
-        )
-        macro_line = next(
-            line for line in syn.splitlines()
-            if line.startswith(f'syn region {vim_ft}MacroLine ')
+            if line.startswith(f'syn region {vim_ft}Operands ')
         )
 
         instructions = ['push', 'pop', 'mov', 'add', 'addc', 'ldar']
         macros = ['push2', 'mov2', 'add16', 'swap', 'incs']
 
-        for region_line, region_name in ((instr_line, 'InstrLine'), (macro_line, 'MacroLine')):
+        for region_line, region_name in ((operands_line, 'Operands'),):
             end_match = re.search(r' end=/(.+?)/ oneline ', region_line)
             self.assertIsNotNone(end_match, f'{region_name} should have an end= pattern')
             end_pat = end_match.group(1)
@@ -1385,12 +1468,12 @@ class TestConfigurationGeneration(unittest.TestCase):
                 f'{region_name} end pattern should start with operation-mnemonic terminator, got: {end_pat}',
             )
             self.assertIn(r'\|\s*\ze;\|$', end_pat, f'{region_name} should also terminate on ; or EOL')
-            for mnemonic in instructions + macros:
-                self.assertRegex(
-                    end_pat,
-                    rf'(?:\\%\(|\\\|){re.escape(mnemonic)}(?:\\\||\\\))',
-                    f'{region_name} end pattern should terminate before {mnemonic!r}',
-                )
+            mnemonic_group = end_pat[len(r'\s*\ze\<'):end_pat.index(r'\>')]
+            self.assertSetEqual(
+                trie_regex_words(mnemonic_group, VIM_DIALECT),
+                set(instructions + macros),
+                f'{region_name} end pattern should terminate before every mnemonic',
+            )
         shutil.rmtree(test_dir)
 
     def test_vim_background_foreground_colors(self):
@@ -1596,7 +1679,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         # Verify all built-in constants are in the match pattern
         from bespokeasm.assembler.keywords import BUILTIN_CONSTANTS_SET
         for constant in BUILTIN_CONSTANTS_SET:
-            self.assertIn(constant, compiler_labels_match, f'{constant} should be in compiler labels match pattern')
+            self.assertIsNotNone(
+                re.fullmatch(compiler_labels_match, constant),
+                f'{constant} should be matched by compiler labels match pattern',
+            )
 
         # Verify the scope is constant.language
         self.assertEqual(
@@ -1636,7 +1722,10 @@ class TestConfigurationGeneration(unittest.TestCase):
         # Verify all built-in constants are in the match pattern
         from bespokeasm.assembler.keywords import BUILTIN_CONSTANTS_SET
         for constant in BUILTIN_CONSTANTS_SET:
-            self.assertIn(constant, compiler_labels_match, f'{constant} should be in compiler labels match pattern')
+            self.assertIsNotNone(
+                re.fullmatch(compiler_labels_match, constant),
+                f'{constant} should be matched by compiler labels match pattern',
+            )
 
         # Verify the name/scope
         self.assertEqual(
@@ -1669,15 +1758,87 @@ class TestConfigurationGeneration(unittest.TestCase):
         with open(syntax_fp) as f:
             syn = f.read()
 
-        # Check for CompilerLabel syntax match that includes built-in constants
-        m = re.search(rf'^syn\s+match\s+{re.escape(vim_ft)}CompilerLabel\s+/(.+)/$', syn, re.MULTILINE)
-        self.assertIsNotNone(m, 'CompilerLabel match line should exist')
-        compiler_labels_pattern = m.group(1)
+        # Check for CompilerLabel keywords that include built-in constants
+        compiler_labels = self._vim_keywords(syn, f'{vim_ft}CompilerLabel')
+        self.assertNotRegex(syn, rf'(?m)^syn\s+match\s+{re.escape(vim_ft)}CompilerLabel\b')
 
         # Verify all built-in constants are in the pattern
         from bespokeasm.assembler.keywords import BUILTIN_CONSTANTS_SET
         for constant in BUILTIN_CONSTANTS_SET:
-            # Vim doesn't escape underscores in this context
-            self.assertIn(constant, compiler_labels_pattern, f'{constant} should be in Vim compiler labels pattern')
+            self.assertIn(constant, compiler_labels, f'{constant} should be in Vim compiler labels pattern')
 
         shutil.rmtree(test_dir)
+
+    def test_template_rendering_is_single_pass(self):
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_list_creation_isa.json')
+        configgen = VimConfigGenerator(str(config_file), 0, tempfile.gettempdir(), None, None, 'asmtest')
+        rendered = configgen._render_template(
+            'a ##FIRST## b ##SECOND## c ##UNKNOWN## d ##FIRST##',
+            {'##FIRST##': '##SECOND##', '##SECOND##': '\\1 $2'},
+        )
+        # replacement values are neither expanded again nor treated as regex substitution syntax
+        self.assertEqual(rendered, 'a ##SECOND## b \\1 $2 c ##UNKNOWN## d ##SECOND##')
+
+    def test_write_output_file_replaces_destination(self):
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_list_creation_isa.json')
+        test_dir = tempfile.mkdtemp()
+        configgen = VimConfigGenerator(str(config_file), 0, test_dir, None, None, 'asmtest')
+        output_fp = os.path.join(test_dir, 'output.txt')
+        configgen._write_output_file(output_fp, 'first version that is longer\n')
+        configgen._write_output_file(output_fp, 'second\n')
+        configgen._write_output_file(os.path.join(test_dir, 'output.bin'), b'\x00\x01')
+        self.assertEqual(sorted(os.listdir(test_dir)), ['output.bin', 'output.txt'])
+        with open(output_fp) as f:
+            self.assertEqual(f.read(), 'second\n')
+        shutil.rmtree(test_dir)
+
+    def test_write_output_file_permissions_follow_umask(self):
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_list_creation_isa.json')
+        test_dir = tempfile.mkdtemp()
+        configgen = VimConfigGenerator(str(config_file), 0, test_dir, None, None, 'asmtest')
+        output_fp = os.path.join(test_dir, 'output.txt')
+        previous_umask = os.umask(0o027)
+        try:
+            # the umask is process wide, so writing a file must not change it, even briefly
+            with patch('os.umask', side_effect=AssertionError('os.umask called')):
+                configgen._write_output_file(output_fp, 'content\n')
+        finally:
+            os.umask(previous_umask)
+        self.assertEqual(os.stat(output_fp).st_mode & 0o777, 0o640)
+        shutil.rmtree(test_dir)
+
+    def test_generators_share_a_loaded_model(self):
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_list_creation_isa.json')
+        test_dir = tempfile.mkdtemp()
+        model = VimConfigGenerator(str(config_file), 0, test_dir, None, None, 'asmtest').model
+        generators = [
+            VSCodeConfigGenerator(str(config_file), 0, test_dir, None, None, 'asmtest', model),
+            SublimeConfigGenerator(str(config_file), 0, test_dir, None, None, 'asmtest', model),
+            VimConfigGenerator(str(config_file), 0, test_dir, None, None, 'asmtest', model),
+        ]
+        for generator in generators:
+            self.assertIs(generator.model, model)
+            generator.generate()
+        # every placeholder in the packaged resources is replaced and no temporary files are left behind
+        for dir_path, _, filenames in os.walk(test_dir):
+            for filename in filenames:
+                self.assertFalse(filename.endswith('.tmp'), filename)
+                if filename.endswith('.sublime-package'):
+                    continue
+                with open(os.path.join(dir_path, filename), encoding='utf-8') as f:
+                    self.assertNotRegex(f.read(), r'##[A-Z_]+##', filename)
+        shutil.rmtree(test_dir)
+
+    def test_hover_doc_bundle_round_trip(self):
+        hover_docs = {
+            'instructions': {'LDA': '### `LDA` : Load — ä', 'NOP': '### `NOP`'},
+            'macros': {'NOP2': '### `NOP`'},
+            'predefined': {'constants': {}, 'data': {'buffer': 'A buffer'}},
+        }
+        bundle_data = encode_hover_doc_bundle(hover_docs)
+        self.assertTrue(bundle_data.startswith(b'BESPOKEASM-HOVER-DOCS 1 '))
+        self.assertEqual(decode_hover_doc_bundle(bundle_data), hover_docs)
+        # identical markdown is stored once
+        self.assertEqual(bundle_data.count(b'### `NOP`'), 1)
+        with self.assertRaises(ValueError):
+            decode_hover_doc_bundle(json.dumps(hover_docs).encode('utf-8'))
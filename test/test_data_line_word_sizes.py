@@ -193,6 +193,47 @@ class TestDataLineWordSizes(unittest.TestCase):
         d.label_scope = self.label_scope
         self.assertEqual(d.word_count, 2)  # 'A', terminator
 
+    def test_literal_fast_path_matches_expression_path(self):
+        test_cases = [
+            ('.byte', ['$01', '0x7F', '%1010', '200', '0']),
+            ('.2byte', ['$1234', '0xBEEF', '%1', '65535']),
+            ('.4byte', ['$01020304', '0xDEADBEEF', '42']),
+            ('.8byte', ['$0102030405060708', '7']),
+        ]
+        word_formats = [(8, 'big'), (16, 'big'), (16, 'little'), (32, 'big'), (32, 'little'), (64, 'little')]
+        for directive, literals in test_cases:
+            for word_size, multi_word_endianness in word_formats:
+                with self.subTest(directive=directive, word_size=word_size, endian=multi_word_endianness):
+                    fast = self._make_data(f'{directive} {", ".join(literals)}', word_size, 'big', multi_word_endianness)
+                    general = self._make_data(
+                        f'{directive} {", ".join(f"({v})" for v in literals)}',
+                        word_size,
+                        'big',
+                        multi_word_endianness,
+                    )
+                    self.assertTrue(fast._is_literal_list)
+                    self.assertFalse(general._is_literal_list)
+                    for d in (fast, general):
+                        d.label_scope = self.label_scope
+                        d.generate_words()
+                    self.assertEqual(fast.word_count, general.word_count)
+                    self.assertEqual(fast.get_words(), general.get_words())
+
+    def test_literal_fast_path_fallbacks(self):
+        self.label_scope.set_label_value('my_label', 3, 1)
+        for line_str in [
+            '.byte $01, my_label',
+            '.byte $01, 2+3',
+            '.byte "ab", 1',
+            '.byte $1FF',
+            '.byte -1',
+            '.16byte $01',
+            '.cstr "abc"',
+        ]:
+            with self.subTest(line_str=line_str):
+                d = self._make_data(line_str, 8, 'big', 'big')
+                self.assertFalse(d._is_literal_list)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,150 @@
+import importlib.resources as pkg_resources
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticError
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.diagnostic_reporter import ErrorReportExit
+from bespokeasm.assembler.diagnostic_reporter import RelatedLocation
+from bespokeasm.assembler.engine import Assembler
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+
+from test import config_files
+
+
+class TestDiagnosticReporter(unittest.TestCase):
+    def test_error_stops_at_first_error_by_default(self):
+        reporter = DiagnosticReporter()
+        line_id = LineIdentifier(3, 'main.asm')
+        with self.assertRaises(DiagnosticError) as ctx:
+            with reporter.recovery_point(line_id):
+                reporter.error(line_id, 'bad operand')
+        self.assertEqual(str(ctx.exception), 'ERROR: file main.asm, line 3 - bad operand')
+        self.assertEqual(ctx.exception.diagnostic.line_id, line_id)
+        with self.assertRaises(SystemExit):
+            with reporter.recovery_point(line_id):
+                sys.exit(f'ERROR: {line_id} - bad operand')
+        reporter.raise_collected_errors()
+
+    def test_collects_sorted_deduplicated_errors(self):
+        reporter = DiagnosticReporter(max_errors=0)
+        second_line = LineIdentifier(7, 'main.asm')
+        first_line = LineIdentifier(2, 'main.asm')
+        with reporter.recovery_point(second_line):
+            reporter.error(second_line, 'unknown label "foo"')
+        with reporter.recovery_point(second_line):
+            sys.exit(f'ERROR: {second_line} - unknown label "foo"')
+        with reporter.recovery_point(first_line):
+            sys.exit('ERROR - operand out of range')
+        self.assertEqual(
+            [str(diagnostic) for diagnostic in reporter.errors],
+            [
+                'ERROR: file main.asm, line 2 - operand out of range',
+                'ERROR: file main.asm, line 7 - unknown label "foo"',
+            ],
+        )
+        with self.assertRaises(ErrorReportExit) as ctx:
+            reporter.raise_collected_errors()
+        self.assertEqual(str(ctx.exception).splitlines()[-1], '2 errors found')
+
+    def test_stops_once_max_errors_collected(self):
+        reporter = DiagnosticReporter(max_errors=2)
+        with reporter.recovery_point(LineIdentifier(1, 'main.asm')):
+            sys.exit('ERROR - first')
+        with self.assertRaises(ErrorReportExit) as ctx:
+            with reporter.recovery_point(LineIdentifier(2, 'main.asm')):
+                sys.exit('ERROR - second')
+        self.assertEqual(
+            str(ctx.exception).splitlines(),
+            [
+                'ERROR: file main.asm, line 1 - first',
+                'ERROR: file main.asm, line 2 - second',
+                'stopping after 2 errors',
+            ],
+        )
+
+    def test_assembler_reports_errors_across_passes(self):
+        LabelScope._global_scope = None
+        InstructionLine.reset_instruction_pattern_cache()
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('.byte $01\njmp\n.byte undefined_label\nbogus a, b\n.byte $02\n')
+            for max_errors, expected_lines in ((1, [2]), (2, [2, 4]), (0, [2, 3, 4])):
+                with self.subTest(max_errors=max_errors):
+                    LabelScope._global_scope = None
+                    assembler = Assembler(
+                        source_file=asm_path,
+                        config_file=config_path,
+                        generate_binary=True,
+                        output_file=os.path.join(temp_dir, 'program.bin'),
+                        binary_start=0,
+                        binary_end=None,
+                        binary_fill_value=0,
+                        enable_pretty_print=False,
+                        pretty_print_format=None,
+                        pretty_print_output=None,
+                        is_verbose=0,
+                        include_paths=[],
+                        predefined=[],
+                        max_errors=max_errors,
+                    )
+                    with self.assertRaises(SystemExit) as ctx:
+                        assembler.assemble_bytecode()
+                    reported_lines = [
+                        int(line.rsplit(', line ', 1)[1].split(' ', 1)[0])
+                        for line in str(ctx.exception.code).splitlines()
+                        if line.startswith('ERROR')
+                    ]
+                    self.assertEqual(reported_lines, expected_lines)
+                    self.assertFalse(os.path.exists(os.path.join(temp_dir, 'program.bin')))
+
+    def test_json_diagnostics_are_streamed(self):
+        output = io.StringIO()
+        reporter = DiagnosticReporter(diagnostics_format='json', diagnostics_output=output, max_errors=0)
+        line_id = LineIdentifier(4, 'main.asm')
+        reporter.warn(line_id, 'unused label', columns=(0, 5))
+        self.assertEqual(
+            json.loads(output.getvalue()),
+            {
+                'severity': 'warning', 'category': 'user', 'file': 'main.asm', 'line': 4,
+                'columns': [0, 5], 'message': 'unused label', 'related': [],
+            },
+        )
+        with reporter.recovery_point(line_id):
+            reporter.error(line_id, 'overlap', related=[RelatedLocation(LineIdentifier(1, 'lib.asm'), 'other line')])
+        with reporter.recovery_point(None):
+            sys.exit('ERROR: file lib.asm, line 9 - bad value')
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(records), 3, 'errors are written as soon as they are collected')
+        self.assertEqual(records[1]['related'], [{'file': 'lib.asm', 'line': 1, 'message': 'other line'}])
+        self.assertEqual((records[2]['file'], records[2]['line'], records[2]['message']), ('lib.asm', 9, 'bad value'))
+        with self.assertRaises(SystemExit) as ctx:
+            reporter.raise_collected_errors()
+        self.assertEqual(ctx.exception.code, 1, 'the text report is not repeated')
+
+    def test_json_diagnostics_without_collecting(self):
+        output = io.StringIO()
+        reporter = DiagnosticReporter(diagnostics_format='json', diagnostics_output=output)
+        with self.assertRaises(SystemExit) as ctx:
+            try:
+                sys.exit('ERROR - unknown emit format "elf"')
+            except SystemExit as e:
+                reporter.exit_with_collected_errors(e)
+        self.assertEqual(ctx.exception.code, 1)
+        record = json.loads(output.getvalue())
+        self.assertEqual((record['file'], record['line']), (None, None))
+        self.assertEqual(record['message'], 'unknown emit format "elf"')
+        with self.assertRaises(ValueError):
+            DiagnosticReporter(diagnostics_format='xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import importlib.resources as pkg_resources
 import unittest
 
 from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
 from bespokeasm.assembler.label_scope import GlobalLabelScope
 from bespokeasm.assembler.label_scope import LabelScope
@@ -178,6 +179,8 @@ class TestDirectiveLines(unittest.TestCase):
             ],
             '32 double 7s',
         )
+        self.assertIsInstance(o1.get_word_buffer(), WordRun, 'fill is kept run-length encoded')
+        self.assertEqual(len(o1.get_word_buffer()), 32)
 
         o2 = DirectiveLine.factory(
             1234,
@@ -382,6 +385,7 @@ class TestDirectiveLines(unittest.TestCase):
                 TestDirectiveLines.isa_model.intra_word_endianness,
             ) for _ in range(0x100-0x42+1)
         ], 'must have all the bytes')
+        self.assertIsInstance(o1.get_word_buffer(), WordRun, 'fill until is kept run-length encoded')
 
         # test fill until current address
         o2 = DirectiveLine.factory(
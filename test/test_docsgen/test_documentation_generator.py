@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 import unittest
@@ -194,6 +195,67 @@ instructions:
             content = f.read()
         self.assertEqual(content, 'new content')
 
+    def _write_loadable_config(self):
+        with open(self.config_file, 'w') as f:
+            f.write("""
+general:
+  min_version: 0.7.0
+  identifier:
+    name: test-isa
+    version: "1.0.0"
+  address_size: 16
+  endian: little
+  registers: []
+  word_size: 8
+  word_segment_size: 8
+operand_sets: {}
+instructions:
+  nop:
+    bytecode:
+      value: 0
+      size: 8
+""")
+
+    def test_fragment_cache_is_reused_between_runs(self):
+        """Rendered instructions are cached in the cache file and reused by the next run."""
+        self._write_loadable_config()
+        output_file = os.path.join(self.temp_dir, 'out.md')
+        cache_file = os.path.join(self.temp_dir, 'cache', 'docs.json')
+        DocumentationGenerator(self.config_file, cache_file_path=cache_file).generate_markdown_documentation(output_file)
+        with open(output_file) as f:
+            first_content = f.read()
+        with open(cache_file) as f:
+            self.assertEqual(len(json.load(f)['fragments']), 1)
+
+        generator = DocumentationGenerator(self.config_file, cache_file_path=cache_file)
+        with patch('bespokeasm.docsgen.markdown_generator.MarkdownGenerator._generate_instruction_documentation') as render:
+            generator.generate_markdown_documentation(output_file)
+            render.assert_not_called()
+        with open(output_file) as f:
+            self.assertEqual(f.read(), first_content)
+
+        # a corrupt cache is ignored
+        with open(cache_file, 'w') as f:
+            f.write('not json')
+        DocumentationGenerator(self.config_file, cache_file_path=cache_file).generate_markdown_documentation(output_file)
+        with open(output_file) as f:
+            self.assertEqual(f.read(), first_content)
+
+    def test_split_by_category_only_rewrites_changed_files(self):
+        """Split output writes one file per category and leaves unchanged files untouched."""
+        self._write_loadable_config()
+        generator = DocumentationGenerator(self.config_file, split_by_category=True)
+        output_dir = generator.generate_markdown_documentation()
+        self.assertEqual(output_dir, os.path.join(self.temp_dir, 'test-isa-docs'))
+        self.assertEqual(sorted(os.listdir(output_dir)), ['index.md', 'instructions-uncategorized.md'])
+        with open(os.path.join(output_dir, 'index.md')) as f:
+            self.assertIn('(instructions-uncategorized.md)', f.read())
+
+        category_file = os.path.join(output_dir, 'instructions-uncategorized.md')
+        os.utime(category_file, (0, 0))
+        generator.generate_markdown_documentation()
+        self.assertEqual(os.stat(category_file).st_mtime, 0)
+
     @patch('bespokeasm.docsgen.AssemblerModel')
     @patch('bespokeasm.docsgen.DocumentationModel')
     @patch('bespokeasm.docsgen.MarkdownGenerator')
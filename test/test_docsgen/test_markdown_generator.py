@@ -1014,6 +1014,63 @@ class TestMarkdownGenerator(unittest.TestCase):
         self.assertIn('*Documentation not provided.*', result)
         self.assertIn('```asm\nNOP\n```', result)
 
+    def _set_two_category_instructions(self):
+        def instruction_doc(category, title):
+            return {
+                'category': category,
+                'title': title,
+                'description': None,
+                'modifies': [],
+                'examples': [],
+                'documented': True,
+                'versions': [{'index': 1, 'signatures': [{'kind': 'none', 'label': None, 'operands': []}]}],
+            }
+
+        self.mock_doc_model.instruction_docs = {
+            'add': instruction_doc('Arithmetic', 'Add'),
+            'sub': instruction_doc('Arithmetic', 'Subtract'),
+            'jmp': instruction_doc('Flow Control', 'Jump'),
+        }
+        self.mock_doc_model.get_instructions_by_category.return_value = {
+            'Arithmetic': ['add', 'sub'],
+            'Flow Control': ['jmp'],
+        }
+
+    def test_fragment_cache_reuses_unchanged_instructions(self):
+        """Only instructions whose documentation changed are rendered again."""
+        self._set_two_category_instructions()
+        first = MarkdownGenerator(self.mock_doc_model, verbose=0)
+        first_result = first.generate()
+        self.assertEqual((first.fragments_reused, first.fragments_rendered), (0, 3))
+        self.assertEqual(len(first.used_fragments), 3)
+
+        self.mock_doc_model.instruction_docs['jmp']['title'] = 'Jump Always'
+        second = MarkdownGenerator(self.mock_doc_model, verbose=0, fragment_cache=first.used_fragments)
+        second_result = second.generate()
+        self.assertEqual((second.fragments_reused, second.fragments_rendered), (2, 1))
+        self.assertIn('### `JMP` : Jump Always', second_result)
+        self.assertEqual(second_result, first_result.replace('Jump', 'Jump Always'))
+        self.assertEqual(second_result, MarkdownGenerator(self.mock_doc_model, verbose=0).generate())
+
+    def test_generate_split_by_category(self):
+        """Each category is written to its own file and linked from the index."""
+        self._set_two_category_instructions()
+        generator = MarkdownGenerator(self.mock_doc_model, verbose=0)
+        files = generator.generate_split_by_category()
+
+        self.assertEqual(
+            sorted(files.keys()),
+            ['index.md', 'instructions-arithmetic.md', 'instructions-flow-control.md'],
+        )
+        self.assertIn('* [Arithmetic](instructions-arithmetic.md)', files['index.md'])
+        self.assertIn('* [Flow Control](instructions-flow-control.md)', files['index.md'])
+        self.assertNotIn('### `ADD`', files['index.md'])
+        self.assertTrue(files['instructions-arithmetic.md'].startswith('# Instructions\n\n## Arithmetic'))
+        self.assertIn('### `SUB` : Subtract', files['instructions-arithmetic.md'])
+        self.assertNotIn('### `JMP`', files['instructions-arithmetic.md'])
+        # every instruction is rendered once, whichever way the output is split
+        self.assertEqual(generator.fragments_rendered, 3)
+
     def test_instruction_versions_emit_headings(self):
         """Multiple operand variants render distinct version headings."""
         self.mock_doc_model.instruction_docs = {
@@ -1,9 +1,13 @@
+import contextlib
 import importlib.resources as pkg_resources
+import io
 import os
+import re
 import tempfile
 import unittest
 
 from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.checker import SyntaxChecker
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
 from bespokeasm.assembler.engine import Assembler
 from bespokeasm.assembler.label_scope import GlobalLabelScope
@@ -19,6 +23,8 @@ from bespokeasm.assembler.line_object.instruction_line import InstructionLine
 from bespokeasm.assembler.line_object.label_line import LabelLine
 from bespokeasm.assembler.memory_zone.manager import MemoryZoneManager
 from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.output_target import OutputTarget
+from bespokeasm.assembler.output_target import validate_output_targets
 from bespokeasm.assembler.preprocessor import Preprocessor
 from bespokeasm.assembler.preprocessor.condition_stack import ConditionStack
 
@@ -530,3 +536,265 @@ class TestAssemblerEngine(unittest.TestCase):
         with self.assertRaises(SystemExit) as duplicate_error:
             second.register_operand_labels(named_scope_manager)
         self.assertIn('defined multiple times', str(duplicate_error.exception))
+
+    def test_emit_multiple_outputs_from_one_run(self):
+        LabelScope._global_scope = None
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('.org $00\n.byte $01, $02\n.org $04\n.byte $03\n')
+            assembler = Assembler(
+                source_file=asm_path,
+                config_file=config_path,
+                generate_binary=True,
+                output_file=os.path.join(temp_dir, 'program.bin'),
+                binary_start=0,
+                binary_end=None,
+                binary_fill_value=0xFF,
+                enable_pretty_print=False,
+                pretty_print_format=None,
+                pretty_print_output=None,
+                is_verbose=0,
+                include_paths=[],
+                predefined=[],
+                emit_targets=['listing', 'srec', f'binary={os.path.join(temp_dir, "copy.bin")}'],
+            )
+            assembler.assemble_bytecode()
+
+            with open(os.path.join(temp_dir, 'program.bin'), 'rb') as handle:
+                image = handle.read()
+            self.assertEqual(image, b'\x01\x02\xFF\xFF\x03')
+            with open(os.path.join(temp_dir, 'copy.bin'), 'rb') as handle:
+                self.assertEqual(handle.read(), image)
+            with open(os.path.join(temp_dir, 'program.srec')) as handle:
+                self.assertIn('S105000001', handle.read())
+            with open(os.path.join(temp_dir, 'program.lst')) as handle:
+                self.assertIn('.byte $01, $02', handle.read())
+
+    def test_emit_binary_with_and_without_output_file(self):
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('.org $00\n.byte $01, $02\n')
+            # without `-o` the binary output file is named after the source file, as by `compile`
+            for output_file, expected_files in [
+                (os.path.join(temp_dir, 'program.bin'), ['program.asm', 'program.bin', 'program.lst']),
+                (os.path.join(temp_dir, 'custom.bin'), ['custom.bin', 'custom.lst', 'program.asm']),
+            ]:
+                with self.subTest(output_file=os.path.basename(output_file)):
+                    LabelScope._global_scope = None
+                    for name in os.listdir(temp_dir):
+                        if name != 'program.asm':
+                            os.remove(os.path.join(temp_dir, name))
+                    assembler = Assembler(
+                        source_file=asm_path,
+                        config_file=config_path,
+                        generate_binary=True,
+                        output_file=output_file,
+                        binary_start=0,
+                        binary_end=None,
+                        binary_fill_value=0,
+                        enable_pretty_print=False,
+                        pretty_print_format=None,
+                        pretty_print_output=None,
+                        is_verbose=0,
+                        include_paths=[],
+                        predefined=[],
+                        emit_targets=['binary', 'listing'],
+                    )
+                    self.assertEqual(
+                        assembler._output_targets,
+                        [OutputTarget('binary', output_file), OutputTarget('listing', output_file[:-4] + '.lst')],
+                    )
+                    assembler.assemble_bytecode()
+                    self.assertEqual(sorted(os.listdir(temp_dir)), expected_files)
+                    with open(output_file, 'rb') as handle:
+                        self.assertEqual(handle.read(), b'\x01\x02')
+
+    def test_emit_option_errors(self):
+        self.assertEqual(OutputTarget.from_emit_option('listing', 'dir/prog.asm'), ('listing', 'dir/prog.lst'))
+        self.assertTrue(OutputTarget.from_emit_option('intel_hex=-', 'prog.asm').is_stdout)
+        for emit_option in ('elf', 'listing=', 'binary=-'):
+            with self.subTest(emit_option=emit_option):
+                with self.assertRaises(SystemExit):
+                    OutputTarget.from_emit_option(emit_option, 'prog.asm')
+        with self.assertRaises(SystemExit) as ctx:
+            validate_output_targets([OutputTarget('hex', 'prog.hex'), OutputTarget('intel_hex', 'prog.hex')])
+        self.assertIn('prog.hex', str(ctx.exception))
+
+    def test_split_binary_by_memzone(self):
+        LabelScope._global_scope = None
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        asm_source = '\n'.join([
+            '#create_memzone rom0 $10 $17',
+            '#create_memzone rom1 $1A $1D',
+            '.memzone rom0',
+            '.byte $01, $02',
+            '.memzone GLOBAL',
+            '.org $16',
+            '.byte $03, $04, $05',  # only partially inside rom0
+            '.memzone rom1',
+            '.org $01 "rom1"',
+            '.byte $07',
+            '.memzone GLOBAL',
+            '.org $40',
+            '.byte $08',  # outside of every zone except GLOBAL
+        ])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write(asm_source)
+            assembler = Assembler(
+                source_file=asm_path,
+                config_file=config_path,
+                generate_binary=True,
+                output_file=os.path.join(temp_dir, 'program.bin'),
+                binary_start=0,
+                binary_end=None,
+                binary_fill_value=0xFF,
+                enable_pretty_print=False,
+                pretty_print_format=None,
+                pretty_print_output=None,
+                is_verbose=0,
+                include_paths=[],
+                predefined=[],
+                split_by_memzone=True,
+            )
+            assembler.assemble_bytecode()
+
+            self.assertFalse(os.path.exists(os.path.join(temp_dir, 'program.bin')))
+            self.assertFalse(os.path.exists(os.path.join(temp_dir, 'program.GLOBAL.bin')))
+            with open(os.path.join(temp_dir, 'program.rom0.bin'), 'rb') as handle:
+                self.assertEqual(handle.read(), b'\x01\x02\xFF\xFF\xFF\xFF\x03\x04')
+            with open(os.path.join(temp_dir, 'program.rom1.bin'), 'rb') as handle:
+                self.assertEqual(handle.read(), b'\xFF\x07\xFF\xFF')
+
+    def test_depfile_lists_config_includes_and_binary_files(self):
+        LabelScope._global_scope = None
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lib_dir = os.path.join(temp_dir, 'my lib')
+            os.makedirs(lib_dir)
+            with open(os.path.join(lib_dir, 'lib.asm'), 'w') as handle:
+                handle.write('.byte $01\n')
+            with open(os.path.join(lib_dir, 'font.bin'), 'wb') as handle:
+                handle.write(b'\x02\x03')
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('#include "lib.asm"\n.incbin "font.bin"\n')
+            depfile_path = os.path.join(temp_dir, 'program.d')
+            assembler = Assembler(
+                source_file=asm_path,
+                config_file=config_path,
+                generate_binary=True,
+                output_file=os.path.join(temp_dir, 'program.bin'),
+                binary_start=0,
+                binary_end=None,
+                binary_fill_value=0,
+                enable_pretty_print=False,
+                pretty_print_format=None,
+                pretty_print_output=None,
+                is_verbose=0,
+                include_paths=[lib_dir],
+                predefined=[],
+                emit_targets=['listing'],
+                depfile=depfile_path,
+            )
+            assembler.assemble_bytecode()
+            with open(depfile_path) as handle:
+                depfile = handle.read()
+
+        rule = depfile.replace('\\\n', '')
+        targets, dependencies = rule.split(':', 1)
+        escaped_lib_dir = lib_dir.replace(' ', '\\ ')
+        self.assertEqual(
+            targets.split(),
+            [os.path.join(temp_dir, 'program.bin'), os.path.join(temp_dir, 'program.lst')],
+        )
+        self.assertEqual(
+            sorted(re.split(r'(?<!\\)\s+', dependencies.strip())),
+            sorted([
+                config_path,
+                asm_path,
+                os.path.join(escaped_lib_dir, 'lib.asm'),
+                os.path.join(escaped_lib_dir, 'font.bin'),
+            ]),
+        )
+
+    def test_check_reports_the_errors_of_assembly(self):
+        config_path = str(pkg_resources.files(config_files).joinpath('test_valid_address_enforcement.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'msb_mismatch.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('.org $2A10\njmp_local $29FA\n')
+            exit_messages = []
+            for run_check in (False, True):
+                LabelScope._global_scope = None
+                assembler = Assembler(
+                    source_file=asm_path,
+                    config_file=config_path,
+                    generate_binary=True,
+                    output_file=os.path.join(temp_dir, 'msb_mismatch.bin'),
+                    binary_start=0,
+                    binary_end=None,
+                    binary_fill_value=0,
+                    enable_pretty_print=False,
+                    pretty_print_format=None,
+                    pretty_print_output=None,
+                    is_verbose=0,
+                    include_paths=[],
+                    predefined=[],
+                )
+                with self.assertRaises(SystemExit) as ctx:
+                    assembler.check() if run_check else assembler.assemble_bytecode()
+                exit_messages.append(str(ctx.exception))
+            self.assertEqual(exit_messages[0], exit_messages[1])
+            self.assertEqual(os.listdir(temp_dir), ['msb_mismatch.asm'])
+
+    def test_syntax_checker_shares_model_across_files(self):
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_paths = []
+            for name, source in [
+                ('first.asm', 'start:\n  ld a, b, c\n  jmp start\n.byte $01\n'),
+                ('bad.asm', 'start:\n  bogus a\n  jmp missing\n'),
+                ('second.asm', 'start:\n  mv a, b, c\n  jmp start\n'),
+            ]:
+                asm_paths.append(os.path.join(temp_dir, name))
+                with open(asm_paths[-1], 'w') as handle:
+                    handle.write(source)
+            checker = SyntaxChecker(config_path, 0, [], [], max_errors=0)
+            model = checker.model
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                failed_files = checker.check_files(asm_paths)
+            self.assertEqual(failed_files, [asm_paths[1]])
+            self.assertIs(checker.model, model)
+            # every error in the failing file is reported, and only the files that were checked exist
+            self.assertIn('unknown instruction', stderr.getvalue())
+            self.assertIn('2 errors found', stderr.getvalue())
+            self.assertEqual(sorted(os.listdir(temp_dir)), ['bad.asm', 'first.asm', 'second.asm'])
+
+    def test_syntax_checker_reports_expression_syntax_errors(self):
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_paths = []
+            for name, source in [
+                ('values.asm', 'VALUE = \n'),
+                ('uses_values.asm', '#include "values.asm"\nstart:\n  jmp start\n'),
+                ('second.asm', 'start:\n  mv a, b, c\n  jmp start\n'),
+            ]:
+                asm_paths.append(os.path.join(temp_dir, name))
+                with open(asm_paths[-1], 'w') as handle:
+                    handle.write(source)
+            checker = SyntaxChecker(config_path, 0, [], [])
+            include_graph = {}
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                self.assertFalse(checker.check(asm_paths[1], include_graph))
+            # the parser raises rather than exits on the included file's error, which fails only that check
+            self.assertIn(f'ERROR: file {asm_paths[0]}, line 1 - Invalid syntax', stderr.getvalue())
+            self.assertEqual(include_graph, {asm_paths[1]: {asm_paths[0]}})
+            with contextlib.redirect_stderr(io.StringIO()) as stderr:
+                self.assertEqual(checker.check_files(asm_paths[1:]), [asm_paths[1]])
+            self.assertEqual(stderr.getvalue().count('Invalid syntax'), 1)
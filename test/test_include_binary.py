@@ -0,0 +1,84 @@
+import importlib.resources as pkg_resources
+import os
+import tempfile
+import unittest
+
+from bespokeasm.assembler.engine import Assembler
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+
+from test import config_files
+
+
+class TestIncludeBinary(unittest.TestCase):
+    def setUp(self) -> None:
+        InstructionLine.reset_instruction_pattern_cache()
+        LabelScope._global_scope = None
+        self.config_path = str(pkg_resources.files(config_files).joinpath('test_instructions_with_variants.yaml'))
+
+    def _assemble(self, temp_dir: str, asm_source: str, include_paths: list[str] | None = None) -> bytes:
+        asm_path = os.path.join(temp_dir, 'main.asm')
+        with open(asm_path, 'w') as handle:
+            handle.write(asm_source)
+        bin_path = os.path.join(temp_dir, 'main.bin')
+        assembler = Assembler(
+            source_file=asm_path,
+            config_file=self.config_path,
+            generate_binary=True,
+            output_file=bin_path,
+            binary_start=0,
+            binary_end=None,
+            binary_fill_value=0,
+            enable_pretty_print=False,
+            pretty_print_format=None,
+            pretty_print_output=None,
+            is_verbose=0,
+            include_paths=include_paths if include_paths is not None else [],
+            predefined=[],
+        )
+        assembler.assemble_bytecode()
+        with open(bin_path, 'rb') as handle:
+            return handle.read()
+
+    def test_incbin_whole_file_and_range(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asset_dir = os.path.join(temp_dir, 'assets')
+            os.makedirs(asset_dir)
+            with open(os.path.join(asset_dir, 'font.bin'), 'wb') as handle:
+                handle.write(bytes(range(16)))
+
+            image = self._assemble(
+                temp_dir,
+                '.org $00\n'
+                '.byte $AA\n'
+                'font_start:\n'
+                '.incbin "font.bin"\n'
+                'font_end:\n'
+                '.incbin "font.bin", 4, 3 ; three bytes from offset 4\n'
+                '.incbin \'font.bin\', 14, 100\n'
+                '.byte font_end - font_start\n',
+                include_paths=[asset_dir],
+            )
+            self.assertEqual(image, b'\xAA' + bytes(range(16)) + b'\x04\x05\x06' + b'\x0E\x0F' + b'\x10')
+
+    def test_incbin_resolves_relative_to_source_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, 'data.bin'), 'wb') as handle:
+                handle.write(b'\x01\x02')
+            image = self._assemble(temp_dir, '.incbin "data.bin"\n.incbin "data.bin", 2\n.byte $FF\n')
+            self.assertEqual(image, b'\x01\x02\xFF')
+
+    def test_incbin_errors(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, 'data.bin'), 'wb') as handle:
+                handle.write(b'\x01\x02')
+            with self.assertRaises(SystemExit):
+                self._assemble(temp_dir, '.incbin "missing.bin"\n')
+            LabelScope._global_scope = None
+            with self.assertRaises(SystemExit) as ctx:
+                self._assemble(temp_dir, '.incbin "data.bin", 3\n')
+            self.assertIn('offset', str(ctx.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -102,3 +102,17 @@ class TestIncludePaths(unittest.TestCase):
             line_objects = self._load_line_objects(main_path, {include_dir})
             lib_lines = [lo for lo in line_objects if lo.line_id.filename == lib_path]
             self.assertTrue(lib_lines, 'include should resolve using include search paths')
+
+    def test_repeated_loads_do_not_share_used_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, 'lib.asm'), 'w') as handle:
+                handle.write('nop\n')
+            main_path = os.path.join(temp_dir, 'main.asm')
+            with open(main_path, 'w') as handle:
+                handle.write('#include "lib.asm"\n')
+
+            self._load_line_objects(main_path, {temp_dir})
+            # a second assembly in the same process must not see the first load's included files
+            self.global_scope = GlobalLabelScope(self.isa_model.registers)
+            line_objects = self._load_line_objects(main_path, {temp_dir})
+            self.assertEqual(len(line_objects), 1)
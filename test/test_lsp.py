@@ -0,0 +1,292 @@
+import importlib.resources as pkg_resources
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.lsp import LanguageServer
+from bespokeasm.lsp import path_to_uri
+from bespokeasm.lsp import word_at
+from bespokeasm.lsp.analysis import CollectingDiagnosticReporter
+from bespokeasm.lsp.analysis import DocumentAnalysis
+from bespokeasm.lsp.document import LineEdit
+from bespokeasm.lsp.document import TextDocument
+from bespokeasm.lsp.jsonrpc import JsonRpcStream
+
+from test import config_files
+
+
+def _change(start_line, start_char, end_line, end_char, text):
+    return {
+        'range': {
+            'start': {'line': start_line, 'character': start_char},
+            'end': {'line': end_line, 'character': end_char},
+        },
+        'text': text,
+    }
+
+
+class TestTextDocument(unittest.TestCase):
+    def test_incremental_changes(self):
+        document = TextDocument('file:///a.asm', 'one\ntwo\r\nthree', 1)
+        self.assertEqual(document.lines, ['one', 'two', 'three'])
+
+        edit = document.apply_change(_change(1, 1, 1, 2, 'W'), 2)
+        self.assertEqual(edit, LineEdit(1, 1, 1))
+        self.assertEqual(document.lines, ['one', 'tWo', 'three'])
+        self.assertEqual(document.version, 2)
+
+        edit = document.apply_change(_change(0, 3, 2, 0, '\nnew\n'))
+        self.assertEqual(edit, LineEdit(0, 3, 3))
+        self.assertEqual(document.text, 'one\nnew\nthree')
+
+        edit = document.apply_change({'text': 'replaced'})
+        self.assertEqual(edit, LineEdit(0, 3, 1))
+        self.assertEqual(document.lines, ['replaced'])
+
+    def test_word_at(self):
+        self.assertEqual(word_at('  jmp .loop', 7), ('.loop', 6, 11))
+        self.assertEqual(word_at('#define FOO 3', 1), ('#define', 0, 7))
+        self.assertIsNone(word_at('  jmp .loop', 1))
+
+
+class TestDocumentAnalysis(unittest.TestCase):
+    def setUp(self):
+        LabelScope._global_scope = None
+        InstructionLine.reset_instruction_pattern_cache()
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml')
+        self.model = AssemblerModel(str(config_file), 0, CollectingDiagnosticReporter())
+
+    def test_requires_collecting_reporter(self):
+        config_file = pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml')
+        model = AssemblerModel(str(config_file), 0, DiagnosticReporter())
+        with self.assertRaises(ValueError):
+            DocumentAnalysis(model, 'a.asm', [])
+
+    def test_definitions_and_local_labels(self):
+        lines = [
+            'VALUE = 5',
+            'first:',
+            '.loop:',
+            '  jmp .loop',
+            'second:',
+            '.loop:',
+            '  jmp .loop',
+            '#define FOO 3',
+            '#create_memzone extra $1000 $1FFF',
+        ]
+        analysis = DocumentAnalysis(self.model, 'a.asm', lines)
+        self.assertEqual(list(analysis.diagnostics()), [])
+
+        line_num, definition = analysis.find_definition('VALUE', 8)
+        self.assertEqual(line_num, 0)
+        self.assertEqual((definition.kind, definition.value, definition.start, definition.end), ('constant', 5, 0, 5))
+        self.assertEqual(analysis.find_definition('.loop', 3)[0], 2)
+        self.assertEqual(analysis.find_definition('.loop', 6)[0], 5)
+        self.assertEqual(analysis.find_definition('FOO', 0)[1].kind, 'symbol')
+        self.assertEqual(analysis.find_definition('extra', 0)[1].kind, 'memzone')
+        self.assertIsNone(analysis.find_definition('missing', 0))
+
+    def test_incremental_update(self):
+        document = TextDocument('file:///a.asm', 'start:\n  ld a, b, c\n.memzone extra\n  bogus a\n')
+        analysis = DocumentAnalysis(self.model, 'a.asm', document.lines)
+        self.assertEqual([line_num for line_num, _ in analysis.diagnostics()], [2, 3])
+
+        # fixing a line only clears its own error
+        edit = document.apply_change(_change(3, 2, 3, 9, 'mv a, b, c'))
+        analysis.update(document.lines, edit)
+        self.assertEqual([line_num for line_num, _ in analysis.diagnostics()], [2])
+        self.assertEqual(analysis.line(3).text, '  mv a, b, c')
+
+        # defining the memory zone resolves the error on a line that was not edited
+        edit = document.apply_change(_change(0, 0, 0, 0, '#create_memzone extra $1000 $1FFF\n'))
+        analysis.update(document.lines, edit)
+        self.assertEqual(list(analysis.diagnostics()), [])
+        self.assertEqual(analysis.line_count, len(document.lines))
+        self.assertEqual(analysis.find_definition('start', 4)[0], 1)
+
+        # and removing it again brings the error back
+        edit = document.apply_change(_change(0, 0, 1, 0, ''))
+        analysis.update(document.lines, edit)
+        self.assertEqual([line_num for line_num, _ in analysis.diagnostics()], [2])
+
+    def test_constant_changes_recheck_dependent_lines(self):
+        document = TextDocument('file:///a.asm', 'C = B + 1\nB = A + 1\n\n')
+        analysis = DocumentAnalysis(self.model, 'a.asm', document.lines)
+        self.assertEqual([line_num for line_num, _ in analysis.diagnostics()], [0, 1])
+
+        # defining A resolves B, which in turn resolves C
+        edit = document.apply_change(_change(2, 0, 2, 0, 'A = 1'))
+        analysis.update(document.lines, edit)
+        self.assertEqual(list(analysis.diagnostics()), [])
+        self.assertEqual(analysis.constant_value('C'), 3)
+
+    def _large_document(self, error_line_count: int = 0) -> tuple[TextDocument, DocumentAnalysis]:
+        lines = []
+        for i in range(5000):
+            lines += [
+                f'func_{i}:', '  ld a, b, c', '.loop:', '  jmp .loop', f'  adi VALUE_{i}',
+                f'VALUE_{i} = {i}', '  mv a, b, c', '  jmp func_0',
+                '  bogus a' if i < error_line_count else '  ; comment', '',
+            ]
+        document = TextDocument('file:///big.asm', '\n'.join(lines))
+        return document, DocumentAnalysis(self.model, 'big.asm', document.lines)
+
+    def test_edit_latency_on_large_document(self):
+        document, analysis = self._large_document()
+        start_time = time.perf_counter()
+        for _ in range(10):
+            edit = document.apply_change(_change(25000, 2, 25000, 2, 'x'))
+            analysis.update(document.lines, edit)
+            self.assertIsNotNone(analysis.find_definition('.loop', 25003))
+        average_seconds = (time.perf_counter() - start_time) / 10
+        # the target is 50 ms per edit, with headroom for slower machines
+        self.assertLess(average_seconds, 0.25)
+
+    def test_definition_edit_latency_on_large_document(self):
+        document, analysis = self._large_document(error_line_count=2000)
+        self.assertEqual(len(analysis.definitions('func_4999')), 1)
+
+        start_time = time.perf_counter()
+        for _ in range(5):
+            # renaming and restoring a label used by every function, then changing a constant
+            for change in (_change(0, 0, 0, 6, 'func_x'), _change(0, 0, 0, 6, 'func_0'), _change(35, 10, 35, 11, '9')):
+                edit = document.apply_change(change)
+                analysis.update(document.lines, edit)
+        average_seconds = (time.perf_counter() - start_time) / 15
+        self.assertEqual(analysis.find_definition('func_0', 7), (0, analysis.definitions('func_0')[0][1]))
+        self.assertEqual(analysis.constant_value('VALUE_3'), 9)
+        self.assertEqual(sum(1 for _ in analysis.diagnostics()), 2000)
+        # the target is 50 ms per edit, with headroom for slower machines
+        self.assertLess(average_seconds, 0.25)
+
+
+class TestLanguageServer(unittest.TestCase):
+    def setUp(self):
+        LabelScope._global_scope = None
+        InstructionLine.reset_instruction_pattern_cache()
+        self.config_file = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+
+    @staticmethod
+    def _frame(messages: list[dict]) -> io.BytesIO:
+        data = b''
+        for message in messages:
+            body = json.dumps(message).encode('utf-8')
+            data += f'Content-Length: {len(body)}\r\n\r\n'.encode('ascii') + body
+        return io.BytesIO(data)
+
+    def _serve(self, messages: list[dict], include_paths: list[str] = ()) -> tuple[int, list[dict]]:
+        output_stream = io.BytesIO()
+        server = LanguageServer(self.config_file, list(include_paths), self._frame(messages), output_stream)
+        exit_code = server.serve()
+        output_stream.seek(0)
+        reader = JsonRpcStream(output_stream, io.BytesIO())
+        responses = []
+        while (message := reader.read_message()) is not None:
+            responses.append(message)
+        return exit_code, responses
+
+    @staticmethod
+    def _position_request(request_id, method, uri, line, character):
+        return {
+            'jsonrpc': '2.0', 'id': request_id, 'method': method,
+            'params': {'textDocument': {'uri': uri}, 'position': {'line': line, 'character': character}},
+        }
+
+    def test_session(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, 'defs.asm'), 'w') as handle:
+                handle.write('SHARED = 7\n')
+            main_path = os.path.join(temp_dir, 'main.asm')
+            uri = path_to_uri(main_path)
+            text = '#include "defs.asm"\nstart:\n  adi SHARED\n  bogus a\n  jmp start\n'
+            messages = [
+                {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}},
+                {'jsonrpc': '2.0', 'method': 'initialized', 'params': {}},
+                {
+                    'jsonrpc': '2.0', 'method': 'textDocument/didOpen',
+                    'params': {'textDocument': {'uri': uri, 'languageId': 'asm', 'version': 1, 'text': text}},
+                },
+                self._position_request(2, 'textDocument/definition', uri, 4, 7),
+                self._position_request(3, 'textDocument/definition', uri, 2, 7),
+                self._position_request(4, 'textDocument/hover', uri, 2, 8),
+                {
+                    'jsonrpc': '2.0', 'method': 'textDocument/didChange',
+                    'params': {
+                        'textDocument': {'uri': uri, 'version': 2},
+                        'contentChanges': [_change(3, 2, 3, 9, 'mv a, b, c')],
+                    },
+                },
+                {'jsonrpc': '2.0', 'id': 5, 'method': 'workspace/symbol', 'params': {}},
+                {'jsonrpc': '2.0', 'id': 6, 'method': 'shutdown'},
+                {'jsonrpc': '2.0', 'method': 'exit'},
+            ]
+            exit_code, responses = self._serve(messages)
+        self.assertEqual(exit_code, 0)
+        by_id = {message['id']: message for message in responses if 'id' in message}
+        notifications = [message for message in responses if 'id' not in message]
+
+        self.assertTrue(by_id[1]['result']['capabilities']['hoverProvider'])
+        self.assertEqual(by_id[2]['result']['uri'], uri)
+        self.assertEqual(by_id[2]['result']['range']['start'], {'line': 1, 'character': 0})
+        self.assertTrue(by_id[3]['result']['uri'].endswith('/defs.asm'))
+        self.assertIn('SHARED', by_id[4]['result']['contents']['value'])
+        self.assertEqual(by_id[5]['error']['code'], -32601)
+        self.assertIsNone(by_id[6]['result'])
+
+        self.assertEqual(len(notifications), 2)
+        first_diagnostics = notifications[0]['params']['diagnostics']
+        self.assertEqual(len(first_diagnostics), 1)
+        self.assertEqual(first_diagnostics[0]['severity'], 1)
+        self.assertEqual(first_diagnostics[0]['range']['start'], {'line': 3, 'character': 2})
+        self.assertEqual(notifications[1]['params']['diagnostics'], [])
+        self.assertEqual(notifications[1]['params']['version'], 2)
+
+    def test_closed_documents_are_not_kept_by_global_scope(self):
+        uri = 'file:///tmp/reopened.asm'
+        messages = [{'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}}]
+        for version in range(20):
+            messages.append({
+                'jsonrpc': '2.0', 'method': 'textDocument/didOpen',
+                'params': {'textDocument': {'uri': uri, 'languageId': 'asm', 'version': version, 'text': 'start:\n'}},
+            })
+            messages.append({'jsonrpc': '2.0', 'method': 'textDocument/didClose', 'params': {'textDocument': {'uri': uri}}})
+        messages.append({'jsonrpc': '2.0', 'method': 'exit'})
+        server = LanguageServer(self.config_file, [], self._frame(messages), io.BytesIO())
+        global_scope = server._model.global_label_scope
+        child_count = len(global_scope._children)
+        server.serve()
+        self.assertEqual(len(global_scope._children), child_count)
+
+    def test_hover_shows_isa_documentation(self):
+        uri = 'file:///tmp/hover.asm'
+        messages = [
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}},
+            {
+                'jsonrpc': '2.0', 'method': 'textDocument/didOpen',
+                'params': {'textDocument': {'uri': uri, 'languageId': 'asm', 'version': 1, 'text': '  ld a, b, c\n.byte 1\n'}},
+            },
+            self._position_request(2, 'textDocument/hover', uri, 0, 3),
+            self._position_request(3, 'textDocument/hover', uri, 1, 2),
+            self._position_request(4, 'textDocument/hover', uri, 0, 0),
+        ]
+        exit_code, responses = self._serve(messages)
+        self.assertEqual(exit_code, 1)
+        by_id = {message['id']: message for message in responses if 'id' in message}
+        self.assertIn('`LD`', by_id[2]['result']['contents']['value'])
+        self.assertIn('`.byte`', by_id[3]['result']['contents']['value'])
+        self.assertIsNone(by_id[4]['result'])
+
+    def test_requests_before_initialize_are_rejected(self):
+        _, responses = self._serve([self._position_request(1, 'textDocument/hover', 'file:///x.asm', 0, 0)])
+        self.assertEqual(responses[0]['error']['code'], -32002)
+
+
+if __name__ == '__main__':
+    unittest.main()
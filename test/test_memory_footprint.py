@@ -0,0 +1,149 @@
+import importlib.resources as pkg_resources
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from bespokeasm.assembler.assembly_file import AssemblyFile
+from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.engine import Assembler
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.label_scope.named_scope_manager import ActiveNamedScopeList
+from bespokeasm.assembler.label_scope.named_scope_manager import NamedScopeManager
+from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.line_object.data_line import DataLine
+from bespokeasm.assembler.line_object.factory import LineOjectFactory
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+from bespokeasm.assembler.memory_zone.manager import MemoryZoneManager
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.preprocessor import Preprocessor
+from bespokeasm.assembler.preprocessor.condition_stack import ConditionStack
+
+from test import config_files
+
+
+# Regression budgets for the memory benchmarks below. Measured values are roughly 800 bytes peak per
+# source line and 600 bytes retained per line object; the budgets leave headroom for platform variance
+# while still failing if per-instance dictionaries or per-word format fields creep back in.
+PEAK_BYTES_PER_SOURCE_LINE_BUDGET = 1200
+RETAINED_BYTES_PER_LINE_OBJECT_BUDGET = 900
+
+
+class TestMemoryFootprint(unittest.TestCase):
+    SOURCE_LINE_COUNT = 3000
+
+    def setUp(self):
+        InstructionLine._INSTRUCTUION_EXTRACTION_PATTERN = None
+        LabelScope._global_scope = None
+        self.diagnostic_reporter = DiagnosticReporter()
+        self.config_file = str(pkg_resources.files(config_files).joinpath('test_instructions_with_variants.yaml'))
+
+    def _write_source(self, directory: str) -> str:
+        asm_path = os.path.join(directory, 'memory_benchmark.asm')
+        with open(asm_path, 'w') as f:
+            f.write('.org $0000\n')
+            for i in range(self.SOURCE_LINE_COUNT // 3):
+                f.write(f'label_{i}:\n')
+                f.write('  nop ; spacer\n')
+                f.write('  .byte 1, 2, 3, 4\n')
+        return asm_path
+
+    def test_line_objects_have_no_instance_dict(self):
+        isa_model = AssemblerModel(self.config_file, 0, self.diagnostic_reporter)
+        memzone_mngr = MemoryZoneManager(isa_model.address_size, isa_model.default_origin)
+        preprocessor = Preprocessor(diagnostic_reporter=self.diagnostic_reporter)
+        named_scope_manager = NamedScopeManager(self.diagnostic_reporter)
+        for line_str in ['nop', '.byte 1, 2', 'some_label:', '.fill 4, 0', '.org $10']:
+            line_objs = LineOjectFactory.parse_line(
+                LineIdentifier(1, 'test_line_objects_have_no_instance_dict'),
+                line_str,
+                isa_model,
+                isa_model.global_label_scope,
+                ActiveNamedScopeList(named_scope_manager),
+                memzone_mngr.global_zone,
+                memzone_mngr,
+                preprocessor,
+                ConditionStack(self.diagnostic_reporter),
+                0,
+            )
+            for lobj in line_objs:
+                self.assertFalse(hasattr(lobj, '__dict__'), f'{type(lobj).__name__} has an instance __dict__')
+        self.assertFalse(hasattr(Word(1, 8), '__dict__'))
+        self.assertFalse(hasattr(LineIdentifier(1, 'file.asm'), '__dict__'))
+
+    def test_words_share_format_descriptor(self):
+        line = DataLine.factory(
+            LineIdentifier(1, 'test_words_share_format_descriptor'),
+            '.byte 1, 2, 3',
+            '',
+            MemoryZoneManager(16, 0).global_zone,
+            8, 8, 'big', 'big',
+            diagnostic_reporter=self.diagnostic_reporter,
+        )
+        line.generate_words()
+        words = line.get_words()
+        self.assertEqual(len(words), 3)
+        for w in words:
+            self.assertIs(w.word_format, line.word_format)
+
+    def test_retained_line_object_memory(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = self._write_source(temp_dir)
+            isa_model = AssemblerModel(self.config_file, 0, self.diagnostic_reporter)
+            memzone_mngr = MemoryZoneManager(isa_model.address_size, isa_model.default_origin)
+            preprocessor = Preprocessor(isa_model.predefined_symbols, isa_model, diagnostic_reporter=self.diagnostic_reporter)
+            asm_file = AssemblyFile(
+                asm_path,
+                isa_model.global_label_scope,
+                NamedScopeManager(self.diagnostic_reporter),
+                self.diagnostic_reporter,
+            )
+            tracemalloc.start()
+            try:
+                baseline, _ = tracemalloc.get_traced_memory()
+                line_objs = asm_file.load_line_objects(isa_model, {temp_dir}, memzone_mngr, preprocessor, 0, set())
+                retained, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        bytes_per_line_object = (retained - baseline) / len(line_objs)
+        self.assertLess(
+            bytes_per_line_object,
+            RETAINED_BYTES_PER_LINE_OBJECT_BUDGET,
+            f'line objects retain {bytes_per_line_object:.0f} bytes each',
+        )
+
+    def test_peak_assembly_memory(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = self._write_source(temp_dir)
+            assembler = Assembler(
+                source_file=asm_path,
+                config_file=self.config_file,
+                generate_binary=True,
+                output_file=os.path.join(temp_dir, 'memory_benchmark.bin'),
+                binary_start=0,
+                binary_end=None,
+                binary_fill_value=0,
+                enable_pretty_print=False,
+                pretty_print_format=None,
+                pretty_print_output=None,
+                is_verbose=0,
+                include_paths=[temp_dir],
+                predefined=[],
+            )
+            tracemalloc.start()
+            try:
+                assembler.assemble_bytecode()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        bytes_per_source_line = peak / self.SOURCE_LINE_COUNT
+        self.assertLess(
+            bytes_per_source_line,
+            PEAK_BYTES_PER_SOURCE_LINE_BUDGET,
+            f'assembly peaked at {bytes_per_source_line:.0f} bytes per source line',
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import importlib.resources as pkg_resources
+import json
+import os
+import tempfile
+import unittest
+
+from bespokeasm.assembler.engine import Assembler
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+from bespokeasm.assembler.memory_zone import MemoryZone
+from bespokeasm.assembler.memory_zone.occupancy import format_memory_map
+from bespokeasm.assembler.memory_zone.occupancy import memory_map_report
+from bespokeasm.assembler.memory_zone.occupancy import OccupancyIndex
+
+from test import config_files
+
+
+class TestOccupancyIndex(unittest.TestCase):
+    def test_overlap_queries(self):
+        index = OccupancyIndex()
+        self.assertIsNone(index.add(0x10, 4, 'a'))
+        self.assertIsNone(index.add(0x20, 2, 'b'))
+        # out of order addition is kept sorted
+        self.assertIsNone(index.add(0x14, 4, 'c'))
+        self.assertIsNone(index.add(0x00, 0, 'empty'))
+        self.assertEqual(len(index), 3)
+
+        self.assertEqual(index.find_overlap(0x13, 1), 'a')
+        self.assertEqual(index.find_overlap(0x0F, 2), 'a')
+        self.assertEqual(index.find_overlap(0x18, 0x10), 'b')
+        self.assertIsNone(index.find_overlap(0x18, 8))
+        self.assertIsNone(index.find_overlap(0x11, 0))
+
+        self.assertEqual(index.add(0x1F, 2, 'd'), 'b', 'overlapping range is reported and not added')
+        self.assertEqual(len(index), 3)
+
+    def test_zone_usage(self):
+        index = OccupancyIndex()
+        index.add(0x00, 4, 'a')
+        index.add(0x08, 2, 'b')
+        index.add(0x0C, 8, 'c')
+        usage = index.zone_usage(MemoryZone(16, 0x02, 0x0F, 'rom'))
+        self.assertEqual((usage.size, usage.used, usage.free), (14, 8, 6))
+        # free regions: 0x04-0x07 and 0x0A-0x0B
+        self.assertEqual((usage.largest_free, usage.free_regions), (4, 2))
+        self.assertAlmostEqual(usage.fragmentation, 1/3)
+
+        empty_usage = OccupancyIndex().zone_usage(MemoryZone(16, 0, 0xFF, 'ram'))
+        self.assertEqual((empty_usage.used, empty_usage.largest_free, empty_usage.fragmentation), (0, 0x100, 0.0))
+
+    def test_report_and_text_format(self):
+        index = OccupancyIndex()
+        index.add(0x00, 0x80, 'a')
+        zones = [MemoryZone(16, 0x100, 0x1FF, 'ram'), MemoryZone(16, 0, 0xFF, 'rom')]
+        report = memory_map_report(index, zones, 8)
+        self.assertEqual([zone['name'] for zone in report['zones']], ['rom', 'ram'])
+        self.assertEqual(report['zones'][0]['used'], 0x80)
+        text = format_memory_map(report, 16)
+        self.assertIn('sizes in 8-bit words', text)
+        self.assertIn('rom   0x0000  0x00ff', text)
+        self.assertIn('50.00%', text)
+
+
+class TestMemoryMapOutput(unittest.TestCase):
+    def setUp(self) -> None:
+        InstructionLine.reset_instruction_pattern_cache()
+        LabelScope._global_scope = None
+
+    def test_emit_memory_map(self):
+        config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('#create_memzone rom $00 $0F\n.memzone rom\n.byte 1, 2, 3\n.org $08 "rom"\n.byte 4\n')
+            assembler = Assembler(
+                source_file=asm_path,
+                config_file=config_path,
+                generate_binary=False,
+                output_file=None,
+                binary_start=0,
+                binary_end=None,
+                binary_fill_value=0,
+                enable_pretty_print=False,
+                pretty_print_format=None,
+                pretty_print_output=None,
+                is_verbose=0,
+                include_paths=[],
+                predefined=[],
+                emit_targets=['memory_map'],
+            )
+            assembler.assemble_bytecode()
+            with open(os.path.join(temp_dir, 'program.memmap.json')) as handle:
+                report = json.load(handle)
+        zones = {zone['name']: zone for zone in report['zones']}
+        self.assertEqual(
+            (zones['rom']['used'], zones['rom']['free'], zones['rom']['largest_free'], zones['rom']['free_regions']),
+            (4, 12, 7, 2),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import contextlib
+import importlib.resources as pkg_resources
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from bespokeasm.assembler.checker import SyntaxChecker
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+from bespokeasm.precommit import run_pre_commit_hook
+from bespokeasm.precommit.include_graph import IncludeGraph
+
+from test import config_files
+
+
+class TestPreCommitHook(unittest.TestCase):
+    def setUp(self):
+        InstructionLine._INSTRUCTUION_EXTRACTION_PATTERN = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root_dir = os.path.realpath(self.temp_dir.name)
+        self.config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        self.cache_path = os.path.join(self.root_dir, 'cache', 'include-graph.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_file(self, name: str, content: str) -> str:
+        path = os.path.join(self.root_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        # each write gets a distinct modification time, even on file systems with a coarse clock
+        stat_result = os.stat(path)
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        return path
+
+    def _run_hook(self, staged_files: list[str], jobs: int = 1) -> list[str]:
+        with contextlib.redirect_stderr(io.StringIO()):
+            return run_pre_commit_hook(
+                staged_files,
+                self.config_path,
+                [os.path.join(self.root_dir, 'programs', '*.asm')],
+                [os.path.join(self.root_dir, 'lib')],
+                [],
+                jobs=jobs,
+                cache_file=self.cache_path,
+            )
+
+    def test_include_graph_affected_roots(self):
+        root_a = self._write_file('a.asm', '')
+        root_b = self._write_file('b.asm', '')
+        root_c = self._write_file('c.asm', '')
+        lib = self._write_file('lib.asm', '')
+        deep = self._write_file('deep.bin', '')
+
+        graph = IncludeGraph({})
+        graph.record(root_a, True, {root_a: {lib}, lib: {deep}})
+        graph.record(root_b, True, {})
+        roots = [root_a, root_b, root_c]
+        # root c has never been checked, so it is always affected
+        self.assertEqual(graph.affected_roots(roots, []), [root_c])
+        self.assertEqual(graph.affected_roots(roots, [deep]), [root_a, root_c])
+        self.assertEqual(graph.affected_roots(roots, [lib, root_b]), [root_a, root_b, root_c])
+
+        graph.record(root_c, False, {})
+        self.assertEqual(graph.affected_roots(roots, []), [root_c])
+        graph.record(root_c, True, {})
+        self.assertEqual(graph.affected_roots(roots, []), [])
+
+        # a file changed since it was recorded is affected even if it is not staged
+        self._write_file('deep.bin', 'changed')
+        self.assertEqual(graph.affected_roots(roots, []), [root_a])
+
+    def test_include_graph_keeps_includes_of_unchanged_files(self):
+        root_a = self._write_file('a.asm', '')
+        root_b = self._write_file('b.asm', '')
+        lib = self._write_file('lib.asm', '')
+        first = self._write_file('first.asm', '')
+        second = self._write_file('second.asm', '')
+
+        # the shared library includes different files for each root program
+        graph = IncludeGraph({})
+        graph.record(root_a, True, {root_a: {lib}, lib: {first}})
+        graph.record(root_b, True, {root_b: {lib}, lib: {second}})
+        self.assertEqual(graph.affected_roots([root_a, root_b], [first]), [root_a, root_b])
+
+        # once the library changes, only the includes recorded since then are kept
+        self._write_file('lib.asm', 'changed')
+        graph.record(root_b, True, {root_b: {lib}, lib: {second}})
+        self.assertEqual(graph.affected_roots([root_b], [first]), [])
+
+    def test_include_graph_cache_round_trip(self):
+        root_a = self._write_file('a.asm', '')
+        lib = self._write_file('lib.asm', '')
+        graph = IncludeGraph({'config_file': 'isa.yaml'})
+        graph.record(root_a, True, {root_a: {lib}})
+        graph.save(self.cache_path)
+
+        loaded_graph = IncludeGraph.load(self.cache_path, {'config_file': 'isa.yaml'})
+        self.assertEqual(loaded_graph.affected_roots([root_a], []), [])
+        self.assertEqual(loaded_graph.affected_roots([root_a], [lib]), [root_a])
+        # a graph recorded with other settings is not used
+        other_graph = IncludeGraph.load(self.cache_path, {'config_file': 'other.yaml'})
+        self.assertEqual(other_graph.affected_roots([root_a], []), [root_a])
+
+        self._write_file(os.path.join('cache', 'include-graph.json'), '{not json')
+        self.assertEqual(IncludeGraph.load(self.cache_path, {}).affected_roots([root_a], []), [root_a])
+
+    def test_hook_checks_only_affected_roots(self):
+        lib = self._write_file(os.path.join('lib', 'lib.asm'), 'helper:\n  mv a, b, c\n  jmp helper\n')
+        uses_lib = self._write_file(os.path.join('programs', 'uses_lib.asm'), 'start:\n  jmp helper\n#include "lib.asm"\n')
+        standalone = self._write_file(os.path.join('programs', 'standalone.asm'), 'start:\n  ld a, b, c\n  jmp start\n')
+
+        # without a cache every root program is checked, in parallel here
+        self.assertEqual(self._run_hook([], jobs=2), [standalone, uses_lib])
+        self.assertTrue(os.path.isfile(self.cache_path))
+        self.assertEqual(self._run_hook([]), [])
+        self.assertEqual(self._run_hook([lib]), [uses_lib])
+        self.assertEqual(self._run_hook([standalone, 'README.md']), [standalone])
+
+        # a root program that fails is checked again until it passes
+        self._write_file(os.path.join('lib', 'lib.asm'), 'helper:\n  bogus a\n')
+        with self.assertRaises(SystemExit) as ctx:
+            self._run_hook([lib])
+        self.assertIn('1 of 1 affected root programs failed to assemble', str(ctx.exception))
+        with self.assertRaises(SystemExit):
+            self._run_hook([])
+        self._write_file(os.path.join('lib', 'lib.asm'), 'helper:\n  mv a, b, c\n')
+        self.assertEqual(self._run_hook([]), [uses_lib])
+        self.assertEqual(self._run_hook([]), [])
+        # the cached graph was recorded with the include paths, so it is not used with others
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(
+                run_pre_commit_hook(
+                    [],
+                    self.config_path,
+                    [os.path.join(self.root_dir, 'programs', 'standalone.asm')],
+                    [],
+                    [],
+                    jobs=1,
+                    cache_file=self.cache_path,
+                ),
+                [standalone],
+            )
+
+    def test_hook_reports_expression_syntax_errors(self):
+        lib = self._write_file(os.path.join('lib', 'values.asm'), 'VALUE = \n')
+        uses_lib = self._write_file(os.path.join('programs', 'uses_lib.asm'), '#include "values.asm"\nstart:\n  jmp start\n')
+        standalone = self._write_file(os.path.join('programs', 'standalone.asm'), 'start:\n  ld a, b, c\n  jmp start\n')
+
+        # the parser raises rather than exits on this error, whether the roots are checked in parallel or not
+        for jobs in [2, 1]:
+            stderr = io.StringIO()
+            with self.assertRaises(SystemExit) as ctx, contextlib.redirect_stderr(stderr):
+                run_pre_commit_hook(
+                    [lib],
+                    self.config_path,
+                    [os.path.join(self.root_dir, 'programs', '*.asm')],
+                    [os.path.join(self.root_dir, 'lib')],
+                    [],
+                    jobs=jobs,
+                    cache_file=self.cache_path,
+                )
+            self.assertIn('1 of', str(ctx.exception))
+            self.assertIn(os.path.relpath(uses_lib), str(ctx.exception))
+            self.assertIn(f'ERROR: file {lib}, line 1 - Invalid syntax', stderr.getvalue())
+            self.assertTrue(os.path.isfile(self.cache_path))
+        # the failing root's includes were recorded, so fixing the included file rechecks just that root
+        self._write_file(os.path.join('lib', 'values.asm'), 'VALUE = 1\n')
+        self.assertEqual(self._run_hook([]), [uses_lib])
+        self.assertEqual(self._run_hook([standalone]), [standalone])
+
+    def test_hook_reports_unexpected_check_errors(self):
+        program = self._write_file(os.path.join('programs', 'program.asm'), 'start:\n  jmp start\n')
+        stderr = io.StringIO()
+        with (
+            patch.object(SyntaxChecker, 'check', side_effect=RuntimeError('checker failed')),
+            self.assertRaises(SystemExit) as ctx,
+            contextlib.redirect_stderr(stderr),
+        ):
+            run_pre_commit_hook(
+                [],
+                self.config_path,
+                [os.path.join(self.root_dir, 'programs', '*.asm')],
+                [],
+                [],
+                jobs=1,
+                cache_file=self.cache_path,
+            )
+        self.assertIn(f'1 of 1 affected root programs failed to assemble: {os.path.relpath(program)}', str(ctx.exception))
+        self.assertIn('RuntimeError: checker failed', stderr.getvalue())
+        self.assertTrue(os.path.isfile(self.cache_path))
+
+    def test_unwritable_cache_only_warns(self):
+        root = self._write_file('a.asm', '')
+        # the cache file's directory can't be created where a file already is
+        self._write_file('cache', '')
+        graph = IncludeGraph({})
+        graph.record(root, True, {})
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            graph.save(self.cache_path)
+        self.assertIn('Warning: Failed to write include graph cache file', stderr.getvalue())
+        self.assertEqual(IncludeGraph.load(self.cache_path, {}).affected_roots([root], []), [root])
+
+    def test_hook_requires_matching_roots(self):
+        with self.assertRaises(SystemExit) as ctx:
+            self._run_hook([])
+        self.assertIn('no root programs match', str(ctx.exception))
@@ -0,0 +1,156 @@
+import io
+import os
+import unittest
+
+from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_format import WordFormat
+from bespokeasm.assembler.bytecode.word_run import WordRun
+from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
+from bespokeasm.assembler.line_identifier import LineIdentifier
+from bespokeasm.assembler.line_object import LineWithWords
+from bespokeasm.assembler.memory_zone import MemoryZone
+from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.pretty_printer.factory import PrettyPrinterFactory
+from bespokeasm.assembler.pretty_printer.hexrecords import HexRecordPrettyPrinter
+from bespokeasm.assembler.pretty_printer.intelhex import IntelHexPrettyPrinter
+from intelhex import IntelHex
+
+
+class DummyLineWithWords(LineWithWords):
+    def __init__(self, words, address, word_size=8, intra_word_endianness='big', segment_size=8):
+        super().__init__(
+            LineIdentifier(1, 'main.asm'), 'data', '', MemoryZone(32, 0, 2**32 - 1, 'GLOBAL'),
+            word_size, segment_size, intra_word_endianness, 'big'
+        )
+        self._words = words
+        self._address = address
+
+    def generate_words(self):
+        pass
+
+
+class TestHexRecordPrettyPrinter(unittest.TestCase):
+    def setUp(self):
+        self.config_path = os.path.join(
+            os.path.dirname(__file__), 'config_files', 'test_instruction_list_creation_isa.json'
+        )
+        self.diagnostic_reporter = DiagnosticReporter()
+        self.model = AssemblerModel(self.config_path, 0, self.diagnostic_reporter)
+
+    def _model_with_general(self, **general) -> AssemblerModel:
+        model = AssemblerModel(self.config_path, 0, self.diagnostic_reporter)
+        model._config['general'].update(general)
+        return model
+
+    @staticmethod
+    def _bytes_line(data: bytes, address: int) -> DummyLineWithWords:
+        return DummyLineWithWords([Word(b, 8) for b in data], address)
+
+    def test_intel_hex_matches_library_output(self):
+        lines = [
+            self._bytes_line(bytes([0x12, 0x34]), 0x00),
+            self._bytes_line(bytes([0x56, 0x78]), 0x10),
+            self._bytes_line(bytes(range(20)), 0x40),
+            self._bytes_line(bytes(range(100, 120)), 0x54),
+        ]
+        native = HexRecordPrettyPrinter(lines, self.model, 'intel_hex').pretty_print()
+        library = IntelHexPrettyPrinter(lines, self.model, True).pretty_print().replace('\r\n', '\n')
+        self.assertEqual(native, library)
+        self.assertTrue(native.startswith(':020000001234B8\n:02001000567820\n'))
+
+    def test_intel_hex_extended_linear_addresses(self):
+        line = DummyLineWithWords(WordRun(WordFormat.get(8), 0xA5, 0x20), 0x1FFF0)
+        output = HexRecordPrettyPrinter([line], self.model, 'intel_hex').pretty_print()
+        extended_records = [r for r in output.splitlines() if r[7:9] == '04']
+        self.assertEqual(len(extended_records), 2, 'one record for 0x1xxxx and one for 0x2xxxx')
+        parsed = IntelHex()
+        parsed.loadhex(io.StringIO(output))
+        self.assertEqual(parsed.minaddr(), 0x1FFF0)
+        self.assertEqual(parsed.tobinstr(), b'\xA5' * 0x20)
+        # no data record may cross a 64 KiB boundary
+        for record in output.splitlines():
+            if record[7:9] == '00':
+                self.assertLessEqual(int(record[3:7], 16) + int(record[1:3], 16), 0x10000)
+
+    def test_intel_hex_word_addresses_crossing_64k_boundary(self):
+        model = self._model_with_general(word_size=16, word_segment_size=16, hex_address_scale=1)
+        line = DummyLineWithWords([Word(value, 16, 16) for value in range(1, 9)], 0xFFFC, word_size=16, segment_size=16)
+        output = HexRecordPrettyPrinter([line], model, 'intel_hex').pretty_print()
+        # each record holds whole words, addressed by word, split where the word address reaches 0x10000
+        self.assertEqual(
+            output.splitlines(),
+            [
+                ':08FFFC000001000200030004F3',
+                ':020000040001F9',
+                ':080000000005000600070008DE',
+                ':00000001FF',
+            ],
+        )
+
+    def test_word_addressed_isa_scaling(self):
+        model = self._model_with_general(word_size=16, word_segment_size=8)
+        lines = [
+            DummyLineWithWords([Word(0x1234, 16), Word(0xABCD, 16)], 0x10, word_size=16),
+            DummyLineWithWords([Word(0x5678, 16, 8, 'little')], 0x12, word_size=16, intra_word_endianness='little'),
+        ]
+        output = HexRecordPrettyPrinter(lines, model, 'intel_hex').pretty_print()
+        parsed = IntelHex()
+        parsed.loadhex(io.StringIO(output))
+        self.assertEqual(parsed.minaddr(), 0x20, 'records use byte addresses by default')
+        self.assertEqual(parsed.tobinstr(), bytes([0x12, 0x34, 0xAB, 0xCD, 0x78, 0x56]))
+
+        model = self._model_with_general(word_size=16, word_segment_size=8, hex_address_scale=1)
+        output = HexRecordPrettyPrinter(lines, model, 'srec').pretty_print()
+        self.assertIn('S10900101234ABCD7856', output)
+
+    def test_segmented_little_endian_words(self):
+        model = self._model_with_general(word_segment_size=4, intra_word_endianness='little')
+        line = DummyLineWithWords(
+            [Word(0x12, 8, 4, 'little'), Word(0x34, 8, 4, 'little')], 0x00,
+            intra_word_endianness='little', segment_size=4,
+        )
+        # every format orders the 4-bit segments of each word by the intra-word endianness
+        self.assertIn('21 43', IntelHexPrettyPrinter([line], model, False).pretty_print())
+        for printer in (IntelHexPrettyPrinter([line], model, True), HexRecordPrettyPrinter([line], model, 'intel_hex')):
+            with self.subTest(printer=type(printer).__name__):
+                parsed = IntelHex()
+                parsed.loadhex(io.StringIO(printer.pretty_print()))
+                self.assertEqual(parsed.tobinstr(), bytes([0x21, 0x43]))
+
+    def test_srec_output(self):
+        lines = [self._bytes_line(bytes([0x12, 0x34]), 0x00), self._bytes_line(bytes([0x56]), 0x02)]
+        output = HexRecordPrettyPrinter(lines, self.model, 'srec').pretty_print()
+        self.assertEqual(output, 'S0030000FC\nS10600001234565D\nS5030001FB\nS9030000FC\n')
+
+        for address, data_type, termination in ((0x12345, 'S2', 'S8'), (0x1234567, 'S3', 'S7')):
+            with self.subTest(address=address):
+                output = HexRecordPrettyPrinter(
+                    [self._bytes_line(bytes(range(40)), address)], self.model, 'srec'
+                ).pretty_print()
+                records = output.splitlines()
+                self.assertEqual([r[:2] for r in records], ['S0', data_type, data_type, data_type, 'S5', termination])
+                for record in records:
+                    record_bytes = bytes.fromhex(record[2:])
+                    self.assertEqual(record_bytes[0], len(record_bytes) - 1, 'byte count')
+                    self.assertEqual(sum(record_bytes) & 0xFF, 0xFF, 'checksum')
+
+    def test_muted_lines_skipped_and_empty_output(self):
+        line = self._bytes_line(bytes([0x12]), 0x00)
+        line._is_muted = True
+        self.assertEqual(HexRecordPrettyPrinter([line], self.model, 'intel_hex').pretty_print(), ':00000001FF\n')
+        self.assertEqual(
+            HexRecordPrettyPrinter([], self.model, 'srec').pretty_print(),
+            'S0030000FC\nS5030000FC\nS9030000FC\n',
+        )
+
+    def test_factory_and_word_size_error(self):
+        self.assertIsInstance(
+            PrettyPrinterFactory.getPrettyPrinter('srec', [], self.model, 'main.asm'),
+            HexRecordPrettyPrinter,
+        )
+        with self.assertRaises(SystemExit):
+            HexRecordPrettyPrinter([], self._model_with_general(word_size=4), 'intel_hex')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,15 +1,18 @@
+import io
 import json
 import os
 import tempfile
 import unittest
 
 from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_run import WordRun
 from bespokeasm.assembler.diagnostic_reporter import DiagnosticReporter
 from bespokeasm.assembler.line_identifier import LineIdentifier
 from bespokeasm.assembler.line_object import LineObject
 from bespokeasm.assembler.line_object import LineWithWords
 from bespokeasm.assembler.memory_zone import MemoryZone
 from bespokeasm.assembler.model import AssemblerModel
+from bespokeasm.assembler.pretty_printer.line_stats import LineStats
 from bespokeasm.assembler.pretty_printer.listing import ListingPrettyPrinter
 
 
@@ -69,6 +72,39 @@ class TestListingPrettyPrinter(unittest.TestCase):
         self.assertTrue(main_data.startswith('    1 | 0 |'))
         self.assertTrue(other_data.startswith('    2 | 1 |'))
 
+    def test_write_streams_lines_in_numeric_line_order(self):
+        # line numbers are ordered numerically, not as text, so line 10000 follows line 9999
+        lines = [
+            LineObject(LineIdentifier(line_num, filename), f'nop ; {filename}:{line_num}', '', self.memzone)
+            for filename, line_num in (('lib.asm', 3), ('main.asm', 10000), ('main.asm', 9999), ('a.asm', 1))
+        ]
+        for line in lines:
+            line.set_start_address(0x0)
+        printer = ListingPrettyPrinter(lines, self.model, 'main.asm')
+        output = io.StringIO()
+        printer.write(output)
+        self.assertEqual(output.getvalue(), printer.pretty_print())
+        order = [
+            line.split(';')[1].split('|')[0].strip() for line in output.getvalue().splitlines() if ';' in line
+        ]
+        self.assertEqual(order, ['main.asm:9999', 'main.asm:10000', 'a.asm:1', 'lib.asm:3'])
+
+    def test_column_widths_from_line_stats(self):
+        line = LineObject(LineIdentifier(1, 'main.asm'), 'lda $1', '', self.memzone)
+        line.set_start_address(0x0)
+        stats = LineStats.from_line_objects([line])
+        self.assertEqual(
+            (stats.max_line_num, stats.max_instruction_length, stats.max_comment_length, stats.max_word_count),
+            (1, 6, 0, 0),
+        )
+        # widths gathered elsewhere (e.g. while assembling) are used as given
+        stats.max_line_num = 123456
+        stats.add(line, 0)
+        printer = ListingPrettyPrinter([line], self.model, 'main.asm', stats)
+        self.assertEqual(printer.max_line_num_width, 6)
+        self.assertEqual(printer.max_instruction_width, 6 + ListingPrettyPrinter.INSTRUCTION_INDENT)
+        self.assertIn('      1 | 0 |', printer.pretty_print())
+
     def test_pretty_print_machine_code_multiline(self):
         line_id = LineIdentifier(1, 'main.asm')
         words = [Word(i, 8) for i in range(8)]
@@ -94,6 +130,33 @@ class TestListingPrettyPrinter(unittest.TestCase):
         ]
         self.assertTrue(any('06 07' in line for line in cont_line))
 
+    def test_pretty_print_word_run_collapsed(self):
+        fill_line = DummyLineWithWords(
+            LineIdentifier(1, 'main.asm'), '.zero 4096', 'padding', self.memzone, 8, 8, 'big', 'big', None
+        )
+        fill_line._words = WordRun(fill_line.word_format, 0, 4096)
+        fill_line.set_start_address(0x0)
+        code_line = DummyLineWithWords(
+            LineIdentifier(2, 'main.asm'), 'add $2', 'machine code', self.memzone, 8, 8, 'big', 'big',
+            [Word(i, 8) for i in range(6)]
+        )
+        code_line.set_start_address(0x1)
+        printer = ListingPrettyPrinter([fill_line, code_line], self.model, 'main.asm')
+        output = printer.pretty_print()
+        lines = [line for line in output.splitlines() if line.strip()]
+        fill_lines = [line for line in lines if '.zero 4096' in line]
+        self.assertEqual(len(fill_lines), 1)
+        self.assertIn('| 00 x 4096         |', fill_lines[0])
+        # the run is summarized on one row, so no continuation rows follow it
+        fill_idx = lines.index(fill_lines[0])
+        self.assertIn('add $2', lines[fill_idx + 1])
+
+        short_run = WordRun(fill_line.word_format, 0xAB, 4)
+        self.assertEqual(
+            ListingPrettyPrinter._generate_word_run_line_string(short_run, 2, 2),
+            'ab ab ',
+        )
+
     def test_pretty_print_machine_code_4bit_words(self):
         config = {
             'description': '4-bit listing test',
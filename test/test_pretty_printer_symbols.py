@@ -0,0 +1,93 @@
+import importlib.resources as pkg_resources
+import json
+import os
+import tempfile
+import unittest
+
+from bespokeasm.assembler.engine import Assembler
+from bespokeasm.assembler.label_scope import LabelScope
+from bespokeasm.assembler.line_object.instruction_line import InstructionLine
+
+from test import config_files
+
+
+class TestSymbolAndSourceMapOutput(unittest.TestCase):
+    def setUp(self) -> None:
+        InstructionLine.reset_instruction_pattern_cache()
+        LabelScope._global_scope = None
+        self.config_path = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+
+    def _assemble(self, temp_dir: str, files: dict[str, str], emit_targets: list[str]) -> None:
+        for filename, content in files.items():
+            with open(os.path.join(temp_dir, filename), 'w') as handle:
+                handle.write(content)
+        assembler = Assembler(
+            source_file=os.path.join(temp_dir, 'main.asm'),
+            config_file=self.config_path,
+            generate_binary=False,
+            output_file=None,
+            binary_start=0,
+            binary_end=None,
+            binary_fill_value=0,
+            enable_pretty_print=False,
+            pretty_print_format=None,
+            pretty_print_output=None,
+            is_verbose=0,
+            include_paths=[],
+            predefined=[],
+            emit_targets=emit_targets,
+        )
+        assembler.assemble_bytecode()
+
+    def test_symbols_and_source_map(self):
+        main_source = (
+            'table_size = 3\n'
+            '_file_const = 7\n'
+            '.org $10\n'
+            'start:\n'
+            '.byte 1, 2, 3\n'
+            '.loop:\n'
+            '.byte 4\n'
+            '#include "lib.asm"\n'
+        )
+        lib_source = (
+            '#create-scope "mathlib" prefix="ml_"\n'
+            '#use-scope "mathlib"\n'
+            'ml_multiply: .2byte $1234\n'
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._assemble(temp_dir, {'main.asm': main_source, 'lib.asm': lib_source}, ['symbols', 'srcmap'])
+            with open(os.path.join(temp_dir, 'main.sym.json')) as handle:
+                symbol_table = json.load(handle)
+            with open(os.path.join(temp_dir, 'main.srcmap.jsonl')) as handle:
+                source_map_lines = handle.read().splitlines()
+
+        self.assertEqual(symbol_table['format'], 'bespokeasm-symbols')
+        symbols = {
+            record['name']: (record['value'], record['kind'], record['scope'], record['line'])
+            for record in symbol_table['symbols']
+        }
+        self.assertEqual(symbols['table_size'], (3, 'constant', 'global', 1))
+        self.assertEqual(symbols['_file_const'], (7, 'constant', 'file', 2))
+        self.assertEqual(symbols['start'], (0x10, 'label', 'global', 4))
+        self.assertEqual(symbols['.loop'], (0x13, 'label', 'local', 6))
+        self.assertEqual(symbols['ml_multiply'], (0x14, 'label', 'named', 3))
+        records_by_name = {record['name']: record for record in symbol_table['symbols']}
+        self.assertEqual(records_by_name['.loop']['scope_reference'], 'start')
+        self.assertEqual(records_by_name['ml_multiply']['scope_reference'], 'mathlib')
+        self.assertTrue(records_by_name['_file_const']['scope_reference'].endswith('main.asm'))
+        values = [record['value'] for record in symbol_table['symbols']]
+        self.assertEqual(values, sorted(values))
+
+        header = json.loads(source_map_lines[0])
+        self.assertEqual(header['fields'], ['address', 'word_count', 'file', 'line'])
+        self.assertEqual(header['record_count'], 3)
+        records = [json.loads(line) for line in source_map_lines[1:]]
+        self.assertEqual([r[:2] for r in records], [[0x10, 3], [0x13, 1], [0x14, 2]])
+        self.assertTrue(header['files'][records[0][2]].endswith('main.asm'))
+        self.assertTrue(header['files'][records[2][2]].endswith('lib.asm'))
+        self.assertEqual(records[2][3], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import importlib.resources as pkg_resources
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import bespokeasm
+
+from test import config_files
+
+# Importing the CLI entry point must stay cheap, as it runs for every invocation including
+# `--help` and shell completion. The budget is the cumulative `-X importtime` of the module in
+# microseconds. It was measured at about 25 ms and leaves room for slower machines.
+CLI_IMPORT_BUDGET_US = 250_000
+
+_PROBE_SCRIPT = '''
+import sys
+sys.argv = ['bespokeasm'] + sys.argv[1:]
+from bespokeasm.__main__ import entry_point
+try:
+    entry_point()
+except SystemExit as e:
+    if e.code not in (None, 0):
+        raise
+print('\\n'.join(sorted(sys.modules)), file=sys.stderr)
+'''
+
+
+class TestStartupImports(unittest.TestCase):
+    def _run_python(self, *args: str) -> subprocess.CompletedProcess:
+        env = dict(os.environ)
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(bespokeasm.__file__)))
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [src_dir, env.get('PYTHONPATH')]))
+        env = {key: value for key, value in env.items() if not key.endswith('_COMPLETE')}
+        result = subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result
+
+    def _imported_modules(self, *cli_args: str) -> set[str]:
+        result = self._run_python('-c', _PROBE_SCRIPT, *cli_args)
+        return set(result.stderr.splitlines())
+
+    def test_cli_import_time_budget(self):
+        result = self._run_python('-X', 'importtime', '-c', 'import bespokeasm.__main__')
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == 'bespokeasm.__main__':
+                cumulative_us = int(fields[1])
+        self.assertIsNotNone(cumulative_us)
+        self.assertLess(cumulative_us, CLI_IMPORT_BUDGET_US)
+
+    def test_help_does_not_import_assembler(self):
+        modules = self._imported_modules('--help')
+        self.assertFalse(any(module.startswith('bespokeasm.assembler') for module in modules))
+        for heavy_module in ('ruamel.yaml', 'intelhex', 'packaging'):
+            self.assertNotIn(heavy_module, modules)
+
+    def test_compile_imports_only_what_it_uses(self):
+        json_config = str(pkg_resources.files(config_files).joinpath('test_instruction_list_creation_isa.json'))
+        yaml_config = str(pkg_resources.files(config_files).joinpath('test_instruction_operands.yaml'))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            asm_path = os.path.join(temp_dir, 'program.asm')
+            with open(asm_path, 'w') as handle:
+                handle.write('.byte $01\n')
+            modules = self._imported_modules('compile', '-c', json_config, '-p', '-t', 'intel_hex', asm_path)
+            self.assertIn('bespokeasm.assembler.engine', modules)
+            for lazy_module in ('ruamel.yaml', 'intelhex', 'bespokeasm.docsgen', 'bespokeasm.configgen'):
+                self.assertNotIn(lazy_module, modules)
+
+            modules = self._imported_modules('compile', '-c', yaml_config, '-p', '-t', 'hex', asm_path)
+            self.assertIn('ruamel.yaml', modules)
+            self.assertIn('intelhex', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
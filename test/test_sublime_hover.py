@@ -1,10 +1,13 @@
 import importlib.util
+import os
 import pathlib as pl
 import re
 import sys
 import tempfile
 import types
 
+from bespokeasm.configgen.hover_docs import encode_hover_doc_bundle
+from bespokeasm.configgen.hover_docs import HOVER_DOC_BUNDLE_FILENAME
 from bespokeasm.utilities import PATTERN_ALLOWED_LABELS
 
 
@@ -205,6 +208,200 @@ class _MockLineView:
         return self._text
 
 
+# --- Workspace index tests ---
+
+
+class _MockBufferView:
+    def __init__(self, view_id, file_name, text):
+        self._id = view_id
+        self._file_name = file_name
+        self.text = text
+        self.changes = 0
+
+    def id(self):
+        return self._id
+
+    def change_count(self):
+        return self.changes
+
+    def file_name(self):
+        return self._file_name
+
+    def window(self):
+        return None
+
+    def edit(self, text):
+        self.text = text
+        self.changes += 1
+
+
+def _install_buffer_collection(hover):
+    hover._collect_lines = lambda view: view.text.splitlines()
+
+
+def test_sublime_file_index_invalidated_by_mtime():
+    hover = _load_sublime_hover_module()
+    _install_label_patterns(hover)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        include_path = pl.Path(temp_dir) / 'defs.asm'
+        include_path.write_text('first:\n', encoding='utf-8')
+        file_index = {}
+        entry = hover._load_file_entry(str(include_path), file_index)
+        assert hover._load_file_entry(str(include_path), file_index) is entry
+        assert 'first' in hover._build_definition_map([entry], 'label')
+
+        include_path.write_text('renamed:\n', encoding='utf-8')
+        stat = include_path.stat()
+        os.utime(include_path, (stat.st_atime, stat.st_mtime + 5))
+        updated = hover._load_file_entry(str(include_path), file_index)
+        assert updated is not entry
+        assert 'renamed' in hover._build_definition_map([updated], 'label')
+
+        include_path.unlink()
+        assert hover._load_file_entry(str(include_path), file_index) is None
+        assert str(include_path) not in file_index
+
+
+def test_sublime_view_state_updates_only_edited_lines():
+    hover = _load_sublime_hover_module()
+    _install_label_patterns(hover)
+    _install_buffer_collection(hover)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = pl.Path(temp_dir)
+        (base_dir / 'defs.asm').write_text('LIMIT = 10\nshared:\n', encoding='utf-8')
+        lines = ['#include "defs.asm"', 'start:'] + ['  jmp start'] * 200 + ['  jmp shared']
+        view = _MockBufferView(1, str(base_dir / 'main.asm'), '\n'.join(lines))
+
+        state = hover._get_view_state(view)
+        assert state['label_map']['shared']['path'] == str(base_dir / 'defs.asm')
+        assert 'LIMIT' in state['constant_map']
+        assert len(hover._find_references('start', state)) == 200
+        assert hover._get_view_state(view) is state
+
+        analyzed = []
+        analyze_line = hover._analyze_line
+
+        def _counting_analyze_line(text):
+            analyzed.append(text)
+            return analyze_line(text)
+
+        hover._analyze_line = _counting_analyze_line
+        lines[100] = 'middle:'
+        view.edit('\n'.join(lines))
+        state = hover._get_view_state(view)
+        assert analyzed == ['middle:']
+        assert state['label_map']['middle']['line'] == 100
+        assert len(hover._find_references('start', state)) == 199
+        assert len(state['line_info']) == len(lines)
+
+
+class _MockSemanticView(_MockBufferView):
+    def __init__(self, view_id, file_name, text):
+        super().__init__(view_id, file_name, text)
+        self.regions = {}
+        self.added_keys = []
+
+    def text_point(self, row, col):
+        return sum(len(line) + 1 for line in self.text.split('\n')[:row]) + col
+
+    def add_regions(self, key, regions, scope=None, flags=0):
+        self.added_keys.append(key)
+        self.regions[key] = [(region.a, region.b) for region in regions]
+
+    def erase_regions(self, key):
+        self.regions.pop(key, None)
+
+
+class _MockMovingSemanticView(_MockSemanticView):
+    """A semantic view whose regions move with the text when it is edited, as they do in Sublime Text."""
+    def edit(self, text):
+        edit_point = 0
+        while edit_point < min(len(text), len(self.text)) and text[edit_point] == self.text[edit_point]:
+            edit_point += 1
+        delta = len(text) - len(self.text)
+        for key, regions in self.regions.items():
+            self.regions[key] = [
+                (a + delta, b + delta) if a >= edit_point else (a, b)
+                for a, b in regions
+            ]
+        super().edit(text)
+
+
+def _install_semantic_mocks(hover):
+    _install_label_patterns(hover)
+    _install_buffer_collection(hover)
+    hover.sublime = types.SimpleNamespace(
+        Region=lambda a, b: types.SimpleNamespace(a=a, b=b),
+        DRAW_SOLID_UNDERLINE=0,
+    )
+    hover._is_bespokeasm_view = lambda view: True
+    hover._get_semantic_setting = lambda view: True
+    hover.SEMANTIC_BLOCK_LINES = 10
+
+
+def test_sublime_semantic_update_pushes_only_changed_blocks():
+    hover = _load_sublime_hover_module()
+    _install_semantic_mocks(hover)
+    lines = ['start:', 'VALUE = 3'] + ['  lda VALUE'] * 18 + ['  jmp start'] * 20
+    view = _MockSemanticView(1, '/tmp/semantic.asm', '\n'.join(lines))
+
+    hover._update_semantic_regions(view)
+    assert len(view.added_keys) == 8
+    offset = view.text_point(39, 0) + len('  jmp ')
+    assert (offset, offset + len('start')) in view.regions['bespokeasm_label_usages_3']
+    assert len(view.regions['bespokeasm_constant_usages_0']) == 8
+
+    # editing a line re-adds only the regions of its block
+    view.added_keys.clear()
+    lines[25] = '  nop'
+    view.edit('\n'.join(lines))
+    hover._update_semantic_regions(view)
+    assert view.added_keys == ['bespokeasm_label_usages_2', 'bespokeasm_constant_usages_2']
+    assert len(view.regions['bespokeasm_label_usages_2']) == 9
+
+    # removing a definition refreshes the blocks using it, and shortening the file erases trailing blocks
+    view.added_keys.clear()
+    lines = ['start:'] + lines[2:30]
+    view.edit('\n'.join(lines))
+    hover._update_semantic_regions(view)
+    assert all(len(regions) == 0 for key, regions in view.regions.items() if 'constant' in key)
+    assert 'bespokeasm_label_usages_3' not in view.regions
+    assert len(view.regions['bespokeasm_label_usages_2']) == 8
+
+    # a block recorded as edited is refreshed even when its text ends up unchanged
+    view.added_keys.clear()
+    hover._DIRTY_SEMANTIC_BLOCKS[view.id()] = {0}
+    view.changes += 1
+    hover._update_semantic_regions(view)
+    assert view.added_keys == ['bespokeasm_label_usages_0', 'bespokeasm_constant_usages_0']
+
+
+def test_sublime_semantic_regions_follow_inserted_and_removed_lines():
+    hover = _load_sublime_hover_module()
+    _install_semantic_mocks(hover)
+    lines = ['start:'] + ['  jmp start'] * 40
+    view = _MockMovingSemanticView(1, '/tmp/semantic.asm', '\n'.join(lines))
+    hover._update_semantic_regions(view)
+
+    def _assert_one_region_per_usage():
+        label_regions = sorted(
+            region for key, regions in view.regions.items() if 'label' in key for region in regions
+        )
+        expected_regions = [
+            (view.text_point(row, 6), view.text_point(row, 11))
+            for row, line in enumerate(lines)
+            if line == '  jmp start'
+        ]
+        assert label_regions == expected_regions
+
+    _assert_one_region_per_usage()
+    for edit_row, new_lines in ((1, ['  nop']), (5, []), (25, ['  nop', '  nop', '  nop'])):
+        lines = lines[:edit_row] + new_lines + lines[edit_row + (0 if new_lines else 1):]
+        view.edit('\n'.join(lines))
+        hover._update_semantic_regions(view)
+        _assert_one_region_per_usage()
+
+
 # --- Directive hover tests ---
 
 
@@ -478,3 +675,33 @@ def test_sublime_code_block_colors_numeric_prefix_directive():
     # Find the span containing "2byte" and verify its color
     assert '>2byte</span>' in html
     assert 'color:#D6ADFF;">2byte</span>' in html
+
+
+def test_sublime_hover_doc_bundle_decodes_entries_lazily(monkeypatch):
+    hover = _load_sublime_hover_module()
+    hover_docs = {
+        'instructions': {'LDA': '### `LDA` : Load — ä', 'NOP': '### `NOP`'},
+        'macros': {'PUSH2': '### `NOP`'},
+        'directives': {'compiler': {'org': 'Set the origin.'}},
+        'registers': {},
+    }
+    bundle_data = encode_hover_doc_bundle(hover_docs)
+    loaded_paths = []
+
+    def load_binary_resource(path):
+        loaded_paths.append(path)
+        return bundle_data
+
+    monkeypatch.setattr(hover.sublime, 'load_binary_resource', load_binary_resource, raising=False)
+    monkeypatch.setattr(hover, '_get_package_name', lambda view: 'Tester')
+    docs = hover._load_instruction_docs(None)
+    assert hover._load_instruction_docs(None) is docs
+    assert loaded_paths == [f'Packages/Tester/{HOVER_DOC_BUNDLE_FILENAME}']
+
+    assert docs.get('instructions').get('LDA') == hover_docs['instructions']['LDA']
+    assert docs.get('macros').get('PUSH2') == '### `NOP`'
+    assert 'org' in docs.get('directives', {}).get('compiler', {})
+    assert docs.get('directives').get('compiler')['org'] == 'Set the origin.'
+    assert docs.get('instructions').get('MISSING') is None
+    assert not docs.get('registers')
+    assert hover._parse_hover_doc_bundle(b'{"instructions": {}}') is None
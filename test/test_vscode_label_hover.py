@@ -5,6 +5,7 @@ import subprocess
 import tempfile
 import unittest
 
+from bespokeasm.configgen.hover_docs import encode_hover_doc_bundle
 from bespokeasm.utilities import PATTERN_ALLOWED_LABELS
 
 
@@ -218,6 +219,7 @@ console.log(JSON.stringify({{
             encoding='utf-8'
         )
         shutil.copy(str(include_files_path), str(temp_path / 'include_files.js'))
+        shutil.copy(str(include_files_path.parent / 'hover_docs.js'), str(temp_path / 'hover_docs.js'))
 
         # Read extension.js and extract just the functions we need
         ext_src = extension_path.read_text()
@@ -251,6 +253,7 @@ const origResolve = require.resolve;
 const labelHelper = require('{(temp_path / "label_hover.js").as_posix()}');
 const constantsHelper = require('{(temp_path / "constants_hover.js").as_posix()}');
 const includeFilesHelper = require('{(temp_path / "include_files.js").as_posix()}');
+const hoverDocsHelper = require('{(temp_path / "hover_docs.js").as_posix()}');
 
 // Now load the extension source and extract functions
 const Module = require('module');
@@ -264,6 +267,7 @@ m.require = function(id) {{
   if (id === './label_hover') return labelHelper;
   if (id === './constants_hover') return constantsHelper;
   if (id === './include_files') return includeFilesHelper;
+  if (id === './hover_docs') return hoverDocsHelper;
   return origRequire(id);
 }};
 
@@ -334,3 +338,50 @@ console.log(JSON.stringify(results));
         self.assertIsNone(payload['notConst'])
 
         shutil.rmtree(temp_dir)
+
+    def test_hover_doc_bundle_reader(self):
+        node_path = shutil.which('node')
+        if not node_path:
+            self.skipTest('node is not available to run hover doc bundle tests')
+
+        helper_path = (
+            pl.Path(__file__).resolve().parent.parent
+            / 'src' / 'bespokeasm' / 'configgen' / 'vscode' / 'resources' / 'hover_docs.js'
+        )
+        hover_docs = {
+            'instructions': {'LDA': '### `LDA` : Load — ä', 'NOP': '### `NOP`'},
+            'macros': {'PUSH2': '### `NOP`'},
+            'predefined': {'constants': {}, 'data': {'buffer': 'A buffer'}, 'memory_zones': {}},
+            'directives': {'compiler': {'org': 'Set the origin.'}},
+        }
+        temp_dir = tempfile.mkdtemp()
+        bundle_path = pl.Path(temp_dir) / 'hover-docs.bundle'
+        bundle_path.write_bytes(encode_hover_doc_bundle(hover_docs))
+
+        script = f"""
+const {{ HoverDocBundle }} = require({json.dumps(helper_path.as_posix())});
+const bundle = HoverDocBundle.open({json.dumps(bundle_path.as_posix())});
+console.log(JSON.stringify({{
+  lda: bundle.section('instructions').get('LDA'),
+  push2: bundle.section('macros').get('PUSH2'),
+  hasOrg: bundle.section('directives', 'compiler').has('org'),
+  org: bundle.section('directives', 'compiler').get('org'),
+  buffer: bundle.section('predefined', 'data').get('buffer'),
+  missing: bundle.section('instructions').get('MISSING'),
+  inherited: bundle.section('instructions').get('constructor'),
+  missingSection: bundle.section('registers').get('A'),
+  notLeaf: bundle.section('directives').get('compiler'),
+}}));
+"""
+        result = subprocess.run([node_path, '-e', script], check=True, capture_output=True, text=True)
+        payload = json.loads(result.stdout.strip())
+        self.assertEqual(payload['lda'], hover_docs['instructions']['LDA'])
+        self.assertEqual(payload['push2'], '### `NOP`')
+        self.assertTrue(payload['hasOrg'])
+        self.assertEqual(payload['org'], 'Set the origin.')
+        self.assertEqual(payload['buffer'], 'A buffer')
+        self.assertIsNone(payload['missing'])
+        self.assertIsNone(payload['inherited'])
+        self.assertIsNone(payload['missingSection'])
+        self.assertIsNone(payload['notLeaf'])
+        shutil.rmtree(temp_dir)
@@ -0,0 +1,135 @@
+import unittest
+
+from bespokeasm.assembler.bytecode.word import Word
+from bespokeasm.assembler.bytecode.word_buffer import WordBuffer
+from bespokeasm.assembler.bytecode.word_format import WordFormat
+from bespokeasm.assembler.bytecode.word_run import WordRun
+
+
+class TestWordBuffer(unittest.TestCase):
+    def test_append_and_word_views(self):
+        word_format = WordFormat.get(8)
+        buffer = WordBuffer(word_format, [1, 2, 0xFF])
+        buffer.append(-1)
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(list(buffer.values), [1, 2, 0xFF, 0xFF])
+        self.assertEqual(buffer[0], Word(1, 8))
+        self.assertEqual(buffer.words(), [Word(1, 8), Word(2, 8), Word(0xFF, 8), Word(0xFF, 8)])
+        for w in buffer:
+            self.assertIs(w.word_format, word_format)
+
+        with self.assertRaises(ValueError):
+            buffer.append(0x100)
+        with self.assertRaises(ValueError):
+            buffer.append(-129)
+
+    def test_extend_fill_and_buffer(self):
+        word_format = WordFormat.get(16)
+        buffer = WordBuffer(word_format)
+        buffer.extend_fill(0xABCD, 3)
+        buffer.extend_fill(0x1111, 0)
+        other = WordBuffer.from_words([Word(0x1234, 16)], word_format)
+        buffer.extend_buffer(other)
+        self.assertEqual(list(buffer.values), [0xABCD, 0xABCD, 0xABCD, 0x1234])
+
+        with self.assertRaises(ValueError):
+            buffer.extend_buffer(WordBuffer(WordFormat.get(8), [1]))
+
+    def test_to_bytes_matches_words_to_bytes(self):
+        test_cases = [
+            (WordFormat.get(8), [0x12, 0x34, 0xFF]),
+            (WordFormat.get(16, 8, 'big'), [0x1234, 0xABCD]),
+            (WordFormat.get(16, 8, 'little'), [0x1234, 0xABCD]),
+            (WordFormat.get(32, 16, 'little'), [0x12345678, 0x9ABCDEF0]),
+            (WordFormat.get(4, 4), [0xA, 0xB, 0xC]),
+            (WordFormat.get(12, 4), [0xABC, 0x123, 0x456]),
+            (WordFormat.get(36, 4), [0x123456789, 0xFEDCBA987]),
+            (WordFormat.get(72, 8), [0x123456789ABCDEF012]),
+        ]
+        for word_format, values in test_cases:
+            words = [Word.from_format(v, word_format) for v in values]
+            buffer = WordBuffer(word_format, values)
+            for compact in (True, False):
+                with self.subTest(word_format=word_format, compact=compact):
+                    self.assertEqual(
+                        buffer.to_bytes(compact=compact),
+                        bytes(Word.words_to_bytes(words, compact_bytes=compact)),
+                    )
+
+    def test_extend_bytes(self):
+        data = bytes([0x12, 0x34, 0x56])
+        test_cases = [
+            (WordFormat.get(8), False, [0x12, 0x34, 0x56]),
+            (WordFormat.get(16, 8, 'big', 'big'), False, [0x12, 0x34, 0x56]),
+            (WordFormat.get(16, 8, 'big', 'big'), True, [0x1234, 0x56FF]),
+            (WordFormat.get(16, 8, 'big', 'little'), True, [0x3412, 0xFF56]),
+            (WordFormat.get(24, 8, 'big', 'big'), True, [0x123456]),
+            (WordFormat.get(12, 4), True, [0x12, 0x34, 0x56]),
+            (WordFormat.get(4, 4, 'big', 'big'), False, [0x1, 0x2, 0x3, 0x4, 0x5, 0x6]),
+            (WordFormat.get(4, 4, 'big', 'little'), False, [0x2, 0x1, 0x4, 0x3, 0x6, 0x5]),
+            (WordFormat.get(2, 2, 'big', 'big'), False, [0, 1, 0, 2, 0, 3, 1, 0, 1, 1, 1, 2]),
+        ]
+        for word_format, pack_bytes, expected in test_cases:
+            with self.subTest(word_format=word_format, pack_bytes=pack_bytes):
+                buffer = WordBuffer(word_format)
+                buffer.extend_bytes(memoryview(data), pack_bytes=pack_bytes, pad_value=0xFF)
+                self.assertEqual(list(buffer.values), expected)
+
+        with self.assertRaises(ValueError):
+            WordBuffer(WordFormat.get(3, 3)).extend_bytes(data)
+
+    def test_empty_buffer(self):
+        buffer = WordBuffer(WordFormat.get(8))
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.to_bytes(), b'')
+        self.assertEqual(buffer.words(), [])
+
+
+class TestWordRun(unittest.TestCase):
+    def test_word_views(self):
+        word_format = WordFormat.get(8)
+        run = WordRun(word_format, -1, 3)
+        self.assertEqual(len(run), 3)
+        self.assertEqual(run.value, 0xFF)
+        self.assertEqual(run[2], Word(0xFF, 8))
+        self.assertEqual(run.words(), [Word(0xFF, 8)]*3)
+        self.assertEqual(run, WordBuffer(word_format, [0xFF, 0xFF, 0xFF]))
+        with self.assertRaises(IndexError):
+            run[3]
+        with self.assertRaises(ValueError):
+            WordRun(word_format, 0x100, 1)
+
+    def test_to_bytes_matches_words_to_bytes(self):
+        test_cases = [
+            (WordFormat.get(8), 0xA5, 5),
+            (WordFormat.get(16, 8, 'little'), 0x1234, 3),
+            (WordFormat.get(4, 4), 0xC, 11),
+            (WordFormat.get(12, 4), 0xABC, 19),
+            (WordFormat.get(8), 0, 0),
+        ]
+        for word_format, value, count in test_cases:
+            words = [Word.from_format(value, word_format)]*count
+            run = WordRun(word_format, value, count)
+            for compact in (True, False):
+                with self.subTest(word_format=word_format, count=count, compact=compact):
+                    self.assertEqual(
+                        run.to_bytes(compact=compact),
+                        bytes(Word.words_to_bytes(words, compact_bytes=compact)),
+                    )
+
+    def test_extend_buffer_with_run(self):
+        word_format = WordFormat.get(8)
+        buffer = WordBuffer(word_format, [1])
+        buffer.extend_buffer(WordRun(word_format, 7, 4))
+        self.assertEqual(list(buffer.values), [1, 7, 7, 7, 7])
+
+    def test_extend_buffer_index_range(self):
+        word_format = WordFormat.get(8)
+        buffer = WordBuffer(word_format)
+        buffer.extend_buffer(WordBuffer(word_format, [1, 2, 3, 4]), 1, 3)
+        buffer.extend_buffer(WordRun(word_format, 7, 10), 8)
+        self.assertEqual(list(buffer.values), [2, 3, 7, 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
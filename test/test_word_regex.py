@@ -0,0 +1,77 @@
+import random
+import re
+import unittest
+
+from bespokeasm.configgen import LanguageConfigGenerator
+from bespokeasm.configgen.word_regex import build_word_trie_regex
+from bespokeasm.configgen.word_regex import PCRE_DIALECT
+from bespokeasm.configgen.word_regex import PCRE_NEVER_MATCH
+from bespokeasm.configgen.word_regex import trie_regex_words
+from bespokeasm.configgen.word_regex import VIM_DIALECT
+
+
+class TestWordTrieRegex(unittest.TestCase):
+    def test_prefix_factoring(self):
+        self.assertEqual(build_word_trie_regex(['lxi', 'ldi', 'ld', 'lda']), 'l(?:d(?:a|i)?|xi)')
+        self.assertEqual(build_word_trie_regex(['if', 'ifdef', 'ifndef']), 'if(?:def|ndef)?')
+        self.assertEqual(build_word_trie_regex(['a', 'ab']), 'ab?')
+        self.assertEqual(build_word_trie_regex(['nop']), 'nop')
+        self.assertEqual(build_word_trie_regex(['.org', '.align']), '\\.(?:align|org)')
+        self.assertEqual(build_word_trie_regex(['ld', 'lda', 'ldi'], VIM_DIALECT), 'ld\\%(a\\|i\\)\\=')
+        self.assertEqual(build_word_trie_regex([]), '')
+        self.assertEqual(build_word_trie_regex(['', 'x', 'x']), 'x')
+
+    def test_output_is_deterministic(self):
+        words = ['push', 'pop', 'mov', 'add', 'addc', 'ldar', 'push2', 'mov2', 'add16']
+        expected = build_word_trie_regex(words)
+        for seed in range(5):
+            shuffled = list(words)
+            random.Random(seed).shuffle(shuffled)
+            self.assertEqual(build_word_trie_regex(shuffled), expected)
+
+    def test_matches_exactly_the_word_list(self):
+        rng = random.Random(1234)
+        alphabet = 'abcdlmnx._-+2'
+        for _ in range(50):
+            words = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))) for _ in range(rng.randint(1, 40))}
+            # every prefix, extension, and mutation of a word is a near miss that must be rejected
+            candidates = set(words)
+            for word in words:
+                candidates.update(word[:i] for i in range(1, len(word)))
+                candidates.update(word + ch for ch in alphabet)
+                candidates.update(word[:-1] + ch for ch in alphabet)
+            pattern = re.compile(build_word_trie_regex(words))
+            for candidate in candidates:
+                self.assertEqual(
+                    pattern.fullmatch(candidate) is not None,
+                    candidate in words,
+                    f'{candidate!r} against {sorted(words)}',
+                )
+
+    def test_word_boundaries_match_flat_alternation(self):
+        words = ['ld', 'lda', 'ldi', 'lxi', 'ma.hl', 'mov', 'mov2']
+        trie_pattern = re.compile('\\b' + build_word_trie_regex(words) + '\\b')
+        flat_pattern = re.compile('\\b' + '\\b|\\b'.join(re.escape(w) for w in words) + '\\b')
+        for line in ['  lda [hl]', 'ldx', '  ma.hl a', 'mov2 a, b', 'lxi2', 'ldi\tlda', 'movement', 'ma.hlx']:
+            self.assertEqual(
+                [m.span() for m in trie_pattern.finditer(line)],
+                [m.span() for m in flat_pattern.finditer(line)],
+                line,
+            )
+
+    def test_round_trip(self):
+        words = {'push', 'pop', 'mov', 'add', 'addc', 'ld.a', 'a-b', 'p'}
+        for dialect in [PCRE_DIALECT, VIM_DIALECT]:
+            self.assertSetEqual(trie_regex_words(build_word_trie_regex(words, dialect), dialect), words)
+        self.assertSetEqual(trie_regex_words('lda|ld|mov'), {'lda', 'ld', 'mov'})
+        with self.assertRaises(ValueError):
+            trie_regex_words('(?:ld')
+
+    def test_empty_token_list_never_matches(self):
+        regex_str = LanguageConfigGenerator._replace_token_with_regex_list(None, '(?i)(##TOKENS##)', '##TOKENS##', [])
+        self.assertEqual(regex_str, f'(?i)({PCRE_NEVER_MATCH})')
+        self.assertIsNone(re.search(regex_str, 'anything at all'))
+
+
+if __name__ == '__main__':
+    unittest.main()